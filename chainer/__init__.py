@@ -1,6 +1,5 @@
 import collections
 import os
-import pkg_resources
 import sys
 import threading
 
@@ -18,6 +17,7 @@ from chainer import link  # NOQA
 from chainer import links  # NOQA
 from chainer import optimizer  # NOQA
 from chainer import optimizers  # NOQA
+from chainer import profiler  # NOQA
 from chainer import reporter  # NOQA
 from chainer import serializer  # NOQA
 from chainer import serializers  # NOQA
@@ -26,16 +26,19 @@ from chainer import variable  # NOQA
 
 
 # import class and function
+from chainer._version import __version__  # NOQA
 from chainer.flag import AUTO  # NOQA
 from chainer.flag import Flag  # NOQA
 from chainer.flag import OFF  # NOQA
 from chainer.flag import ON  # NOQA
+from chainer.function import array_only_mode  # NOQA
 from chainer.function import force_backprop_mode  # NOQA
 from chainer.function import Function  # NOQA
 from chainer.function import no_backprop_mode  # NOQA
 from chainer.function_set import FunctionSet  # NOQA
 from chainer.functions import array  # NOQA
 from chainer.functions import basic_math  # NOQA
+from chainer.functions.array import get_item  # NOQA
 from chainer.initializer import Initializer  # NOQA
 from chainer.initializers import init_weight  # NOQA
 from chainer.link import Chain  # NOQA
@@ -67,9 +70,6 @@ set 1 to CHAINER_PYTHON_350_FORCE environment variable."""
         raise Exception(msg)
 
 
-__version__ = pkg_resources.get_distribution('chainer').version
-
-
 thread_local = threading.local()
 
 
@@ -130,6 +130,6 @@ class DebugMode(object):
 
 
 basic_math.install_variable_arithmetics()
-array.get_item.install_variable_get_item()
+get_item.install_variable_get_item()
 
 disable_experimental_feature_warning = False
@@ -1,10 +1,14 @@
+from chainer.dataset import batch  # NOQA
 from chainer.dataset import convert  # NOQA
 from chainer.dataset import dataset_mixin  # NOQA
 from chainer.dataset import download  # NOQA
 from chainer.dataset import iterator  # NOQA
+from chainer.dataset import transform  # NOQA
 
 
 # import class and function
+from chainer.dataset.batch import ColumnBatch  # NOQA
+from chainer.dataset.batch import get_examples  # NOQA
 from chainer.dataset.convert import concat_examples  # NOQA
 from chainer.dataset.convert import to_device  # NOQA
 from chainer.dataset.dataset_mixin import DatasetMixin  # NOQA
@@ -14,3 +18,4 @@ from chainer.dataset.download import get_dataset_directory  # NOQA
 from chainer.dataset.download import get_dataset_root  # NOQA
 from chainer.dataset.download import set_dataset_root  # NOQA
 from chainer.dataset.iterator import Iterator  # NOQA
+from chainer.dataset.transform import TransformConverter  # NOQA
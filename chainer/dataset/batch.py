@@ -0,0 +1,97 @@
+import numpy
+import six
+
+from chainer import cuda
+
+
+class ColumnBatch(object):
+
+    """Batch of examples stored as columns.
+
+    ColumnBatch is a sequence of examples that holds the corresponding items
+    of all the examples together, e.g. as arrays already stacked along the
+    first axis. It is returned by :meth:`get_examples` of datasets combining
+    other datasets such as :class:`~chainer.datasets.TupleDataset`, so that
+    :func:`~chainer.dataset.concat_examples` can use the columns without
+    building and concatenating each example.
+
+    It otherwise behaves as a read-only list of examples: each example is a
+    tuple or a dictionary made of the items of the columns. Indexing it by a
+    slice or an index array returns another ColumnBatch.
+
+    Args:
+        columns (tuple or dict): Columns of the batch. Each column is an array
+            or a sequence of items, and all of them must have the same length.
+
+    Attributes:
+        columns: The columns given to the constructor.
+
+    """
+
+    def __init__(self, columns):
+        if isinstance(columns, dict):
+            lengths = set(len(column) for column in six.itervalues(columns))
+        else:
+            columns = tuple(columns)
+            lengths = set(len(column) for column in columns)
+        if len(lengths) > 1:
+            raise ValueError('columns have different lengths')
+        self.columns = columns
+        self._length = lengths.pop() if lengths else 0
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice) or not numpy.isscalar(index):
+            return ColumnBatch(self._map(lambda c: _take(c, index)))
+        if index < -self._length or index >= self._length:
+            raise IndexError('batch index out of range')
+        return self._map(lambda c: c[index])
+
+    def __iter__(self):
+        for i in six.moves.range(self._length):
+            yield self[i]
+
+    def _map(self, f):
+        if isinstance(self.columns, dict):
+            return {key: f(column)
+                    for key, column in six.iteritems(self.columns)}
+        return tuple(f(column) for column in self.columns)
+
+
+def _is_array(x):
+    return isinstance(x, (numpy.ndarray, cuda.ndarray))
+
+
+def _take(column, index):
+    if isinstance(index, slice) or _is_array(column):
+        return column[index]
+    return [column[i] for i in index]
+
+
+def get_examples(dataset, indices):
+    """Returns the examples of given indices of a dataset.
+
+    It uses the ``get_examples`` method of the dataset if it has one.
+    Otherwise, each example is read by indexing the dataset.
+
+    Args:
+        dataset: Dataset to read the examples from.
+        indices (sequence of ints): Indices of the examples.
+
+    Returns:
+        Sequence of the examples. It is either a list of examples or a
+        :class:`ColumnBatch`.
+
+    """
+    if hasattr(dataset, 'get_examples'):
+        return dataset.get_examples(indices)
+    return [dataset[index] for index in indices]
+
+
+def get_column(dataset, indices):
+    # Array-backed datasets are read by one fancy indexing.
+    if _is_array(dataset):
+        return dataset[indices]
+    return get_examples(dataset, indices)
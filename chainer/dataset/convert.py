@@ -2,6 +2,7 @@ import numpy
 import six
 
 from chainer import cuda
+from chainer.dataset import batch as batch_module
 
 
 def to_device(device, x):
@@ -53,6 +54,10 @@ def concat_examples(batch, device=None, padding=None):
     array, and returns a dictionary with two entries ``x`` and ``y`` whose
     values are the concatenated arrays.
 
+    If the batch is a :class:`~chainer.dataset.ColumnBatch`, the arrays are
+    built from its columns; columns that are already arrays are used as they
+    are.
+
     When the arrays to concatenate have different shapes, the behavior depends
     on the ``padding`` value. If ``padding`` is ``None`` (default), it raises
     an error. Otherwise, it builds an array of the minimum shape that the
@@ -81,6 +86,9 @@ def concat_examples(batch, device=None, padding=None):
     if len(batch) == 0:
         raise ValueError('batch is empty')
 
+    if isinstance(batch, batch_module.ColumnBatch):
+        return _concat_columns(batch.columns, device, padding)
+
     first_elem = batch[0]
 
     if isinstance(first_elem, tuple):
@@ -109,6 +117,25 @@ def concat_examples(batch, device=None, padding=None):
         return to_device(device, _concat_arrays(batch, padding))
 
 
+def _concat_columns(columns, device, padding):
+    if isinstance(columns, dict):
+        if not isinstance(padding, dict):
+            padding = {key: padding for key in columns}
+        return {key: to_device(device, _concat_column(column, padding[key]))
+                for key, column in six.iteritems(columns)}
+
+    if not isinstance(padding, tuple):
+        padding = [padding] * len(columns)
+    return tuple(to_device(device, _concat_column(column, pad))
+                 for column, pad in zip(columns, padding))
+
+
+def _concat_column(column, padding):
+    if isinstance(column, (numpy.ndarray, cuda.ndarray)):
+        return column
+    return _concat_arrays(list(column), padding)
+
+
 def _concat_arrays(arrays, padding):
     # Convert `arrays` to numpy.ndarray if `arrays` consists of the built-in
     # types such as int or float.
@@ -10,6 +10,10 @@ class DatasetMixin(object):
     Dataset implementation using DatasetMixin still has to provide the
     :meth:`__len__` operator explicitly.
 
+    Iterators read a batch of examples by :meth:`get_examples` if the dataset
+    has it. An implementation that supports efficient batched access should
+    override it as well as :meth:`__getitem__`.
+
     """
 
     def __getitem__(self, index):
@@ -48,3 +52,19 @@ class DatasetMixin(object):
 
         """
         raise NotImplementedError
+
+    def get_examples(self, indices):
+        """Returns the examples of given indices.
+
+        The default implementation calls :meth:`get_example` for each index.
+        Implementations may override it to read the examples at once, and may
+        return a :class:`~chainer.dataset.ColumnBatch` instead of a list.
+
+        Args:
+            indices (sequence of ints): The indices of the examples.
+
+        Returns:
+            Sequence of the examples.
+
+        """
+        return [self.get_example(i) for i in indices]
@@ -0,0 +1,318 @@
+import numpy
+from numpy.lib import stride_tricks
+
+from chainer import cuda
+from chainer.dataset import convert
+
+
+def _random_state(random_state):
+    if random_state is None:
+        return numpy.random
+    return random_state
+
+
+def _asarray(xp, a):
+    if xp is numpy:
+        return a
+    return xp.asarray(a)
+
+
+def _gather(x, rows, cols):
+    # Gathers x[i, :, rows[i], cols[i]] for all the examples at once.
+    # ``rows`` and ``cols`` are host arrays of shape (n, h) and (n, w).
+    xp = cuda.get_array_module(x)
+    n, c = x.shape[:2]
+    index = (numpy.arange(n)[:, None, None, None],
+             numpy.arange(c)[None, :, None, None],
+             rows[:, None, :, None],
+             cols[:, None, None, :])
+    return x[tuple(_asarray(xp, i) for i in index)]
+
+
+def center_crop(x, size):
+    """Crops the center of each image in a batch.
+
+    Args:
+        x (numpy.ndarray or cupy.ndarray): Batch of images of shape
+            ``(batchsize, channels, height, width)``.
+        size (tuple of ints): Height and width of the cropped images.
+
+    Returns:
+        A view of ``x`` that contains the cropped images.
+
+    """
+    h, w = size
+    height, width = x.shape[2:]
+    top = (height - h) // 2
+    left = (width - w) // 2
+    return x[:, :, top:top + h, left:left + w]
+
+
+def random_crop(x, size, random_state=None):
+    """Crops a randomly placed region of each image in a batch.
+
+    The region is chosen independently for each image, and all the images are
+    cropped by one indexing operation.
+
+    Args:
+        x (numpy.ndarray or cupy.ndarray): Batch of images of shape
+            ``(batchsize, channels, height, width)``.
+        size (tuple of ints): Height and width of the cropped images.
+        random_state (numpy.random.RandomState): Random number generator. If
+            it is ``None``, the global generator of NumPy is used.
+
+    Returns:
+        Array of the cropped images.
+
+    """
+    random_state = _random_state(random_state)
+    h, w = size
+    n, _, height, width = x.shape
+    if h > height or w > width:
+        raise ValueError('crop size {} is larger than the image size {}'
+                         .format(size, (height, width)))
+    top = random_state.randint(0, height - h + 1, size=n)
+    left = random_state.randint(0, width - w + 1, size=n)
+    if isinstance(x, numpy.ndarray):
+        # View of all the windows, from which the selected ones are copied
+        s_n, s_c, s_h, s_w = x.strides
+        windows = stride_tricks.as_strided(
+            x, (n, height - h + 1, width - w + 1, x.shape[1], h, w),
+            (s_n, s_h, s_w, s_c, s_h, s_w))
+        return windows[numpy.arange(n), top, left]
+    return _gather(x, top[:, None] + numpy.arange(h),
+                   left[:, None] + numpy.arange(w))
+
+
+def random_flip(x, random_state=None, horizontal=True, vertical=False):
+    """Flips each image in a batch with probability one half.
+
+    Args:
+        x (numpy.ndarray or cupy.ndarray): Batch of images of shape
+            ``(batchsize, channels, height, width)``.
+        random_state (numpy.random.RandomState): Random number generator. If
+            it is ``None``, the global generator of NumPy is used.
+        horizontal (bool): If ``True``, the images are randomly flipped
+            horizontally.
+        vertical (bool): If ``True``, the images are randomly flipped
+            vertically.
+
+    Returns:
+        Array of the flipped images.
+
+    """
+    random_state = _random_state(random_state)
+    n = len(x)
+    if horizontal:
+        flip = random_state.randint(0, 2, size=n).astype(bool)
+        x = _flip(x, flip, (Ellipsis, slice(None, None, -1)))
+    if vertical:
+        flip = random_state.randint(0, 2, size=n).astype(bool)
+        x = _flip(x, flip, (Ellipsis, slice(None, None, -1), slice(None)))
+    return x
+
+
+def _flip(x, flip, reverse):
+    xp = cuda.get_array_module(x)
+    if xp is numpy:
+        # Overwrites the flipped images in a copy of the batch
+        y = x.copy()
+        y[flip] = x[flip][reverse]
+        return y
+    flip = xp.asarray(flip.reshape(len(x), 1, 1, 1))
+    return xp.where(flip, x[reverse], x)
+
+
+def random_scale(x, scale_range, random_state=None):
+    """Zooms each image in a batch by a random factor.
+
+    Each image is scaled around its center by a factor drawn uniformly from
+    ``scale_range`` and resampled by the nearest neighbor, so that the shape
+    of the images is not changed. A factor larger than one zooms in, and a
+    factor smaller than one zooms out replicating the pixels on the borders.
+
+    Args:
+        x (numpy.ndarray or cupy.ndarray): Batch of images of shape
+            ``(batchsize, channels, height, width)``.
+        scale_range (tuple of floats): Minimum and maximum of the factors.
+        random_state (numpy.random.RandomState): Random number generator. If
+            it is ``None``, the global generator of NumPy is used.
+
+    Returns:
+        Array of the scaled images.
+
+    """
+    random_state = _random_state(random_state)
+    n, _, height, width = x.shape
+    scale = random_state.uniform(scale_range[0], scale_range[1], size=n)
+
+    def source(length):
+        center = length / 2.
+        coord = (numpy.arange(length) + 0.5 - center) / scale[:, None]
+        index = numpy.floor(coord + center).astype(numpy.intp)
+        return numpy.clip(index, 0, length - 1)
+
+    return _gather(x, source(height), source(width))
+
+
+def normalize(x, mean=None, std=None, dtype=numpy.float32):
+    """Converts a batch of images to floating point numbers and normalizes it.
+
+    Args:
+        x (numpy.ndarray or cupy.ndarray): Batch of images of shape
+            ``(batchsize, channels, height, width)``.
+        mean (float or array): Value to subtract. If it is an array of shape
+            ``(channels,)``, it is subtracted from each channel. Otherwise, it
+            must be broadcastable to the shape of an image. An array on the
+            same device as ``x`` is used without transfer.
+        std (float or array): Value to divide the images by after the mean
+            is subtracted. Its shape follows the same rule as ``mean``.
+        dtype: Data type of the resulting array.
+
+    Returns:
+        Array of the normalized images.
+
+    """
+    xp = cuda.get_array_module(x)
+    y = x.astype(dtype)
+    if mean is not None:
+        y -= _as_image_array(xp, mean, dtype)
+    if std is not None:
+        y /= _as_image_array(xp, std, dtype)
+    return y
+
+
+def _as_image_array(xp, a, dtype):
+    # An array already on the device of the images is used without transfer
+    if not isinstance(a, xp.ndarray):
+        if isinstance(a, cuda.ndarray):
+            a = cuda.to_cpu(a)
+        a = _asarray(xp, numpy.asarray(a))
+    if a.dtype != dtype:
+        a = a.astype(dtype)
+    if a.ndim == 1:
+        a = a.reshape(-1, 1, 1)
+    return a
+
+
+def reorder_channels(x, order):
+    """Reorders the channels of a batch of images.
+
+    For example, ``reorder_channels(x, (2, 1, 0))`` converts RGB images to BGR
+    images.
+
+    Args:
+        x (numpy.ndarray or cupy.ndarray): Batch of images of shape
+            ``(batchsize, channels, height, width)``.
+        order (tuple of ints): Indices of the channels of the input images in
+            the order of the output channels.
+
+    Returns:
+        Array of the images with the channels reordered.
+
+    """
+    xp = cuda.get_array_module(x)
+    return x.take(_asarray(xp, numpy.asarray(order, numpy.intp)), axis=1)
+
+
+def oversample(x, size):
+    """Crops the center, corners, and their mirrors of each image in a batch.
+
+    Args:
+        x (numpy.ndarray or cupy.ndarray): Batch of images of shape
+            ``(batchsize, channels, height, width)``.
+        size (tuple of ints): Height and width of the cropped images.
+
+    Returns:
+        Array of shape ``(batchsize * 10, channels) + size``. The ten crops of
+        each image are consecutive; the first five of them are the four
+        corners and the center, and the other five are their mirrors.
+
+    """
+    xp = cuda.get_array_module(x)
+    h, w = size
+    height, width = x.shape[2:]
+    corners = [(0, 0), (0, width - w), (height - h, 0),
+               (height - h, width - w)]
+    crops = xp.empty((len(x), 10, x.shape[1], h, w), dtype=x.dtype)
+    for i, (top, left) in enumerate(corners):
+        crops[:, i] = x[:, :, top:top + h, left:left + w]
+    crops[:, 4] = center_crop(x, size)
+    for i in range(5):
+        crops[:, i + 5] = crops[:, i, :, :, ::-1]
+    return crops.reshape((-1,) + crops.shape[2:])
+
+
+class TransformConverter(object):
+
+    """Converter that transforms each batch after concatenating it.
+
+    This converter applies a transformation to a whole batch of arrays at
+    once, e.g. data augmentation composed of the functions in the
+    :mod:`chainer.dataset.transform` module. Since the transformation is
+    applied to the arrays sent to the device, it runs on GPU if ``device``
+    is a GPU ID.
+
+    Each batch is transformed with its own random number generator seeded by
+    the pair of ``seed`` and the number of batches converted so far. The
+    random transformations are thus reproducible regardless of how the batch
+    is loaded, e.g. by the worker processes of
+    :class:`~chainer.iterators.MultiprocessIterator`.
+
+    .. admonition:: Example
+
+       >>> from chainer.dataset import transform
+       >>> def augment(x, random_state):
+       ...     x = transform.random_crop(x, (24, 24), random_state)
+       ...     x = transform.random_flip(x, random_state)
+       ...     return transform.normalize(x, mean=127.5, std=127.5)
+       >>> converter = transform.TransformConverter(augment, seed=0)
+       >>> batch = [(numpy.zeros((3, 32, 32), numpy.uint8), 0)] * 2
+       >>> x, t = converter(batch)
+       >>> x.shape
+       (2, 3, 24, 24)
+
+    Args:
+        transform: Callable that takes an array and a random number generator
+            of type :class:`numpy.random.RandomState`, and returns the
+            transformed array.
+        converter: Converter function that concatenates the examples. The
+            default value is :func:`~chainer.dataset.concat_examples`.
+        key (int or str): Index of the array to transform, if the converter
+            returns a tuple or a dictionary of arrays.
+        seed (int): Seed of the random transformations. If it is ``None``, it
+            is drawn from the global generator of NumPy.
+
+    Attributes:
+        count (int): Number of batches converted so far.
+
+    """
+
+    def __init__(self, transform, converter=convert.concat_examples, key=0,
+                 seed=None):
+        self.transform = transform
+        self.converter = converter
+        self.key = key
+        if seed is None:
+            seed = numpy.random.randint(2 ** 31)
+        self.seed = seed
+        self.count = 0
+
+    def __call__(self, batch, device=None):
+        arrays = self.converter(batch, device)
+        random_state = numpy.random.RandomState([self.seed, self.count])
+        self.count += 1
+
+        if isinstance(arrays, tuple):
+            arrays = list(arrays)
+            arrays[self.key] = self.transform(arrays[self.key], random_state)
+            return tuple(arrays)
+        elif isinstance(arrays, dict):
+            arrays = dict(arrays)
+            arrays[self.key] = self.transform(arrays[self.key], random_state)
+            return arrays
+        else:
+            return self.transform(arrays, random_state)
+
+    def serialize(self, serializer):
+        self.count = serializer('count', self.count)
@@ -1,24 +1,20 @@
-from chainer.datasets import cifar  # NOQA
-from chainer.datasets import dict_dataset  # NOQA
-from chainer.datasets import image_dataset  # NOQA
-from chainer.datasets import mnist  # NOQA
-from chainer.datasets import ptb  # NOQA
-from chainer.datasets import sub_dataset  # NOQA
-from chainer.datasets import tuple_dataset  # NOQA
+from chainer.utils import lazy_import
 
 
-# import class and function
-from chainer.datasets.cifar import get_cifar10  # NOQA
-from chainer.datasets.cifar import get_cifar100  # NOQA
-from chainer.datasets.dict_dataset import DictDataset  # NOQA
-from chainer.datasets.image_dataset import ImageDataset  # NOQA
-from chainer.datasets.image_dataset import LabeledImageDataset  # NOQA
-from chainer.datasets.mnist import get_mnist  # NOQA
-from chainer.datasets.ptb import get_ptb_words  # NOQA
-from chainer.datasets.ptb import get_ptb_words_vocabulary  # NOQA
-from chainer.datasets.sub_dataset import get_cross_validation_datasets  # NOQA
-from chainer.datasets.sub_dataset import get_cross_validation_datasets_random  # NOQA
-from chainer.datasets.sub_dataset import split_dataset  # NOQA
-from chainer.datasets.sub_dataset import split_dataset_random  # NOQA
-from chainer.datasets.sub_dataset import SubDataset  # NOQA
-from chainer.datasets.tuple_dataset import TupleDataset  # NOQA
+lazy_import.replace_module(__name__, {
+    '.': [
+        'cached_dataset', 'cifar', 'dict_dataset', 'image_dataset', 'mnist',
+        'ptb', 'sub_dataset', 'tuple_dataset'],
+    '.cached_dataset': ['CachedDataset'],
+    '.cifar': ['get_cifar10', 'get_cifar100'],
+    '.dict_dataset': ['DictDataset'],
+    '.image_dataset': ['CachedLabeledImageDataset', 'ImageDataset',
+                       'LabeledImageDataset'],
+    '.mnist': ['get_mnist'],
+    '.ptb': ['get_ptb_words', 'get_ptb_words_vocabulary'],
+    '.sub_dataset': [
+        'get_cross_validation_datasets',
+        'get_cross_validation_datasets_random', 'split_dataset',
+        'split_dataset_random', 'SubDataset'],
+    '.tuple_dataset': ['TupleDataset'],
+})
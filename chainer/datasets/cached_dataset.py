@@ -0,0 +1,240 @@
+from __future__ import division
+import collections
+import mmap
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy
+import six
+from six.moves import cPickle as pickle
+
+from chainer.dataset import batch
+from chainer.dataset import dataset_mixin
+
+
+class CachedDataset(dataset_mixin.DatasetMixin):
+
+    """Dataset wrapper that memoizes the examples of a base dataset.
+
+    This dataset computes each example by the base dataset only once, which
+    is useful when reading an example is expensive, e.g. when it decodes an
+    image or tokenizes a text. The computed examples are kept in two tiers.
+
+    The first tier is a least-recently-used cache in memory, whose size is
+    bounded by ``max_bytes``. The size of an example is the total number of
+    bytes of the arrays in it. The second tier is a file on the local disk.
+    Each example is written to the file when it is computed, so that the
+    examples evicted from the memory are read from the file through a
+    memory map instead of being computed again.
+
+    The file is shared with the processes forked after the construction, e.g.
+    the worker processes of :class:`~chainer.iterators.MultiprocessIterator`;
+    an example computed by a worker is read from the file by the other
+    workers. Each process has its own memory tier.
+
+    The numbers of the hits in the tiers and the misses are counted over all
+    the processes. They can be reported with
+    :func:`~chainer.training.extensions.observe_value`, e.g.::
+
+        cached = CachedDataset(dataset)
+        trainer.extend(extensions.observe_value(
+            'cache/hit_rate', lambda _: cached.statistics()['hit_rate']))
+
+    .. note::
+       The examples are returned without copies. They should not be modified
+       in place.
+
+    Args:
+        dataset: Base dataset.
+        max_bytes (int): Maximum number of bytes of the examples kept in
+            memory by each process.
+        path (str): Directory to store the files of the disk tier in. If it is
+            ``None``, a temporary directory is created and removed by
+            :meth:`finalize`. The files are not reused across instances.
+        spill (bool): If ``False``, the disk tier is not used, and the
+            examples evicted from the memory are computed again.
+
+    """
+
+    def __init__(self, dataset, max_bytes=1 << 30, path=None, spill=True):
+        self._dataset = dataset
+        self._max_bytes = max_bytes
+        self._memory = collections.OrderedDict()
+        self._memory_bytes = 0
+        # memory hits, disk hits and misses over all the processes
+        self._counts = multiprocessing.Array('l', 3)
+
+        self._spill = spill
+        self._temporary = spill and path is None
+        self._dir = None
+        if spill:
+            if path is None:
+                path = tempfile.mkdtemp()
+            elif not os.path.isdir(path):
+                os.makedirs(path)
+            self._dir = path
+            self._lock = multiprocessing.Lock()
+            # offset and length of each example in the data file
+            self._index = numpy.memmap(
+                os.path.join(path, 'index'), numpy.int64, 'w+',
+                shape=(max(len(dataset), 1), 2))
+            self._data_path = os.path.join(path, 'data')
+            self._fd = os.open(self._data_path,
+                               os.O_RDWR | os.O_CREAT | os.O_TRUNC)
+            self._map = None
+
+    def __len__(self):
+        return len(self._dataset)
+
+    def get_example(self, i):
+        i = self._normalize_index(i)
+        example, found = self._find(i)
+        if not found:
+            example = self._dataset[i]
+            self._add(i, example)
+        return example
+
+    def get_examples(self, indices):
+        examples = []
+        missed = []
+        for k, i in enumerate(indices):
+            i = self._normalize_index(i)
+            example, found = self._find(i)
+            examples.append(example)
+            if not found:
+                missed.append((k, i))
+        if missed:
+            computed = batch.get_examples(
+                self._dataset, [i for _, i in missed])
+            for (k, i), example in six.moves.zip(missed, computed):
+                self._add(i, example)
+                examples[k] = example
+        return examples
+
+    def statistics(self):
+        """Returns the statistics of the cache.
+
+        Returns:
+            dict: Dictionary with the following entries.
+
+            - ``memory_hits``: Number of examples read from the memory.
+            - ``disk_hits``: Number of examples read from the disk.
+            - ``misses``: Number of examples computed by the base dataset.
+            - ``hit_rate``: Ratio of the hits to all the reads.
+            - ``memory_bytes``: Number of bytes of the examples kept in the
+              memory of this process.
+
+            The numbers of the reads are counted over all the processes.
+
+        """
+        with self._counts.get_lock():
+            memory_hits, disk_hits, misses = self._counts[:]
+        total = memory_hits + disk_hits + misses
+        return {
+            'memory_hits': memory_hits,
+            'disk_hits': disk_hits,
+            'misses': misses,
+            'hit_rate': (memory_hits + disk_hits) / total if total else 0.,
+            'memory_bytes': self._memory_bytes,
+        }
+
+    def finalize(self):
+        """Releases the cache.
+
+        It removes the files of the disk tier if they are stored in a
+        temporary directory.
+
+        """
+        self._memory.clear()
+        self._memory_bytes = 0
+        if self._spill and self._fd is not None:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            os.close(self._fd)
+            self._fd = None
+            del self._index
+            if self._temporary:
+                shutil.rmtree(self._dir, ignore_errors=True)
+
+    def _normalize_index(self, i):
+        i = int(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('dataset index out of range')
+        return i
+
+    def _count(self, k):
+        with self._counts.get_lock():
+            self._counts[k] += 1
+
+    def _find(self, i):
+        memory = self._memory
+        if i in memory:
+            example = memory.pop(i)
+            memory[i] = example
+            self._count(0)
+            return example, True
+        if self._spill and self._index[i, 1] > 0:
+            example = self._read(i)
+            self._put(i, example)
+            self._count(1)
+            return example, True
+        self._count(2)
+        return None, False
+
+    def _add(self, i, example):
+        if self._spill:
+            self._write(i, example)
+        self._put(i, example)
+
+    def _put(self, i, example):
+        size = _nbytes(example)
+        if size > self._max_bytes:
+            return
+        memory = self._memory
+        if i in memory:
+            self._memory_bytes -= _nbytes(memory.pop(i))
+        memory[i] = example
+        self._memory_bytes += size
+        while self._memory_bytes > self._max_bytes:
+            _, evicted = memory.popitem(last=False)
+            self._memory_bytes -= _nbytes(evicted)
+
+    def _read(self, i):
+        offset, length = (int(v) for v in self._index[i])
+        if self._map is None or len(self._map) < offset + length:
+            # the data file has grown since it was mapped
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._fd, os.fstat(self._fd).st_size,
+                                  access=mmap.ACCESS_READ)
+        return pickle.loads(self._map[offset:offset + length])
+
+    def _write(self, i, example):
+        data = pickle.dumps(example, pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if self._index[i, 1] > 0:
+                # another process has written the example
+                return
+            offset = os.lseek(self._fd, 0, os.SEEK_END)
+            written = 0
+            while written < len(data):
+                written += os.write(self._fd, data[written:])
+            # the length is set last so that readers see a complete entry
+            self._index[i, 0] = offset
+            self._index[i, 1] = len(data)
+
+
+def _nbytes(example):
+    if isinstance(example, numpy.ndarray):
+        return example.nbytes
+    if isinstance(example, (tuple, list)):
+        return sum(_nbytes(x) for x in example)
+    if isinstance(example, dict):
+        return sum(_nbytes(x) for x in six.itervalues(example))
+    return sys.getsizeof(example)
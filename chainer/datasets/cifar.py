@@ -7,6 +7,7 @@ import six.moves.cPickle as pickle
 
 from chainer.dataset import download
 from chainer.datasets import tuple_dataset
+from chainer.serializers import npz
 
 
 def get_cifar10(withlabel=True, ndim=3, scale=1.):
@@ -124,12 +125,12 @@ def _retrieve_cifar_100():
             train_x, train_y = load(archive, 'cifar-100-python/train')
             test_x, test_y = load(archive, 'cifar-100-python/test')
 
-        numpy.savez_compressed(path, train_x=train_x, train_y=train_y,
-                               test_x=test_x, test_y=test_y)
+        npz.savez_compressed(path, {'train_x': train_x, 'train_y': train_y,
+                                    'test_x': test_x, 'test_y': test_y})
         return {'train_x': train_x, 'train_y': train_y,
                 'test_x': test_x, 'test_y': test_y}
 
-    return download.cache_or_load_file(path, creator, numpy.load)
+    return download.cache_or_load_file(path, creator, npz.NpzFile)
 
 
 def _retrieve_cifar(name):
@@ -163,12 +164,12 @@ def _retrieve_cifar(name):
         train_x = train_x.reshape(50000, 3072)
         train_y = train_y.reshape(50000)
 
-        numpy.savez_compressed(path, train_x=train_x, train_y=train_y,
-                               test_x=test_x, test_y=test_y)
+        npz.savez_compressed(path, {'train_x': train_x, 'train_y': train_y,
+                                    'test_x': test_x, 'test_y': test_y})
         return {'train_x': train_x, 'train_y': train_y,
                 'test_x': test_x, 'test_y': test_y}
 
-    return download.cache_or_load_file(path, creator, numpy.load)
+    return download.cache_or_load_file(path, creator, npz.NpzFile)
 
 
 def _pickle_load(f):
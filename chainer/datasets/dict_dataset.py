@@ -1,5 +1,7 @@
 import six
 
+from chainer.dataset import batch
+
 
 class DictDataset(object):
 
@@ -39,3 +41,20 @@ class DictDataset(object):
 
     def __len__(self):
         return self._length
+
+    def get_examples(self, indices):
+        """Returns the examples of given indices as a column batch.
+
+        Each underlying dataset given as an array is read by one fancy
+        indexing, so that the items of the examples are already stacked.
+
+        Args:
+            indices (sequence of ints): The indices of the examples.
+
+        Returns:
+            ~chainer.dataset.ColumnBatch: Examples of the indices.
+
+        """
+        return batch.ColumnBatch(
+            {key: batch.get_column(dataset, indices)
+             for key, dataset in six.iteritems(self._datasets)})
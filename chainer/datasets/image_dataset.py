@@ -1,3 +1,4 @@
+from multiprocessing import sharedctypes
 import os
 
 import numpy
@@ -142,6 +143,127 @@ class LabeledImageDataset(dataset_mixin.DatasetMixin):
         return image.transpose(2, 0, 1), label
 
 
+class CachedLabeledImageDataset(LabeledImageDataset):
+
+    """Dataset of image and label pairs that caches the decoded images.
+
+    This dataset reads image files like :class:`LabeledImageDataset`, except
+    that each image is decoded only at the first access and stored in a cache
+    as a ``uint8`` array. The following accesses return a copy of the cached
+    array, so that no image is decoded in later epochs. Since the images are
+    kept as ``uint8``, the cache consumes a quarter of the memory of
+    ``float32`` images; the conversion to floating point numbers and the
+    subtraction of the mean should be done for each batch, e.g. in the
+    converter passed to the updater.
+
+    All the images are stored in an array of the same shape. The images are
+    resized to ``size`` if it is given. Otherwise, all the images must have
+    the same shape as the first image. The number of channels must be the
+    same for all the images.
+
+    The cache is placed in shared memory by default, which is shared with the
+    processes forked after the construction, e.g. the worker processes of
+    :class:`~chainer.iterators.MultiprocessIterator`. If ``cache`` is a path,
+    the cache is a memory-mapped file instead, which can be reused across
+    runs; the flags of the cached images are stored in the file of the path
+    with suffix ``.filled``. In this case, the operating system keeps the
+    frequently accessed part of the cache in memory. The files must be removed
+    when the list of the images is changed.
+
+    .. note::
+       **This dataset requires the Pillow package being installed.**
+
+    Args:
+        pairs (str or list of tuples): Paths to images and their labels. See
+            :class:`LabeledImageDataset` for details.
+        root (str): Root directory to retrieve images from.
+        size (tuple of ints): Height and width to which the images are
+            resized. If it is ``None``, the images are not resized.
+        cache (str): Path to the file of the cache. If it is ``None``, the
+            cache is placed in shared memory.
+        label_dtype: Data type of the labels.
+
+    """
+
+    def __init__(self, pairs, root='.', size=None, cache=None,
+                 label_dtype=numpy.int32):
+        super(CachedLabeledImageDataset, self).__init__(
+            pairs, root, numpy.uint8, label_dtype)
+        self._size = size
+
+        first = self._read(0)
+        self._shape = first.shape
+        shape = (len(self),) + first.shape
+        self._cache = cache
+        if cache is None:
+            size = int(numpy.prod(shape))
+            self._images = numpy.frombuffer(
+                sharedctypes.RawArray('B', max(size, 1)), numpy.uint8,
+                count=size).reshape(shape)
+            self._filled = numpy.frombuffer(
+                sharedctypes.RawArray('B', max(len(self), 1)), numpy.uint8,
+                count=len(self))
+        else:
+            self._images = _open_memmap(cache, shape)
+            self._filled = _open_memmap(cache + '.filled', (len(self),))
+        if not self._filled[0]:
+            self._store(0, first)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self._cache is None:
+            raise TypeError('CachedLabeledImageDataset in shared memory '
+                            'cannot be pickled')
+        del state['_images']
+        del state['_filled']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__ = state
+        shape = (len(self),) + self._shape
+        self._images = _open_memmap(self._cache, shape)
+        self._filled = _open_memmap(self._cache + '.filled', (len(self),))
+
+    def get_example(self, i):
+        if not self._filled[i]:
+            self._store(i, self._read(i))
+        image = numpy.array(self._images[i])
+        label = numpy.array(self._pairs[i][1], dtype=self._label_dtype)
+        return image, label
+
+    def _read(self, i):
+        path = os.path.join(self._root, self._pairs[i][0])
+        f = Image.open(path)
+        try:
+            if self._size is not None:
+                height, width = self._size
+                f = f.resize((width, height), Image.BILINEAR)
+            image = numpy.asarray(f, dtype=numpy.uint8)
+        finally:
+            if hasattr(f, 'close'):
+                f.close()
+        if image.ndim == 2:
+            image = image[:, :, numpy.newaxis]
+        return image.transpose(2, 0, 1)
+
+    def _store(self, i, image):
+        if image.shape != self._images.shape[1:]:
+            raise ValueError(
+                'the shape of image {} is {}, while {} is expected'.format(
+                    self._pairs[i][0], image.shape, self._images.shape[1:]))
+        self._images[i] = image
+        # the flag is set after the image is written so that other processes
+        # never read a partially written image
+        self._filled[i] = 1
+
+
+def _open_memmap(path, shape):
+    size = int(numpy.prod(shape))
+    if os.path.exists(path) and os.path.getsize(path) == size:
+        return numpy.memmap(path, numpy.uint8, 'r+', shape=shape)
+    return numpy.memmap(path, numpy.uint8, 'w+', shape=shape)
+
+
 def _check_pillow_availability():
     if not available:
         raise ImportError('PIL cannot be loaded. Install Pillow!\n'
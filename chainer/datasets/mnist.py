@@ -7,6 +7,7 @@ import six
 
 from chainer.dataset import download
 from chainer.datasets import tuple_dataset
+from chainer.serializers import npz
 
 
 def get_mnist(withlabel=True, ndim=1, scale=1., dtype=numpy.float32,
@@ -87,7 +88,7 @@ def _retrieve_mnist(name, urls):
     root = download.get_dataset_directory('pfnet/chainer/mnist')
     path = os.path.join(root, name)
     return download.cache_or_load_file(
-        path, lambda path: _make_npz(path, urls), numpy.load)
+        path, lambda path: _make_npz(path, urls), npz.NpzFile)
 
 
 def _make_npz(path, urls):
@@ -111,5 +112,5 @@ def _make_npz(path, urls):
             for j in six.moves.range(784):
                 x[i, j] = ord(fx.read(1))
 
-    numpy.savez_compressed(path, x=x, y=y)
+    npz.savez_compressed(path, {'x': x, 'y': y})
     return {'x': x, 'y': y}
@@ -3,6 +3,7 @@ import os
 import numpy
 
 from chainer.dataset import download
+from chainer.serializers import npz
 
 
 def get_ptb_words():
@@ -61,12 +62,12 @@ def _retrieve_ptb_words(name, url):
         for i, word in enumerate(words):
             x[i] = vocab[word]
 
-        numpy.savez_compressed(path, x=x)
+        npz.savez_compressed(path, {'x': x})
         return {'x': x}
 
     root = download.get_dataset_directory('pfnet/chainer/ptb')
     path = os.path.join(root, name)
-    loaded = download.cache_or_load_file(path, creator, numpy.load)
+    loaded = download.cache_or_load_file(path, creator, npz.NpzFile)
     return loaded['x']
 
 
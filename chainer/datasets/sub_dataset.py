@@ -1,6 +1,7 @@
 import numpy
 import six
 
+from chainer.dataset import batch
 from chainer.dataset import dataset_mixin
 
 
@@ -75,6 +76,17 @@ class SubDataset(dataset_mixin.DatasetMixin):
             index = self._order[index]
         return self._dataset[index]
 
+    def get_examples(self, indices):
+        indices = numpy.asarray(indices, dtype=numpy.intp)
+        if indices.size and (indices.min() < -self._size or
+                             indices.max() >= self._size):
+            raise IndexError('dataset index out of range')
+        indices = numpy.where(indices >= 0, indices + self._start,
+                              indices + self._finish)
+        if self._order is not None:
+            indices = numpy.asarray(self._order)[indices]
+        return batch.get_examples(self._dataset, indices)
+
 
 def split_dataset(dataset, split_at, order=None):
     """Splits a dataset into two subsets.
@@ -0,0 +1,475 @@
+import collections
+import copy
+import pickle
+
+import numpy
+import six
+
+from chainer import cuda
+from chainer import function
+from chainer.functions.activation import relu
+from chainer.functions.array import reshape
+from chainer.functions.connection import convolution_2d
+from chainer.functions.connection import linear
+from chainer.functions.math import identity
+from chainer.functions.noise import dropout
+from chainer.functions.normalization import batch_normalization
+from chainer import variable
+
+
+_weighted_functions = (convolution_2d.Convolution2DFunction,
+                       linear.LinearFunction)
+
+
+class _CopyHook(function.FunctionHook):
+
+    # Keeps copies of the functions taken before their forward computation,
+    # which do not hold arrays retained for the backward computation.
+
+    name = 'FrozenGraphCopyHook'
+
+    def __init__(self):
+        self.copies = {}
+
+    def forward_preprocess(self, function, in_data):
+        f = copy.copy(function)
+        for name in ('_stack', '_local_function_hooks'):
+            if hasattr(f, name):
+                delattr(f, name)
+        self.copies[id(function)] = f
+
+
+class _Node(object):
+
+    """Function application of a frozen graph.
+
+    Args:
+        function (~chainer.Function): Function applied to the input arrays.
+        inputs (list of ints): Slots of the input arrays.
+        outputs (list of ints): Slots of the output arrays.
+
+    Attributes:
+        activation (str): Name of the activation applied in place to the
+            first output, or ``None``. Only ``'relu'`` is supported.
+        release (list of ints): Slots of the arrays no longer used after
+            this node.
+
+    """
+
+    def __init__(self, function, inputs, outputs):
+        self.function = function
+        self.inputs = inputs
+        self.outputs = outputs
+        self.activation = None
+        self.release = []
+
+
+class FrozenGraph(object):
+
+    """Compact inference graph built by :func:`freeze`.
+
+    A frozen graph is a flat list of function applications on arrays with
+    the parameters of the model embedded as constants. Calling it runs the
+    :meth:`~chainer.Function.forward` methods of the functions directly on
+    the given arrays, without building any computational graph, and returns
+    arrays in the same structure as the outputs of the traced model, i.e. an
+    array, a tuple of arrays or a dictionary of arrays.
+
+    The intermediate arrays are released as soon as they are no longer used.
+    Each call uses fresh copies of the functions, so a frozen graph can be
+    called from multiple threads.
+
+    Attributes:
+        nodes (list): Function applications in the order of execution.
+
+    """
+
+    def __init__(self, nodes, n_inputs, constants, n_slots, output_slots,
+                 output_type):
+        self.nodes = nodes
+        self._n_inputs = n_inputs
+        self._constants = constants
+        self._n_slots = n_slots
+        self._output_slots = output_slots
+        self._output_type = output_type
+
+    def __call__(self, *inputs):
+        """Computes the outputs of the frozen graph.
+
+        Args:
+            inputs: Input arrays. Their number must be the same as that of
+                the sample inputs given to :func:`freeze`.
+
+        Returns:
+            An array, a tuple of arrays or a dictionary of arrays.
+
+        """
+        if len(inputs) != self._n_inputs:
+            raise ValueError(
+                'the frozen graph takes {} inputs, but {} were given'.format(
+                    self._n_inputs, len(inputs)))
+        inputs = tuple([x.data if isinstance(x, variable.Variable) else x
+                        for x in inputs])
+
+        if cuda.available:
+            device = cuda.get_device(*inputs)
+        else:
+            device = cuda.DummyDevice
+        with device:
+            values = self._run(inputs)
+
+        if self._output_type is dict:
+            return {key: values[slot]
+                    for key, slot in six.iteritems(self._output_slots)}
+        elif self._output_type is None:
+            return values[self._output_slots]
+        else:
+            return self._output_type(
+                [values[slot] for slot in self._output_slots])
+
+    def _run(self, inputs):
+        values = [None] * self._n_slots
+        values[:len(inputs)] = inputs
+        values[len(inputs):len(inputs) + len(self._constants)] = \
+            self._constants
+        for node in self.nodes:
+            f = copy.copy(node.function)
+            ys = f.forward(tuple([values[i] for i in node.inputs]))
+            if node.activation == 'relu':
+                y = ys[0]
+                cuda.get_array_module(y).maximum(y, 0, out=y)
+            for slot, y in six.moves.zip(node.outputs, ys):
+                values[slot] = y
+            for slot in node.release:
+                values[slot] = None
+        return values
+
+    def to_cpu(self):
+        """Copies the constant arrays to CPU."""
+        self._constants = [cuda.to_cpu(c) for c in self._constants]
+        return self
+
+    def to_gpu(self, device=None):
+        """Copies the constant arrays to GPU.
+
+        Args:
+            device: Target device specifier. If omitted, the current device is
+                used.
+
+        """
+        with cuda.get_device(device):
+            self._constants = [cuda.to_gpu(c) for c in self._constants]
+        return self
+
+    def save(self, file):
+        """Saves the frozen graph to a single file.
+
+        The graph is saved in the pickle format, which is loaded quickly by
+        :func:`load`. The constant arrays are saved as they are, so call
+        :meth:`to_cpu` beforehand to load the file on machines without GPUs.
+
+        Args:
+            file (str or file-like): Target file.
+
+        """
+        if isinstance(file, six.string_types):
+            with open(file, 'wb') as f:
+                pickle.dump(self, f, pickle.HIGHEST_PROTOCOL)
+        else:
+            pickle.dump(self, file, pickle.HIGHEST_PROTOCOL)
+
+
+def load(file):
+    """Loads a frozen graph saved by :meth:`FrozenGraph.save`.
+
+    .. warning::
+       The file is loaded by :mod:`pickle`. Do not load files from untrusted
+       sources.
+
+    Args:
+        file (str or file-like): Source file.
+
+    Returns:
+        FrozenGraph: The loaded frozen graph.
+
+    """
+    if isinstance(file, six.string_types):
+        with open(file, 'rb') as f:
+            return pickle.load(f)
+    else:
+        return pickle.load(file)
+
+
+def freeze(model, *args, **kwargs):
+    """Traces a model and builds a frozen graph for inference.
+
+    This function calls ``model`` with the sample input arrays, traces the
+    computational graph of the outputs, and optimizes it as follows.
+
+    - :func:`~chainer.functions.identity` and reshapes that do not change
+      the shape are removed. :func:`~chainer.functions.dropout` is also
+      removed if ``test=True`` is given by ``kwargs``; otherwise it is kept
+      and applied with a new mask at each call of the frozen graph.
+    - Batch normalization in the testing mode, i.e.
+      :func:`~chainer.functions.fixed_batch_normalization`, applied only to
+      the output of a :func:`~chainer.functions.convolution_2d` or
+      :func:`~chainer.functions.linear` is folded into the weight and the
+      bias of the preceding function if they are parameters of the model,
+      i.e. not computed from other variables.
+    - :func:`~chainer.functions.relu` applied only to the output of a
+      convolution or a linear function is fused into it and computed in
+      place.
+
+    The parameters of the model are copied to the frozen graph, so later
+    updates of the model do not affect it. The model must be called in the
+    inference mode, e.g. with ``test=True``, which should be passed by
+    ``kwargs``.
+
+    The frozen graph is specialized to the control flow taken for the sample
+    inputs and to the shapes computed from them, except that reshapes that
+    keep the leading axis of the first input are generalized to any batch
+    size.
+
+    Args:
+        model (callable): Model to freeze, e.g. a :class:`~chainer.Chain`. It
+            must return a :class:`~chainer.Variable`, a tuple or list of
+            them, or a dictionary of them.
+        args: Sample input arrays.
+        kwargs: Keyword arguments passed to ``model``.
+
+    Returns:
+        FrozenGraph: The frozen graph.
+
+    .. admonition:: Example
+
+       >>> model = L.ResNet50Layers(pretrained_model=None)  # doctest: +SKIP
+       >>> x = np.zeros((1, 3, 224, 224), 'f')
+       >>> graph = chainer.frozen_graph.freeze(
+       ...     model, x, layers=['prob'])  # doctest: +SKIP
+       >>> graph.save('resnet50.pkl')  # doctest: +SKIP
+       >>> graph = chainer.frozen_graph.load('resnet50.pkl')  # doctest: +SKIP
+       >>> y = graph(x)['prob']  # doctest: +SKIP
+
+    """
+    xs = [variable.Variable(x) for x in args]
+    hook = _CopyHook()
+    with hook:
+        outputs = model(*xs, **kwargs)
+
+    if isinstance(outputs, variable.Variable):
+        output_type = None
+        output_vars = [outputs]
+    elif isinstance(outputs, dict):
+        output_type = dict
+        output_keys = list(outputs)
+        output_vars = [outputs[key] for key in output_keys]
+    elif isinstance(outputs, (tuple, list)):
+        output_type = type(outputs)
+        output_vars = list(outputs)
+    else:
+        raise TypeError('unsupported type of outputs: {}'.format(
+            type(outputs)))
+    for y in output_vars:
+        if not isinstance(y, variable.Variable):
+            raise TypeError('outputs must be Variable objects')
+
+    builder = _GraphBuilder(xs, hook.copies, test=kwargs.get('test', False))
+    builder.trace(output_vars)
+    builder.optimize()
+    output_slots = builder.compile()
+    if output_type is None:
+        output_slots, = output_slots
+    elif output_type is dict:
+        output_slots = dict(six.moves.zip(output_keys, output_slots))
+    return FrozenGraph(builder.nodes, len(xs), builder.constants,
+                       builder.n_slots, output_slots, output_type)
+
+
+class _GraphBuilder(object):
+
+    # Values of the graph are identified by keys, which are the IDs of the
+    # traced variables (or of the arrays of constants) until they are
+    # translated to slot numbers by ``compile``.
+
+    def __init__(self, inputs, copies, test=False):
+        self.input_keys = [id(x) for x in inputs]
+        self.batch_size = len(inputs[0].data) if inputs and \
+            inputs[0].ndim > 0 else None
+        self.copies = copies
+        self.test = test
+        self.constants = collections.OrderedDict()
+        self.shapes = {}
+        self.nodes = []
+        self.output_keys = []
+
+    def _key(self, x):
+        key = id(x)
+        if key not in self.input_keys and x.creator is None:
+            # Constants are identified by their arrays so that parameters
+            # wrapped by different variables are shared.
+            key = id(x.data)
+            if key not in self.constants:
+                self.constants[key] = x.data.copy()
+        self.shapes[key] = x.shape
+        return key
+
+    def trace(self, outputs):
+        functions = []
+        seen = set()
+        stack = [y.creator for y in outputs]
+        while stack:
+            f = stack.pop()
+            if f is None or id(f) in seen:
+                continue
+            if id(f) not in self.copies:
+                raise RuntimeError(
+                    'function {} was not called during tracing'.format(
+                        f.label))
+            seen.add(id(f))
+            functions.append(f)
+            stack.extend([x.creator for x in f.inputs])
+        functions.sort(key=lambda f: f.rank)
+
+        for f in functions:
+            in_keys = [self._key(x) for x in f.inputs]
+            out_keys = []
+            for y in f.outputs:
+                y = y()
+                # a dead output is never used, so any unique key suffices
+                out_keys.append(object() if y is None else self._key(y))
+            self.nodes.append(_Node(self.copies[id(f)], in_keys, out_keys))
+        self.output_keys = [self._key(y) for y in outputs]
+
+    def optimize(self):
+        self._eliminate_identities()
+        self._fold_batch_normalization()
+        self._fuse_relu()
+        self._generalize_reshapes()
+
+    def _eliminate_identities(self):
+        alias = {}
+        nodes = []
+        for node in self.nodes:
+            node.inputs = [alias.get(key, key) for key in node.inputs]
+            f = node.function
+            if isinstance(f, identity.Identity) or (
+                    self.test and isinstance(f, dropout.Dropout)) or (
+                    isinstance(f, reshape.Reshape) and
+                    self.shapes.get(node.inputs[0]) ==
+                    self.shapes.get(node.outputs[0])):
+                for x, y in six.moves.zip(node.inputs, node.outputs):
+                    alias[y] = x
+            else:
+                nodes.append(node)
+        self.nodes = nodes
+        self.output_keys = [alias.get(key, key) for key in self.output_keys]
+
+    def _single_consumers(self):
+        # Returns the dictionary from each key to the node that produces it
+        # if its value is used by just one node and is not an output.
+        counts = collections.Counter(self.output_keys)
+        for node in self.nodes:
+            counts.update(node.inputs)
+        producers = {}
+        for node in self.nodes:
+            if isinstance(node.function, _weighted_functions) and \
+                    node.activation is None and counts[node.outputs[0]] == 1:
+                producers[node.outputs[0]] = node
+        return producers
+
+    def _fold_batch_normalization(self):
+        producers = self._single_consumers()
+        nodes = []
+        for node in self.nodes:
+            f = node.function
+            producer = producers.get(node.inputs[0])
+            if producer is None or \
+                    not isinstance(
+                        f, batch_normalization.BatchNormalizationFunction) or \
+                    f.train or len(node.inputs) != 5 or \
+                    not all(key in self.constants
+                            for key in node.inputs[1:] + producer.inputs[1:]):
+                nodes.append(node)
+                continue
+
+            gamma, beta, mean, var = [self.constants[key]
+                                      for key in node.inputs[1:]]
+            W = self.constants[producer.inputs[1]]
+            if gamma.ndim != 1 or len(gamma) != len(W):
+                nodes.append(node)
+                continue
+            if len(producer.inputs) == 3:
+                b = self.constants[producer.inputs[2]]
+            else:
+                b = 0
+            xp = cuda.get_array_module(W)
+            scale = gamma.astype(numpy.float64) / xp.sqrt(
+                var.astype(numpy.float64) + f.eps)
+            new_W = W * scale.reshape((-1,) + (1,) * (W.ndim - 1))
+            new_b = (b - mean) * scale + beta
+
+            W_key = object()
+            b_key = object()
+            self.constants[W_key] = new_W.astype(W.dtype)
+            self.constants[b_key] = new_b.astype(W.dtype)
+            producer.inputs = [producer.inputs[0], W_key, b_key]
+            producer.outputs = node.outputs
+        self.nodes = nodes
+
+    def _fuse_relu(self):
+        producers = self._single_consumers()
+        nodes = []
+        for node in self.nodes:
+            producer = producers.get(node.inputs[0])
+            if producer is not None and isinstance(node.function, relu.ReLU):
+                producer.activation = 'relu'
+                producer.outputs = node.outputs
+            else:
+                nodes.append(node)
+        self.nodes = nodes
+
+    def _generalize_reshapes(self):
+        for node in self.nodes:
+            f = node.function
+            if not isinstance(f, reshape.Reshape) or \
+                    self.batch_size is None:
+                continue
+            in_shape = self.shapes.get(node.inputs[0], ())
+            out_shape = tuple(f.shape)
+            if in_shape[:1] == out_shape[:1] == (self.batch_size,) and \
+                    -1 not in out_shape:
+                f.shape = (-1,) + out_shape[1:]
+
+    def compile(self):
+        # Assigns slots to values: inputs, constants, and outputs of the
+        # nodes in this order.
+        slots = {}
+        for key in self.input_keys:
+            slots[key] = len(slots)
+        used = set(self.output_keys)
+        for node in self.nodes:
+            used.update(node.inputs)
+        constants = []
+        for key, value in six.iteritems(self.constants):
+            if key in used and key not in slots:
+                slots[key] = len(slots)
+                constants.append(value)
+        n_fixed = len(slots)
+        for node in self.nodes:
+            for key in node.outputs:
+                slots[key] = len(slots)
+
+        last_use = {}
+        for i, node in enumerate(self.nodes):
+            node.inputs = [slots[key] for key in node.inputs]
+            node.outputs = [slots[key] for key in node.outputs]
+            for slot in node.inputs + node.outputs:
+                last_use[slot] = i
+        output_slots = [slots[key] for key in self.output_keys]
+        for slot, i in six.iteritems(last_use):
+            if slot >= n_fixed and slot not in output_slots:
+                self.nodes[i].release.append(slot)
+
+        self.constants = constants
+        self.n_slots = len(slots)
+        return output_slots
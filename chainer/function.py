@@ -78,6 +78,40 @@ def force_backprop_mode():
     _thread_local.default_backprop = default
 
 
+@contextlib.contextmanager
+def array_only_mode():
+    """Enable the array-only inference mode.
+
+    In this context, :class:`Function` objects do not build any part of
+    computational graphs. A function called in this mode runs its
+    :meth:`~Function.forward` method directly on the given arrays and returns
+    the output arrays themselves instead of :class:`~chainer.Variable`
+    objects. Type checking, function hooks and the checks of the debug mode
+    are skipped as well. :class:`~chainer.Variable` objects such as the
+    parameters of links can still be passed to functions, in which case their
+    :data:`~chainer.Variable.data` arrays are used.
+
+    This mode is intended for latency-sensitive inference. Most links can be
+    applied to raw arrays end to end in this context, and then return raw
+    arrays. Note that the code that uses attributes specific to
+    :class:`~chainer.Variable` on the outputs of functions does not work in
+    this mode.
+
+    In this example, ``y`` is a :class:`numpy.ndarray`.
+
+    >>> l = L.Linear(3, 2)
+    >>> with chainer.array_only_mode():
+    ...     y = F.relu(l(np.ones((1, 3), 'f')))
+
+    """
+    default = getattr(_thread_local, 'array_only', False)
+    _thread_local.array_only = True
+    try:
+        yield
+    finally:
+        _thread_local.array_only = default
+
+
 class Function(object):
 
     """Function on variables with backpropagation ability.
@@ -149,8 +183,34 @@ class Function(object):
             your own program.
 
     """
+
+    # The attributes of the graph bookkeeping are stored in slots. The
+    # instance dictionary is kept so that implementations can store arbitrary
+    # attributes such as retained arrays.
+    __slots__ = ('inputs', 'outputs', 'rank', '_stack',
+                 '_local_function_hooks', '__dict__', '__weakref__')
+
     type_check_enable = int(os.environ.get('CHAINER_TYPE_CHECK', '1')) != 0
 
+    # The default pickling of Python 2 does not support slots (except for
+    # the protocol 2), so the slots are stored in the state explicitly.
+    _state_slots = ('inputs', 'outputs', 'rank', '_stack',
+                    '_local_function_hooks')
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        for name in self._state_slots:
+            if hasattr(self, name):
+                state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+        for name in self._state_slots:
+            if name in state:
+                object.__setattr__(self, name, state.pop(name))
+        self.__dict__.update(state)
+
     def __call__(self, *inputs):
         """Applies forward propagation with chaining backward references.
 
@@ -177,6 +237,9 @@ class Function(object):
 
         """
 
+        if getattr(_thread_local, 'array_only', False):
+            return self._call_array_only(inputs)
+
         inputs = [x if isinstance(x, chainer.Variable)
                   else chainer.Variable(x, volatile=flag.AUTO)
                   for x in inputs]
@@ -195,9 +258,18 @@ class Function(object):
         for hook in six.itervalues(hooks):
             hook.forward_preprocess(self, in_data)
         # Forward prop
-        with cuda.get_device(*in_data):
+        # Device selection is skipped on host-only computation, which is
+        # always the case when CuPy is not available.
+        if cuda.available:
+            device = cuda.get_device(*in_data)
+        else:
+            device = cuda.DummyDevice
+        if device is cuda.DummyDevice:
             outputs = self.forward(in_data)
-            assert type(outputs) == tuple
+        else:
+            with device:
+                outputs = self.forward(in_data)
+        assert type(outputs) == tuple
         for hook in six.itervalues(hooks):
             hook.forward_postprocess(self, in_data)
 
@@ -233,6 +305,25 @@ class Function(object):
         else:
             return ret
 
+    def _call_array_only(self, inputs):
+        in_data = tuple([x.data if isinstance(x, chainer.Variable) else x
+                         for x in inputs])
+        if cuda.available:
+            device = cuda.get_device(*in_data)
+        else:
+            device = cuda.DummyDevice
+        if device is cuda.DummyDevice:
+            outputs = self.forward(in_data)
+        else:
+            with device:
+                outputs = self.forward(in_data)
+        assert type(outputs) == tuple
+
+        if len(outputs) == 1:
+            return outputs[0]
+        else:
+            return outputs
+
     @property
     def local_function_hooks(self):
         """Ordered Dictionary of registered function hooks.
@@ -306,7 +397,8 @@ class Function(object):
             return value must be a tuple even if it returns only one array.
 
         """
-        if any(isinstance(x, cuda.ndarray) for x in inputs):
+        if cuda.available and any(isinstance(x, cuda.ndarray)
+                                  for x in inputs):
             return self.forward_gpu(inputs)
         else:
             return self.forward_cpu(inputs)
@@ -369,7 +461,8 @@ class Function(object):
             return value must be a tuple even if it returns only one array.
 
         """
-        if any(isinstance(x, cuda.ndarray) for x in inputs + grad_outputs):
+        if cuda.available and any(isinstance(x, cuda.ndarray)
+                                  for x in inputs + grad_outputs):
             return self.backward_gpu(inputs, grad_outputs)
         else:
             return self.backward_cpu(inputs, grad_outputs)
@@ -0,0 +1,4 @@
+from chainer.utils import lazy_import
+
+
+lazy_import.replace_module(__name__, {})
@@ -0,0 +1,104 @@
+import numpy
+
+from chainer import function
+from chainer.utils import conv
+from chainer.utils import quantization
+from chainer.utils import type_check
+
+
+def _pair(x):
+    if hasattr(x, '__getitem__'):
+        return x
+    return x, x
+
+
+class QuantizedConvolution2DFunction(function.Function):
+
+    def __init__(self, x_scale, stride=1, pad=0, cover_all=False):
+        self.x_scale = x_scale
+        self.sy, self.sx = _pair(stride)
+        self.ph, self.pw = _pair(pad)
+        self.cover_all = cover_all
+
+    def check_type_forward(self, in_types):
+        n_in = in_types.size()
+        type_check.expect(3 <= n_in, n_in <= 4)
+        x_type, w_type, s_type = in_types[:3]
+
+        type_check.expect(
+            x_type.dtype.kind == 'f',
+            w_type.dtype == numpy.int8,
+            s_type.dtype.kind == 'f',
+            x_type.ndim == 4,
+            w_type.ndim == 4,
+            s_type.ndim == 1,
+            x_type.shape[1] == w_type.shape[1],
+            s_type.shape[0] == w_type.shape[0],
+        )
+        if n_in.eval() == 4:
+            b_type = in_types[3]
+            type_check.expect(
+                b_type.dtype == x_type.dtype,
+                b_type.ndim == 1,
+                b_type.shape[0] == w_type.shape[0],
+            )
+
+    def forward_cpu(self, inputs):
+        x, W, W_scale = inputs[:3]
+        out_c, _, kh, kw = W.shape
+        x_q = quantization.quantize(x, self.x_scale)
+        col = conv.im2col_cpu(
+            x_q, kh, kw, self.sy, self.sx, self.ph, self.pw,
+            cover_all=self.cover_all)
+        n, c, _, _, out_h, out_w = col.shape
+        col = col.transpose(0, 4, 5, 1, 2, 3).reshape(
+            n * out_h * out_w, c * kh * kw)
+        y = quantization.matmul_int32(col, W.reshape(out_c, -1)).astype(
+            x.dtype)
+        y *= (self.x_scale * W_scale).astype(x.dtype)
+        if len(inputs) == 4:
+            y += inputs[3]
+        return y.reshape(n, out_h, out_w, out_c).transpose(0, 3, 1, 2),
+
+
+def quantized_convolution_2d(x, W, W_scale, x_scale, b=None, stride=1,
+                             pad=0, cover_all=False):
+    """Two-dimensional convolution with int8 filters for inference.
+
+    This function computes the same output as
+    :func:`~chainer.functions.convolution_2d` with the filter
+    ``W * W_scale[:, None, None, None]``. The input is quantized to int8 with
+    the scale ``x_scale``, the products of the int8 input and filter are
+    accumulated in int32, and then the output is dequantized to the dtype of
+    the input.
+
+    This function only supports the forward computation on CPU.
+
+    Args:
+        x (~chainer.Variable): Input variable of shape
+            :math:`(n, c_I, h, w)`.
+        W (~chainer.Variable): int8 filter of shape
+            :math:`(c_O, c_I, k_H, k_W)`.
+        W_scale (~chainer.Variable): Scales of the output channels of the
+            filter, of shape :math:`(c_O,)`.
+        x_scale (float): Scale of the quantization of the input.
+        b (~chainer.Variable): Bias of shape :math:`(c_O,)` (optional).
+        stride (int or pair of ints): Stride of filter applications.
+            ``stride=s`` and ``stride=(s, s)`` are equivalent.
+        pad (int or pair of ints): Spatial padding width for input arrays.
+            ``pad=p`` and ``pad=(p, p)`` are equivalent.
+        cover_all (bool): If ``True``, all spatial locations are convoluted
+            into some output pixels.
+
+    Returns:
+        ~chainer.Variable: Output variable.
+
+    .. seealso:: :class:`~chainer.links.QuantizedConvolution2D`,
+       :func:`~chainer.links.quantize`
+
+    """
+    func = QuantizedConvolution2DFunction(x_scale, stride, pad, cover_all)
+    if b is None:
+        return func(x, W, W_scale)
+    else:
+        return func(x, W, W_scale, b)
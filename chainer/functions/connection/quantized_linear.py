@@ -0,0 +1,84 @@
+import numpy
+
+from chainer import function
+from chainer.utils import quantization
+from chainer.utils import type_check
+
+
+def _as_mat(x):
+    if x.ndim == 2:
+        return x
+    return x.reshape(len(x), -1)
+
+
+class QuantizedLinearFunction(function.Function):
+
+    def __init__(self, x_scale):
+        self.x_scale = x_scale
+
+    def check_type_forward(self, in_types):
+        n_in = in_types.size()
+        type_check.expect(3 <= n_in, n_in <= 4)
+        x_type, w_type, s_type = in_types[:3]
+
+        type_check.expect(
+            x_type.dtype.kind == 'f',
+            w_type.dtype == numpy.int8,
+            s_type.dtype.kind == 'f',
+            x_type.ndim >= 2,
+            w_type.ndim == 2,
+            s_type.ndim == 1,
+            type_check.prod(x_type.shape[1:]) == w_type.shape[1],
+            s_type.shape[0] == w_type.shape[0],
+        )
+        if n_in.eval() == 4:
+            b_type = in_types[3]
+            type_check.expect(
+                b_type.dtype == x_type.dtype,
+                b_type.ndim == 1,
+                b_type.shape[0] == w_type.shape[0],
+            )
+
+    def forward_cpu(self, inputs):
+        x = _as_mat(inputs[0])
+        W, W_scale = inputs[1:3]
+        x_q = quantization.quantize(x, self.x_scale)
+        y = quantization.matmul_int32(x_q, W).astype(x.dtype)
+        y *= (self.x_scale * W_scale).astype(x.dtype)
+        if len(inputs) == 4:
+            y += inputs[3]
+        return y,
+
+
+def quantized_linear(x, W, W_scale, x_scale, b=None):
+    """Linear function with int8 weights for inference.
+
+    This function computes the same output as :func:`~chainer.functions.linear`
+    with the weight matrix ``W * W_scale[:, None]``. The input is quantized to
+    int8 with the scale ``x_scale``, the product of the int8 input and weight
+    is accumulated in int32, and then it is dequantized to the dtype of the
+    input.
+
+    This function only supports the forward computation on CPU.
+
+    Args:
+        x (~chainer.Variable): Input variable of shape :math:`(s_B, s_1,
+            \\dots, s_n)`, which is treated as a matrix of shape
+            :math:`(s_B, M)`.
+        W (~chainer.Variable): int8 weight matrix of shape :math:`(N, M)`.
+        W_scale (~chainer.Variable): Scales of the output channels of the
+            weight matrix, of shape :math:`(N,)`.
+        x_scale (float): Scale of the quantization of the input.
+        b (~chainer.Variable): Bias vector of shape :math:`(N,)` (optional).
+
+    Returns:
+        ~chainer.Variable: Output variable of shape :math:`(s_B, N)`.
+
+    .. seealso:: :class:`~chainer.links.QuantizedLinear`,
+       :func:`~chainer.links.quantize`
+
+    """
+    if b is None:
+        return QuantizedLinearFunction(x_scale)(x, W, W_scale)
+    else:
+        return QuantizedLinearFunction(x_scale)(x, W, W_scale, b)
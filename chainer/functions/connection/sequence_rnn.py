@@ -0,0 +1,398 @@
+import numpy
+import six
+
+from chainer import cuda
+from chainer import function
+from chainer.functions.activation import lstm
+from chainer.functions.array import concat
+from chainer.functions.array import reshape
+from chainer.functions.array import split_axis
+from chainer.utils import type_check
+from chainer import variable
+
+
+def _sigmoid(x, xp):
+    half = x.dtype.type(0.5)
+    return xp.tanh(x * half) * half + half
+
+
+def _check_batch_sizes(batch_sizes):
+    batch_sizes = tuple(int(b) for b in batch_sizes)
+    for b_prev, b in six.moves.zip(batch_sizes, batch_sizes[1:]):
+        if b > b_prev:
+            raise ValueError(
+                'The batch sizes of the steps of a sequence must be in '
+                'descending order.')
+    return batch_sizes
+
+
+def _previous_outputs(h0, ys, offsets, batch_sizes):
+    # Rows of the state used by each step, in the same order as the inputs.
+    xp = cuda.get_array_module(h0)
+    rows = []
+    for t, b in enumerate(batch_sizes):
+        if t == 0:
+            rows.append(h0[:b])
+        else:
+            rows.append(ys[offsets[t - 1]:offsets[t - 1] + b])
+    if not rows:
+        return xp.empty((0, h0.shape[1]), dtype=h0.dtype)
+    return xp.concatenate(rows)
+
+
+class SequenceLSTM(function.Function):
+
+    """LSTM units applied to all the steps of a sequence.
+
+    It has four inputs ``(c, h, x, W)`` and three outputs ``(y, c, h)``. ``x``
+    is the input projections of all the steps concatenated along the first
+    axis, and ``W`` is the weight of the lateral connections. ``y`` is the
+    outputs of all the steps in the same order as ``x``.
+
+    """
+
+    def __init__(self, batch_sizes):
+        self.batch_sizes = _check_batch_sizes(batch_sizes)
+        self.offsets = numpy.cumsum((0,) + self.batch_sizes).tolist()
+
+    def check_type_forward(self, in_types):
+        type_check.expect(in_types.size() == 4)
+        c_type, h_type, x_type, w_type = in_types
+
+        type_check.expect(
+            c_type.dtype.kind == 'f',
+            h_type.dtype == c_type.dtype,
+            x_type.dtype == c_type.dtype,
+            w_type.dtype == c_type.dtype,
+
+            c_type.ndim == 2,
+            h_type.ndim == 2,
+            x_type.ndim == 2,
+            w_type.ndim == 2,
+
+            h_type.shape[0] == c_type.shape[0],
+            h_type.shape[1] == c_type.shape[1],
+            x_type.shape[0] == self.offsets[-1],
+            x_type.shape[1] == 4 * c_type.shape[1],
+            w_type.shape[0] == x_type.shape[1],
+            w_type.shape[1] == c_type.shape[1],
+        )
+        if self.batch_sizes:
+            type_check.expect(c_type.shape[0] >= self.batch_sizes[0])
+
+    def forward(self, inputs):
+        xp = cuda.get_array_module(*inputs)
+        c0, h0, x, W = inputs
+        c = c0.copy()
+        h = h0.copy()
+        # activated gates in the same layout as x
+        self.gates = xp.empty_like(x)
+        self.cs = xp.empty((len(x), c.shape[1]), dtype=x.dtype)
+        ys = xp.empty_like(self.cs)
+
+        for s, b in six.moves.zip(self.offsets, self.batch_sizes):
+            e = s + b
+            a, i, f, o = lstm._extract_gates(x[s:e] + h[:b].dot(W.T))
+            ga, gi, gf, go = lstm._extract_gates(self.gates[s:e])
+            ga[...] = xp.tanh(a)
+            gi[...] = _sigmoid(i, xp)
+            gf[...] = _sigmoid(f, xp)
+            go[...] = _sigmoid(o, xp)
+            c[:b] = ga * gi + gf * c[:b]
+            self.cs[s:e] = c[:b]
+            ys[s:e] = go * xp.tanh(c[:b])
+            h[:b] = ys[s:e]
+
+        self.ys = ys
+        return ys, c, h
+
+    def backward(self, inputs, grad_outputs):
+        xp = cuda.get_array_module(*inputs)
+        c0, h0, x, W = inputs
+        gys, gc, gh = grad_outputs
+        gc = xp.zeros_like(c0) if gc is None else gc.copy()
+        gh = xp.zeros_like(h0) if gh is None else gh.copy()
+        gx = xp.empty_like(x)
+
+        for t in six.moves.range(len(self.batch_sizes) - 1, -1, -1):
+            s = self.offsets[t]
+            b = self.batch_sizes[t]
+            e = s + b
+            if t == 0:
+                c_prev = c0[:b]
+            else:
+                c_prev = self.cs[self.offsets[t - 1]:self.offsets[t - 1] + b]
+            if gys is not None:
+                gh[:b] += gys[s:e]
+
+            a, i, f, o = lstm._extract_gates(self.gates[s:e])
+            ga, gi, gf, go = lstm._extract_gates(gx[s:e])
+            co = xp.tanh(self.cs[s:e])
+            gc_t = gh[:b] * o * (1 - co * co) + gc[:b]
+            ga[...] = gc_t * i * (1 - a * a)
+            gi[...] = gc_t * a * i * (1 - i)
+            gf[...] = gc_t * c_prev * f * (1 - f)
+            go[...] = gh[:b] * co * o * (1 - o)
+            gc[:b] = gc_t * f
+            gh[:b] = gx[s:e].dot(W)
+
+        h_prev = _previous_outputs(h0, self.ys, self.offsets, self.batch_sizes)
+        gW = gx.T.dot(h_prev)
+        return gc, gh, gx, gW
+
+
+class SequenceGRU(function.Function):
+
+    """GRU applied to all the steps of a sequence.
+
+    It has four inputs ``(h, x, U, b)`` and two outputs ``(y, h)``. ``x`` is
+    the input projections of all the steps concatenated along the first axis,
+    whose second axis consists of the projections for the reset gate, the
+    update gate and the candidate state in this order. ``U`` and ``b`` are the
+    weight and the bias of the lateral connections stacked in the same order.
+    ``y`` is the outputs of all the steps in the same order as ``x``.
+
+    If ``initial_state`` is ``False``, the lateral connections are not used at
+    the first step, and ``h`` is ignored.
+
+    """
+
+    def __init__(self, batch_sizes, initial_state=True):
+        self.batch_sizes = _check_batch_sizes(batch_sizes)
+        self.offsets = numpy.cumsum((0,) + self.batch_sizes).tolist()
+        self.initial_state = initial_state
+
+    def check_type_forward(self, in_types):
+        type_check.expect(in_types.size() == 4)
+        h_type, x_type, u_type, b_type = in_types
+
+        type_check.expect(
+            h_type.dtype.kind == 'f',
+            x_type.dtype == h_type.dtype,
+            u_type.dtype == h_type.dtype,
+            b_type.dtype == h_type.dtype,
+
+            h_type.ndim == 2,
+            x_type.ndim == 2,
+            u_type.ndim == 2,
+            b_type.ndim == 1,
+
+            x_type.shape[0] == self.offsets[-1],
+            x_type.shape[1] == 3 * h_type.shape[1],
+            u_type.shape[0] == x_type.shape[1],
+            u_type.shape[1] == h_type.shape[1],
+            b_type.shape[0] == x_type.shape[1],
+        )
+        if self.batch_sizes:
+            type_check.expect(h_type.shape[0] >= self.batch_sizes[0])
+
+    def forward(self, inputs):
+        xp = cuda.get_array_module(*inputs)
+        h0, x, U, bias = inputs
+        n = h0.shape[1]
+        h = h0.copy()
+        U_rz, U_h = U[:2 * n], U[2 * n:]
+        b_rz, b_h = bias[:2 * n], bias[2 * n:]
+        shape = len(x), n
+        self.r = xp.zeros(shape, dtype=x.dtype)
+        self.z = xp.empty(shape, dtype=x.dtype)
+        self.h_bar = xp.empty(shape, dtype=x.dtype)
+        self.rh = xp.zeros(shape, dtype=x.dtype)
+        ys = xp.empty(shape, dtype=x.dtype)
+
+        for t, (s, b) in enumerate(
+                six.moves.zip(self.offsets, self.batch_sizes)):
+            e = s + b
+            x_r, x_z, x_h = x[s:e, :n], x[s:e, n:2 * n], x[s:e, 2 * n:]
+            if t == 0 and not self.initial_state:
+                self.z[s:e] = _sigmoid(x_z, xp)
+                self.h_bar[s:e] = xp.tanh(x_h)
+                ys[s:e] = self.z[s:e] * self.h_bar[s:e]
+            else:
+                h_prev = h[:b]
+                rz = h_prev.dot(U_rz.T) + b_rz
+                self.r[s:e] = _sigmoid(x_r + rz[:, :n], xp)
+                self.z[s:e] = _sigmoid(x_z + rz[:, n:], xp)
+                self.rh[s:e] = self.r[s:e] * h_prev
+                self.h_bar[s:e] = xp.tanh(
+                    x_h + self.rh[s:e].dot(U_h.T) + b_h)
+                ys[s:e] = h_prev + self.z[s:e] * (self.h_bar[s:e] - h_prev)
+            h[:b] = ys[s:e]
+
+        self.ys = ys
+        return ys, h
+
+    def backward(self, inputs, grad_outputs):
+        xp = cuda.get_array_module(*inputs)
+        h0, x, U, bias = inputs
+        n = h0.shape[1]
+        U_rz, U_h = U[:2 * n], U[2 * n:]
+        gys, gh = grad_outputs
+        gh = xp.zeros_like(h0) if gh is None else gh.copy()
+        gx = xp.empty_like(x)
+
+        for t in six.moves.range(len(self.batch_sizes) - 1, -1, -1):
+            s = self.offsets[t]
+            b = self.batch_sizes[t]
+            e = s + b
+            if gys is not None:
+                gh[:b] += gys[s:e]
+            g = gh[:b]
+            r, z, h_bar = self.r[s:e], self.z[s:e], self.h_bar[s:e]
+            gx_r, gx_z, gx_h = gx[s:e, :n], gx[s:e, n:2 * n], gx[s:e, 2 * n:]
+            gx_h[...] = g * z * (1 - h_bar * h_bar)
+            if t == 0 and not self.initial_state:
+                gx_r[...] = 0
+                gx_z[...] = g * h_bar * z * (1 - z)
+                gh[:b] = 0
+                continue
+
+            if t == 0:
+                h_prev = h0[:b]
+            else:
+                h_prev = self.ys[self.offsets[t - 1]:self.offsets[t - 1] + b]
+            gx_z[...] = g * (h_bar - h_prev) * z * (1 - z)
+            grh = gx_h.dot(U_h)
+            gx_r[...] = grh * h_prev * r * (1 - r)
+            gh[:b] = g * (1 - z) + grh * r + gx[s:e, :2 * n].dot(U_rz)
+
+        # The lateral connections are not used at the first step without the
+        # initial state.
+        start = 0 if self.initial_state else self.offsets[1]
+        h_prev = _previous_outputs(h0, self.ys, self.offsets, self.batch_sizes)
+        gU = xp.concatenate((gx[start:, :2 * n].T.dot(h_prev[start:]),
+                             gx[start:, 2 * n:].T.dot(self.rh[start:])))
+        gb = gx[start:].sum(axis=0)
+        return gh, gx, gU, gb
+
+
+def _flatten_sequence(xs):
+    # Concatenates the steps of a sequence along the first axis. It returns
+    # the concatenated input, the batch sizes of the steps, and a function
+    # that splits the outputs into the same form as the given sequence.
+    if isinstance(xs, (list, tuple)):
+        if not xs:
+            raise ValueError('The sequence must not be empty.')
+        batch_sizes = _check_batch_sizes(x.shape[0] for x in xs)
+        sections = numpy.cumsum(batch_sizes[:-1]).tolist()
+
+        def restore(y):
+            if not sections:
+                return [y]
+            return list(split_axis.split_axis(y, sections, axis=0))
+
+        if len(xs) == 1:
+            return xs[0], batch_sizes, restore
+        return concat.concat(xs, axis=0), batch_sizes, restore
+
+    length, batch = xs.shape[:2]
+    if length == 0:
+        raise ValueError('The sequence must not be empty.')
+
+    def restore(y):
+        return reshape.reshape(y, (length, batch) + y.shape[1:])
+
+    x = reshape.reshape(xs, (length * batch,) + xs.shape[2:])
+    return x, (batch,) * length, restore
+
+
+def _zeros(x, batch, size):
+    xp = cuda.get_array_module(x.data)
+    with cuda.get_device(x.data):
+        return variable.Variable(
+            xp.zeros((batch, size), dtype=x.dtype), volatile='auto')
+
+
+def sequence_lstm(c, h, xs, W):
+    """Long Short-Term Memory units applied to a whole sequence.
+
+    This function computes the same outputs as :func:`~chainer.functions.lstm`
+    applied step by step, where the input signal of each step is the sum of
+    the given input projection ``xs[t]`` and the lateral connection
+    ``h.dot(W.T)``. All the steps are computed by a single function, whose
+    backward computation goes through the sequence at once.
+
+    Since the input projections do not depend on the states, they can be
+    computed for all the steps beforehand by one matrix multiplication, e.g.
+    by :func:`~chainer.functions.linear` applied to the concatenated inputs.
+
+    This function supports variable length sequences in the same way as
+    :func:`~chainer.functions.lstm`. The mini-batch size of each step must be
+    equal to or smaller than that of the previous step. The rows of the states
+    beyond the mini-batch size of a step are not updated at the step.
+
+    Args:
+        c (~chainer.Variable): Initial cell states. If it is ``None``, zeros
+            are used.
+        h (~chainer.Variable): Initial outputs. If it is ``None``, zeros are
+            used.
+        xs: Input projections of the steps. It is either a variable of shape
+            ``(T, B, 4 * N)``, where ``T`` is the length of the sequence and
+            ``N`` is the number of the units, or a list of variables of shape
+            ``(B_t, 4 * N)`` whose mini-batch sizes ``B_t`` are in descending
+            order.
+        W (~chainer.Variable): Weight of the lateral connections of shape
+            ``(4 * N, N)``.
+
+    Returns:
+        tuple: Three items ``c``, ``h`` and ``ys``. ``c`` and ``h`` are the
+            cell states and the outputs after the last step. ``ys`` is the
+            outputs of all the steps in the same form as ``xs``.
+
+    .. seealso:: :meth:`chainer.links.LSTM.forward_sequence`
+
+    """
+    x, batch_sizes, restore = _flatten_sequence(xs)
+    size = W.shape[1]
+    if c is None:
+        c = _zeros(x, batch_sizes[0] if h is None else h.shape[0], size)
+    if h is None:
+        h = _zeros(x, c.shape[0], size)
+    y, c, h = SequenceLSTM(batch_sizes)(c, h, x, W)
+    return c, h, restore(y)
+
+
+def sequence_gru(h, xs, U, b):
+    """Gated Recurrent Unit applied to a whole sequence.
+
+    This function computes the same outputs as :class:`~chainer.links.GRU`
+    applied step by step, where the input projections :math:`W_r x`,
+    :math:`W_z x` and :math:`W x` (including their biases) of all the steps
+    are given. All the steps are computed by a single function, whose backward
+    computation goes through the sequence at once.
+
+    This function supports variable length sequences. The mini-batch size of
+    each step must be equal to or smaller than that of the previous step. The
+    rows of the state beyond the mini-batch size of a step are not updated at
+    the step.
+
+    Args:
+        h (~chainer.Variable): Initial hidden state. If it is ``None``, the
+            lateral connections are not used at the first step as
+            :class:`~chainer.links.StatefulGRU` without a state.
+        xs: Input projections of the steps. It is either a variable of shape
+            ``(T, B, 3 * N)``, where ``T`` is the length of the sequence and
+            ``N`` is the number of the units, or a list of variables of shape
+            ``(B_t, 3 * N)`` whose mini-batch sizes ``B_t`` are in descending
+            order. The second axis consists of the projections for the reset
+            gate, the update gate and the candidate state in this order.
+        U (~chainer.Variable): Weights of the lateral connections :math:`U_r`,
+            :math:`U_z` and :math:`U` stacked along the first axis. Its shape
+            is ``(3 * N, N)``.
+        b (~chainer.Variable): Biases of the lateral connections stacked in the
+            same order. Its shape is ``(3 * N,)``.
+
+    Returns:
+        tuple: Two items ``h`` and ``ys``. ``h`` is the hidden state after the
+            last step, and ``ys`` is the outputs of all the steps in the same
+            form as ``xs``.
+
+    .. seealso:: :meth:`chainer.links.StatefulGRU.forward_sequence`
+
+    """
+    x, batch_sizes, restore = _flatten_sequence(xs)
+    initial_state = h is not None
+    if not initial_state:
+        h = _zeros(x, batch_sizes[0], U.shape[1])
+    y, h = SequenceGRU(batch_sizes, initial_state)(h, x, U, b)
+    return h, restore(y)
@@ -0,0 +1,163 @@
+import numpy
+import six
+
+from chainer import cuda
+from chainer import function
+from chainer.utils import type_check
+
+
+def _as_mat(x):
+    if x.ndim == 2:
+        return x
+    return x.reshape(len(x), -1)
+
+
+class LinearSoftmaxCrossEntropy(function.Function):
+
+    """Linear layer followed by softmax cross entropy, computed in chunks."""
+
+    ignore_label = -1
+
+    def __init__(self, normalize=True, chunk_size=1024):
+        if chunk_size <= 0:
+            raise ValueError('chunk_size must be positive')
+        self.normalize = normalize
+        self.chunk_size = chunk_size
+
+    def check_type_forward(self, in_types):
+        n_in = in_types.size()
+        type_check.expect(3 <= n_in, n_in <= 4)
+        x_type, t_type, w_type = in_types[:3]
+
+        type_check.expect(
+            x_type.dtype.kind == 'f',
+            x_type.ndim >= 2,
+            t_type.dtype == numpy.int32,
+            t_type.ndim == 1,
+            x_type.shape[0] == t_type.shape[0],
+            w_type.dtype == x_type.dtype,
+            w_type.ndim == 2,
+            type_check.prod(x_type.shape[1:]) == w_type.shape[1],
+        )
+        if n_in.eval() == 4:
+            b_type = in_types[3]
+            type_check.expect(
+                b_type.dtype == x_type.dtype,
+                b_type.ndim == 1,
+                b_type.shape[0] == w_type.shape[0],
+            )
+
+    def _chunks(self, n_class):
+        for start in six.moves.range(0, n_class, self.chunk_size):
+            yield start, min(start + self.chunk_size, n_class)
+
+    def _logits(self, x, W, b, start, stop):
+        y = x.dot(W[start:stop].T).astype(x.dtype, copy=False)
+        if b is not None:
+            y += b[start:stop]
+        return y
+
+    def forward(self, inputs):
+        xp = cuda.get_array_module(*inputs)
+        x = _as_mat(inputs[0])
+        t, W = inputs[1:3]
+        b = inputs[3] if len(inputs) == 4 else None
+
+        # Online log-sum-exp over class chunks: only a (batch, chunk_size)
+        # block of logits is alive at any time.
+        m = xp.full((len(x),), -numpy.inf, dtype=x.dtype)
+        s = xp.zeros((len(x),), dtype=x.dtype)
+        t_logit = xp.zeros((len(x),), dtype=x.dtype)
+        for start, stop in self._chunks(len(W)):
+            y = self._logits(x, W, b, start, stop)
+            hit = xp.arange(start, stop, dtype=t.dtype)[None, :] == t[:, None]
+            t_logit += (y * hit).sum(axis=1)
+            m_new = xp.maximum(m, y.max(axis=1))
+            s *= xp.exp(m - m_new)
+            y -= m_new[:, None]
+            s += xp.exp(y, out=y).sum(axis=1)
+            m = m_new
+        self.log_z = m + xp.log(s)
+
+        mask = t != self.ignore_label
+        if self.normalize:
+            count = int(mask.sum())
+        else:
+            count = len(x)
+        self._coeff = 1.0 / max(count, 1)
+
+        loss = ((self.log_z - t_logit) * mask).sum() * self._coeff
+        return xp.asarray(loss, dtype=x.dtype).reshape(()),
+
+    def backward(self, inputs, grad_outputs):
+        xp = cuda.get_array_module(*inputs)
+        x = _as_mat(inputs[0])
+        t, W = inputs[1:3]
+        b = inputs[3] if len(inputs) == 4 else None
+        gloss = grad_outputs[0]
+
+        scale = (t != self.ignore_label).astype(x.dtype)[:, None]
+        scale *= gloss * self._coeff
+        gx = xp.zeros_like(x)
+        gW = xp.empty_like(W)
+        gb = None if b is None else xp.empty_like(b)
+        for start, stop in self._chunks(len(W)):
+            gy = self._logits(x, W, b, start, stop)
+            gy -= self.log_z[:, None]
+            xp.exp(gy, out=gy)
+            gy -= xp.arange(start, stop, dtype=t.dtype)[None, :] == t[:, None]
+            gy *= scale
+            gx += gy.dot(W[start:stop]).astype(x.dtype, copy=False)
+            gW[start:stop] = gy.T.dot(x)
+            if gb is not None:
+                gb[start:stop] = gy.sum(axis=0)
+
+        gx = gx.reshape(inputs[0].shape)
+        if gb is None:
+            return gx, None, gW
+        return gx, None, gW, gb
+
+
+def linear_softmax_cross_entropy(x, t, W, b=None, normalize=True,
+                                 chunk_size=1024):
+    """Computes softmax cross entropy of a linear layer without its logits.
+
+    This function is equivalent to
+    ``softmax_cross_entropy(linear(x, W, b), t)``, but it never holds the
+    whole ``(batch, n_class)`` logit matrix. The classes are processed in
+    chunks of ``chunk_size`` rows of ``W``; the forward pass accumulates the
+    log partition function with an online log-sum-exp, and the backward pass
+    recomputes each chunk of logits to derive the gradients. The peak memory
+    of the intermediate arrays is thus proportional to
+    ``batch * chunk_size`` instead of ``batch * n_class``, which matters for
+    models with a large output vocabulary.
+
+    Args:
+        x (~chainer.Variable): Input variable of shape :math:`(s_B, s_1, \
+            ..., s_n)`. Dimensions other than the first one are
+            concatenated as in :func:`~chainer.functions.linear`.
+        t (~chainer.Variable): Variable holding an int32 vector of ground
+            truth labels. If ``t[i] == -1``, the corresponding ``x[i]`` is
+            ignored.
+        W (~chainer.Variable): Weight variable of shape ``(n_class, N)``.
+        b (~chainer.Variable): Bias variable (optional) of shape
+            ``(n_class,)``.
+        normalize (bool): If ``True``, the loss is divided by the number of
+            non-ignored labels. Otherwise, it is divided by the batch size.
+        chunk_size (int): Number of classes processed at once.
+
+    Returns:
+        Variable: A variable holding a scalar array of the cross entropy loss.
+
+    .. note::
+
+       This function is not differentiable with respect to ``t``.
+
+    .. seealso:: :func:`~chainer.functions.softmax_cross_entropy`
+
+    """
+    func = LinearSoftmaxCrossEntropy(normalize, chunk_size)
+    if b is None:
+        return func(x, t, W)
+    else:
+        return func(x, t, W, b)
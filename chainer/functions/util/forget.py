@@ -1,5 +1,12 @@
+import weakref
+
+import numpy
+import six
+
 from chainer import cuda
 from chainer import function
+from chainer import link as link_module
+from chainer import reporter
 from chainer import variable
 
 
@@ -116,3 +123,325 @@ def forget(func, *xs):
 
     """
     return Forget(func)(*xs)
+
+
+def _split_segments(sizes, n_segments):
+    # Returns the end indices of ``n_segments`` contiguous segments whose
+    # total activation sizes are as even as possible.
+    n = len(sizes)
+    n_segments = max(1, min(n_segments, n))
+    total = float(sum(sizes))
+    ends = []
+    acc = 0
+    for i, size in enumerate(sizes):
+        acc += size
+        j = len(ends) + 1
+        if j == n_segments:
+            break
+        if acc >= total * j / n_segments or n - i - 1 == n_segments - j:
+            ends.append(i + 1)
+    ends.append(n)
+    return ends
+
+
+def _estimate_peak_memory(x_size, sizes, ends):
+    # Boundary outputs are kept during the whole forward/backward pass, while
+    # the outputs inside one segment are alive only during its recomputation.
+    stored = x_size + sum(sizes[end - 1] for end in ends)
+    recompute = 0
+    begin = 0
+    for end in ends:
+        recompute = max(recompute, sum(sizes[begin:end - 1]))
+        begin = end
+    return stored + recompute
+
+
+def _make_segment(funcs, begin, end, sizes):
+    def segment(h):
+        for i in six.moves.range(begin, end):
+            h = funcs[i](h)
+            sizes[i] = h.data.nbytes
+        return h
+    return segment
+
+
+def _links_of(funcs):
+    return [child for func in funcs if isinstance(func, link_module.Link)
+            for child in func.links()]
+
+
+def _state_keys(links):
+    # Returns the keys of the attributes of the links holding variables other
+    # than the parameters, e.g. the recurrent states of LSTM.
+    return [(i, name) for i, child in enumerate(links)
+            for name in sorted(child.__dict__)
+            if name not in child._params and
+            isinstance(child.__dict__[name], variable.Variable)]
+
+
+class _Segment(object):
+
+    # Segment of a sequence of functions wrapped by Forget. The states of the
+    # links in the segment are passed as the inputs and the outputs of
+    # Forget, so that the gradients flow through them, e.g. across the time
+    # steps of stacked LSTMs. Each call leaves the links unchanged except for
+    # their persistent values at the first call; the caller sets the new
+    # states to the links. The recomputation in the backward propagation
+    # starts from the states at the beginning of the forward propagation.
+
+    def __init__(self, funcs, begin, end, sizes):
+        self.funcs = funcs[begin:end]
+        self.begin = begin
+        self.sizes = sizes
+        self.links = _links_of(self.funcs)
+        self.initial_states = _save_states(self.funcs)
+        self.in_keys = _state_keys(self.links)
+        self.in_states = self.get_states(self.in_keys)
+        self.out_keys = None
+        self.n_calls = 0
+
+    def get_states(self, keys):
+        return [getattr(self.links[i], name) for i, name in keys]
+
+    def set_states(self, keys, states):
+        for (i, name), state in six.moves.zip(keys, states):
+            setattr(self.links[i], name, state)
+
+    def __call__(self, h, *states):
+        recompute = self.n_calls > 0
+        self.n_calls += 1
+        if recompute:
+            current = _save_states(self.funcs)
+            _restore_states(self.initial_states)
+        self.set_states(self.in_keys, states)
+        for i, func in enumerate(self.funcs):
+            h = func(h)
+            self.sizes[self.begin + i] = h.data.nbytes
+        if self.out_keys is None:
+            self.out_keys = _state_keys(self.links)
+        outputs = (h,) + tuple(self.get_states(self.out_keys))
+        if recompute:
+            _restore_states(current)
+        else:
+            # the states are set by the caller to the outputs of Forget
+            self.set_states(self.in_keys, self.in_states)
+        return outputs
+
+
+def _save_states(funcs):
+    # Saves the states of the links in ``funcs``: the persistent values (e.g.
+    # the running statistics of batch normalization) are copied, and the
+    # other attributes holding variables (e.g. the recurrent states of
+    # LSTM) are kept by reference, as they are replaced instead of updated in
+    # place.
+    saved = []
+    for func in funcs:
+        if not isinstance(func, link_module.Link):
+            continue
+        for child in func.links():
+            persistents = []
+            for name in child._persistent:
+                value = getattr(child, name)
+                if hasattr(value, 'copy'):
+                    value = value.copy()
+                persistents.append((name, value))
+            saved.append((child, persistents, dict(child.__dict__)))
+    return saved
+
+
+def _restore_states(saved):
+    for child, persistents, attributes in saved:
+        for name, value in persistents:
+            current = getattr(child, name)
+            if isinstance(current, (numpy.ndarray, cuda.ndarray)):
+                current[...] = value
+            else:
+                setattr(child, name, value)
+        for name, current in list(six.iteritems(child.__dict__)):
+            if name in child._params or name in child._persistent:
+                continue
+            old = attributes.get(name)
+            if current is old or not (
+                    isinstance(current, variable.Variable) or
+                    isinstance(old, variable.Variable)):
+                continue
+            if name in attributes:
+                setattr(child, name, old)
+            else:
+                delattr(child, name)
+
+
+def _measure_sizes(funcs, x):
+    # Runs a forward pass without a computational graph to measure the output
+    # size of each function. The states of the links are restored afterwards,
+    # so that stateful layers are not updated by this pass.
+    sizes = [0] * len(funcs)
+    saved = _save_states(funcs)
+    try:
+        h = variable.Variable(x.data, volatile=True)
+        _make_segment(funcs, 0, len(funcs), sizes)(h)
+    finally:
+        _restore_states(saved)
+    return sizes
+
+
+# Cache of the segmentations chosen by memory budgets. The keys contain the
+# ids of the functions, and the entries are removed when any of the functions
+# is deleted.
+_plan_cache = {}
+
+
+def _plan_key(funcs, x, memory_budget):
+    return (tuple(id(func) for func in funcs), x.shape, x.dtype.str,
+            memory_budget)
+
+
+def _cache_plan(funcs, key, plan):
+    def remove(_):
+        _plan_cache.pop(key, None)
+
+    try:
+        refs = [weakref.ref(func, remove) for func in funcs]
+    except TypeError:
+        # the plan is not cached if any function cannot be referenced weakly
+        return
+    _plan_cache[key] = refs, plan
+
+
+def _get_cached_plan(funcs, key):
+    entry = _plan_cache.get(key)
+    if entry is None:
+        return None
+    refs, plan = entry
+    if any(ref() is not func for ref, func in six.moves.zip(refs, funcs)):
+        return None
+    return plan
+
+
+def _plan_by_budget(funcs, x, memory_budget):
+    # Returns the segment ends (or ``None`` if no segmentation is needed) and
+    # the estimated peak memory.
+    x_size = x.data.nbytes
+    sizes = _measure_sizes(funcs, x)
+    if x_size + sum(sizes) <= memory_budget:
+        return None, x_size + sum(sizes)
+
+    candidates = [_split_segments(sizes, n)
+                  for n in six.moves.range(1, len(funcs) + 1)]
+    peaks = [_estimate_peak_memory(x_size, sizes, ends)
+             for ends in candidates]
+    fit = [i for i, peak in enumerate(peaks) if peak <= memory_budget]
+    i = fit[0] if fit else peaks.index(min(peaks))
+    return candidates[i], peaks[i]
+
+
+def checkpoint_sequential(funcs, x, n_segments=None, memory_budget=None):
+    """Calls a sequence of functions with automatic recomputation.
+
+    This function computes ``funcs[-1](...funcs[1](funcs[0](x)))`` like a
+    plain loop, but splits the sequence into contiguous segments and wraps
+    each of them with :func:`~chainer.functions.forget`. Only the outputs at
+    the segment boundaries are kept on the computational graph; the others
+    are recomputed segment by segment in backward propagation.
+
+    The segmentation is decided by either ``n_segments`` or
+    ``memory_budget``. With ``n_segments``, the sequence is split into that
+    many segments. With ``memory_budget``, the output size of each function
+    is measured by a forward pass without a computational graph, and the
+    fewest segments whose estimated peak memory fits in the budget are used;
+    if the whole sequence fits without recomputation, no segmentation is done
+    at all. The peak memory is estimated from the sizes of the outputs of
+    ``funcs``, so memory used inside each function is not taken into account.
+
+    The measurement pass restores the states of the links in ``funcs``
+    after it finishes, i.e. their persistent values (e.g. the running
+    statistics of :class:`~chainer.links.BatchNormalization`) and their
+    attributes holding variables (e.g. the recurrent states of
+    :class:`~chainer.links.LSTM`). Its result
+    is cached for the same functions and the same shape and dtype of the
+    input, so the pass runs only at the first call as long as the same
+    function objects (e.g. the same :class:`~chainer.ChainList`) are given.
+
+    The estimated peak memory in bytes is reported to the current reporter
+    as ``checkpoint/estimated_peak_memory``.
+
+    .. admonition:: Example
+
+       A stack of residual blocks held in a :class:`~chainer.ChainList` can
+       be run with at most four segments as follows:
+
+       >>> blocks = chainer.ChainList(*[L.Linear(3, 3) for _ in range(8)])
+       >>> x = chainer.Variable(np.random.uniform(-1, 1, (2, 3)).astype('f'))
+       >>> y = F.checkpoint_sequential(blocks, x, n_segments=4)
+       >>> y.shape
+       (2, 3)
+
+    Links holding states in variables, e.g. stacked
+    :class:`~chainer.links.LSTM` links, are supported: the states of the
+    links in each segment are passed through the segment, so that the
+    gradients flow through them, and the recomputation starts from the
+    states at the beginning of the forward computation. The persistent
+    values of the links are not updated again by the recomputation.
+
+    .. note::
+
+       Like :func:`~chainer.functions.forget`, this function does not
+       support functions behaving randomly.
+
+    Args:
+        funcs: Sequence of callables. Each of them must take one
+            :class:`~chainer.Variable` and return one
+            :class:`~chainer.Variable`. A :class:`~chainer.ChainList` can be
+            passed directly.
+        x (~chainer.Variable): Input variable.
+        n_segments (int): Number of segments.
+        memory_budget (int): Memory budget in bytes used to choose the
+            number of segments.
+
+    Returns:
+        ~chainer.Variable: Output of the last function.
+
+    """
+    if (n_segments is None) == (memory_budget is None):
+        raise ValueError(
+            'exactly one of n_segments and memory_budget must be given')
+    if n_segments is not None and n_segments <= 0:
+        raise ValueError('n_segments must be positive')
+    funcs = list(funcs)
+    if not funcs:
+        return x
+
+    if not isinstance(x, variable.Variable):
+        x = variable.Variable(x)
+    sizes = [0] * len(funcs)
+    if memory_budget is not None:
+        key = _plan_key(funcs, x, memory_budget)
+        plan = _get_cached_plan(funcs, key)
+        if plan is None:
+            plan = _plan_by_budget(funcs, x, memory_budget)
+            _cache_plan(funcs, key, plan)
+        ends, peak = plan
+        if ends is None:
+            reporter.report({'checkpoint/estimated_peak_memory': peak})
+            for func in funcs:
+                x = func(x)
+            return x
+    else:
+        n_segments = min(n_segments, len(funcs))
+        ends = [len(funcs) * (i + 1) // n_segments
+                for i in six.moves.range(n_segments)]
+
+    x_size = x.data.nbytes
+    begin = 0
+    for end in ends:
+        segment = _Segment(funcs, begin, end, sizes)
+        outputs = Forget(segment)(
+            x, *segment.get_states(segment.in_keys))
+        if not isinstance(outputs, tuple):
+            outputs = outputs,
+        x = outputs[0]
+        segment.set_states(segment.out_keys, outputs[1:])
+        begin = end
+    reporter.report({'checkpoint/estimated_peak_memory':
+                     _estimate_peak_memory(x_size, sizes, ends)})
+    return x
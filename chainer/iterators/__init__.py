@@ -1,7 +1,9 @@
-from chainer.iterators import multiprocess_iterator  # NOQA
-from chainer.iterators import serial_iterator  # NOQA
+from chainer.utils import lazy_import
 
 
-# import class and function
-from chainer.iterators.multiprocess_iterator import MultiprocessIterator  # NOQA
-from chainer.iterators.serial_iterator import SerialIterator  # NOQA
+lazy_import.replace_module(__name__, {
+    '.': ['bucket_iterator', 'multiprocess_iterator', 'serial_iterator'],
+    '.bucket_iterator': ['BucketIterator'],
+    '.multiprocess_iterator': ['MultiprocessIterator'],
+    '.serial_iterator': ['SerialIterator'],
+})
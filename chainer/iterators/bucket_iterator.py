@@ -0,0 +1,166 @@
+from __future__ import division
+
+import numpy
+import six
+
+from chainer.dataset import iterator
+
+
+def _length(example):
+    if isinstance(example, tuple):
+        example = example[0]
+    return len(example)
+
+
+class BucketIterator(iterator.Iterator):
+
+    """Dataset iterator that makes batches of examples of similar lengths.
+
+    When the examples of a batch have various lengths, e.g. sentences, most of
+    the batch padded by :func:`~chainer.dataset.concat_examples` is wasted.
+    This iterator reduces the padding by sorting the examples by their lengths
+    before splitting them into batches.
+
+    At the beginning of each epoch, the examples are shuffled and divided into
+    windows of ``window_size`` examples. The examples of each window are
+    sorted in the descending order of their lengths and split into batches,
+    and the order of all the batches is shuffled. Each window thus acts as a
+    pool of the buckets of lengths, and the whole dataset is sorted at once if
+    ``window_size`` is ``None``. Since the examples of each batch are in the
+    descending order of their lengths, the batch can be fed to
+    :func:`~chainer.functions.n_step_lstm` without sorting.
+
+    A batch never spans two epochs, and the last batch of each window may be
+    smaller than the others. If ``max_tokens`` is given, the size of each
+    batch is also limited so that the number of elements of the padded batch,
+    i.e. the batch size times the maximum length, does not exceed it.
+
+    The ratio of the padding of the latest batch is available as the
+    ``padding_ratio`` attribute, which can be reported by
+    :func:`~chainer.training.extensions.observe_value`.
+
+    Args:
+        dataset: Dataset to iterate.
+        batch_size (int): Maximum number of examples within each batch.
+        repeat (bool): If ``True``, it infinitely loops over the dataset.
+            Otherwise, it stops iteration at the end of the first epoch.
+        shuffle (bool): If ``True``, the examples and the batches are
+            shuffled at the beginning of each epoch. Otherwise, the examples
+            of each window are only sorted by their lengths.
+        window_size (int): Number of examples sorted together. The whole
+            dataset is sorted if it is ``None``.
+        max_tokens (int): Maximum number of elements of each padded batch.
+            An example longer than it makes a batch by itself.
+        length: Function that returns the length of an example. The length
+            of the first array is used by default if the example is a tuple,
+            and the length of the example otherwise. It is called for all
+            the examples at the construction.
+
+    Attributes:
+        padding_ratio (float): Ratio of the padding of the latest batch padded
+            to the maximum length of its examples.
+
+    """
+
+    def __init__(self, dataset, batch_size, repeat=True, shuffle=True,
+                 window_size=None, max_tokens=None, length=_length):
+        self.dataset = dataset
+        self.batch_size = batch_size
+        self.window_size = window_size
+        self.max_tokens = max_tokens
+        self._repeat = repeat
+        self._shuffle = shuffle
+        self._lengths = numpy.array(
+            [length(dataset[i]) for i in six.moves.range(len(dataset))],
+            dtype=numpy.int64)
+
+        self.current_position = 0
+        self.epoch = 0
+        self.is_new_epoch = False
+        self.padding_ratio = 0.0
+        self._plan()
+
+    def __next__(self):
+        if not self._repeat and self.epoch > 0:
+            raise StopIteration
+
+        i = self.current_position
+        i_end = i + int(numpy.argmax(self._ends[i:])) + 1
+        indices = self._order[i:i_end]
+        batch = [self.dataset[index] for index in indices]
+
+        lengths = self._lengths[indices]
+        max_length = lengths.max()
+        if max_length > 0:
+            self.padding_ratio = float(
+                1 - lengths.sum() / (len(lengths) * max_length))
+        else:
+            self.padding_ratio = 0.0
+
+        if i_end >= len(self._order):
+            if self._repeat and self._shuffle:
+                self._plan()
+            self.current_position = 0
+            self.epoch += 1
+            self.is_new_epoch = True
+        else:
+            self.is_new_epoch = False
+            self.current_position = i_end
+
+        return batch
+
+    next = __next__
+
+    @property
+    def epoch_detail(self):
+        return self.epoch + self.current_position / len(self.dataset)
+
+    @property
+    def repeat(self):
+        return self._repeat
+
+    def serialize(self, serializer):
+        self.current_position = serializer('current_position',
+                                           self.current_position)
+        self.epoch = serializer('epoch', self.epoch)
+        self.is_new_epoch = serializer('is_new_epoch', self.is_new_epoch)
+        serializer('_order', self._order)
+        serializer('_ends', self._ends)
+
+    def _plan(self):
+        # Determines the batches of an epoch. The batches are stored as the
+        # order of the examples and the flags of the last examples of the
+        # batches, which are serialized to resume the epoch.
+        n = len(self._lengths)
+        if self._shuffle:
+            order = numpy.random.permutation(n)
+        else:
+            order = numpy.arange(n)
+        window_size = self.window_size or n
+
+        batches = []
+        for i in six.moves.range(0, n, window_size):
+            window = order[i:i + window_size]
+            window = window[numpy.argsort(
+                -self._lengths[window], kind='mergesort')]
+            batches.extend(self._split(window))
+        if self._shuffle:
+            batches = [batches[i] for i in
+                       numpy.random.permutation(len(batches))]
+
+        self._order = numpy.concatenate(batches)
+        self._ends = numpy.zeros(n, dtype=bool)
+        self._ends[numpy.cumsum([len(b) for b in batches]) - 1] = True
+
+    def _split(self, window):
+        # Splits the indices sorted in the descending order of the lengths.
+        batches = []
+        i = 0
+        while i < len(window):
+            size = self.batch_size
+            if self.max_tokens is not None:
+                max_length = max(1, self._lengths[window[i]])
+                size = max(1, min(size, self.max_tokens // max_length))
+            batches.append(window[i:i + size])
+            i += size
+        return batches
@@ -36,6 +36,10 @@ class MultiprocessIterator(iterator.Iterator):
         shared_mem (int): The size of using shared memory per data.
             If ``None``, size is adjusted automatically.
 
+    After :meth:`finalize` is called, the iterator can still be used; the
+    worker processes are started again at the next iteration. It can be used
+    to apply changes of ``batch_size``, ``n_processes`` and ``n_prefetch``.
+
     """
 
     _last_signal = object()
@@ -86,6 +90,10 @@ class MultiprocessIterator(iterator.Iterator):
     def epoch_detail(self):
         return self.epoch + self.current_position / len(self.dataset)
 
+    @property
+    def repeat(self):
+        return self._repeat
+
     def finalize(self):
         if self._finalized is None or self._finalized.is_set():
             return
@@ -100,6 +108,11 @@ class MultiprocessIterator(iterator.Iterator):
             worker.join()
         self._get_data_loop_thread.join()
 
+        # The workers are started again on the next iteration, prefetching
+        # from the current position with the current settings.
+        self._finalized = None
+        self._pushed_position = None
+
     def serialize(self, serializer):
         self.current_position = serializer('current_position',
                                            self.current_position)
@@ -19,6 +19,10 @@ class SerialIterator(iterator.Iterator):
     order of examples has an important meaning and the updater depends on the
     original order, this option should be set to ``False``.
 
+    If the dataset has the ``get_examples`` method (see
+    :meth:`~chainer.dataset.DatasetMixin.get_examples`), each batch is read by
+    one call of it.
+
     Args:
         dataset: Dataset to iterate.
         batch_size (int): Number of examples within each batch.
@@ -52,9 +56,10 @@ class SerialIterator(iterator.Iterator):
         N = len(self.dataset)
 
         if self._order is None:
-            batch = self.dataset[i:i_end]
+            indices = numpy.arange(i, min(i_end, N))
         else:
-            batch = [self.dataset[index] for index in self._order[i:i_end]]
+            # copy since the order is shuffled in place below
+            indices = self._order[i:i_end].copy()
 
         if i_end >= N:
             if self._repeat:
@@ -63,10 +68,10 @@ class SerialIterator(iterator.Iterator):
                     numpy.random.shuffle(self._order)
                 if rest > 0:
                     if self._order is None:
-                        batch.extend(self.dataset[:rest])
+                        rest_indices = numpy.arange(rest)
                     else:
-                        batch.extend([self.dataset[index]
-                                      for index in self._order[:rest]])
+                        rest_indices = self._order[:rest]
+                    indices = numpy.concatenate((indices, rest_indices))
                 self.current_position = rest
             else:
                 self.current_position = 0
@@ -77,14 +82,32 @@ class SerialIterator(iterator.Iterator):
             self.is_new_epoch = False
             self.current_position = i_end
 
-        return batch
+        return self._get_examples(indices)
 
     next = __next__
 
+    def _get_examples(self, indices):
+        if hasattr(self.dataset, 'get_examples'):
+            return self.dataset.get_examples(indices)
+        if self._order is None and len(indices):
+            # read by slices, which may be efficient for the dataset
+            start = indices[0]
+            if indices[-1] == start + len(indices) - 1:
+                return self.dataset[start:start + len(indices)]
+            rest = len(indices) - (len(self.dataset) - start)
+            batch = list(self.dataset[start:])
+            batch.extend(self.dataset[:rest])
+            return batch
+        return [self.dataset[index] for index in indices]
+
     @property
     def epoch_detail(self):
         return self.epoch + self.current_position / len(self.dataset)
 
+    @property
+    def repeat(self):
+        return self._repeat
+
     def serialize(self, serializer):
         self.current_position = serializer('current_position',
                                            self.current_position)
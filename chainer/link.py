@@ -339,6 +339,32 @@ class Link(object):
         self._cpu = False
         return self
 
+    def astype(self, dtype):
+        """Casts parameter arrays under the link hierarchy to given type.
+
+        The data and gradient arrays of all parameters are replaced by their
+        casted copies. Persistent values and uninitialized parameters are not
+        affected. It is typically used with
+        :meth:`~chainer.GradientMethod.use_fp32_update` to run forward and
+        backward computations in half precision.
+
+        Args:
+            dtype: Floating point type of the new parameter arrays.
+
+        Returns: self
+
+        """
+        for link in self.links():
+            d = link.__dict__
+            for name in link._params:
+                param = d[name]
+                with cuda.get_device(param.data):
+                    grad = param.grad
+                    param.data = param.data.astype(dtype)
+                    if grad is not None:
+                        param.grad = grad.astype(dtype)
+        return self
+
     def params(self):
         """Returns a generator of all parameters under the link hierarchy.
 
@@ -1,69 +1,58 @@
 """Collection of :class:`~chainer.Link` implementations."""
 
-from chainer.links.activation import maxout  # NOQA
-from chainer.links.activation import prelu  # NOQA
-from chainer.links.connection import bias  # NOQA
-from chainer.links.connection import bilinear  # NOQA
-from chainer.links.connection import convolution_2d  # NOQA
-from chainer.links.connection import convolution_nd  # NOQA
-from chainer.links.connection import deconvolution_2d  # NOQA
-from chainer.links.connection import deconvolution_nd  # NOQA
-from chainer.links.connection import dilated_convolution_2d  # NOQA
-from chainer.links.connection import embed_id  # NOQA
-from chainer.links.connection import gru  # NOQA
-from chainer.links.connection import highway  # NOQA
-from chainer.links.connection import inception  # NOQA
-from chainer.links.connection import inceptionbn  # NOQA
-from chainer.links.connection import linear  # NOQA
-from chainer.links.connection import lstm  # NOQA
-from chainer.links.connection import mlp_convolution_2d  # NOQA
-from chainer.links.connection import n_step_lstm  # NOQA
-from chainer.links.connection import parameter  # NOQA
-from chainer.links.connection import peephole  # NOQA
-from chainer.links.connection import scale  # NOQA
-from chainer.links.connection import zoneoutlstm  # NOQA
-from chainer.links.loss import black_out  # NOQA
-from chainer.links.loss import crf1d  # NOQA
-from chainer.links.loss import hierarchical_softmax  # NOQA
-from chainer.links.loss import negative_sampling  # NOQA
-from chainer.links.model import classifier  # NOQA
-from chainer.links.normalization import batch_normalization  # NOQA
-from chainer.links.normalization import layer_normalization  # NOQA
-from chainer.links.theano import theano_function  # NOQA
+from chainer.utils import lazy_import
 
 
-# import class and function
-from chainer.links.activation.maxout import Maxout  # NOQA
-from chainer.links.activation.prelu import PReLU  # NOQA
-from chainer.links.connection.bias import Bias  # NOQA
-from chainer.links.connection.bilinear import Bilinear  # NOQA
-from chainer.links.connection.convolution_2d import Convolution2D  # NOQA
-from chainer.links.connection.convolution_nd import ConvolutionND  # NOQA
-from chainer.links.connection.deconvolution_2d import Deconvolution2D  # NOQA
-from chainer.links.connection.deconvolution_nd import DeconvolutionND  # NOQA
-from chainer.links.connection.dilated_convolution_2d import DilatedConvolution2D  # NOQA
-from chainer.links.connection.embed_id import EmbedID  # NOQA
-from chainer.links.connection.gru import GRU  # NOQA
-from chainer.links.connection.gru import StatefulGRU  # NOQA
-from chainer.links.connection.highway import Highway  # NOQA
-from chainer.links.connection.inception import Inception  # NOQA
-from chainer.links.connection.inceptionbn import InceptionBN  # NOQA
-from chainer.links.connection.linear import Linear  # NOQA
-from chainer.links.connection.lstm import LSTM  # NOQA
-from chainer.links.connection.lstm import StatelessLSTM  # NOQA
-from chainer.links.connection.mlp_convolution_2d import MLPConvolution2D  # NOQA
-from chainer.links.connection.n_step_lstm import NStepLSTM  # NOQA
-from chainer.links.connection.parameter import Parameter  # NOQA
-from chainer.links.connection.peephole import StatefulPeepholeLSTM  # NOQA
-from chainer.links.connection.scale import Scale  # NOQA
-from chainer.links.connection.zoneoutlstm import StatefulZoneoutLSTM  # NOQA
-from chainer.links.loss.black_out import BlackOut  # NOQA
-from chainer.links.loss.crf1d import CRF1d  # NOQA
-from chainer.links.loss.hierarchical_softmax import BinaryHierarchicalSoftmax  # NOQA
-from chainer.links.loss.negative_sampling import NegativeSampling  # NOQA
-from chainer.links.model.classifier import Classifier  # NOQA
-from chainer.links.model.vision.resnet import ResNet50Layers  # NOQA
-from chainer.links.model.vision.vgg import VGG16Layers  # NOQA
-from chainer.links.normalization.batch_normalization import BatchNormalization  # NOQA
-from chainer.links.normalization.layer_normalization import LayerNormalization  # NOQA
-from chainer.links.theano.theano_function import TheanoFunction  # NOQA
+lazy_import.replace_module(__name__, {
+    '.': [
+        'activation', 'connection', 'loss', 'model', 'normalization',
+        'theano'],
+    '.activation': ['maxout', 'prelu'],
+    '.activation.maxout': ['Maxout'],
+    '.activation.prelu': ['PReLU'],
+    '.connection': [
+        'bias', 'bilinear', 'convolution_2d', 'convolution_nd',
+        'deconvolution_2d', 'deconvolution_nd', 'dilated_convolution_2d',
+        'embed_id', 'gru', 'highway', 'inception', 'inceptionbn', 'linear',
+        'lstm', 'mlp_convolution_2d', 'n_step_lstm', 'parameter', 'peephole',
+        'quantized_convolution_2d', 'quantized_linear', 'scale',
+        'zoneoutlstm'],
+    '.connection.bias': ['Bias'],
+    '.connection.bilinear': ['Bilinear'],
+    '.connection.convolution_2d': ['Convolution2D'],
+    '.connection.convolution_nd': ['ConvolutionND'],
+    '.connection.deconvolution_2d': ['Deconvolution2D'],
+    '.connection.deconvolution_nd': ['DeconvolutionND'],
+    '.connection.dilated_convolution_2d': ['DilatedConvolution2D'],
+    '.connection.embed_id': ['EmbedID'],
+    '.connection.gru': ['GRU', 'StatefulGRU'],
+    '.connection.highway': ['Highway'],
+    '.connection.inception': ['Inception'],
+    '.connection.inceptionbn': ['InceptionBN'],
+    '.connection.linear': ['Linear'],
+    '.connection.lstm': ['LSTM', 'StatelessLSTM'],
+    '.connection.mlp_convolution_2d': ['MLPConvolution2D'],
+    '.connection.n_step_lstm': ['NStepLSTM'],
+    '.connection.parameter': ['Parameter'],
+    '.connection.peephole': ['StatefulPeepholeLSTM'],
+    '.connection.quantized_convolution_2d': ['QuantizedConvolution2D'],
+    '.connection.quantized_linear': ['QuantizedLinear'],
+    '.connection.scale': ['Scale'],
+    '.connection.zoneoutlstm': ['StatefulZoneoutLSTM'],
+    '.loss': [
+        'black_out', 'crf1d', 'hierarchical_softmax', 'negative_sampling'],
+    '.loss.black_out': ['BlackOut'],
+    '.loss.crf1d': ['CRF1d'],
+    '.loss.hierarchical_softmax': ['BinaryHierarchicalSoftmax'],
+    '.loss.negative_sampling': ['NegativeSampling'],
+    '.model': ['classifier', 'quantization'],
+    '.model.classifier': ['Classifier'],
+    '.model.quantization': ['quantize'],
+    '.model.vision.resnet': ['ResNet50Layers'],
+    '.model.vision.vgg': ['VGG16Layers'],
+    '.normalization': ['batch_normalization', 'layer_normalization'],
+    '.normalization.batch_normalization': ['BatchNormalization'],
+    '.normalization.layer_normalization': ['LayerNormalization'],
+    '.theano': ['theano_function'],
+    '.theano.theano_function': ['TheanoFunction'],
+})
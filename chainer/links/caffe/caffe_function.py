@@ -1,10 +1,14 @@
 import collections
+import os
 import pkg_resources
+import shutil
 import sys
+import tempfile
 import warnings
 
 import numpy
 import six
+from six.moves import cPickle as pickle
 
 from chainer import functions
 from chainer import link
@@ -114,11 +118,20 @@ class CaffeFunction(link.Chain):
        computation in Chainer, so we can run backprop through this pre-trained
        net.
 
+       Parsing a large model file takes a long time. Use
+       :meth:`load_with_cache` to parse it only once and load the converted
+       model from a cache file afterwards::
+
+          func = CaffeFunction.load_with_cache(
+              'path/to/bvlc_reference_caffenet.caffemodel')
+
     Args:
         model_path (str): Path to the binary-proto model file of Caffe.
 
     Attributes:
         forwards (dict): A mapping from layer names to corresponding functions.
+        variables (dict): A mapping from the blob names of the inputs and the
+            outputs of the last call to the corresponding variables.
 
     """
 
@@ -136,6 +149,7 @@ class CaffeFunction(link.Chain):
         self.forwards = {}
         self.split_map = {}
         self.layers = []
+        self._plans = {}
 
         if net.layer:
             for layer in net.layer:
@@ -156,13 +170,66 @@ class CaffeFunction(link.Chain):
                         'Skip the layer "%s", since CaffeFunction does not'
                         'support it' % layer.name)
 
+    @classmethod
+    def load_with_cache(cls, model_path, cache_path=None):
+        """Loads a Caffe model through a cache of the converted model.
+
+        Parsing a large caffemodel with protocol buffers is slow. This method
+        parses the model file only when the cache does not exist, and stores
+        the converted :class:`CaffeFunction` into the cache file by pickle.
+        The following calls load the cache file instead of the model file.
+        The cache is made again when the size or the modification time of
+        the model file is changed.
+
+        Args:
+            model_path (str): Path to the binary-proto model file of Caffe.
+            cache_path (str): Path to the cache file. If it is ``None``, the
+                path of the model file with the ``.pkl`` suffix is used.
+
+        Returns:
+            CaffeFunction: The loaded function.
+
+        """
+        if cache_path is None:
+            cache_path = model_path + '.pkl'
+        stat = os.stat(model_path)
+        key = stat.st_size, int(stat.st_mtime)
+
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                if pickle.load(f) == key:
+                    return pickle.load(f)
+
+        func = cls(model_path)
+        cache_dir = os.path.dirname(os.path.abspath(cache_path))
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(key, f, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(func, f, pickle.HIGHEST_PROTOCOL)
+            shutil.move(temp_path, cache_path)
+        except Exception:
+            os.remove(temp_path)
+            raise
+        return func
+
     def __call__(self, inputs, outputs, disable=(), train=True):
         """Executes a sub-network of the network.
 
-        This function acts as an interpreter of the network definition for
-        Caffe. On execution, it interprets each layer one by one, and if the
-        bottom blobs are already computed, then emulates the layer and stores
-        output blobs as :class:`~chainer.Variable` objects.
+        This function acts as an emulator of the network definition for
+        Caffe. The layers needed to compute the output blobs from the input
+        blobs are determined on the first call with each combination of the
+        input blob names, ``outputs`` and ``disable``. The resulting execution
+        plan is cached and reused by the following calls with the same
+        combination. The layers are emulated in the order of the definition;
+        if the bottom blobs of a layer are not given nor computed, the layer
+        is ignored. Layers whose top blobs are not used to compute the output
+        blobs are not executed.
+
+        Each intermediate blob is released as soon as all the layers using it
+        are executed, so that the memory of the intermediate arrays can be
+        freed during the forward computation unless they are required by the
+        backward computation.
 
         Args:
             inputs (dict): A dictionary whose key-value pairs indicate initial
@@ -180,24 +247,89 @@ class CaffeFunction(link.Chain):
                 corresponding to elements of the  `outputs` argument.
 
         """
+        outputs = tuple(outputs)
+        key = frozenset(inputs), outputs, frozenset(disable)
+        plan = self._plans.get(key)
+        if plan is None:
+            plan = self._compile(inputs, outputs, disable)
+            self._plans[key] = plan
+        n_slots, input_slots, steps, output_slots = plan
+
         self.train = train
-        variables = dict(inputs)
+        values = [None] * n_slots
+        for name, slot in input_slots:
+            values[slot] = inputs[name]
+        forwards = self.forwards
+        for func_name, bottom, top, release in steps:
+            output_vars = forwards[func_name](*[values[i] for i in bottom])
+            if not isinstance(output_vars, collections.Iterable):
+                output_vars = output_vars,
+            for var, i in zip(output_vars, top):
+                values[i] = var
+            for i in release:
+                values[i] = None
+
+        ret = tuple(values[i] for i in output_slots)
+        self.variables = dict(inputs)
+        self.variables.update(zip(outputs, ret))
+        return ret
+
+    def _compile(self, inputs, outputs, disable):
+        # Each value of a blob gets a slot; an in-place layer gives a new
+        # value to the blob of the same name.
+        input_slots = [(name, i) for i, name in enumerate(inputs)]
+        n_slots = len(input_slots)
+        current = {name: i for name, i in input_slots}
+        steps = []
         for func_name, bottom, top in self.layers:
             if (func_name in disable or
                 func_name not in self.forwards or
-                    any(blob not in variables for blob in bottom)):
+                    any(blob not in current for blob in bottom)):
                 continue
-
-            func = self.forwards[func_name]
-            input_vars = tuple(variables[blob] for blob in bottom)
-            output_vars = func(*input_vars)
-            if not isinstance(output_vars, collections.Iterable):
-                output_vars = output_vars,
-            for var, name in zip(output_vars, top):
-                variables[name] = var
-
-        self.variables = variables
-        return tuple(variables[blob] for blob in outputs)
+            bottom_slots = [current[blob] for blob in bottom]
+            top_slots = list(six.moves.range(n_slots, n_slots + len(top)))
+            n_slots += len(top)
+            current.update(zip(top, top_slots))
+            steps.append((func_name, bottom_slots, top_slots))
+        output_slots = tuple(current[blob] for blob in outputs)
+
+        # Keeps only the layers needed to compute the outputs.
+        needed = set(output_slots)
+        pruned = []
+        for step in reversed(steps):
+            if needed.intersection(step[2]):
+                needed.update(step[1])
+                pruned.append(step)
+        pruned.reverse()
+
+        # Renumbers the slots of the needed values, and releases each value
+        # after the last layer using it.
+        renumber = {}
+        for name, slot in input_slots:
+            if slot in needed:
+                renumber[slot] = len(renumber)
+        for _, _, top in pruned:
+            for slot in top:
+                renumber[slot] = len(renumber)
+        last_use = {}
+        for k, (_, bottom, top) in enumerate(pruned):
+            for slot in top:
+                last_use[slot] = k
+            for slot in bottom:
+                last_use[slot] = k
+        releases = [[] for _ in pruned]
+        for slot, k in six.iteritems(last_use):
+            if slot not in output_slots:
+                releases[k].append(renumber[slot])
+
+        return (
+            len(renumber),
+            [(name, renumber[slot]) for name, slot in input_slots
+             if slot in needed],
+            [(func_name, [renumber[slot] for slot in bottom],
+              [renumber[slot] for slot in top], releases[k])
+             for k, (func_name, bottom, top) in enumerate(pruned)],
+            tuple(renumber[slot] for slot in output_slots))
 
     def _add_layer(self, layer):
         bottom = []
@@ -354,7 +486,7 @@ class CaffeFunction(link.Chain):
     def _setup_eltwise(self, layer):
         # stable_prod_grad parameter is not supported now.
         operation = layer.eltwise_param.operation
-        coeffs = layer.eltwise_param.coeff or None
+        coeffs = list(layer.eltwise_param.coeff) or None
         self.forwards[layer.name] = _EltwiseFunction(operation, coeffs)
         self._add_layer(layer)
 
@@ -455,7 +587,7 @@ def _get_ksize(param):
     elif len(param.kernel_size) == 1:
         return param.kernel_size[0]
     else:
-        return param.kernel_size
+        return tuple(param.kernel_size)
 
 
 def _get_stride(param):
@@ -468,7 +600,7 @@ def _get_stride(param):
     elif len(param.stride) == 1:
         return param.stride[0]
     else:
-        return param.stride
+        return tuple(param.stride)
 
 
 def _get_pad(param):
@@ -481,7 +613,7 @@ def _get_pad(param):
     elif len(param.pad) == 1:
         return param.pad[0]
     else:
-        return param.pad
+        return tuple(param.pad)
 
 
 def _get_num(blob):
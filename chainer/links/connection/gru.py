@@ -1,8 +1,12 @@
 import numpy
 
 import chainer
+from chainer import cuda
 from chainer.functions.activation import sigmoid
 from chainer.functions.activation import tanh
+from chainer.functions.array import concat
+from chainer.functions.connection import linear as linear_function
+from chainer.functions.connection import sequence_rnn
 from chainer import link
 from chainer.links.connection import linear
 
@@ -28,6 +32,22 @@ class GRUBase(link.Chain):
                             initialW=inner_init, initial_bias=bias_init),
         )
 
+    def _forward_sequence(self, h, xs):
+        x, batch_sizes, restore = sequence_rnn._flatten_sequence(xs)
+        W = concat.concat((self.W_r.W, self.W_z.W, self.W.W), axis=0)
+        b = concat.concat((self.W_r.b, self.W_z.b, self.W.b), axis=0)
+        U = concat.concat((self.U_r.W, self.U_z.W, self.U.W), axis=0)
+        bU = concat.concat((self.U_r.b, self.U_z.b, self.U.b), axis=0)
+
+        initial_state = h is not None
+        if not initial_state:
+            with cuda.get_device(self._device_id):
+                h = sequence_rnn._zeros(x, batch_sizes[0], U.shape[1])
+        x = linear_function.linear(x, W, b)
+        y, h = sequence_rnn.SequenceGRU(batch_sizes, initial_state)(
+            h, x, U, bU)
+        return h, restore(y)
+
 
 class GRU(GRUBase):
 
@@ -80,6 +100,32 @@ class GRU(GRUBase):
         h_new = (1 - z) * h + z * h_bar
         return h_new
 
+    def forward_sequence(self, h, xs):
+        """Applies the GRU to a whole sequence.
+
+        It returns the same outputs as calling this link for each step of the
+        sequence. The input connections of all the steps are computed by one
+        matrix multiplication, and the lateral connections of all the steps
+        are computed by :func:`~chainer.functions.sequence_gru`. It is faster
+        than calling this link for each step, especially when the mini-batch
+        is small.
+
+        Args:
+            h (~chainer.Variable): Initial hidden vector.
+            xs: Input sequence. It is either a variable of shape
+                ``(T, B, n_inputs)``, where ``T`` is the length of the
+                sequence, or a list of variables of shape ``(B_t, n_inputs)``
+                whose mini-batch sizes ``B_t`` are in descending order.
+
+        Returns:
+            tuple: Two items ``h`` and ``ys``. ``h`` is the hidden vector after
+            the last step. ``ys`` is the outputs of all the steps in the same
+            form as ``xs``. The rows of ``h`` beyond the mini-batch size of a
+            step are not updated at the step.
+
+        """
+        return self._forward_sequence(h, xs)
+
 
 class StatefulGRU(GRUBase):
     """Stateful Gated Recurrent Unit function (GRU).
@@ -174,3 +220,29 @@ class StatefulGRU(GRUBase):
             h_new += (1 - z) * self.h
         self.h = h_new
         return self.h
+
+    def forward_sequence(self, xs):
+        """Updates the internal state by a whole sequence.
+
+        It returns the same outputs as calling this link for each step of the
+        sequence, and updates the internal state in the same way. The input
+        connections of all the steps are computed by one matrix
+        multiplication, and the lateral connections of all the steps are
+        computed by :func:`~chainer.functions.sequence_gru`. It is faster than
+        calling this link for each step, especially when the mini-batch is
+        small.
+
+        Args:
+            xs: Input sequence. It is either a variable of shape
+                ``(T, B, in_size)``, where ``T`` is the length of the
+                sequence, or a list of variables of shape ``(B_t, in_size)``
+                whose mini-batch sizes ``B_t`` are in descending order.
+
+        Returns:
+            Outputs of all the steps in the same form as ``xs``. The rows of
+            the state beyond the mini-batch size of a step are not updated at
+            the step.
+
+        """
+        self.h, ys = self._forward_sequence(self.h, xs)
+        return ys
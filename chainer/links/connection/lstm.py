@@ -6,6 +6,7 @@ from chainer import cuda
 from chainer.functions.activation import lstm
 from chainer.functions.array import concat
 from chainer.functions.array import split_axis
+from chainer.functions.connection import sequence_rnn
 from chainer import initializers
 from chainer import link
 from chainer.links.connection import linear
@@ -257,3 +258,51 @@ class LSTM(LSTMBase):
             self.h = concat.concat([y, h_rest], axis=0)
 
         return y
+
+    def forward_sequence(self, xs):
+        """Updates the internal state by a whole sequence.
+
+        It returns the same outputs as calling this link for each step of the
+        sequence, and updates the internal state in the same way. The upward
+        connections of all the steps are computed by one matrix
+        multiplication, and the lateral connections and the LSTM units of all
+        the steps are computed by :func:`~chainer.functions.sequence_lstm`.
+        It is faster than calling this link for each step, especially when
+        the mini-batch is small.
+
+        Args:
+            xs: Input sequence. It is either a variable of shape
+                ``(T, B, in_size)``, where ``T`` is the length of the
+                sequence, or a list of variables of shape ``(B_t, in_size)``
+                whose mini-batch sizes ``B_t`` are in descending order.
+
+        Returns:
+            Outputs of the LSTM units of all the steps in the same form as
+            ``xs``, i.e. a variable of shape ``(T, B, out_size)`` or a list of
+            variables of shape ``(B_t, out_size)``.
+
+        """
+        x, batch_sizes, restore = sequence_rnn._flatten_sequence(xs)
+        if self.upward.has_uninitialized_params:
+            with cuda.get_device(self._device_id):
+                in_size = x.size // x.shape[0]
+                self.upward._initialize_params(in_size)
+                self._initialize_params()
+
+        batch = batch_sizes[0]
+        if self.h is not None and len(self.h.data) < batch:
+            msg = ('The batch size of x must be equal to or less than'
+                   'the size of the previous state h.')
+            raise TypeError(msg)
+        c, h = self.c, self.h
+        with cuda.get_device(self._device_id):
+            if c is None:
+                c = sequence_rnn._zeros(
+                    x, batch if h is None else h.shape[0], self.state_size)
+            if h is None:
+                h = sequence_rnn._zeros(x, c.shape[0], self.state_size)
+
+        lstm_in = self.upward(x)
+        y, self.c, self.h = sequence_rnn.SequenceLSTM(batch_sizes)(
+            c, h, lstm_in, self.lateral.W)
+        return restore(y)
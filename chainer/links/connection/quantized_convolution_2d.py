@@ -0,0 +1,71 @@
+import numpy
+
+from chainer.functions.connection import quantized_convolution_2d
+from chainer import link
+
+
+class QuantizedConvolution2D(link.Link):
+
+    """Two-dimensional convolutional layer with int8 filters for inference.
+
+    This is a link that wraps the
+    :func:`~chainer.functions.quantized_convolution_2d` function. It holds an
+    int8 filter ``W``, the float32 scales ``W_scale`` of its output channels,
+    the scale ``x_scale`` of the quantization of the input and optionally a
+    float32 bias ``b``. They are not trainable and are registered as
+    persistent values. The values are usually set by
+    :func:`~chainer.links.quantize` from a trained
+    :class:`~chainer.links.Convolution2D` link.
+
+    Args:
+        in_channels (int): Number of channels of input arrays.
+        out_channels (int): Number of channels of output arrays.
+        ksize (int or pair of ints): Size of filters (a.k.a. kernels).
+            ``ksize=k`` and ``ksize=(k, k)`` are equivalent.
+        stride (int or pair of ints): Stride of filter applications.
+            ``stride=s`` and ``stride=(s, s)`` are equivalent.
+        pad (int or pair of ints): Spatial padding width for input arrays.
+            ``pad=p`` and ``pad=(p, p)`` are equivalent.
+        nobias (bool): If ``True``, then this link does not use the bias.
+
+    .. seealso:: :func:`~chainer.functions.quantized_convolution_2d`
+
+    """
+
+    def __init__(self, in_channels, out_channels, ksize, stride=1, pad=0,
+                 nobias=False):
+        super(QuantizedConvolution2D, self).__init__()
+        self.stride = _pair(stride)
+        self.pad = _pair(pad)
+        kh, kw = _pair(ksize)
+        self.add_persistent(
+            'W', numpy.zeros((out_channels, in_channels, kh, kw),
+                             dtype=numpy.int8))
+        self.add_persistent(
+            'W_scale', numpy.ones(out_channels, dtype=numpy.float32))
+        self.add_persistent('x_scale', 1.0)
+        if nobias:
+            self.b = None
+        else:
+            self.add_persistent(
+                'b', numpy.zeros(out_channels, dtype=numpy.float32))
+
+    def __call__(self, x):
+        """Applies the quantized convolution layer.
+
+        Args:
+            x (~chainer.Variable): Input image.
+
+        Returns:
+            ~chainer.Variable: Output of the convolution.
+
+        """
+        return quantized_convolution_2d.quantized_convolution_2d(
+            x, self.W, self.W_scale, self.x_scale, self.b, self.stride,
+            self.pad)
+
+
+def _pair(x):
+    if hasattr(x, '__getitem__'):
+        return x
+    return x, x
@@ -0,0 +1,53 @@
+import numpy
+
+from chainer.functions.connection import quantized_linear
+from chainer import link
+
+
+class QuantizedLinear(link.Link):
+
+    """Linear layer with int8 weights for inference.
+
+    This is a link that wraps the
+    :func:`~chainer.functions.quantized_linear` function. It holds an int8
+    weight matrix ``W``, the float32 scales ``W_scale`` of its output
+    channels, the scale ``x_scale`` of the quantization of the input and
+    optionally a float32 bias vector ``b``. They are not trainable and are
+    registered as persistent values. The values are usually set by
+    :func:`~chainer.links.quantize` from a trained
+    :class:`~chainer.links.Linear` link.
+
+    Args:
+        in_size (int): Dimension of input vectors.
+        out_size (int): Dimension of output vectors.
+        nobias (bool): If ``True``, then this link does not use the bias.
+
+    .. seealso:: :func:`~chainer.functions.quantized_linear`
+
+    """
+
+    def __init__(self, in_size, out_size, nobias=False):
+        super(QuantizedLinear, self).__init__()
+        self.add_persistent(
+            'W', numpy.zeros((out_size, in_size), dtype=numpy.int8))
+        self.add_persistent(
+            'W_scale', numpy.ones(out_size, dtype=numpy.float32))
+        self.add_persistent('x_scale', 1.0)
+        if nobias:
+            self.b = None
+        else:
+            self.add_persistent(
+                'b', numpy.zeros(out_size, dtype=numpy.float32))
+
+    def __call__(self, x):
+        """Applies the quantized linear layer.
+
+        Args:
+            x (~chainer.Variable): Batch of input vectors.
+
+        Returns:
+            ~chainer.Variable: Output of the linear layer.
+
+        """
+        return quantized_linear.quantized_linear(
+            x, self.W, self.W_scale, self.x_scale, self.b)
@@ -0,0 +1,158 @@
+import copy
+
+import six
+
+from chainer import cuda
+from chainer.dataset import convert
+from chainer import function
+from chainer.functions.connection import convolution_2d
+from chainer.functions.connection import linear
+from chainer import link
+from chainer.links.connection import convolution_2d as convolution_2d_link
+from chainer.links.connection import linear as linear_link
+from chainer.links.connection import quantized_convolution_2d
+from chainer.links.connection import quantized_linear
+from chainer.utils import quantization
+from chainer import variable
+
+
+class _CalibrationHook(function.FunctionHook):
+
+    # Records the maximum absolute value of the inputs of the linear and
+    # convolution functions, identified by the arrays of their weights.
+
+    name = 'QuantizationCalibrationHook'
+
+    def __init__(self):
+        self.max_abs = {}
+        # keeps the weights alive so that their IDs are not reused
+        self._weights = {}
+
+    def forward_preprocess(self, function, in_data):
+        if not isinstance(function, (linear.LinearFunction,
+                                     convolution_2d.Convolution2DFunction)):
+            return
+        x, W = in_data[:2]
+        value = float(abs(x).max()) if x.size else 0.0
+        key = id(W)
+        self._weights[key] = W
+        self.max_abs[key] = max(self.max_abs.get(key, 0.0), value)
+
+
+def _quantize_weight(W):
+    W = cuda.to_cpu(W)
+    max_abs = abs(W.reshape(len(W), -1)).max(axis=1)
+    scale = quantization.scale_of(max_abs)
+    expander = (slice(None),) + (None,) * (W.ndim - 1)
+    return quantization.quantize(W, scale[expander]), scale
+
+
+def _quantize_link(child, max_abs):
+    if isinstance(child, linear_link.Linear):
+        out_size, in_size = child.W.data.shape
+        ret = quantized_linear.QuantizedLinear(
+            in_size, out_size, nobias=child.b is None)
+    else:
+        out_channels, in_channels, kh, kw = child.W.data.shape
+        ret = quantized_convolution_2d.QuantizedConvolution2D(
+            in_channels, out_channels, (kh, kw), child.stride, child.pad,
+            nobias=child.b is None)
+    ret.W, ret.W_scale = _quantize_weight(child.W.data)
+    ret.x_scale = float(quantization.scale_of(max_abs))
+    if child.b is not None:
+        ret.b = cuda.to_cpu(child.b.data).copy()
+    return ret
+
+
+def _replace_links(parent, convert_link):
+    if isinstance(parent, link.Chain):
+        d = parent.__dict__
+        for name in parent._children:
+            new = convert_link(d[name])
+            if new is None:
+                _replace_links(d[name], convert_link)
+            else:
+                new.name = name
+                d[name] = new
+    elif isinstance(parent, link.ChainList):
+        children = parent._children
+        for i, child in enumerate(children):
+            new = convert_link(child)
+            if new is None:
+                _replace_links(child, convert_link)
+            else:
+                new.name = str(i)
+                children[i] = new
+
+
+def quantize(model, iterator, converter=convert.concat_examples, device=None,
+             eval_func=None):
+    """Quantizes the linear and convolution layers of a model to int8.
+
+    This function builds a copy of the given model for inference on CPU, in
+    which each :class:`~chainer.links.Linear` and
+    :class:`~chainer.links.Convolution2D` link is replaced by a
+    :class:`~chainer.links.QuantizedLinear` and a
+    :class:`~chainer.links.QuantizedConvolution2D` link, respectively. The
+    weights are quantized to int8 with a scale for each output channel. The
+    scale of the input of each layer is calibrated by the maximum absolute
+    value of the inputs observed when the model is applied to the batches of
+    the given iterator.
+
+    The calibration loop is the same as that of
+    :class:`~chainer.training.extensions.Evaluator`, i.e. the model (or
+    ``eval_func``) is called with the volatile variables of the arrays
+    converted from each batch. The model must be set to the inference mode
+    beforehand if it has a flag for it. The layers that are not called
+    during the calibration are not quantized. The given model is not
+    modified.
+
+    Args:
+        model (~chainer.Link): Model to quantize.
+        iterator: Dataset iterator for the calibration. It must not repeat
+            the dataset, and is copied before the iteration unless it has the
+            ``reset`` method.
+        converter: Converter function to build input arrays.
+            :func:`~chainer.dataset.concat_examples` is used by default.
+        device: Device to which the calibration data is sent. Negative value
+            indicates the host memory (CPU).
+        eval_func: Function called with the converted input arrays for the
+            calibration. The model itself is called if it is ``None``.
+
+    Returns:
+        ~chainer.Link: The quantized copy of the model.
+
+    """
+    if hasattr(iterator, 'reset'):
+        iterator.reset()
+        it = iterator
+    else:
+        it = copy.copy(iterator)
+    eval_func = eval_func or model
+    hook = _CalibrationHook()
+    with hook:
+        for batch in it:
+            in_arrays = converter(batch, device)
+            if isinstance(in_arrays, tuple):
+                eval_func(*[variable.Variable(x, volatile='on')
+                            for x in in_arrays])
+            elif isinstance(in_arrays, dict):
+                eval_func(**{key: variable.Variable(x, volatile='on')
+                             for key, x in six.iteritems(in_arrays)})
+            else:
+                eval_func(variable.Variable(in_arrays, volatile='on'))
+
+    def convert_link(child):
+        # The copy of the model shares the weight arrays with the model.
+        if isinstance(child, (linear_link.Linear,
+                              convolution_2d_link.Convolution2D)) and \
+                id(child.W.data) in hook.max_abs:
+            return _quantize_link(child, hook.max_abs[id(child.W.data)])
+        return None
+
+    ret = model.copy()
+    new = convert_link(ret)
+    if new is not None:
+        return new
+    _replace_links(ret, convert_link)
+    return ret
@@ -214,8 +214,8 @@ class ResNet50Layers(link.Chain):
         x = Variable(self.xp.asarray(x), volatile=flag.ON)
         y = self(x, layers=['prob'])['prob']
         if oversample:
-            n = y.data.shape[0] // 10
-            y_shape = y.data.shape[1:]
+            n = y.shape[0] // 10
+            y_shape = y.shape[1:]
             y = reshape(y, (n, 10) + y_shape)
             y = sum(y, axis=1) / 10
         return y
@@ -379,7 +379,7 @@ class BottleneckB(link.Chain):
 
 
 def _global_average_pooling_2d(x):
-    n, channel, rows, cols = x.data.shape
+    n, channel, rows, cols = x.shape
     h = average_pooling_2d(x, (rows, cols), stride=1)
     h = reshape(h, (n, channel))
     return h
@@ -240,8 +240,8 @@ class VGG16Layers(link.Chain):
         x = Variable(self.xp.asarray(x), volatile=flag.ON)
         y = self(x, layers=['prob'])['prob']
         if oversample:
-            n = y.data.shape[0] // 10
-            y_shape = y.data.shape[1:]
+            n = y.shape[0] // 10
+            y_shape = y.shape[1:]
             y = reshape(y, (n, 10) + y_shape)
             y = sum(y, axis=1) / 10
         return y
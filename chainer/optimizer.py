@@ -5,6 +5,7 @@ import six
 
 from chainer import cuda
 import chainer.link as link_module
+from chainer import profiler
 
 
 def _sum_sqnorm(arr):
@@ -17,6 +18,29 @@ def _sum_sqnorm(arr):
     return sum([float(i) for i in six.itervalues(sq_sum)])
 
 
+def _all_finite(arr):
+    # Reduces the flags per device so that only one synchronization is needed
+    # for each device.
+    finite = {}
+    for x in arr:
+        with cuda.get_device(x) as dev:
+            xp = cuda.get_array_module(x)
+            f = xp.isfinite(x).all()
+            key = int(dev)
+            finite[key] = f if key not in finite else finite[key] & f
+    return all(bool(f) for f in six.itervalues(finite))
+
+
+def _init_master(param, state):
+    # Adds the single precision master copy of a half precision parameter to
+    # its state, and casts the other states to single precision.
+    with cuda.get_device(param.data):
+        for key, value in six.iteritems(state):
+            if getattr(value, 'dtype', None) == numpy.float16:
+                state[key] = value.astype(numpy.float32)
+        state['master'] = param.data.astype(numpy.float32)
+
+
 def exponential_decay_noise(xp, shape, dtype, hook, opt):
     """Time-dependent annealed Gaussian noise function from the paper:
 
@@ -98,19 +122,21 @@ class Optimizer(object):
                 states[name] = state
             else:
                 state = states[name]
-                with cuda.get_device(param.data) as dev:
-                    if int(dev) == -1:  # cpu
+                if isinstance(param.data, numpy.ndarray):  # cpu
+                    # no state can be on GPU if CuPy is not available
+                    if cuda.available:
                         for key, value in six.iteritems(state):
                             if isinstance(value, cuda.ndarray):
                                 state[key] = value.get()
-                    else:  # gpu
-                        cupy = cuda.cupy
-                        for key, value in six.iteritems(state):
-                            if isinstance(value, numpy.ndarray):
-                                state[key] = cuda.to_gpu(value)
-                            elif (isinstance(value, cupy.ndarray) and
-                                  value.device != dev):
-                                state[key] = cupy.copy(value)
+                    continue
+                with cuda.get_device(param.data) as dev:  # gpu
+                    cupy = cuda.cupy
+                    for key, value in six.iteritems(state):
+                        if isinstance(value, numpy.ndarray):
+                            state[key] = cuda.to_gpu(value)
+                        elif (isinstance(value, cupy.ndarray) and
+                              value.device != dev):
+                            state[key] = cupy.copy(value)
 
     def init_state(self, param, state):
         """Initializes the optimizer state corresponding to the parameter.
@@ -385,32 +411,111 @@ class GradientMethod(Optimizer):
         :meth:`update_one_gpu`).
 
         """
+        loss_scale = getattr(self, '_loss_scale', None)
         if lossfun is not None:
             use_cleargrads = getattr(self, '_use_cleargrads', False)
-            loss = lossfun(*args, **kwds)
-            if use_cleargrads:
-                self.target.cleargrads()
-            else:
-                self.target.zerograds()
-            loss.backward()
+            with profiler.phase('forward'):
+                loss = lossfun(*args, **kwds)
+            with profiler.phase('backward'):
+                if use_cleargrads:
+                    self.target.cleargrads()
+                else:
+                    self.target.zerograds()
+                if loss_scale is not None:
+                    xp = cuda.get_array_module(loss.data)
+                    loss.grad = xp.full_like(loss.data, loss_scale)
+                loss.backward()
             del loss
 
+        with profiler.phase('optimizer'):
+            self._update_params(loss_scale)
+
+    def _update_params(self, loss_scale):
         # TODO(unno): Some optimizers can skip this process if they does not
         # affect to a parameter when its gradient is zero.
         for name, param in self.target.namedparams():
             if param.grad is None:
-                with cuda.get_device(param.data):
-                    xp = cuda.get_array_module(param.data)
-                    param.grad = xp.zeros_like(param.data)
-
-        self.call_hooks()
-        self.prepare()
-
-        self.t += 1
-        states = self._states
+                if isinstance(param.data, numpy.ndarray):
+                    param.grad = numpy.zeros_like(param.data)
+                else:
+                    with cuda.get_device(param.data):
+                        param.grad = cuda.cupy.zeros_like(param.data)
+
+        if loss_scale is not None:
+            finite = _all_finite([p.grad for p in self.target.params()])
+            self._update_loss_scale(finite)
+            if not finite:
+                return
+
+        masters = self._swap_in_masters(loss_scale)
+        try:
+            self.call_hooks()
+            self.prepare()
+
+            self.t += 1
+            states = self._states
+            for name, param in self.target.namedparams():
+                if isinstance(param.data, numpy.ndarray):
+                    self.update_one(param, states[name])
+                else:
+                    with cuda.get_device(param.data):
+                        self.update_one(param, states[name])
+        finally:
+            self._swap_out_masters(masters)
+
+    def _swap_in_masters(self, loss_scale):
+        # Replaces the arrays of half precision parameters by their single
+        # precision master copies (if enabled) and unscales the gradients, so
+        # that hooks and update rules work on the master copies as usual.
+        use_fp32_update = getattr(self, '_use_fp32_update', False)
+        masters = []
+        if not use_fp32_update and loss_scale is None:
+            return masters
         for name, param in self.target.namedparams():
             with cuda.get_device(param.data):
-                self.update_one(param, states[name])
+                if not (use_fp32_update and
+                        param.data.dtype == numpy.float16):
+                    if loss_scale is not None:
+                        param.grad *= 1.0 / loss_scale
+                    continue
+
+                state = self._states.get(name, {})
+                if 'master' not in state:
+                    _init_master(param, state)
+                master = state['master']
+                if isinstance(param.data, numpy.ndarray):
+                    master = cuda.to_cpu(master)
+                else:
+                    master = cuda.to_gpu(master)
+                grad = param.grad.astype(numpy.float32)
+                if loss_scale is not None:
+                    grad *= 1.0 / loss_scale
+                masters.append((name, param, param.data, param.grad))
+                param.data = master
+                param.grad = grad
+        return masters
+
+    def _swap_out_masters(self, masters):
+        for name, param, data, grad in masters:
+            with cuda.get_device(data):
+                if name in self._states:
+                    self._states[name]['master'] = param.data
+                data[...] = param.data
+                grad[...] = param.grad
+                param.data = data
+                param.grad = grad
+
+    def _update_loss_scale(self, finite):
+        if not self._dynamic_loss_scale:
+            return
+        if finite:
+            self._n_finite_steps += 1
+            if self._n_finite_steps >= self._loss_scale_interval:
+                self._loss_scale *= 2.0
+                self._n_finite_steps = 0
+        else:
+            self._loss_scale = max(self._loss_scale / 2.0, 1.0)
+            self._n_finite_steps = 0
 
     def update_one(self, param, state):
         """Updates a parameter based on the corresponding gradient and state.
@@ -465,6 +570,81 @@ class GradientMethod(Optimizer):
         """
         self._use_cleargrads = use
 
+    def use_fp32_update(self, flag=True):
+        """Enables or disables single precision master copies of parameters.
+
+        When enabled, each parameter of type :class:`numpy.float16` gets a
+        :class:`numpy.float32` master copy stored in its state dictionary.
+        The gradient is cast to single precision, and hook functions and the
+        update rule work on the master copy, whose optimizer states are hence
+        also allocated in single precision. The updated master copy is then
+        cast back to the parameter array. This keeps small updates that would
+        be rounded off in half precision.
+
+        The master copies are initialized from the parameters at the first
+        update or serialization, and saved and loaded with the optimizer
+        states. To resume the training, enable this feature before loading
+        the optimizer, so that the master copies and the single precision
+        states are loaded without rounding.
+
+        Args:
+            flag (bool): If ``True``, this function enables the master copies.
+
+        .. seealso:: :meth:`use_loss_scaling`, :meth:`chainer.Link.astype`
+
+        """
+        self._use_fp32_update = flag
+
+    def use_loss_scaling(self, scale=2.0 ** 15, dynamic=True, interval=1000):
+        """Enables loss scaling.
+
+        With loss scaling, the gradient of the loss is initialized by
+        ``scale`` instead of one in :meth:`update`, so that small gradients do
+        not underflow in half precision backward computation. The parameter
+        gradients are divided by the scale before the hook functions are
+        invoked. If any gradient contains an infinite value or NaN, the update
+        is skipped; in this case :attr:`t` is not incremented.
+
+        If ``dynamic`` is ``True``, the scale is halved on every skipped
+        update, and doubled after ``interval`` consecutive updates without
+        overflow. The current scale is available as :attr:`loss_scale`.
+
+        If :meth:`update` is called without a loss function, the gradients
+        must have been computed from the loss multiplied by
+        :attr:`loss_scale`.
+
+        Args:
+            scale (float): Initial loss scale. ``None`` disables loss scaling.
+            dynamic (bool): If ``True``, the scale is adjusted automatically.
+            interval (int): Number of updates without overflow after which
+                the scale is doubled.
+
+        """
+        self._loss_scale = scale
+        self._dynamic_loss_scale = dynamic
+        self._loss_scale_interval = interval
+        self._n_finite_steps = 0
+
+    @property
+    def loss_scale(self):
+        """Current loss scale, or ``None`` if loss scaling is disabled."""
+        return getattr(self, '_loss_scale', None)
+
+    def serialize(self, serializer):
+        if getattr(self, '_use_fp32_update', False):
+            # the master copies and the single precision states must exist
+            # before loading them
+            for name, param in self.target.namedparams():
+                state = self._states.get(name)
+                if (state is not None and 'master' not in state and
+                        param.data.dtype == numpy.float16):
+                    _init_master(param, state)
+        super(GradientMethod, self).serialize(serializer)
+        if self.loss_scale is not None:
+            self._loss_scale = serializer('loss_scale', self._loss_scale)
+            self._n_finite_steps = serializer(
+                'n_finite_steps', self._n_finite_steps)
+
 
 class WeightDecay(object):
     """Optimizer hook function for weight decay regularization.
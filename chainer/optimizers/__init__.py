@@ -1,21 +1,17 @@
-from chainer.optimizers import ada_delta  # NOQA
-from chainer.optimizers import ada_grad  # NOQA
-from chainer.optimizers import adam  # NOQA
-from chainer.optimizers import momentum_sgd  # NOQA
-from chainer.optimizers import nesterov_ag  # NOQA
-from chainer.optimizers import rmsprop  # NOQA
-from chainer.optimizers import rmsprop_graves  # NOQA
-from chainer.optimizers import sgd  # NOQA
-from chainer.optimizers import smorms3  # NOQA
+from chainer.utils import lazy_import
 
 
-# import class and function
-from chainer.optimizers.ada_delta import AdaDelta  # NOQA
-from chainer.optimizers.ada_grad import AdaGrad  # NOQA
-from chainer.optimizers.adam import Adam  # NOQA
-from chainer.optimizers.momentum_sgd import MomentumSGD  # NOQA
-from chainer.optimizers.nesterov_ag import NesterovAG  # NOQA
-from chainer.optimizers.rmsprop import RMSprop  # NOQA
-from chainer.optimizers.rmsprop_graves import RMSpropGraves  # NOQA
-from chainer.optimizers.sgd import SGD  # NOQA
-from chainer.optimizers.smorms3 import SMORMS3  # NOQA
+lazy_import.replace_module(__name__, {
+    '.': [
+        'ada_delta', 'ada_grad', 'adam', 'momentum_sgd', 'nesterov_ag',
+        'rmsprop', 'rmsprop_graves', 'sgd', 'smorms3'],
+    '.ada_delta': ['AdaDelta'],
+    '.ada_grad': ['AdaGrad'],
+    '.adam': ['Adam'],
+    '.momentum_sgd': ['MomentumSGD'],
+    '.nesterov_ag': ['NesterovAG'],
+    '.rmsprop': ['RMSprop'],
+    '.rmsprop_graves': ['RMSpropGraves'],
+    '.sgd': ['SGD'],
+    '.smorms3': ['SMORMS3'],
+})
@@ -0,0 +1,156 @@
+import threading
+import time
+
+from chainer import cuda
+
+
+class PhaseTimer(object):
+
+    """Accumulator of the wall-clock time spent in the phases of training.
+
+    The training loop and the updaters mark their phases, e.g. waiting for the
+    dataset iterator, the forward and backward computations and the optimizer
+    step, by :func:`phase`. While a timer object is current, the time spent
+    in each phase is added to it; otherwise :func:`phase` does nothing, so
+    that the marks cost almost nothing unless the time is measured.
+
+    The phases are exclusive: while a phase is nested in another one, the time
+    is only added to the inner phase. The current timer is kept for each
+    thread, so the phases run in other threads (e.g. the evaluation by
+    :class:`~chainer.training.extensions.BackgroundEvaluator`) are not timed.
+
+    The timer is made current by :meth:`start` or by the ``with`` statement.
+    :class:`~chainer.training.extensions.ProfileReport` uses it to report the
+    breakdown of the time of the training loop.
+
+    Args:
+        synchronize (bool): If ``True``, the default CUDA stream is
+            synchronized at the boundaries of the phases, so that the time of
+            asynchronous kernels is added to the phase that launched them. It
+            makes the training slower.
+
+    Attributes:
+        times (dict): A mapping from phase names to the accumulated time in
+            seconds.
+
+    """
+
+    def __init__(self, synchronize=False):
+        self.synchronize = synchronize
+        self.times = {}
+        # names and start times of the running phases
+        self._running = []
+
+    def __enter__(self):
+        self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """Makes this timer current."""
+        _get_timers().append(self)
+
+    def stop(self):
+        """Recovers the previous timer to the current."""
+        timers = _get_timers()
+        if self in timers:
+            timers.remove(self)
+
+    def reset(self):
+        """Clears the accumulated time.
+
+        Returns:
+            dict: The accumulated time before the reset.
+
+        """
+        times = self.times
+        self.times = {}
+        return times
+
+    def _now(self):
+        if self.synchronize and cuda.available:
+            cuda.Stream.null.synchronize()
+        return time.time()
+
+    def _add(self, now):
+        entry = self._running[-1]
+        self.times[entry[0]] = self.times.get(entry[0], 0.) + now - entry[1]
+        entry[1] = now
+
+    def _enter(self, name):
+        now = self._now()
+        if self._running:
+            self._add(now)
+        self._running.append([name, now])
+
+    def _exit(self):
+        now = self._now()
+        self._add(now)
+        self._running.pop()
+        if self._running:
+            self._running[-1][1] = now
+
+
+class _Phase(object):
+
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.timer._enter(self.name)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.timer._exit()
+
+
+class _NullPhase(object):
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+
+_null_phase = _NullPhase()
+_thread_local = threading.local()
+
+
+def _get_timers():
+    try:
+        return _thread_local.timers
+    except AttributeError:
+        timers = _thread_local.timers = []
+        return timers
+
+
+def get_current_timer():
+    """Returns the current timer object, or ``None`` if there is no one."""
+    timers = _get_timers()
+    return timers[-1] if timers else None
+
+
+def phase(name):
+    """Returns a context to time a phase of training.
+
+    The time spent in the ``with`` statement is added to the current
+    :class:`PhaseTimer` under the given name. If there is no current timer,
+    the returned context does nothing.
+
+    .. admonition:: Example
+
+       The time of a forward computation is timed as follows::
+
+          with chainer.profiler.phase('forward'):
+              loss = model(x, t)
+
+    Args:
+        name (str): Name of the phase.
+
+    """
+    timers = _get_timers()
+    if not timers:
+        return _null_phase
+    return _Phase(timers[-1], name)
@@ -1,5 +1,6 @@
 import collections
 import contextlib
+import threading
 
 import numpy
 import six
@@ -63,11 +64,11 @@ class Reporter(object):
 
     def __enter__(self):
         """Makes this reporter object current."""
-        _reporters.append(self)
+        _get_reporters().append(self)
 
     def __exit__(self, exc_type, exc_value, traceback):
         """Recovers the previous reporter object to the current."""
-        _reporters.pop()
+        _get_reporters().pop()
 
     @contextlib.contextmanager
     def scope(self, observation):
@@ -87,9 +88,11 @@ class Reporter(object):
         old = self.observation
         self.observation = observation
         self.__enter__()
-        yield
-        self.__exit__(None, None, None)
-        self.observation = old
+        try:
+            yield
+        finally:
+            self.__exit__(None, None, None)
+            self.observation = old
 
     def add_observer(self, name, observer):
         """Registers an observer of values.
@@ -146,12 +149,22 @@ class Reporter(object):
             self.observation.update(values)
 
 
-_reporters = []
+# The stack of current reporters is kept for each thread, so that an
+# evaluation in a background thread does not interfere with the training.
+_thread_local = threading.local()
+
+
+def _get_reporters():
+    try:
+        return _thread_local.reporters
+    except AttributeError:
+        reporters = _thread_local.reporters = []
+        return reporters
 
 
 def get_current_reporter():
     """Returns the current reporter object."""
-    return _reporters[-1]
+    return _get_reporters()[-1]
 
 
 def report(values, observer=None):
@@ -202,8 +215,9 @@ def report(values, observer=None):
             of the observed value.
 
     """
-    if _reporters:
-        current = _reporters[-1]
+    reporters = _get_reporters()
+    if reporters:
+        current = reporters[-1]
         current.report(values, observer)
 
 
@@ -215,11 +229,13 @@ def report_scope(observation):
     except that it does not make the reporter current redundantly.
 
     """
-    current = _reporters[-1]
+    current = _get_reporters()[-1]
     old = current.observation
     current.observation = observation
-    yield
-    current.observation = old
+    try:
+        yield
+    finally:
+        current.observation = old
 
 
 def _get_device(x):
@@ -1,12 +1,10 @@
-from chainer.serializers import hdf5  # NOQA
-from chainer.serializers import npz  # NOQA
+from chainer.utils import lazy_import
 
 
-from chainer.serializers.hdf5 import HDF5Deserializer  # NOQA
-from chainer.serializers.hdf5 import HDF5Serializer  # NOQA
-from chainer.serializers.hdf5 import load_hdf5  # NOQA
-from chainer.serializers.hdf5 import save_hdf5  # NOQA
-from chainer.serializers.npz import DictionarySerializer  # NOQA
-from chainer.serializers.npz import load_npz  # NOQA
-from chainer.serializers.npz import NpzDeserializer  # NOQA
-from chainer.serializers.npz import save_npz  # NOQA
+lazy_import.replace_module(__name__, {
+    '.': ['hdf5', 'npz'],
+    '.hdf5': ['HDF5Deserializer', 'HDF5Serializer', 'load_hdf5', 'save_hdf5'],
+    '.npz': [
+        'DictionarySerializer', 'load_npz', 'NpzDeserializer', 'NpzFile',
+        'save_npz', 'savez_compressed'],
+})
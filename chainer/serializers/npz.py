@@ -1,9 +1,333 @@
+import io
+import multiprocessing
+from multiprocessing import pool
+import struct
+import time
+import zipfile
+import zlib
+
 import numpy
+from numpy.lib import format
+import six
 
 from chainer import cuda
 from chainer import serializer
 
 
+# Each array is deflated in chunks of this size, each of which is compressed
+# independently and ends at a byte boundary, so that the chunks of a member of
+# the zip file form one deflate stream readable by any zip reader.
+_CHUNK_SIZE = 1 << 22
+_MAX_CHUNKS = 4096
+# ID of the extra field of the central directory that stores the size of the
+# chunks of the data and their compressed sizes, which are used to inflate the
+# chunks in parallel.
+_CHUNKS_EXTRA_ID = 0x4843
+_ZIP64_LIMIT = 0x7fffffff
+
+
+def _n_threads(n_threads):
+    if n_threads is None:
+        return multiprocessing.cpu_count()
+    if n_threads < 1:
+        raise ValueError('n_threads must be positive')
+    return n_threads
+
+
+def _imap(func, tasks, n_threads):
+    # Maps the function in order by a thread pool, which runs in parallel
+    # since zlib releases the GIL.
+    if n_threads == 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield func(task)
+        return
+    thread_pool = pool.ThreadPool(n_threads)
+    try:
+        for result in thread_pool.imap(func, tasks):
+            yield result
+    finally:
+        thread_pool.terminate()
+
+
+def _deflate(task):
+    data, level, last = task
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    flush = zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH
+    return compressor.compress(data) + compressor.flush(flush)
+
+
+def _inflate(task):
+    data, out = task
+    inflated = zlib.decompressobj(-zlib.MAX_WBITS).decompress(data)
+    if len(inflated) != len(out):
+        raise ValueError('corrupted chunk in NPZ file')
+    out[...] = numpy.frombuffer(inflated, dtype=numpy.uint8)
+
+
+def _npy_chunks(array):
+    # Splits the NPY representation of an array into the header and the chunks
+    # of the data, which are views of the array.
+    header = io.BytesIO()
+    if array.dtype.hasobject:
+        format.write_array(header, array)
+        return [header.getvalue()], 0
+    if not array.flags.c_contiguous:
+        array = array.copy()
+    d = format.header_data_from_array_1_0(array)
+    try:
+        format.write_array_header_1_0(header, d)
+    except ValueError:
+        header = io.BytesIO()
+        format.write_array_header_2_0(header, d)
+    data = array.reshape(-1).view(numpy.uint8)
+    chunk_size = max(_CHUNK_SIZE, -(-len(data) // _MAX_CHUNKS))
+    return [header.getvalue()] + [data[i:i + chunk_size]
+                                  for i in six.moves.range(
+                                      0, len(data), chunk_size)], chunk_size
+
+
+def _dos_time():
+    t = time.localtime()
+    return ((t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2),
+            ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday)
+
+
+def savez_compressed(file, arrays, level=6, n_threads=None):
+    """Saves arrays to a compressed NPZ file by multiple threads.
+
+    This function writes a file in the same format as
+    :func:`numpy.savez_compressed`, which can be read by :func:`numpy.load`.
+    Each array is compressed in chunks on a thread pool, which is much faster
+    than :func:`numpy.savez_compressed` for large arrays on a multi-core
+    machine. The compressed sizes of the chunks are also stored in the file,
+    so that :class:`NpzFile` decompresses them in parallel.
+
+    Args:
+        file (str or file): Name of the file or a writable and seekable file
+            object.
+        arrays (dict): Dictionary of the arrays to save.
+        level (int): Compression level of zlib from 1 (fastest) to 9 (best
+            compression).
+        n_threads (int): Number of the threads. The number of the CPUs is
+            used by default.
+
+    """
+    n_threads = _n_threads(n_threads)
+    if isinstance(file, six.string_types):
+        with open(file, 'wb') as f:
+            savez_compressed(f, arrays, level, n_threads)
+        return
+
+    members = [(key + '.npy',) + _npy_chunks(numpy.asarray(value))
+               for key, value in six.iteritems(arrays)]
+    tasks = [(chunk, level, i == len(chunks) - 1)
+             for _, chunks, _ in members for i, chunk in enumerate(chunks)]
+    compressed = _imap(_deflate, tasks, n_threads)
+    dos_time, dos_date = _dos_time()
+
+    entries = []
+    start = file.tell()
+    for name, chunks, chunk_size in members:
+        name = name.encode('utf-8')
+        size = sum(len(chunk) for chunk in chunks)
+        # The compressed size can be slightly larger than the original size.
+        zip64 = size + size // 100 + 1024 > _ZIP64_LIMIT
+        offset = file.tell()
+        file.write(b'\0' * (30 + len(name) + (20 if zip64 else 0)))
+
+        crc = 0
+        sizes = []
+        for chunk in chunks:
+            crc = zlib.crc32(chunk, crc)
+            data = next(compressed)
+            file.write(data)
+            sizes.append(len(data))
+        crc &= 0xffffffff
+        compressed_size = sum(sizes)
+        end = file.tell()
+
+        file.seek(offset)
+        file.write(_local_header(name, crc, compressed_size, size, zip64,
+                                 dos_time, dos_date))
+        file.seek(end)
+        entries.append((name, crc, compressed_size, size, offset - start,
+                        chunk_size, sizes))
+
+    _write_central_directory(file, entries, start, dos_time, dos_date)
+
+
+def _local_header(name, crc, compressed_size, size, zip64, dos_time,
+                  dos_date):
+    extra = b''
+    version = 20
+    if zip64:
+        extra = struct.pack('<HHQQ', 1, 16, size, compressed_size)
+        size = compressed_size = 0xffffffff
+        version = 45
+    return struct.pack(
+        '<4s2B4HL2L2H', b'PK\x03\x04', version, 0, 0, zipfile.ZIP_DEFLATED,
+        dos_time, dos_date, crc, compressed_size, size, len(name),
+        len(extra)) + name + extra
+
+
+def _write_central_directory(file, entries, start, dos_time, dos_date):
+    directory_offset = file.tell() - start
+    for name, crc, compressed_size, size, offset, chunk_size, sizes in entries:
+        zip64 = []
+        if size > _ZIP64_LIMIT:
+            zip64.append(size)
+            size = 0xffffffff
+        if compressed_size > _ZIP64_LIMIT:
+            zip64.append(compressed_size)
+            compressed_size = 0xffffffff
+        if offset > _ZIP64_LIMIT:
+            zip64.append(offset)
+            offset = 0xffffffff
+        extra = b''
+        if zip64:
+            extra += struct.pack('<HH%dQ' % len(zip64), 1, 8 * len(zip64),
+                                 *zip64)
+        extra += struct.pack('<HHQ%dL' % len(sizes), _CHUNKS_EXTRA_ID,
+                             8 + 4 * len(sizes), chunk_size, *sizes)
+        version = 45 if zip64 else 20
+        file.write(struct.pack(
+            '<4s4B4HL2L5H2L', b'PK\x01\x02', version, 3, version, 0, 0,
+            zipfile.ZIP_DEFLATED, dos_time, dos_date, crc, compressed_size,
+            size, len(name), len(extra), 0, 0, 0, 0o644 << 16, offset))
+        file.write(name)
+        file.write(extra)
+
+    directory_end = file.tell() - start
+    directory_size = directory_end - directory_offset
+    n_entries = len(entries)
+    if (n_entries >= 0xffff or directory_offset > _ZIP64_LIMIT or
+            directory_size > _ZIP64_LIMIT):
+        file.write(struct.pack(
+            '<4sQ2H2L4Q', b'PK\x06\x06', 44, 45, 45, 0, 0, n_entries,
+            n_entries, directory_size, directory_offset))
+        file.write(struct.pack('<4sLQL', b'PK\x06\x07', 0, directory_end, 1))
+        n_entries = min(n_entries, 0xffff)
+        directory_offset = min(directory_offset, 0xffffffff)
+        directory_size = min(directory_size, 0xffffffff)
+    file.write(struct.pack(
+        '<4s4H2LH', b'PK\x05\x06', 0, 0, n_entries, n_entries,
+        directory_size, directory_offset, 0))
+
+
+def _chunks_info(extra):
+    # Finds the size of the chunks and their compressed sizes in the extra
+    # field.
+    i = 0
+    while i + 4 <= len(extra):
+        tp, length = struct.unpack('<HH', extra[i:i + 4])
+        if tp == _CHUNKS_EXTRA_ID:
+            info = struct.unpack('<Q%dL' % ((length - 8) // 4),
+                                 extra[i + 4:i + 4 + length])
+            return info[0], info[1:]
+        i += 4 + length
+    return None
+
+
+class NpzFile(object):
+
+    """NPZ file whose arrays are decompressed by multiple threads.
+
+    This is a replacement of the object returned by :func:`numpy.load` for an
+    NPZ file. The arrays saved by :func:`savez_compressed` are decompressed in
+    chunks on a thread pool. The other arrays are read as
+    :func:`numpy.load` does. Each array is read when it is accessed by its
+    key.
+
+    Args:
+        file (str or file): Name of the file or a readable and seekable file
+            object.
+        n_threads (int): Number of the threads. The number of the CPUs is
+            used by default.
+
+    Attributes:
+        files (list of str): Keys of the arrays.
+
+    """
+
+    def __init__(self, file, n_threads=None):
+        self._n_threads = _n_threads(n_threads)
+        self._zip = zipfile.ZipFile(file)
+        self._infos = {}
+        for info in self._zip.infolist():
+            key = info.filename
+            if key.endswith('.npy'):
+                key = key[:-4]
+            self._infos[key] = info
+        self.files = list(self._infos)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Closes the file."""
+        self._zip.close()
+
+    def keys(self):
+        return list(self.files)
+
+    def __iter__(self):
+        return iter(self.files)
+
+    def __len__(self):
+        return len(self.files)
+
+    def __contains__(self, key):
+        return key in self._infos
+
+    def __getitem__(self, key):
+        info = self._infos[key]
+        chunks_info = None
+        if info.compress_type == zipfile.ZIP_DEFLATED:
+            chunks_info = _chunks_info(info.extra)
+        if chunks_info is None:
+            with self._zip.open(info) as f:
+                return format.read_array(f)
+        chunk_size, sizes = chunks_info
+
+        fp = self._zip.fp
+        fp.seek(info.header_offset)
+        header = fp.read(30)
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        fp.seek(info.header_offset + 30 + name_length + extra_length)
+        data = numpy.frombuffer(fp.read(info.compress_size), numpy.uint8)
+        offsets = numpy.cumsum((0,) + sizes)
+        chunks = [data[begin:end]
+                  for begin, end in six.moves.zip(offsets[:-1], offsets[1:])]
+
+        npy = zlib.decompressobj(-zlib.MAX_WBITS).decompress(chunks[0])
+        crc = zlib.crc32(npy)
+        if len(chunks) == 1:
+            array = format.read_array(io.BytesIO(npy))
+        else:
+            header = io.BytesIO(npy)
+            version = format.read_magic(header)
+            if version == (1, 0):
+                shape, fortran_order, dtype = format.read_array_header_1_0(
+                    header)
+            else:
+                shape, fortran_order, dtype = format.read_array_header_2_0(
+                    header)
+            array = numpy.empty(shape, dtype,
+                                order='F' if fortran_order else 'C')
+            out = array.reshape(-1, order='A').view(numpy.uint8)
+            tasks = [(chunk, out[i * chunk_size:(i + 1) * chunk_size])
+                     for i, chunk in enumerate(chunks[1:])]
+            for _ in _imap(_inflate, tasks, self._n_threads):
+                pass
+            crc = zlib.crc32(out, crc)
+        if crc & 0xffffffff != info.CRC:
+            raise ValueError('bad CRC of {} in NPZ file'.format(key))
+        return array
+
+
 class DictionarySerializer(serializer.Serializer):
 
     """Serializer for dictionary.
@@ -51,23 +375,31 @@ class DictionarySerializer(serializer.Serializer):
         return ret
 
 
-def save_npz(filename, obj, compression=True):
+def save_npz(filename, obj, compression=True, n_threads=None):
     """Saves an object to the file in NPZ format.
 
     This is a short-cut function to save only one object into an NPZ file.
+    The arrays are compressed by multiple threads with
+    :func:`savez_compressed`.
 
     Args:
         filename (str): Target file name.
         obj: Object to be serialized. It must support serialization protocol.
-        compression (bool): If ``True``, compression in the resulting zip file
-            is enabled.
+        compression (bool or int): If ``True``, compression in the resulting
+            zip file is enabled. If it is an integer, it is used as the
+            compression level of zlib from 1 (fastest) to 9 (best
+            compression), and ``0`` disables the compression.
+        n_threads (int): Number of the threads to compress the arrays. The
+            number of the CPUs is used by default.
 
     """
     s = DictionarySerializer()
     s.save(obj)
     with open(filename, 'wb') as f:
-        if compression:
-            numpy.savez_compressed(f, **s.target)
+        if compression is True:
+            savez_compressed(f, s.target, n_threads=n_threads)
+        elif compression:
+            savez_compressed(f, s.target, compression, n_threads)
         else:
             numpy.savez(f, **s.target)
 
@@ -114,17 +446,19 @@ class NpzDeserializer(serializer.Deserializer):
         return value
 
 
-def load_npz(filename, obj):
+def load_npz(filename, obj, n_threads=None):
     """Loads an object from the file in NPZ format.
 
     This is a short-cut function to load from an `.npz` file that contains only
-    one object.
+    one object. The arrays are read by :class:`NpzFile`.
 
     Args:
         filename (str): Name of the file to be loaded.
         obj: Object to be deserialized. It must support serialization protocol.
+        n_threads (int): Number of the threads to decompress the arrays. The
+            number of the CPUs is used by default.
 
     """
-    with numpy.load(filename) as f:
+    with NpzFile(filename, n_threads) as f:
         d = NpzDeserializer(f)
         d.load(obj)
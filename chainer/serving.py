@@ -0,0 +1,386 @@
+import collections
+import threading
+import time
+
+import numpy
+import six
+from six.moves import queue
+
+from chainer import cuda
+from chainer.dataset import convert
+from chainer import function
+from chainer import variable
+
+
+class Request(object):
+
+    """Pending prediction of an example submitted to :class:`BatchingServer`.
+
+    Attributes:
+        example: The submitted example.
+        submitted_at (float): Time when the example was submitted.
+
+    """
+
+    def __init__(self, example):
+        self.example = example
+        self.submitted_at = time.time()
+        self._event = threading.Event()
+        self._result = None
+        self._exception = None
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def done(self):
+        """Returns ``True`` if the result is available."""
+        return self._event.is_set()
+
+    def result(self, timeout=None):
+        """Waits for the result and returns it.
+
+        Args:
+            timeout (float): Maximum time to wait in seconds. If it is
+                ``None``, this method waits forever.
+
+        Returns:
+            The output of the model for the example. If the prediction has
+            failed, the exception raised by the model is raised again.
+
+        """
+        if not self._event.wait(timeout):
+            raise RuntimeError('timed out waiting for the result')
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def add_done_callback(self, callback):
+        """Registers a function called with this request when it is done.
+
+        The callback is called from the worker thread of the server, or
+        immediately if the request is already done.
+
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def _set(self, result=None, exception=None):
+        with self._lock:
+            self._result = result
+            self._exception = exception
+            self._event.set()
+            callbacks = self._callbacks
+            self._callbacks = []
+        for callback in callbacks:
+            callback(self)
+
+
+def _scatter(outputs, n):
+    # Splits the batched outputs into the outputs of each example.
+    if isinstance(outputs, variable.Variable):
+        outputs = outputs.data
+    if isinstance(outputs, tuple):
+        return list(six.moves.zip(*[_scatter(y, n) for y in outputs]))
+    if isinstance(outputs, dict):
+        keys = list(outputs)
+        values = [_scatter(outputs[key], n) for key in keys]
+        return [dict(six.moves.zip(keys, v))
+                for v in six.moves.zip(*values)]
+    outputs = cuda.to_cpu(outputs)
+    if len(outputs) != n:
+        raise ValueError(
+            'the batch size of the outputs does not match: {} != {}'.format(
+                len(outputs), n))
+    return list(outputs)
+
+
+class BatchingServer(object):
+
+    """In-process server that runs a model on dynamically formed batches.
+
+    This class accepts individual examples from many threads, coalesces them
+    into batches, runs the model once per batch, and scatters the outputs
+    back to the requests. A batch is formed when ``max_batch_size`` examples
+    are waiting or when the oldest waiting example has waited for
+    ``max_latency`` seconds, whichever comes first.
+
+    Each batch is converted by ``converter`` as in
+    :class:`~chainer.training.extensions.Evaluator`, and ``predict`` is
+    called with the resulting arrays in :func:`~chainer.no_backprop_mode`.
+    The outputs of ``predict`` must be a :class:`~chainer.Variable` or an
+    array whose first axis is the batch axis, or a tuple or dictionary of
+    them. They are sent to CPU and split into the outputs of each example.
+
+    The server runs a worker thread between :meth:`start` and :meth:`stop`.
+    It can also be used as a context manager.
+
+    .. admonition:: Example
+
+       >>> from chainer import serving
+       >>> model = L.Classifier(L.Linear(3, 2))
+       >>> with serving.BatchingServer(model.predictor) as server:
+       ...     y = server.predict(np.zeros(3, 'f'))
+       >>> y.shape
+       (2,)
+
+    Args:
+        predict (callable): Function that computes the outputs of a batch,
+            e.g. a :class:`~chainer.Link`.
+        max_batch_size (int): Maximum number of examples in a batch.
+        max_latency (float): Maximum time in seconds that an example waits
+            for other examples to form a batch.
+        converter: Converter function to build input arrays from a list of
+            examples. :func:`~chainer.dataset.concat_examples` is used by
+            default.
+        device: Device to which the input arrays are sent by ``converter``.
+        window (int): Number of the latest requests used to compute the
+            statistics.
+
+    """
+
+    def __init__(self, predict, max_batch_size=32, max_latency=0.005,
+                 converter=convert.concat_examples, device=None,
+                 window=1000):
+        if max_batch_size < 1:
+            raise ValueError('max_batch_size must be positive')
+        self.predict_batch = predict
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.converter = converter
+        self.device = device
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._stopping = False
+        # guards the enqueueing of requests against stop, so that no request
+        # is enqueued behind the sentinel
+        self._lock = threading.Lock()
+        self._latencies = collections.deque(maxlen=window)
+        self._batch_sizes = collections.deque(maxlen=window)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        """Starts the worker thread."""
+        if self._thread is not None:
+            raise RuntimeError('the server is already running')
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stops the worker thread after processing the waiting examples."""
+        if self._thread is None:
+            return
+        with self._lock:
+            self._stopping = True
+            self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def submit(self, example):
+        """Submits an example.
+
+        Args:
+            example: Example in the same form as those of the dataset passed
+                to ``converter``.
+
+        Returns:
+            Request: The pending prediction of the example.
+
+        """
+        with self._lock:
+            if self._thread is None or self._stopping:
+                raise RuntimeError('the server is not running')
+            request = Request(example)
+            self._queue.put(request)
+        return request
+
+    def predict(self, example, timeout=None):
+        """Submits an example and waits for its outputs.
+
+        Args:
+            example: Example to predict.
+            timeout (float): Maximum time to wait in seconds.
+
+        Returns:
+            The outputs of the model for the example.
+
+        """
+        return self.submit(example).result(timeout)
+
+    def submit_asyncio(self, example, loop=None):
+        """Submits an example from an :mod:`asyncio` event loop.
+
+        Args:
+            example: Example to predict.
+            loop: Event loop on which the returned future is resolved. The
+                default event loop is used if it is ``None``.
+
+        Returns:
+            asyncio.Future: Future of the outputs of the model for the
+            example, which can be awaited in the loop.
+
+        """
+        import asyncio
+
+        loop = loop or asyncio.get_event_loop()
+        future = loop.create_future()
+
+        def callback(request):
+            loop.call_soon_threadsafe(_resolve, future, request)
+
+        self.submit(example).add_done_callback(callback)
+        return future
+
+    @property
+    def queue_depth(self):
+        """Number of examples waiting to be batched."""
+        return self._queue.qsize()
+
+    def latency_percentiles(self, percentiles=(50, 90, 99)):
+        """Returns the percentiles of the latencies of the latest requests.
+
+        The latency of a request is the time from its submission to the
+        availability of its result.
+
+        Args:
+            percentiles (tuple of floats): Percentiles to compute.
+
+        Returns:
+            dict: Dictionary that maps each percentile to the latency in
+            seconds. It is empty if no request has been processed.
+
+        """
+        latencies = list(self._latencies)
+        if not latencies:
+            return {}
+        values = numpy.percentile(latencies, percentiles)
+        return dict(six.moves.zip(percentiles, values))
+
+    def statistics(self):
+        """Returns the statistics of the server.
+
+        Returns:
+            dict: Dictionary with the following entries.
+
+            - ``'queue_depth'``: Number of waiting examples.
+            - ``'batch_size'``: Mean size of the latest batches.
+            - ``'latency/<p>'``: Percentiles of the latency in seconds for
+              50, 90 and 99.
+
+        """
+        stats = {'queue_depth': self.queue_depth}
+        if self._batch_sizes:
+            stats['batch_size'] = numpy.mean(list(self._batch_sizes))
+        for p, latency in six.iteritems(self.latency_percentiles()):
+            stats['latency/{}'.format(p)] = latency
+        return stats
+
+    def _next_batch(self):
+        # Blocks until a batch is formed. Returns None when stopping.
+        request = self._queue.get()
+        if request is None:
+            return None
+        batch = [request]
+        deadline = request.submitted_at + self.max_latency
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.time()
+            try:
+                if timeout > 0:
+                    request = self._queue.get(timeout=timeout)
+                else:
+                    request = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                # stop after processing this batch and the waiting examples
+                self._queue.put(None)
+                break
+            batch.append(request)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                break
+            self._process(batch)
+
+    def _process(self, batch):
+        try:
+            in_arrays = self.converter([r.example for r in batch],
+                                       self.device)
+            with function.no_backprop_mode():
+                if isinstance(in_arrays, tuple):
+                    outputs = self.predict_batch(*in_arrays)
+                elif isinstance(in_arrays, dict):
+                    outputs = self.predict_batch(**in_arrays)
+                else:
+                    outputs = self.predict_batch(in_arrays)
+            results = _scatter(outputs, len(batch))
+        except Exception as e:
+            for request in batch:
+                request._set(exception=e)
+            return
+
+        now = time.time()
+        self._batch_sizes.append(len(batch))
+        for request, result in six.moves.zip(batch, results):
+            self._latencies.append(now - request.submitted_at)
+            request._set(result=result)
+
+
+def _resolve(future, request):
+    if future.cancelled():
+        return
+    try:
+        future.set_result(request.result())
+    except Exception as e:
+        future.set_exception(e)
+
+
+class LocalClient(object):
+
+    """In-process stand-in of a client of :class:`BatchingServer`.
+
+    This class provides the interface of a remote procedure call client on
+    top of a server in the same process, so that the code of clients can be
+    tested and benchmarked without the RPC layer. The examples are copied
+    on submission as they would be serialized by the RPC layer.
+
+    Args:
+        server (BatchingServer): Server to send the examples to.
+        timeout (float): Maximum time to wait for each result in seconds.
+
+    """
+
+    def __init__(self, server, timeout=None):
+        self.server = server
+        self.timeout = timeout
+
+    def __call__(self, example):
+        """Sends an example and returns its outputs."""
+        return self.server.predict(_copy(example), self.timeout)
+
+    def call_async(self, example):
+        """Sends an example and returns its :class:`Request`."""
+        return self.server.submit(_copy(example))
+
+
+def _copy(example):
+    if isinstance(example, tuple):
+        return tuple(_copy(x) for x in example)
+    if isinstance(example, dict):
+        return {key: _copy(x) for key, x in six.iteritems(example)}
+    if isinstance(example, numpy.ndarray):
+        return example.copy()
+    return example
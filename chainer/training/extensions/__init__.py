@@ -1,27 +1,25 @@
-from chainer.training.extensions import _snapshot  # NOQA
-from chainer.training.extensions import computational_graph  # NOQA
-from chainer.training.extensions import evaluator  # NOQA
-from chainer.training.extensions import exponential_shift  # NOQA
-from chainer.training.extensions import linear_shift  # NOQA
-from chainer.training.extensions import log_report  # NOQA
-from chainer.training.extensions import micro_average  # NOQA
-from chainer.training.extensions import plot_report  # NOQA
-from chainer.training.extensions import print_report  # NOQA
-from chainer.training.extensions import progress_bar  # NOQA
-from chainer.training.extensions import value_observation  # NOQA
+from chainer.utils import lazy_import
 
 
-# import class and function
-from chainer.training.extensions._snapshot import snapshot  # NOQA
-from chainer.training.extensions._snapshot import snapshot_object  # NOQA
-from chainer.training.extensions.computational_graph import dump_graph  # NOQA
-from chainer.training.extensions.evaluator import Evaluator  # NOQA
-from chainer.training.extensions.exponential_shift import ExponentialShift  # NOQA
-from chainer.training.extensions.linear_shift import LinearShift  # NOQA
-from chainer.training.extensions.log_report import LogReport  # NOQA
-from chainer.training.extensions.micro_average import MicroAverage  # NOQA
-from chainer.training.extensions.plot_report import PlotReport  # NOQA
-from chainer.training.extensions.print_report import PrintReport  # NOQA
-from chainer.training.extensions.progress_bar import ProgressBar  # NOQA
-from chainer.training.extensions.value_observation import observe_lr  # NOQA
-from chainer.training.extensions.value_observation import observe_value  # NOQA
+lazy_import.replace_module(__name__, {
+    '.': [
+        '_snapshot', 'background_evaluator', 'batch_size_tuner',
+        'computational_graph', 'evaluator', 'exponential_shift',
+        'linear_shift', 'log_report', 'micro_average', 'plot_report',
+        'print_report', 'profile_report', 'progress_bar', 'util',
+        'value_observation'],
+    '._snapshot': ['snapshot', 'snapshot_object'],
+    '.background_evaluator': ['BackgroundEvaluator'],
+    '.batch_size_tuner': ['BatchSizeTuner'],
+    '.computational_graph': ['dump_graph'],
+    '.evaluator': ['Evaluator'],
+    '.exponential_shift': ['ExponentialShift'],
+    '.linear_shift': ['LinearShift'],
+    '.log_report': ['LogReport'],
+    '.micro_average': ['MicroAverage'],
+    '.plot_report': ['PlotReport'],
+    '.print_report': ['PrintReport'],
+    '.profile_report': ['ProfileReport'],
+    '.progress_bar': ['ProgressBar'],
+    '.value_observation': ['observe_lr', 'observe_value'],
+})
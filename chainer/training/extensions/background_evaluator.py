@@ -0,0 +1,221 @@
+import copy
+import threading
+
+import numpy
+import six
+
+from chainer import cuda
+from chainer.dataset import convert
+from chainer.dataset import iterator as iterator_module
+from chainer import reporter as reporter_module
+from chainer.training.extensions import evaluator
+from chainer.training import trigger as trigger_module
+
+
+class _OneEpochIterator(iterator_module.Iterator):
+
+    # Iterates a repeating iterator until the end of its current epoch. It is
+    # used instead of copying the iterator, so that the worker processes of
+    # MultiprocessIterator are kept across evaluations.
+
+    def __init__(self, iterator):
+        self.iterator = iterator
+        self._done = False
+
+    def __next__(self):
+        if self._done:
+            raise StopIteration
+        batch = self.iterator.next()
+        self._done = self.iterator.is_new_epoch
+        return batch
+
+    next = __next__
+
+    @property
+    def epoch_detail(self):
+        return self.iterator.epoch_detail
+
+
+def _snapshot(target):
+    # Copies the link hierarchy with its own parameter and persistent arrays.
+    ret = target.copy()
+    for link in ret.links():
+        d = link.__dict__
+        for name in link._params:
+            param = d[name]
+            with cuda.get_device(param.data):
+                param.data = param.data.copy()
+        for name in link._persistent:
+            value = d[name]
+            if isinstance(value, (numpy.ndarray, cuda.ndarray)):
+                with cuda.get_device(value):
+                    d[name] = value.copy()
+    return ret
+
+
+class BackgroundEvaluator(evaluator.Evaluator):
+
+    """Trainer extension to evaluate models in a background thread.
+
+    This extension works as :class:`Evaluator`, except that the evaluation
+    runs in a background thread while the training continues. When the
+    evaluation is triggered, the parameters and the persistent values of the
+    target links are copied, and the copy is evaluated in the background.
+    The result is reported to the trainer at the first iteration after the
+    evaluation finishes, together with the following entries that indicate
+    which parameters are evaluated.
+
+    - ``'<name>/epoch'`` and ``'<name>/iteration'`` are the epoch and
+      iteration counts at which the parameters are copied, where ``<name>``
+      is the name of this extension.
+
+    If the evaluation is triggered again before the previous one finishes, it
+    waits for the previous evaluation.
+
+    This extension is invoked at every iteration to check the evaluation, so
+    the interval of the evaluation is given by the ``trigger`` argument
+    instead of the trigger of the extension. The result of an evaluation that
+    finishes after the training loop is not reported to the trainer, but is
+    available in the :attr:`results` attribute.
+
+    If the iterator repeats the dataset, it is not copied at each evaluation;
+    instead, one epoch is read from the iterator itself. It keeps, e.g., the
+    worker processes of :class:`~chainer.iterators.MultiprocessIterator`
+    across evaluations. Note that the last batch of an epoch of such an
+    iterator contains the examples of the next epoch unless the batch size
+    divides the size of the dataset. The iterator is finalized by this
+    extension in that case. Otherwise, the iterator is copied as
+    :class:`Evaluator` does.
+
+    Since the target links are updated concurrently, the evaluation uses the
+    copies of them, which are available by :meth:`get_target` during the
+    evaluation. The evaluation function given by ``eval_func`` must not use
+    the original target links.
+
+    Args:
+        iterator: Dataset iterator for the validation dataset. It can also be
+            a dictionary of iterators. If this is just an iterator, the
+            iterator is registered by the name ``'main'``.
+        target: Link object or a dictionary of links to evaluate. If this is
+            just a link object, the link is registered by the name ``'main'``.
+        converter: Converter function to build input arrays.
+            :func:`~chainer.dataset.concat_examples` is used by default.
+        device: Device to which the training data is sent. Negative value
+            indicates the host memory (CPU).
+        eval_hook: Function to prepare for each evaluation process. It is
+            called at the beginning of the evaluation in the background. The
+            copy of the evaluator extension object is passed at each call.
+        eval_func: Evaluation function called at each iteration. The copy of
+            the target link to evaluate as a callable is used by default.
+        trigger: Trigger that determines when to start the evaluation. It is
+            passed to :func:`~chainer.training.get_trigger`.
+
+    Attributes:
+        results (list): List of the tuples of the epoch and iteration counts
+            and the result dictionary of the finished evaluations.
+
+    """
+    trigger = 1, 'iteration'
+
+    def __init__(self, iterator, target, converter=convert.concat_examples,
+                 device=None, eval_hook=None, eval_func=None,
+                 trigger=(1, 'epoch')):
+        super(BackgroundEvaluator, self).__init__(
+            iterator, target, converter, device, eval_hook, eval_func)
+        self._eval_trigger = trigger_module.get_trigger(trigger)
+        self._thread = None
+        self._finished = []
+        self._lock = threading.Lock()
+        self.results = []
+
+    def __call__(self, trainer=None):
+        """Executes the extension.
+
+        It reports the results of the finished evaluations and starts a new
+        evaluation if the trigger fires. If ``trainer`` is omitted, it
+        evaluates the target links synchronously as :class:`Evaluator` does.
+
+        Args:
+            trainer (~chainer.training.Trainer): Trainer object that invokes
+                this extension.
+
+        """
+        if trainer is None:
+            ev = copy.copy(self)
+            ev._iterators = self._get_epoch_iterators()
+            return super(BackgroundEvaluator, ev).__call__()
+
+        self._report_finished()
+        if self._eval_trigger(trainer):
+            self.wait()
+            self._report_finished()
+            updater = trainer.updater
+            self._start(updater.epoch, updater.iteration)
+
+    def wait(self):
+        """Waits for the running evaluation to finish."""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def finalize(self):
+        self.wait()
+        with self._lock:
+            finished = self._finished
+            self._finished = []
+        self.results.extend(r for r in finished
+                            if not isinstance(r[2], Exception))
+        for iterator in six.itervalues(self._iterators):
+            if getattr(iterator, 'repeat', False) and \
+                    hasattr(iterator, 'finalize'):
+                iterator.finalize()
+
+    def _start(self, epoch, iteration):
+        # The copy of this extension evaluates the copies of the targets.
+        ev = copy.copy(self)
+        ev._targets = {name: _snapshot(target)
+                       for name, target in six.iteritems(self._targets)}
+        ev._iterators = self._get_epoch_iterators()
+
+        def run():
+            if self.device is not None and self.device >= 0:
+                cuda.get_device(self.device).use()
+            reporter = reporter_module.Reporter()
+            prefix = self.name + '/' if hasattr(self, 'name') else ''
+            for name, target in six.iteritems(ev._targets):
+                reporter.add_observer(prefix + name, target)
+                reporter.add_observers(prefix + name,
+                                       target.namedlinks(skipself=True))
+            try:
+                with reporter:
+                    result = ev.evaluate()
+            except Exception as e:
+                # raised again in the training loop
+                result = e
+            with self._lock:
+                self._finished.append((epoch, iteration, result))
+
+        self._thread = threading.Thread(target=run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _get_epoch_iterators(self):
+        iterators = {}
+        for name, iterator in six.iteritems(self._iterators):
+            if getattr(iterator, 'repeat', False):
+                iterator = _OneEpochIterator(iterator)
+            iterators[name] = iterator
+        return iterators
+
+    def _report_finished(self):
+        with self._lock:
+            finished = self._finished
+            self._finished = []
+        prefix = self.name + '/' if hasattr(self, 'name') else ''
+        for epoch, iteration, result in finished:
+            if isinstance(result, Exception):
+                raise result
+            self.results.append((epoch, iteration, result))
+            reporter_module.report(result)
+            reporter_module.report({prefix + 'epoch': epoch,
+                                    prefix + 'iteration': iteration})
@@ -0,0 +1,235 @@
+from __future__ import division
+
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy
+import six
+
+from chainer import cuda
+from chainer import serializer as serializer_module
+from chainer.serializers import npz
+from chainer.training import extension
+
+
+def _reset_peak_rss():
+    # Resets the peak resident set size of this process to the current one.
+    # Returns ``False`` if it is not supported on the platform; the reset of
+    # the high-water mark is available on Linux 4.0 or later.
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+    except (IOError, OSError):
+        return False
+    return True
+
+
+def _get_peak_rss():
+    # Returns the peak resident set size of this process in bytes since the
+    # last reset, or ``None`` if it cannot be measured on the platform.
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except (IOError, OSError, IndexError, ValueError):
+        pass
+    return None
+
+
+def _synchronize():
+    if cuda.available:
+        cuda.Stream.null.synchronize()
+
+
+class BatchSizeTuner(extension.Extension):
+
+    """Trainer extension to choose the batch size by timed probes.
+
+    This extension is invoked once before the training loop starts. It runs
+    short probes of :meth:`Updater.update <chainer.training.Updater.update>`
+    for each combination of candidate batch sizes and iterator settings,
+    measures the throughput in examples per second and the peak resident set
+    size of the process, and reconfigures the iterator in place with the
+    setting of the highest throughput whose peak memory does not exceed
+    ``memory_limit``.
+
+    The whole state of the updater, i.e. the iterators, the optimizers, the
+    target links and the iteration count, is saved before the probes and
+    restored after each probe, so the training starts from the same state as
+    without this extension. Parameters that are initialized lazily at the
+    first forward computation must be initialized before the training starts.
+
+    Each iterator setting is a dictionary of attributes set to the iterator,
+    e.g. ``{'n_processes': 4, 'n_prefetch': 2}`` for
+    :class:`~chainer.iterators.MultiprocessIterator`. The
+    :meth:`~chainer.dataset.Iterator.finalize` method of the iterator is
+    called after changing its attributes, so that the iterators running
+    worker processes restart them with the new setting.
+
+    The memory is measured as the peak resident set size during each probe,
+    i.e. the high-water mark ``VmHWM`` of ``/proc/self/status`` after
+    resetting it through ``/proc/self/clear_refs``, so that temporary arrays
+    freed within an update are also taken into account. The memory of worker
+    processes and devices is not. If the peak cannot be measured on the
+    platform (it requires Linux 4.0 or later), the memory limit is ignored. A
+    candidate that raises :class:`MemoryError` is rejected, and larger batch
+    sizes are not tried with the same iterator setting.
+
+    The measured results are stored in :attr:`results` and written to a log
+    file in JSON format. They are also saved and loaded with the trainer, so
+    that the probes are not repeated when the training is resumed; the chosen
+    setting is applied to the iterator again at the first invocation after
+    resuming.
+
+    The extension does nothing after the first invocation except for the
+    above. Its default trigger is ``(1, 'epoch')`` so that it is not called
+    at every iteration.
+
+    Args:
+        batch_sizes (list of ints): Candidate batch sizes. They are tried in
+            ascending order.
+        iterator_settings (list of dicts): Candidate iterator settings. If it
+            is ``None``, only the current setting is used. Each key must be
+            an existing attribute of the iterator.
+        n_iterations (int): Number of timed updates of each probe.
+        n_warmup (int): Number of updates before the timed ones in each
+            probe.
+        memory_limit (int): Upper limit of the peak resident set size in
+            bytes. If it is ``None``, the memory is not limited.
+        iterator (str): Name of the iterator of the updater to configure.
+        log_name (str): Name of the log file under the output directory. If
+            it is ``None``, no log file is written.
+
+    Attributes:
+        results (list of dicts): Results of the probes. Each of them contains
+            ``'batch_size'``, the iterator setting, ``'throughput'`` in
+            examples per second and ``'memory'`` in bytes.
+        best (dict): The chosen result, or ``None`` if no candidate fits. In
+            the latter case, the original setting of the iterator is kept.
+
+    """
+    trigger = 1, 'epoch'
+    invoke_before_training = True
+    priority = extension.PRIORITY_WRITER
+
+    def __init__(self, batch_sizes, iterator_settings=None, n_iterations=5,
+                 n_warmup=1, memory_limit=None, iterator='main',
+                 log_name='batch_size_tuning'):
+        if not batch_sizes:
+            raise ValueError('batch_sizes must not be empty')
+        self._batch_sizes = sorted(batch_sizes)
+        self._iterator_settings = iterator_settings or [{}]
+        self._n_iterations = n_iterations
+        self._n_warmup = n_warmup
+        self._memory_limit = memory_limit
+        self._iterator_name = iterator
+        self._log_name = log_name
+        self._done = False
+        self._configured = False
+        self.results = []
+        self.best = None
+
+    def __call__(self, trainer):
+        if self._configured:
+            return
+        self._configured = True
+        updater = trainer.updater
+        iterator = updater.get_iterator(self._iterator_name)
+        if self._done:
+            # resumed from a snapshot taken after the probes
+            if self.best is not None:
+                self._configure(iterator, self.best['batch_size'],
+                                self._best_setting())
+            return
+
+        for setting in self._iterator_settings:
+            for key in setting:
+                if not hasattr(iterator, key):
+                    raise ValueError(
+                        'iterator {} does not have attribute {}'.format(
+                            type(iterator).__name__, key))
+        self._done = True
+        original = {key: getattr(iterator, key)
+                    for setting in self._iterator_settings for key in setting}
+        original_batch_size = iterator.batch_size
+        serializer = npz.DictionarySerializer()
+        updater.serialize(serializer)
+        # the serializer refers to the arrays of the updater on CPU
+        state = {key: numpy.array(value)
+                 for key, value in six.iteritems(serializer.target)}
+
+        with trainer.reporter.scope({}):
+            for setting in self._iterator_settings:
+                for batch_size in self._batch_sizes:
+                    self._configure(iterator, batch_size, setting)
+                    try:
+                        result = self._probe(updater, batch_size)
+                    except MemoryError:
+                        result = None
+                    finally:
+                        updater.serialize(npz.NpzDeserializer(state))
+                    if result is None:
+                        break
+                    result.update(setting)
+                    self.results.append(result)
+
+        candidates = [r for r in self.results
+                      if self._memory_limit is None or r['memory'] is None or
+                      r['memory'] <= self._memory_limit]
+        if candidates:
+            self.best = max(candidates, key=lambda r: r['throughput'])
+            self._configure(iterator, self.best['batch_size'],
+                            self._best_setting())
+        else:
+            self._configure(iterator, original_batch_size, original)
+
+        if self._log_name is not None:
+            self._write_log(trainer.out)
+
+    def serialize(self, serializer):
+        self._done = serializer('_done', self._done)
+        if isinstance(serializer, serializer_module.Serializer):
+            serializer('_results', json.dumps(
+                {'results': self.results, 'best': self.best}))
+        else:
+            results = json.loads(serializer('_results', ''))
+            self.results = results['results']
+            self.best = results['best']
+
+    def _best_setting(self):
+        return {k: v for k, v in six.iteritems(self.best)
+                if k not in ('batch_size', 'throughput', 'memory')}
+
+    def _configure(self, iterator, batch_size, setting):
+        iterator.batch_size = batch_size
+        for key, value in six.iteritems(setting):
+            setattr(iterator, key, value)
+        iterator.finalize()
+
+    def _probe(self, updater, batch_size):
+        measured = _reset_peak_rss()
+        for _ in six.moves.range(self._n_warmup):
+            updater.update()
+        _synchronize()
+
+        start = time.time()
+        for _ in six.moves.range(self._n_iterations):
+            updater.update()
+        _synchronize()
+        elapsed = time.time() - start
+
+        memory = _get_peak_rss() if measured else None
+        throughput = batch_size * self._n_iterations / max(elapsed, 1e-9)
+        return {'batch_size': batch_size, 'throughput': throughput,
+                'memory': memory}
+
+    def _write_log(self, out):
+        fd, path = tempfile.mkstemp(prefix=self._log_name, dir=out)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'results': self.results, 'best': self.best}, f,
+                      indent=4)
+        shutil.move(path, os.path.join(out, self._log_name))
@@ -0,0 +1,121 @@
+from __future__ import division
+
+import time
+import warnings
+
+import six
+
+from chainer import profiler
+from chainer import reporter
+from chainer.training import extension
+
+
+class ProfileReport(extension.Extension):
+
+    """Trainer extension to report the throughput and the time breakdown.
+
+    This extension measures the wall-clock time of the phases of the training
+    loop by :class:`~chainer.profiler.PhaseTimer`, and reports the following
+    values by :func:`chainer.report` at each invocation. Each value is
+    computed over the period since the previous invocation.
+
+    - ``<prefix>/iterations_per_second``: The number of updates per second.
+    - ``<prefix>/examples_per_second``: The number of examples per second. It
+      is computed from the ``batch_size`` attribute of the main iterator, and
+      is not reported if the iterator does not have it.
+    - ``<prefix>/<phase>``: The fraction of the time spent in each phase.
+      The phases marked by the built-in updaters and the optimizers are
+      ``iterator`` (waiting for the next batch), ``converter``, ``forward``,
+      ``backward`` and ``optimizer``. The rest of the time of
+      :meth:`Updater.update <chainer.training.Updater.update>` is reported
+      as ``update``, and the time of each extension as
+      ``extension/<name>``. The time outside of all phases is reported as
+      ``other``.
+    - ``<prefix>/input_bound``: ``1.0`` if the fraction of ``iterator`` and
+      ``converter`` is not less than ``input_bound_threshold``, and ``0.0``
+      otherwise.
+
+    A warning is issued when the training is found input-bound for the first
+    time; in such a case, using
+    :class:`~chainer.iterators.MultiprocessIterator` or increasing its number
+    of prefetched batches may improve the throughput.
+
+    Only the phases run in the thread of the training loop are timed. Since
+    the GPU kernels run asynchronously, their time is added to the phase that
+    waits for them unless ``synchronize`` is ``True``.
+
+    The reported values are accumulated by :class:`LogReport` as other
+    observations. This extension is invoked before the training starts to
+    begin the measurement, and its priority is higher than that of
+    :class:`LogReport` so that the values are reported in the same iteration.
+
+    Args:
+        input_bound_threshold (float): Fraction of the time of the data
+            loading phases at which the training is regarded as input-bound.
+        synchronize (bool): If ``True``, the default CUDA stream is
+            synchronized at the boundaries of the phases to time the GPU
+            computations precisely. It makes the training slower.
+        prefix (str): Prefix of the reported keys.
+
+    Attributes:
+        input_bound (bool): ``True`` if the training was input-bound at the
+            latest invocation.
+
+    """
+    invoke_before_training = True
+    priority = extension.PRIORITY_WRITER
+
+    def __init__(self, input_bound_threshold=0.5, synchronize=False,
+                 prefix='profile'):
+        self._input_bound_threshold = input_bound_threshold
+        self._prefix = prefix
+        self._timer = profiler.PhaseTimer(synchronize=synchronize)
+        self._started = False
+        self._warned = False
+        self._start_at = None
+        self._start_iteration = None
+        self.input_bound = False
+
+    def __call__(self, trainer):
+        updater = trainer.updater
+        now = time.time()
+        if not self._started:
+            self._started = True
+            self._timer.start()
+            self._start_at = now
+            self._start_iteration = updater.iteration
+            return
+
+        elapsed = now - self._start_at
+        n_iterations = updater.iteration - self._start_iteration
+        times = self._timer.reset()
+        self._start_at = now
+        self._start_iteration = updater.iteration
+        if elapsed <= 0 or n_iterations <= 0:
+            return
+
+        prefix = self._prefix + '/'
+        values = {prefix + 'iterations_per_second': n_iterations / elapsed}
+        batch_size = getattr(updater.get_iterator('main'), 'batch_size', None)
+        if batch_size is not None:
+            values[prefix + 'examples_per_second'] = \
+                batch_size * n_iterations / elapsed
+        for name, t in six.iteritems(times):
+            values[prefix + name] = t / elapsed
+        values[prefix + 'other'] = max(
+            0., 1. - sum(six.itervalues(times)) / elapsed)
+
+        input_time = times.get('iterator', 0.) + times.get('converter', 0.)
+        self.input_bound = input_time >= \
+            self._input_bound_threshold * elapsed
+        values[prefix + 'input_bound'] = float(self.input_bound)
+        if self.input_bound and not self._warned:
+            self._warned = True
+            warnings.warn(
+                'training is input-bound: %.0f%% of the time is spent on '
+                'loading the data' % (100 * input_time / elapsed))
+        reporter.report(values)
+
+    def finalize(self):
+        self._timer.stop()
+        self._started = False
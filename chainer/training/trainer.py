@@ -4,6 +4,7 @@ import time
 
 import six
 
+from chainer import profiler
 from chainer import reporter as reporter_module
 from chainer import serializer as serializer_module
 from chainer.training import extension as extension_module
@@ -275,6 +276,7 @@ class Trainer(object):
             key=lambda name: self._extensions[name].priority, reverse=True)
         extensions = [(name, self._extensions[name])
                       for name in extension_order]
+        phase_names = {name: 'extension/' + name for name in extension_order}
 
         self._start_at = time.time()
 
@@ -292,10 +294,12 @@ class Trainer(object):
             while not stop_trigger(self):
                 self.observation = {}
                 with reporter.scope(self.observation):
-                    update()
+                    with profiler.phase('update'):
+                        update()
                     for name, entry in extensions:
                         if entry.trigger(self):
-                            entry.extension(self)
+                            with profiler.phase(phase_names[name]):
+                                entry.extension(self)
         finally:
             for _, entry in extensions:
                 finalize = getattr(entry.extension, 'finalize', None)
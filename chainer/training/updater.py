@@ -1,12 +1,99 @@
+import contextlib
 import copy
+import mmap
+import multiprocessing
+from multiprocessing import sharedctypes
+import os
+import tempfile
+import traceback
+
+import numpy
 import six
 
+from chainer import cuda
 from chainer.dataset import convert
 from chainer.dataset import iterator as iterator_module
+from chainer.functions.loss import softmax_cross_entropy
 from chainer import optimizer as optimizer_module
+from chainer import profiler
+from chainer import reporter as reporter_module
 from chainer import variable
 
 
+def _call_loss_func(loss_func, in_arrays):
+    with profiler.phase('forward'):
+        if isinstance(in_arrays, tuple):
+            in_vars = tuple(variable.Variable(x) for x in in_arrays)
+            return loss_func(*in_vars)
+        elif isinstance(in_arrays, dict):
+            in_vars = {key: variable.Variable(x)
+                       for key, x in six.iteritems(in_arrays)}
+            return loss_func(**in_vars)
+        else:
+            return loss_func(variable.Variable(in_arrays))
+
+
+def _backward(loss, coeff, optimizer):
+    # Scales the initial gradient instead of the loss itself so that no extra
+    # node is added to the graph; the loss scale of the optimizer (if any) is
+    # also applied here, as the optimizer is updated without a loss function.
+    loss_scale = getattr(optimizer, 'loss_scale', None)
+    if loss_scale is not None:
+        coeff *= loss_scale
+    with profiler.phase('backward'):
+        xp = cuda.get_array_module(loss.data)
+        loss.grad = xp.full_like(loss.data, coeff)
+        loss.backward()
+
+
+class _WeightedDictSummary(object):
+
+    # Summary of observations like DictSummary, whose mean is weighted, e.g.
+    # by the sizes of the micro-batches.
+
+    def __init__(self):
+        self._sums = {}
+        self._weights = {}
+
+    def add(self, d, weight=1.0):
+        sums = self._sums
+        weights = self._weights
+        for k, v in six.iteritems(d):
+            if isinstance(v, variable.Variable):
+                v = v.data
+            if not (numpy.isscalar(v) or getattr(v, 'ndim', -1) == 0):
+                continue
+            with cuda.get_device(v):
+                if k in sums:
+                    sums[k] = sums[k] + v * weight
+                    weights[k] += weight
+                else:
+                    sums[k] = v * weight
+                    weights[k] = weight
+
+    def compute_mean(self):
+        means = {}
+        for k, x in six.iteritems(self._sums):
+            with cuda.get_device(x):
+                means[k] = x / self._weights[k]
+        return means
+
+
+@contextlib.contextmanager
+def _micro_batch_scope(summary, weight=1.0):
+    # Observations of each micro-batch are summarized and reported as their
+    # means after the last micro-batch.
+    try:
+        reporter = reporter_module.get_current_reporter()
+    except IndexError:
+        yield
+        return
+    observation = {}
+    with reporter.scope(observation):
+        yield
+    summary.add(observation, weight)
+
+
 class Updater(object):
 
     """Interface of updater objects for trainers.
@@ -107,6 +194,15 @@ class StandardUpdater(Updater):
             indicates the host memory (CPU).
         loss_func: Loss function. The target link of the main optimizer is used
             by default.
+        n_micro_batches (int): Number of micro-batches each batch is split
+            into. If it is greater than one, the default update routine runs
+            the forward and backward computations for each micro-batch in
+            turn, accumulating the gradients, and then updates the parameters
+            once. The computational graph of each micro-batch is released
+            before the next one, so the peak memory is that of a micro-batch.
+            The loss of each micro-batch is weighted by its ratio to the whole
+            batch, and the values reported during the computation are
+            averaged over the micro-batches.
 
     Attributes:
         converter: Converter function.
@@ -114,11 +210,12 @@ class StandardUpdater(Updater):
                    main optimizer is used instead.
         device: Device to which the training data is sent.
         iteration: Current number of completed updates.
+        n_micro_batches: Number of micro-batches each batch is split into.
 
     """
 
     def __init__(self, iterator, optimizer, converter=convert.concat_examples,
-                 device=None, loss_func=None):
+                 device=None, loss_func=None, n_micro_batches=1):
         if isinstance(iterator, iterator_module.Iterator):
             iterator = {'main': iterator}
         self._iterators = iterator
@@ -131,9 +228,13 @@ class StandardUpdater(Updater):
             for optimizer in six.itervalues(self._optimizers):
                 optimizer.target.to_gpu(device)
 
+        if n_micro_batches < 1:
+            raise ValueError('n_micro_batches must be positive')
+
         self.converter = converter
         self.loss_func = loss_func
         self.device = device
+        self.n_micro_batches = n_micro_batches
         self.iteration = 0
 
     @property
@@ -175,8 +276,13 @@ class StandardUpdater(Updater):
         self.iteration += 1
 
     def update_core(self):
-        batch = self._iterators['main'].next()
-        in_arrays = self.converter(batch, self.device)
+        with profiler.phase('iterator'):
+            batch = self._iterators['main'].next()
+        if self.n_micro_batches > 1:
+            self._update_micro_batches(batch)
+            return
+        with profiler.phase('converter'):
+            in_arrays = self.converter(batch, self.device)
 
         optimizer = self._optimizers['main']
         loss_func = self.loss_func or optimizer.target
@@ -192,6 +298,25 @@ class StandardUpdater(Updater):
             in_var = variable.Variable(in_arrays)
             optimizer.update(loss_func, in_var)
 
+    def _update_micro_batches(self, batch):
+        optimizer = self._optimizers['main']
+        loss_func = self.loss_func or optimizer.target
+        n = min(self.n_micro_batches, len(batch))
+
+        optimizer.target.cleargrads()
+        summary = _WeightedDictSummary()
+        for i in six.moves.range(n):
+            micro_batch = batch[i::n]
+            coeff = float(len(micro_batch)) / len(batch)
+            with profiler.phase('converter'):
+                in_arrays = self.converter(micro_batch, self.device)
+            with _micro_batch_scope(summary, coeff):
+                loss = _call_loss_func(loss_func, in_arrays)
+            _backward(loss, coeff, optimizer)
+            del loss
+        reporter_module.report(summary.compute_mean())
+        optimizer.update()
+
     def serialize(self, serializer):
         for name, iterator in six.iteritems(self._iterators):
             iterator.serialize(serializer['iterator:' + name])
@@ -233,16 +358,21 @@ class ParallelUpdater(StandardUpdater):
             as ``models``.
         loss_func: Loss function. The model is used as a loss function by
             default.
+        n_micro_batches (int): Number of micro-batches each batch is split
+            into before being split between the devices. The gradients of all
+            micro-batches are accumulated, and the parameters are updated
+            once per batch. See :class:`~chainer.training.StandardUpdater`.
 
     """
 
     def __init__(self, iterator, optimizer, converter=convert.concat_examples,
-                 models=None, devices=None, loss_func=None):
+                 models=None, devices=None, loss_func=None, n_micro_batches=1):
         super(ParallelUpdater, self).__init__(
             iterator=iterator,
             optimizer=optimizer,
             converter=converter,
             loss_func=loss_func,
+            n_micro_batches=n_micro_batches,
         )
 
         if models is None:
@@ -282,48 +412,909 @@ class ParallelUpdater(StandardUpdater):
         models_others = {k: v for k, v in self._models.items()
                          if v is not model_main}
 
-        batch = self.get_iterator('main').next()
+        with profiler.phase('iterator'):
+            batch = self.get_iterator('main').next()
+        n_micro = min(self.n_micro_batches, len(batch))
+
+        # For reducing memory
+        for model in six.itervalues(self._models):
+            model.cleargrads()
+
+        summary = _WeightedDictSummary()
+        for i in six.moves.range(n_micro):
+            micro_batch = batch[i::n_micro]
+            # weighted by the size as in StandardUpdater
+            self._accumulate_grads(
+                micro_batch, float(len(micro_batch)) / len(batch), i == 0,
+                summary)
+        if self.n_micro_batches > 1:
+            reporter_module.report(summary.compute_mean())
 
+        for model in six.itervalues(models_others):
+            model_main.addgrads(model)
+
+        optimizer.update()
+
+        for model in six.itervalues(models_others):
+            model.copyparams(model_main)
+
+    def _accumulate_grads(self, batch, coeff, first, summary):
         #
         # Split the batch to sub-batches.
         #
         n = len(self._models)
         in_arrays_list = {}
-        for i, key in enumerate(six.iterkeys(self._models)):
-            in_arrays_list[key] = self.converter(
-                batch[i::n], self._devices[key])
-
-        # For reducing memory
-        for model in six.itervalues(self._models):
-            model.cleargrads()
+        with profiler.phase('converter'):
+            for i, key in enumerate(six.iterkeys(self._models)):
+                in_arrays_list[key] = self.converter(
+                    batch[i::n], self._devices[key])
 
         losses = []
         for model_key, model in six.iteritems(self._models):
             in_arrays = in_arrays_list[model_key]
             loss_func = self.loss_func or model
-
-            if isinstance(in_arrays, tuple):
-                in_vars = tuple(variable.Variable(x) for x in in_arrays)
-                losses.append(loss_func(*in_vars))
-            elif isinstance(in_arrays, dict):
-                in_vars = {key: variable.Variable(x)
-                           for key, x in six.iteritems(in_arrays)}
-                losses.append(loss_func(**in_vars))
+            if self.n_micro_batches > 1:
+                with _micro_batch_scope(summary, coeff):
+                    losses.append(_call_loss_func(loss_func, in_arrays))
             else:
-                in_vars = variable.Variable(in_arrays)
-                losses.append(loss_func(in_vars))
+                losses.append(_call_loss_func(loss_func, in_arrays))
 
         # For _uninitialized_params
-        for model in six.itervalues(self._models):
-            model.cleargrads()
+        if first:
+            for model in six.itervalues(self._models):
+                model.cleargrads()
 
+        optimizer = self.get_optimizer('main')
         for loss in losses:
-            loss.backward()
+            _backward(loss, coeff, optimizer)
+
+
+def _share_params(link, updater_name):
+    # Moves the parameter arrays to shared memory, which is inherited by the
+    # processes forked afterwards.
+    for child in link.links():
+        if child._uninitialized_params:
+            raise ValueError(
+                'parameters must be initialized before the training with '
+                '{}'.format(updater_name))
+    for param in link.params():
+        data = param.data
+        if not isinstance(data, numpy.ndarray):
+            raise ValueError('{} only supports CPU'.format(updater_name))
+        buf = sharedctypes.RawArray('b', max(data.nbytes, 1))
+        shared = numpy.frombuffer(buf, dtype=data.dtype, count=data.size)
+        shared = shared.reshape(data.shape)
+        shared[...] = data
+        param.data = shared
+
+
+def _to_float(value):
+    if isinstance(value, variable.Variable):
+        value = value.data
+    return float(value)
+
+
+def _worker_reporter(optimizers):
+    reporter = reporter_module.Reporter()
+    for name, optimizer in six.iteritems(optimizers):
+        reporter.add_observer(name, optimizer.target)
+        reporter.add_observers(
+            name, optimizer.target.namedlinks(skipself=True))
+    return reporter
+
+
+def _hogwild_worker(pipe, stop, seed, iterator, optimizers, converter,
+                    loss_func):
+    numpy.random.seed(seed)
+    reporter = _worker_reporter(optimizers)
+
+    optimizer = optimizers['main']
+    try:
+        while not stop.is_set():
+            observation = {}
+            with reporter.scope(observation):
+                _compute_grads(iterator, optimizer, converter, loss_func)
+                optimizer.update()
+            pipe.send({key: _to_float(value)
+                       for key, value in six.iteritems(observation)})
+    except Exception:
+        pipe.send(traceback.format_exc())
+    finally:
+        iterator.finalize()
+        pipe.close()
+
+
+class HogwildUpdater(StandardUpdater):
+
+    """Implementation of an asynchronous multi-process CPU updater.
+
+    This is an implementation of :class:`Updater` that trains a model on CPU
+    by multiple processes in the Hogwild! style: the parameter arrays are
+    placed in shared memory, and each process computes the gradients of its
+    own batches and updates the shared parameters without any lock. It is
+    suitable for models with sparse gradients, e.g. word embeddings.
+
+    Each dataset iterator of ``iterators`` is used by one process. The first
+    one is used by the main process and registered by the name ``'main'``,
+    which determines the epoch of the training, and the others are used by
+    the worker processes forked at the first update. Each process has its own
+    state of the optimizer. The worker processes keep updating the parameters
+    without waiting for the main process until the updater is finalized. At
+    each iteration, the main process updates the parameters with one batch,
+    and its observation is averaged with those of all the updates that the
+    worker processes have finished since the previous iteration, which are
+    reported to the trainer. Since the workers do not stop, the parameters
+    also change during the extensions, e.g. an evaluation.
+
+    The worker processes are forked, so this updater is only available on
+    platforms that support ``fork``. The parameters must be initialized, and
+    the model and the optimizer must not be replaced after the first update.
+    The states of the iterators and the optimizers of the worker processes
+    are not serialized.
 
-        for model in six.itervalues(models_others):
-            model_main.addgrads(model)
+    Args:
+        iterators: List of dataset iterators for the training dataset, e.g.
+            for the subsets of the dataset split by
+            :func:`~chainer.datasets.split_dataset`. The number of processes
+            is the length of this list.
+        optimizer: Optimizer to update parameters. It can also be a dictionary
+            of optimizers, in which case only the optimizer of the name
+            ``'main'`` is used by the update routine.
+        converter: Converter function to build input arrays. Each batch
+            extracted by the iterator of each process is passed to this
+            function. :func:`~chainer.dataset.concat_examples` is used by
+            default.
+        loss_func: Loss function. The target link of the main optimizer is
+            used by default.
+
+    """
+
+    def __init__(self, iterators, optimizer, converter=convert.concat_examples,
+                 loss_func=None):
+        if len(iterators) == 0:
+            raise ValueError('iterators must not be empty')
+        super(HogwildUpdater, self).__init__(
+            iterator=iterators[0],
+            optimizer=optimizer,
+            converter=converter,
+            device=-1,
+            loss_func=loss_func,
+        )
+        self._worker_iterators = list(iterators[1:])
+        self._workers = None
+        self._pipes = None
+        self._stop = None
 
+    def update_core(self):
+        if self._workers is None:
+            self._start_workers()
+
+        summary = _WeightedDictSummary()
+        with _micro_batch_scope(summary):
+            super(HogwildUpdater, self).update_core()
+        # Collects the observations that the workers have sent so far
+        # without waiting for them.
+        for pipe in self._pipes:
+            while pipe.poll():
+                try:
+                    observation = pipe.recv()
+                except EOFError:
+                    raise RuntimeError(
+                        'a worker process of HogwildUpdater exited '
+                        'unexpectedly')
+                if not isinstance(observation, dict):
+                    raise RuntimeError(
+                        'a worker process of HogwildUpdater failed:\n' +
+                        observation)
+                summary.add(observation)
+        reporter_module.report(summary.compute_mean())
+
+    def finalize(self):
+        if self._workers is not None:
+            self._stop.set()
+            for pipe in self._pipes:
+                # drains the pipe so that no worker is blocked by sending
+                # an observation; it is closed when the worker exits
+                try:
+                    while True:
+                        pipe.recv()
+                except EOFError:
+                    pass
+            for worker in self._workers:
+                worker.join()
+            for pipe in self._pipes:
+                pipe.close()
+            self._workers = None
+            self._pipes = None
+            self._stop = None
+        super(HogwildUpdater, self).finalize()
+
+    def _start_workers(self):
+        optimizer = self.get_optimizer('main')
+        _share_params(optimizer.target, 'HogwildUpdater')
+
+        self._stop = multiprocessing.Event()
+        self._workers = []
+        self._pipes = []
+        for iterator in self._worker_iterators:
+            pipe, worker_pipe = multiprocessing.Pipe(duplex=False)
+            worker = multiprocessing.Process(
+                target=_hogwild_worker,
+                args=(worker_pipe, self._stop, numpy.random.randint(2 ** 31),
+                      iterator, self._optimizers, self.converter,
+                      self.loss_func))
+            worker.daemon = True
+            worker.start()
+            worker_pipe.close()
+            self._workers.append(worker)
+            self._pipes.append(pipe)
+
+
+def _sorted_params(link):
+    return [param for _, param in sorted(link.namedparams())]
+
+
+def _compute_grads(iterator, optimizer, converter, loss_func):
+    model = optimizer.target
+    with profiler.phase('iterator'):
+        batch = iterator.next()
+    with profiler.phase('converter'):
+        in_arrays = converter(batch, -1)
+    loss = _call_loss_func(loss_func or model, in_arrays)
+    model.cleargrads()
+    _backward(loss, 1.0, optimizer)
+
+
+class _SharedGradients(object):
+
+    # Buffers in shared memory to average the gradients of the processes.
+    # Each process writes its flattened gradients to its own row of the
+    # buffer. In the reduction, each process sums up its own chunk of the
+    # columns over the rows and writes the mean to the result buffer, so that
+    # the reduction is parallelized over the processes.
+
+    def __init__(self, params, n_processes):
+        self.shapes = [param.data.shape for param in params]
+        self.offsets = numpy.cumsum([0] + [param.data.size
+                                           for param in params])
+        size = int(self.offsets[-1])
+        self.dtype = numpy.result_type(*[param.data for param in params])
+        self.grads = self._empty((n_processes, size))
+        self.result = self._empty((size,))
+        self.bounds = numpy.linspace(0, size, n_processes + 1).astype(int)
+        self.n_processes = n_processes
+
+    def _empty(self, shape):
+        size = int(numpy.prod(shape))
+        buf = sharedctypes.RawArray(
+            'b', max(size * self.dtype.itemsize, 1))
+        return numpy.frombuffer(
+            buf, dtype=self.dtype, count=size).reshape(shape)
+
+    def write(self, rank, params):
+        row = self.grads[rank]
+        for i, param in enumerate(params):
+            begin, end = self.offsets[i], self.offsets[i + 1]
+            if param.grad is None:
+                row[begin:end] = 0
+            else:
+                row[begin:end] = param.grad.ravel()
+
+    def reduce(self, rank):
+        begin, end = self.bounds[rank], self.bounds[rank + 1]
+        result = self.result[begin:end]
+        numpy.sum(self.grads[:, begin:end], axis=0, out=result)
+        result *= 1. / self.n_processes
+
+    def read(self, params):
+        for i, param in enumerate(params):
+            grad = self.result[self.offsets[i]:self.offsets[i + 1]]
+            grad = grad.reshape(self.shapes[i])
+            if grad.dtype != param.data.dtype:
+                grad = grad.astype(param.data.dtype)
+            param.grad = grad
+
+
+def _data_parallel_worker(pipe, rank, seed, iterator, optimizers, converter,
+                          loss_func, shared_grads):
+    numpy.random.seed(seed)
+    reporter = _worker_reporter(optimizers)
+
+    optimizer = optimizers['main']
+    params = _sorted_params(optimizer.target)
+    try:
+        while True:
+            command = pipe.recv()
+            if command == 'grads':
+                observation = {}
+                with reporter.scope(observation):
+                    _compute_grads(iterator, optimizer, converter, loss_func)
+                shared_grads.write(rank, params)
+                pipe.send({key: _to_float(value)
+                           for key, value in six.iteritems(observation)})
+            elif command == 'reduce':
+                shared_grads.reduce(rank)
+                pipe.send(None)
+            else:
+                break
+    except Exception:
+        pipe.send(traceback.format_exc())
+    finally:
+        iterator.finalize()
+        pipe.close()
+
+
+class MultiprocessParallelUpdater(StandardUpdater):
+
+    """Implementation of a synchronous multi-process CPU updater.
+
+    This is an implementation of :class:`Updater` that trains a model on CPU
+    by multiple processes in the synchronous data-parallel style, which
+    utilizes multiple cores beyond the limit of the global interpreter lock.
+    The parameter arrays are placed in shared memory. At each iteration,
+    every process computes the gradients of its own batch, and the gradients
+    are averaged over the processes through shared memory buffers; each
+    process reduces its own chunk of the flattened gradients. The main
+    process then updates the parameters by the optimizer with the averaged
+    gradients, so that the update is equivalent to that of
+    :class:`StandardUpdater` with the union of the batches.
+
+    Each dataset iterator of ``iterators`` is used by one process. The first
+    one is used by the main process and registered by the name ``'main'``,
+    which determines the epoch of the training, and the others are used by
+    the worker processes forked at the first update. The batch of each
+    process should be of the same size to get the mean gradient of the whole
+    batch. The observations reported by the processes are averaged and
+    reported to the trainer.
+
+    The worker processes are forked, so this updater is only available on
+    platforms that support ``fork``. The model must not be replaced after the
+    first update. The states of the iterators of the worker processes are not
+    serialized. The persistent values of the model, e.g. the statistics of
+    :class:`~chainer.links.BatchNormalization`, are updated only with the
+    batches of the main process.
+
+    Unlike :class:`ParallelUpdater`, the gradients are kept in buffers of
+    the size of the model for each process.
+
+    Args:
+        iterators: List of dataset iterators for the training dataset, e.g.
+            for the subsets of the dataset split by
+            :class:`~chainer.datasets.SubDataset`. The number of processes is
+            the length of this list.
+        optimizer: Optimizer to update parameters. It can also be a dictionary
+            of optimizers, in which case only the optimizer of the name
+            ``'main'`` is used by the update routine.
+        converter: Converter function to build input arrays. Each batch
+            extracted by the iterator of each process is passed to this
+            function. :func:`~chainer.dataset.concat_examples` is used by
+            default.
+        loss_func: Loss function. The target link of the main optimizer is
+            used by default.
+
+    """
+
+    def __init__(self, iterators, optimizer, converter=convert.concat_examples,
+                 loss_func=None):
+        if len(iterators) == 0:
+            raise ValueError('iterators must not be empty')
+        super(MultiprocessParallelUpdater, self).__init__(
+            iterator=iterators[0],
+            optimizer=optimizer,
+            converter=converter,
+            device=-1,
+            loss_func=loss_func,
+        )
+        self._worker_iterators = list(iterators[1:])
+        self._workers = None
+        self._pipes = None
+        self._shared_grads = None
+
+    def update_core(self):
+        optimizer = self.get_optimizer('main')
+        if self._workers is not None:
+            self._send('grads')
+
+        summary = _WeightedDictSummary()
+        with _micro_batch_scope(summary):
+            _compute_grads(self.get_iterator('main'), optimizer,
+                           self.converter, self.loss_func)
+        if self._workers is None:
+            # The workers are forked after the parameters are initialized by
+            # the first forward computation.
+            self._start_workers()
+            self._send('grads')
+
+        params = _sorted_params(optimizer.target)
+        self._shared_grads.write(0, params)
+        for observation in self._recv():
+            summary.add(observation)
+
+        self._send('reduce')
+        self._shared_grads.reduce(0)
+        self._recv()
+
+        self._shared_grads.read(params)
         optimizer.update()
+        reporter_module.report(summary.compute_mean())
 
-        for model in six.itervalues(models_others):
-            model.copyparams(model_main)
+    def finalize(self):
+        if self._workers is not None:
+            for pipe in self._pipes:
+                try:
+                    pipe.send(None)
+                except (IOError, OSError):
+                    pass  # the worker has already exited
+            for worker in self._workers:
+                worker.join()
+            for pipe in self._pipes:
+                pipe.close()
+            self._workers = None
+            self._pipes = None
+            self._shared_grads = None
+        super(MultiprocessParallelUpdater, self).finalize()
+
+    def _send(self, command):
+        for pipe in self._pipes:
+            pipe.send(command)
+
+    def _recv(self):
+        results = []
+        for pipe in self._pipes:
+            result = pipe.recv()
+            if isinstance(result, str):
+                raise RuntimeError(
+                    'a worker process of MultiprocessParallelUpdater '
+                    'failed:\n' + result)
+            results.append(result)
+        return results
+
+    def _start_workers(self):
+        optimizer = self.get_optimizer('main')
+        _share_params(optimizer.target, 'MultiprocessParallelUpdater')
+        self._shared_grads = _SharedGradients(
+            _sorted_params(optimizer.target),
+            len(self._worker_iterators) + 1)
+
+        self._workers = []
+        self._pipes = []
+        for rank, iterator in enumerate(self._worker_iterators, 1):
+            pipe, worker_pipe = multiprocessing.Pipe()
+            worker = multiprocessing.Process(
+                target=_data_parallel_worker,
+                args=(worker_pipe, rank, numpy.random.randint(2 ** 31),
+                      iterator, self._optimizers, self.converter,
+                      self.loss_func, self._shared_grads))
+            worker.daemon = True
+            worker.start()
+            worker_pipe.close()
+            self._workers.append(worker)
+            self._pipes.append(pipe)
+
+
+def _share_persistents(link):
+    # Moves the persistent arrays, e.g. the statistics of batch
+    # normalization, to shared memory. They are updated in place.
+    for child in link.links():
+        for name in child._persistent:
+            value = getattr(child, name)
+            if isinstance(value, numpy.ndarray):
+                buf = sharedctypes.RawArray('b', max(value.nbytes, 1))
+                shared = numpy.frombuffer(
+                    buf, dtype=value.dtype, count=value.size)
+                shared = shared.reshape(value.shape)
+                shared[...] = value
+                setattr(child, name, shared)
+
+
+def _allocate_shared_file(size):
+    # Allocates a buffer in a file mapped to memory, which is shared with
+    # another process that opens the file. /dev/shm is used if available so
+    # that the buffer is not written back to the disk.
+    directory = '/dev/shm' if os.path.isdir('/dev/shm') else None
+    fd, path = tempfile.mkstemp(prefix='chainer-pipeline-', dir=directory)
+    try:
+        os.ftruncate(fd, size)
+        buf = mmap.mmap(fd, size)
+    finally:
+        os.close(fd)
+    return buf, path
+
+
+def _open_shared_file(path, size):
+    fd = os.open(path, os.O_RDWR)
+    try:
+        buf = mmap.mmap(fd, size)
+    finally:
+        os.close(fd)
+        os.unlink(path)
+    return buf
+
+
+class _PipelineEndpoint(object):
+
+    # One end of the connection between two adjacent stages of a pipeline.
+    # The arrays of each micro-batch are written to its own slot of a buffer
+    # in shared memory and only their shapes are sent through the pipe. When
+    # an array is larger than the slot, e.g. for a larger batch than the
+    # first one, the sender allocates a new buffer with larger slots and
+    # tells the receiver to map it before sending the array. The arrays
+    # received from the old buffer are still valid, since the buffer is kept
+    # alive by them.
+
+    def __init__(self, conn, send_buf, recv_buf, capacity, n_slots):
+        self.conn = conn
+        self.send_buf = send_buf
+        self.recv_buf = recv_buf
+        self.send_capacity = capacity
+        self.recv_capacity = capacity
+        self.n_slots = n_slots
+
+    def send(self, index, array):
+        if array.nbytes > self.send_capacity:
+            capacity = max(array.nbytes, self.send_capacity * 2)
+            # aligns the slots to cache lines
+            capacity = -(-capacity // 64) * 64
+            buf, path = _allocate_shared_file(capacity * self.n_slots)
+            self.conn.send((None, path, capacity))
+            self.send_buf = buf
+            self.send_capacity = capacity
+        slot = self._slot(self.send_buf, self.send_capacity, index,
+                          array.shape, array.dtype)
+        slot[...] = array
+        self.conn.send((index, array.shape, array.dtype.str))
+
+    def recv(self, index):
+        message = self.conn.recv()
+        while message[0] is None:
+            _, path, capacity = message
+            self.recv_buf = _open_shared_file(path, capacity * self.n_slots)
+            self.recv_capacity = capacity
+            message = self.conn.recv()
+        if message[0] != index:
+            raise RuntimeError('pipeline stages are out of sync')
+        _, shape, dtype = message
+        # The slot is not overwritten until the next iteration, so it is used
+        # without copy.
+        return self._slot(self.recv_buf, self.recv_capacity, index, shape,
+                          numpy.dtype(dtype))
+
+    def _slot(self, buf, capacity, index, shape, dtype):
+        return numpy.frombuffer(
+            buf, dtype=dtype, count=int(numpy.prod(shape)),
+            offset=index * capacity).reshape(shape)
+
+
+def _pipeline_connection(capacity, n_slots):
+    # Returns the endpoints of the upstream and downstream stages.
+    forward = sharedctypes.RawArray('b', max(capacity * n_slots, 1))
+    backward = sharedctypes.RawArray('b', max(capacity * n_slots, 1))
+    upstream, downstream = multiprocessing.Pipe()
+    return (_PipelineEndpoint(upstream, forward, backward, capacity, n_slots),
+            _PipelineEndpoint(downstream, backward, forward, capacity,
+                              n_slots))
+
+
+def _run_pipeline_stage(stage, rank, n_stages, upstream, downstream, inputs,
+                        targets, coeffs, optimizer, loss_func, reporter):
+    # Runs the forward and backward computations of the micro-batches of one
+    # stage in the one-forward-one-backward schedule: after the forward
+    # computations that fill the pipeline, each stage alternates them so that
+    # at most ``n_stages - rank`` micro-batches are kept alive.
+    n_micro_batches = len(coeffs)
+    outputs = {}
+    summary = _WeightedDictSummary()
+    total_loss = [0.]
+
+    def forward(i):
+        if upstream is None:
+            x = variable.Variable(inputs[i])
+        else:
+            x = variable.Variable(upstream.recv(i))
+        y = stage(x)
+        if downstream is None:
+            observation = {}
+            with reporter.scope(observation):
+                loss = loss_func(y, *targets[i])
+            # The loss and the observations are weighted by the size of the
+            # micro-batch to get those of the whole batch.
+            summary.add(observation, coeffs[i])
+            total_loss[0] += coeffs[i] * _to_float(loss.data)
+            _backward(loss, coeffs[i], optimizer)
+            if upstream is not None:
+                upstream.send(i, x.grad)
+        else:
+            downstream.send(i, y.data)
+            outputs[i] = x, y
+
+    def backward(i):
+        x, y = outputs.pop(i)
+        y.grad = downstream.recv(i)
+        y.backward()
+        if upstream is not None:
+            upstream.send(i, x.grad)
+
+    n_warmup = min(n_stages - rank - 1, n_micro_batches)
+    for i in six.moves.range(n_warmup):
+        forward(i)
+    for i in six.moves.range(n_micro_batches - n_warmup):
+        forward(n_warmup + i)
+        if downstream is not None:
+            backward(i)
+    if downstream is not None:
+        for i in six.moves.range(n_micro_batches - n_warmup, n_micro_batches):
+            backward(i)
+    observation = {key: _to_float(value)
+                   for key, value in six.iteritems(summary.compute_mean())}
+    if downstream is None:
+        observation['loss'] = total_loss[0]
+    return observation
+
+
+def _pipeline_worker(pipe, rank, seed, stages, upstream, downstream, grads,
+                     optimizers, loss_func, unused_conns):
+    for conn in unused_conns:
+        conn.close()
+    numpy.random.seed(seed)
+    reporter = _worker_reporter(optimizers)
+
+    stage = stages[rank]
+    params = _sorted_params(stage)
+    try:
+        while True:
+            command = pipe.recv()
+            if command is None:
+                break
+            targets, coeffs = command
+            stage.cleargrads()
+            observation = _run_pipeline_stage(
+                stage, rank, len(stages), upstream, downstream, None,
+                targets, coeffs, optimizers['main'], loss_func, reporter)
+            for param, grad in six.moves.zip(params, grads):
+                if param.grad is None:
+                    grad[...] = 0
+                else:
+                    grad[...] = param.grad
+            pipe.send(observation)
+    except Exception:
+        pipe.send(traceback.format_exc())
+    finally:
+        for conn in (pipe, upstream, downstream):
+            if conn is not None:
+                getattr(conn, 'conn', conn).close()
+
+
+class PipelineParallelUpdater(StandardUpdater):
+
+    """Implementation of a pipeline model-parallel updater.
+
+    This is an implementation of :class:`Updater` that trains a model split
+    into stages by multiple processes on CPU. Each stage is a link that takes
+    one variable and returns one variable, and the stages are computed in
+    sequence. Each stage runs in its own process: the first one in the main
+    process and the others in the worker processes forked at the first update.
+
+    Each batch is split into ``n_micro_batches`` micro-batches, which are
+    streamed through the stages, so that the stages compute different
+    micro-batches at the same time. The outputs of the stages and the
+    gradients with respect to them are passed to the adjacent stages through
+    shared memory. Each stage computes the micro-batches in the
+    one-forward-one-backward schedule, which keeps the activations of at most
+    as many micro-batches as the stages. After all the micro-batches are
+    computed, the main process updates the parameters of all the stages by
+    the optimizer. The update is thus equivalent to that of
+    :class:`StandardUpdater` with the whole batch.
+
+    The converter must return a tuple of arrays. The first one is the input
+    of the first stage, and the others are passed to ``loss_func`` together
+    with the output of the last stage. The loss and the other values
+    reported in ``loss_func`` are averaged over the micro-batches and
+    reported as the observations of the target link of the main optimizer,
+    e.g. ``main/loss``.
+
+    The parameters and the persistent arrays of the stages are placed in
+    shared memory at the first update, which runs the stages once in the
+    main process to initialize the parameters. The worker processes are
+    forked, so this updater is only available on platforms that support
+    ``fork``. The stages must not be replaced after the first update.
+
+    Args:
+        iterator: Dataset iterator for the training dataset.
+        optimizer: Optimizer to update parameters. It can also be a dictionary
+            of optimizers, in which case only the optimizer of the name
+            ``'main'`` is used by the update routine. Its target link must
+            contain the stages.
+        stages (~chainer.ChainList): Stages of the model. The target link of
+            the main optimizer is used by default.
+        n_micro_batches (int): Number of micro-batches each batch is split
+            into. The number of the stages is used by default. A larger
+            number reduces the idle time of the stages at the beginning and
+            the end of each iteration.
+        converter: Converter function to build input arrays. Each batch
+            extracted by the main iterator is passed to this function.
+            :func:`~chainer.dataset.concat_examples` is used by default.
+        loss_func: Function that computes the loss from the output of the
+            last stage and the target arrays.
+            :func:`~chainer.functions.softmax_cross_entropy` is used by
+            default.
+
+    """
+
+    def __init__(self, iterator, optimizer, stages=None, n_micro_batches=None,
+                 converter=convert.concat_examples,
+                 loss_func=softmax_cross_entropy.softmax_cross_entropy):
+        super(PipelineParallelUpdater, self).__init__(
+            iterator=iterator,
+            optimizer=optimizer,
+            converter=converter,
+            device=-1,
+            loss_func=loss_func,
+        )
+        if stages is None:
+            stages = self.get_optimizer('main').target
+        if len(stages) == 0:
+            raise ValueError('stages must not be empty')
+        if n_micro_batches is None:
+            n_micro_batches = len(stages)
+        if n_micro_batches < 1:
+            raise ValueError('n_micro_batches must be positive')
+        self.stages = stages
+        self.n_micro_batches = n_micro_batches
+        self._workers = None
+        self._pipes = None
+        self._downstream = None
+        self._worker_params = None
+        self._grads = None
+
+    def update_core(self):
+        with profiler.phase('iterator'):
+            batch = self._iterators['main'].next()
+        with profiler.phase('converter'):
+            in_arrays = self.converter(batch, -1)
+        if not isinstance(in_arrays, tuple):
+            raise TypeError('converter of PipelineParallelUpdater must return '
+                            'a tuple of arrays')
+        x, targets = in_arrays[0], in_arrays[1:]
+        n_micro_batches = min(self.n_micro_batches, len(x))
+        bounds = numpy.linspace(0, len(x), n_micro_batches + 1).astype(int)
+        slices = [slice(begin, end)
+                  for begin, end in six.moves.zip(bounds[:-1], bounds[1:])]
+        inputs = [x[s] for s in slices]
+        micro_targets = [tuple(t[s] for t in targets) for s in slices]
+        coeffs = [float(s.stop - s.start) / len(x) for s in slices]
+
+        if self._workers is None:
+            self._start_workers(inputs[0], -(-len(x) // n_micro_batches))
+
+        optimizer = self.get_optimizer('main')
+        n_stages = len(self.stages)
+        try:
+            for rank, pipe in enumerate(self._pipes, 1):
+                pipe.send((micro_targets if rank == n_stages - 1 else None,
+                           coeffs))
+            stage = self.stages[0]
+            stage.cleargrads()
+            observation = _run_pipeline_stage(
+                stage, 0, n_stages, None, self._downstream, inputs,
+                micro_targets, coeffs, optimizer, self.loss_func,
+                reporter_module.Reporter())
+            for pipe in self._pipes:
+                result = pipe.recv()
+                if isinstance(result, str):
+                    raise RuntimeError(
+                        'a worker process of PipelineParallelUpdater '
+                        'failed:\n' + result)
+                observation.update(result)
+        except (EOFError, IOError, OSError):
+            # A worker has failed, which closes the connections to it.
+            errors = []
+            for pipe in self._pipes:
+                try:
+                    if pipe.poll(1):
+                        errors.append(pipe.recv())
+                except (EOFError, IOError, OSError):
+                    pass
+            self._terminate()
+            raise RuntimeError(
+                'a worker process of PipelineParallelUpdater failed:\n' +
+                '\n'.join(e for e in errors if isinstance(e, str)))
+        except Exception:
+            self._terminate()
+            raise
+
+        for param, grad in six.moves.zip(self._worker_params, self._grads):
+            param.grad = grad
+        optimizer.update()
+        reporter_module.report(observation, optimizer.target)
+
+    def finalize(self):
+        if self._workers is not None:
+            for pipe in self._pipes:
+                try:
+                    pipe.send(None)
+                except (IOError, OSError):
+                    pass  # the worker has already exited
+            for worker in self._workers:
+                worker.join()
+            self._close()
+        super(PipelineParallelUpdater, self).finalize()
+
+    def _terminate(self):
+        for worker in self._workers:
+            worker.terminate()
+            worker.join()
+        self._close()
+
+    def _close(self):
+        for pipe in self._pipes:
+            pipe.close()
+        if self._downstream is not None:
+            self._downstream.conn.close()
+        self._workers = None
+        self._pipes = None
+        self._downstream = None
+        self._worker_params = None
+        self._grads = None
+
+    def _start_workers(self, x, max_micro_batch_size):
+        stages = self.stages
+        # Runs the stages once to initialize the parameters and to measure
+        # the sizes of the arrays passed between the stages.
+        h = variable.Variable(x, volatile='on')
+        capacities = []
+        for stage in stages[:-1]:
+            h = stage(h)
+            capacity = -(-h.data.nbytes * max_micro_batch_size // len(x))
+            # aligns the slots to cache lines
+            capacities.append(-(-capacity // 64) * 64)
+        stages[-1](h)
+
+        _share_params(stages, 'PipelineParallelUpdater')
+        _share_persistents(stages)
+        n_stages = len(stages)
+        connections = [_pipeline_connection(capacity, self.n_micro_batches)
+                       for capacity in capacities]
+        self._worker_params = []
+        self._grads = []
+        worker_grads = [[] for _ in six.moves.range(n_stages)]
+        for rank in six.moves.range(1, n_stages):
+            for param in _sorted_params(stages[rank]):
+                buf = sharedctypes.RawArray('b', max(param.data.nbytes, 1))
+                grad = numpy.frombuffer(
+                    buf, dtype=param.data.dtype, count=param.data.size)
+                grad = grad.reshape(param.data.shape)
+                self._worker_params.append(param)
+                self._grads.append(grad)
+                worker_grads[rank].append(grad)
+
+        pipes = [multiprocessing.Pipe() for _ in six.moves.range(1, n_stages)]
+        all_conns = [endpoint.conn for pair in connections
+                     for endpoint in pair]
+        all_conns += [conn for pair in pipes for conn in pair]
+        self._workers = []
+        for rank in six.moves.range(1, n_stages):
+            upstream = connections[rank - 1][1]
+            downstream = connections[rank][0] if rank < n_stages - 1 else None
+            worker_pipe = pipes[rank - 1][1]
+            used = [worker_pipe, upstream.conn]
+            if downstream is not None:
+                used.append(downstream.conn)
+            worker = multiprocessing.Process(
+                target=_pipeline_worker,
+                args=(worker_pipe, rank, numpy.random.randint(2 ** 31),
+                      stages, upstream, downstream, worker_grads[rank],
+                      self._optimizers, self.loss_func,
+                      [conn for conn in all_conns
+                       if all(conn is not u for u in used)]))
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+        self._pipes = [pair[0] for pair in pipes]
+        self._downstream = connections[0][0] if connections else None
+        used = list(self._pipes)
+        if self._downstream is not None:
+            used.append(self._downstream.conn)
+        for conn in all_conns:
+            if all(conn is not u for u in used):
+                conn.close()
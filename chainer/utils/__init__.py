@@ -1,5 +1,6 @@
 import numpy
 
+from chainer.utils import lazy_import
 from chainer.utils import walker_alias  # NOQA
 
 
@@ -32,3 +33,7 @@ def force_type(dtype, value):
         return value.astype(dtype, copy=False)
     else:
         return value
+
+
+# the other submodules, e.g. chainer.utils.conv, are imported on access
+lazy_import.replace_module(__name__, {})
@@ -0,0 +1,105 @@
+import importlib
+import pkgutil
+import sys
+import types
+
+import six
+
+
+class LazyModule(types.ModuleType):
+
+    """Module whose attributes are imported on their first access.
+
+    This module type is used by packages of Chainer that collect many
+    submodules or depend on optional libraries, so that ``import chainer``
+    does not import all of them. Each lazy attribute is imported by the
+    equivalent of ``from <module> import <name>`` when it is accessed for the
+    first time, and then stored to the module as an ordinary attribute.
+
+    Other attributes that name submodules of the package are also imported
+    on their first access, so that the dotted access to a submodule, e.g.
+    ``chainer.functions.loss.crf1d``, works without importing it explicitly.
+
+    Use :func:`replace_module` to create an instance of this class.
+
+    """
+
+    def __getattr__(self, name):
+        # This method is only called when the usual lookup fails, i.e. for
+        # attributes not imported yet.
+        lazy_attributes = self.__dict__.get('_lazy_attributes', {})
+        if name not in lazy_attributes:
+            if not self._has_submodule(name):
+                raise AttributeError('module {} has no attribute {}'.format(
+                    self.__name__, name))
+            module_name = '.'
+        else:
+            module_name = lazy_attributes[name]
+
+        if module_name == '.':
+            value = importlib.import_module('.' + name, self.__name__)
+        else:
+            module = importlib.import_module(module_name, self.__name__)
+            try:
+                value = getattr(module, name)
+            except AttributeError:
+                value = importlib.import_module(
+                    '{}.{}'.format(module.__name__, name))
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        names = set(self.__dict__)
+        names.update(self.__dict__.get('__all__', ()))
+        return sorted(names)
+
+    def _has_submodule(self, name):
+        path = self.__dict__.get('__path__')
+        if path is None or name.startswith('__'):
+            return False
+        return any(module_name == name
+                   for _, module_name, _ in pkgutil.iter_modules(path))
+
+
+def replace_module(name, imports):
+    """Replaces a module by a :class:`LazyModule`.
+
+    This function is called at the end of the ``__init__.py`` of a package,
+    in place of the import statements of its public API. The module object is
+    replaced in :data:`sys.modules`, so the importer of the package receives
+    the lazy module.
+
+    Subpackages of a lazy package also call this function with an empty
+    ``imports``, so that their submodules can be accessed by attributes.
+
+    Args:
+        name (str): Name of the module to replace, i.e. ``__name__``.
+        imports (dict): Dictionary that maps a module name to the list of
+            names imported from it. A module name that starts with a dot is
+            relative to the replaced module, and ``'.'`` denotes the
+            submodules of the replaced package itself. The imported names
+            are listed in ``__all__`` of the new module unless it is empty.
+
+    Returns:
+        LazyModule: The new module object.
+
+    """
+    module = sys.modules[name]
+    lazy_module = LazyModule(name)
+    lazy_module.__dict__.update(module.__dict__)
+    # Python 2 clears the dictionary of a module object when it is deleted,
+    # while the functions defined in the module still use it as their
+    # globals.
+    lazy_module._original_module = module
+
+    lazy_attributes = {}
+    for module_name, names in six.iteritems(imports):
+        for attr in names:
+            lazy_attributes[attr] = module_name
+    lazy_module._lazy_attributes = lazy_attributes
+    if lazy_attributes:
+        lazy_module.__all__ = sorted(
+            attr for attr in lazy_attributes if not attr.startswith('_'))
+
+    sys.modules[name] = lazy_module
+    return lazy_module
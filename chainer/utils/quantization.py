@@ -0,0 +1,87 @@
+import numpy
+import six
+
+
+# Number of int8 products whose sum is exactly representable in float32,
+# i.e. 1024 * 127 ** 2 < 2 ** 24.
+_block_size = 1024
+
+# Size in bytes of the scratch buffer of the float32 blocks of the weight
+# matrix converted on the fly, small enough to stay in the cache.
+_scratch_size = 1 << 20
+
+
+def scale_of(max_abs):
+    """Returns the scales of symmetric int8 quantization.
+
+    Args:
+        max_abs (numpy.ndarray or float): Maximum absolute values of the
+            quantized values. Zeros are treated as ones.
+
+    Returns:
+        numpy.ndarray: The scales in float32, which map the maximum absolute
+        values to 127.
+
+    """
+    max_abs = numpy.asarray(max_abs, dtype=numpy.float32)
+    return numpy.where(max_abs > 0, max_abs / 127, 1).astype(numpy.float32)
+
+
+def quantize(x, scale):
+    """Quantizes an array to int8.
+
+    Args:
+        x (numpy.ndarray): Array to quantize.
+        scale (numpy.ndarray or float): Scale of the quantization. It must be
+            broadcastable to ``x``.
+
+    Returns:
+        numpy.ndarray: The int8 array nearest to ``x / scale`` in the range
+        of ``[-127, 127]``.
+
+    """
+    q = numpy.asarray(x / scale)
+    numpy.clip(q, -127, 127, out=q)
+    # Rounds half to even like numpy.rint, which is much slower, by adding
+    # and subtracting a number whose unit in the last place is one.
+    magic = q.dtype.type(1.5 * 2 ** numpy.finfo(q.dtype).nmant)
+    q += magic
+    q -= magic
+    return q.astype(numpy.int8)
+
+
+def matmul_int32(a, b):
+    """Computes ``a.dot(b.T)`` of int8 matrices with int32 accumulation.
+
+    NumPy has no fast routine of integer matrix products, so the product is
+    computed by float32 BLAS on blocks of the inner dimension small enough
+    that the partial sums are exact, and then the partial sums are
+    accumulated in int32. The blocks of ``b``, which is usually a weight
+    matrix, are converted to float32 on the fly in a scratch buffer of a
+    fixed size, so that no float32 copy of the whole matrix is made.
+
+    Args:
+        a (numpy.ndarray): int8 matrix of shape ``(m, k)``.
+        b (numpy.ndarray): int8 matrix of shape ``(n, k)``.
+
+    Returns:
+        numpy.ndarray: int32 matrix of shape ``(m, n)``.
+
+    """
+    m, k = a.shape
+    n = b.shape[0]
+    y = numpy.zeros((m, n), dtype=numpy.int32)
+    if k == 0 or n == 0:
+        return y
+    width = min(k, _block_size)
+    rows = max(1, min(n, _scratch_size // (4 * width)))
+    scratch = numpy.empty((rows, width), dtype=numpy.float32)
+    for j in six.moves.range(0, k, _block_size):
+        a_block = a[:, j:j + _block_size].astype(numpy.float32)
+        for i in six.moves.range(0, n, rows):
+            b_block = b[i:i + rows, j:j + _block_size]
+            b_float = scratch[:b_block.shape[0], :b_block.shape[1]]
+            b_float[...] = b_block
+            partial = a_block.dot(b_float.T)
+            y[:, i:i + rows] += partial.astype(numpy.int32)
+    return y
@@ -89,6 +89,11 @@ class Variable(object):
 
     """
 
+    # Graph nodes are created for every function application, so their
+    # attributes are stored in slots instead of a per-instance dictionary.
+    __slots__ = ('data', 'rank', '_volatile', '_grad', 'creator', 'name',
+                 '__weakref__')
+
     def __init__(self, data, volatile=flag.OFF, name=None, grad=None):
         if not isinstance(data, (numpy.ndarray, cuda.ndarray)):
             msg = '''numpy.ndarray or cuda.ndarray are expected.
@@ -242,10 +247,16 @@ Actual: {0}'''.format(type(data))
         warnings.warn(
             'Variable.zerograd is deprecated. Use Variable.cleargard instead.',
             DeprecationWarning)
-        with cuda.get_device(self.data) as dev:
+        if isinstance(self.data, numpy.ndarray):
+            if self._grad is None:
+                self._grad = numpy.zeros_like(self.data)
+            else:
+                self._grad.fill(0)
+            return
+
+        with cuda.get_device(self.data):
             if self._grad is None:
-                xp = numpy if int(dev) == -1 else cuda.cupy
-                self._grad = xp.zeros_like(self.data)
+                self._grad = cuda.cupy.zeros_like(self.data)
             else:
                 self._grad.fill(0)
 
@@ -286,6 +297,14 @@ Actual: {0}'''.format(type(data))
         if src is None:
             return
 
+        if (isinstance(src, numpy.ndarray) and
+                isinstance(self.data, numpy.ndarray)):
+            if dst is None:
+                self._grad = numpy.copy(src)
+            else:
+                self._grad += src
+            return
+
         src_dev = cuda.get_device(src)
         dst_dev = cuda.get_device(self.data)
 
@@ -360,6 +379,8 @@ Actual: {0}'''.format(type(data))
                     raise
 
         is_debug = chainer.is_debug()
+        # No device has to be selected if CuPy is not available
+        host_only = not cuda.available
 
         cand_funcs = []
         seen_set = set()
@@ -368,10 +389,10 @@ Actual: {0}'''.format(type(data))
 
         # Initialize error by 1, if this is a loss variable
         if self.data.size == 1 and self.grad is None:
-            with cuda.get_device(self.data) as device:
-                if device is cuda.DummyDevice:
-                    self.grad = numpy.ones_like(self.data)
-                else:
+            if isinstance(self.data, numpy.ndarray):
+                self.grad = numpy.ones_like(self.data)
+            else:
+                with cuda.get_device(self.data):
                     self.grad = cuda.cupy.ones_like(self.data)
 
         def add_cand(cand):
@@ -393,7 +414,8 @@ Actual: {0}'''.format(type(data))
                 hooks = collections.OrderedDict(hooks)
                 hooks.update(func.local_function_hooks)
 
-            cuda.get_device(*(in_data + out_grad)).use()
+            if not host_only:
+                cuda.get_device(*(in_data + out_grad)).use()
             for hook in six.itervalues(hooks):
                 hook.backward_preprocess(func, in_data, out_grad)
             gxs = func.backward(in_data, out_grad)
@@ -428,7 +450,8 @@ Actual: {0}'''.format(type(data))
                         x.grad = gx
                         need_copy.add(id_x)
                     else:
-                        cuda.get_device(gx).use()
+                        if not host_only:
+                            cuda.get_device(gx).use()
                         if id_x in need_copy:
                             x.grad = utils.force_array(x.grad + gx)  # copy
                             need_copy.remove(id_x)
@@ -441,7 +464,8 @@ Actual: {0}'''.format(type(data))
                         seen_vars.add(id_x)
                         need_copy.add(id_x)
                     else:
-                        cuda.get_device(gx).use()
+                        if not host_only:
+                            cuda.get_device(gx).use()
                         if id_x in need_copy:  # 2nd visit
                             x._grad = utils.force_array(gx + x._grad)  # copied
                             need_copy.remove(id_x)
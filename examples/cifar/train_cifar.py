@@ -1,6 +1,8 @@
 from __future__ import print_function
 import argparse
 
+import numpy
+
 import chainer
 import chainer.links as L
 from chainer import training
@@ -34,11 +36,18 @@ def main():
                         help='GPU ID (negative value indicates CPU)')
     parser.add_argument('--out', '-o', default='result',
                         help='Directory to output the result')
+    parser.add_argument('--processes', '-p', type=int, default=1,
+                        help='Number of processes to compute the gradients '
+                        'in parallel on CPU')
     parser.add_argument('--resume', '-r', default='',
                         help='Resume the training from snapshot')
     args = parser.parse_args()
 
+    if args.gpu >= 0 and args.processes > 1:
+        raise ValueError('multiple processes are only supported on CPU')
+
     print('GPU: {}'.format(args.gpu))
+    print('# process: {}'.format(args.processes))
     print('# Minibatch-size: {}'.format(args.batchsize))
     print('# epoch: {}'.format(args.epoch))
     print('')
@@ -65,11 +74,23 @@ def main():
     optimizer.setup(model)
     optimizer.add_hook(chainer.optimizer.WeightDecay(5e-4))
 
-    train_iter = chainer.iterators.SerialIterator(train, args.batchsize)
     test_iter = chainer.iterators.SerialIterator(test, args.batchsize,
                                                  repeat=False, shuffle=False)
     # Set up a trainer
-    updater = training.StandardUpdater(train_iter, optimizer, device=args.gpu)
+    if args.processes > 1:
+        # each process computes the gradients of a part of each mini-batch
+        # taken from its own part of the dataset
+        bounds = numpy.linspace(0, len(train), args.processes + 1).astype(int)
+        train_iters = [
+            chainer.iterators.SerialIterator(
+                chainer.datasets.SubDataset(train, start, finish),
+                args.batchsize // args.processes)
+            for start, finish in zip(bounds[:-1], bounds[1:])]
+        updater = training.MultiprocessParallelUpdater(train_iters, optimizer)
+    else:
+        train_iter = chainer.iterators.SerialIterator(train, args.batchsize)
+        updater = training.StandardUpdater(
+            train_iter, optimizer, device=args.gpu)
     trainer = training.Trainer(updater, (args.epoch, 'epoch'), out=args.out)
 
     # Evaluate the model with the test dataset for each epoch
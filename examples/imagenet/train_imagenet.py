@@ -10,11 +10,12 @@ ImageDataLayer).
 """
 from __future__ import print_function
 import argparse
-import random
+import os
 
 import numpy as np
 
 import chainer
+from chainer.dataset import transform
 from chainer import training
 from chainer.training import extensions
 
@@ -24,45 +25,36 @@ import googlenetbn
 import nin
 
 
-class PreprocessedDataset(chainer.dataset.DatasetMixin):
+class Preprocess(object):
 
-    def __init__(self, path, root, mean, crop_size, random=True):
-        self.base = chainer.datasets.LabeledImageDataset(path, root)
-        self.mean = mean.astype('f')
-        self.crop_size = crop_size
-        self.random = random
+    """Transformation applied to each minibatch of uint8 images.
 
-    def __len__(self):
-        return len(self.base)
+    It applies following preprocesses to the whole minibatch at once:
+        - Cropping (random or center rectangular)
+        - Random flip
+        - Subtracting the center crop of the mean image
+        - Scaling to [0, 1] value
 
-    def get_example(self, i):
-        # It reads the i-th image/label pair and return a preprocessed image.
-        # It applies following preprocesses:
-        #     - Cropping (random or center rectangular)
-        #     - Random flip
-        #     - Scaling to [0, 1] value
-        crop_size = self.crop_size
+    """
 
-        image, label = self.base[i]
-        _, h, w = image.shape
+    def __init__(self, mean, crop_size, random=True):
+        self.mean = transform.center_crop(mean[None], (crop_size, crop_size))
+        self.mean = self.mean[0].astype('f')
+        self.crop_size = crop_size
+        self.random = random
 
+    def __call__(self, images, random_state):
+        size = self.crop_size, self.crop_size
         if self.random:
-            # Randomly crop a region and flip the image
-            top = random.randint(0, h - crop_size - 1)
-            left = random.randint(0, w - crop_size - 1)
-            if random.randint(0, 1):
-                image = image[:, :, ::-1]
+            images = transform.random_crop(images, size, random_state)
+            images = transform.random_flip(images, random_state)
         else:
-            # Crop the center
-            top = (h - crop_size) // 2
-            left = (w - crop_size) // 2
-        bottom = top + crop_size
-        right = left + crop_size
-
-        image = image[:, top:bottom, left:right]
-        image -= self.mean[:, top:bottom, left:right]
-        image *= (1.0 / 255.0)  # Scale to [0, 1]
-        return image, label
+            images = transform.center_crop(images, size)
+        xp = chainer.cuda.get_array_module(images)
+        if not isinstance(self.mean, xp.ndarray):
+            # Keep the mean on the device of the images
+            self.mean = xp.asarray(self.mean)
+        return transform.normalize(images, self.mean, 255)
 
 
 class TestModeEvaluator(extensions.Evaluator):
@@ -93,6 +85,9 @@ def main():
                         help='Convnet architecture')
     parser.add_argument('--batchsize', '-B', type=int, default=32,
                         help='Learning minibatch size')
+    parser.add_argument('--cache', '-c',
+                        help='Directory to store the caches of decoded '
+                        'images (they are kept in memory if not given)')
     parser.add_argument('--epoch', '-E', type=int, default=10,
                         help='Number of epochs to train')
     parser.add_argument('--gpu', '-g', type=int, default=-1,
@@ -126,8 +121,18 @@ def main():
 
     # Load the datasets and mean file
     mean = np.load(args.mean)
-    train = PreprocessedDataset(args.train, args.root, mean, model.insize)
-    val = PreprocessedDataset(args.val, args.root, mean, model.insize, False)
+    train_cache = val_cache = None
+    if args.cache:
+        train_cache = os.path.join(args.cache, 'train.cache')
+        val_cache = os.path.join(args.cache, 'val.cache')
+    train = chainer.datasets.CachedLabeledImageDataset(
+        args.train, args.root, cache=train_cache)
+    val = chainer.datasets.CachedLabeledImageDataset(
+        args.val, args.root, cache=val_cache)
+    train_converter = transform.TransformConverter(
+        Preprocess(mean, model.insize))
+    val_converter = transform.TransformConverter(
+        Preprocess(mean, model.insize, False))
     # These iterators load the images with subprocesses running in parallel to
     # the training/validation.
     train_iter = chainer.iterators.MultiprocessIterator(
@@ -140,13 +145,16 @@ def main():
     optimizer.setup(model)
 
     # Set up a trainer
-    updater = training.StandardUpdater(train_iter, optimizer, device=args.gpu)
+    updater = training.StandardUpdater(
+        train_iter, optimizer, converter=train_converter, device=args.gpu)
     trainer = training.Trainer(updater, (args.epoch, 'epoch'), args.out)
 
     val_interval = (10 if args.test else 100000), 'iteration'
     log_interval = (10 if args.test else 1000), 'iteration'
 
-    trainer.extend(TestModeEvaluator(val_iter, model, device=args.gpu),
+    trainer.extend(TestModeEvaluator(val_iter, model,
+                                     converter=val_converter,
+                                     device=args.gpu),
                    trigger=val_interval)
     trainer.extend(extensions.dump_graph('main/loss'))
     trainer.extend(extensions.snapshot(), trigger=val_interval)
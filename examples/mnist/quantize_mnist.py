@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Benchmark of the int8 quantization of the MNIST example.
+
+This script loads a model trained by ``train_mnist.py`` from a snapshot of
+the trainer, quantizes its linear layers to int8 with calibration on a part
+of the training set, and compares the accuracy and the throughput on the test
+set of the float and the quantized models on CPU.
+
+"""
+from __future__ import division
+from __future__ import print_function
+
+import argparse
+import time
+
+import numpy
+
+import chainer
+import chainer.links as L
+from chainer import serializers
+
+import train_mnist
+
+
+def evaluate(predictor, dataset, batchsize):
+    iterator = chainer.iterators.SerialIterator(
+        dataset, batchsize, repeat=False, shuffle=False)
+    correct = 0
+    elapsed = 0
+    for batch in iterator:
+        x, t = chainer.dataset.concat_examples(batch)
+        start = time.time()
+        y = predictor(chainer.Variable(x, volatile='on'))
+        elapsed += time.time() - start
+        correct += int((y.data.argmax(axis=1) == t).sum())
+    return correct / len(dataset), len(dataset) / elapsed
+
+
+def model_size(link):
+    size = sum(param.data.nbytes for param in link.params())
+    for child in link.links():
+        for name in child._persistent:
+            value = getattr(child, name)
+            if isinstance(value, numpy.ndarray):
+                size += value.nbytes
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Chainer example: MNIST quantization')
+    parser.add_argument('snapshot',
+                        help='Snapshot of the trainer of train_mnist.py')
+    parser.add_argument('--batchsize', '-b', type=int, default=100,
+                        help='Number of images in each mini-batch')
+    parser.add_argument('--calibration', '-c', type=int, default=1000,
+                        help='Number of training images for calibration')
+    parser.add_argument('--unit', '-u', type=int, default=1000,
+                        help='Number of units')
+    args = parser.parse_args()
+
+    model = L.Classifier(train_mnist.MLP(args.unit, 10))
+    # Initialize the parameters of the links whose input sizes are inferred
+    model.predictor(numpy.zeros((1, 784), dtype=numpy.float32))
+    serializers.NpzDeserializer(
+        numpy.load(args.snapshot), path='updater/model:main/').load(model)
+
+    train, test = chainer.datasets.get_mnist()
+    calibration_iter = chainer.iterators.SerialIterator(
+        train[:args.calibration], args.batchsize, repeat=False)
+    quantized = L.quantize(model, calibration_iter)
+
+    print('{:<10}{:>12}{:>20}{:>16}'.format(
+        'model', 'accuracy', 'throughput (img/s)', 'size (bytes)'))
+    for name, target in (('float', model), ('int8', quantized)):
+        accuracy, throughput = evaluate(
+            target.predictor, test, args.batchsize)
+        print('{:<10}{:>12.4f}{:>20.1f}{:>16}'.format(
+            name, accuracy, throughput, model_size(target)))
+
+
+if __name__ == '__main__':
+    main()
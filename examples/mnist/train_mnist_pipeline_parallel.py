@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+from __future__ import print_function
+import argparse
+
+import chainer
+import chainer.functions as F
+import chainer.links as L
+from chainer import training
+from chainer.training import extensions
+
+
+# Network definition
+class Stage(chainer.Chain):
+
+    def __init__(self, n_out, activation=True):
+        super(Stage, self).__init__(
+            # the input size is inferred
+            l=L.Linear(None, n_out),
+        )
+        self.activation = activation
+
+    def __call__(self, x):
+        h = self.l(x)
+        if self.activation:
+            h = F.relu(h)
+        return h
+
+
+class PipelineMLP(chainer.ChainList):
+
+    def __init__(self, n_units, n_out, n_stages):
+        stages = [Stage(n_units) for _ in range(n_stages - 1)]
+        stages.append(Stage(n_out, activation=False))
+        super(PipelineMLP, self).__init__(*stages)
+
+    def __call__(self, x):
+        # used by the evaluator, which computes the stages in sequence
+        for stage in self:
+            x = stage(x)
+        return x
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Chainer example: MNIST')
+    parser.add_argument('--batchsize', '-b', type=int, default=100,
+                        help='Number of images in each mini-batch')
+    parser.add_argument('--epoch', '-e', default=20, type=int,
+                        help='Number of sweeps over the dataset to train')
+    parser.add_argument('--micro-batches', '-m', default=8, type=int,
+                        help='Number of micro-batches each mini-batch is '
+                        'split into')
+    parser.add_argument('--out', '-o', default='result_pipeline',
+                        help='Directory to output the result')
+    parser.add_argument('--resume', '-r', default='',
+                        help='Resume the training from snapshot')
+    parser.add_argument('--stages', '-s', default=3, type=int,
+                        help='Number of stages, each of which runs in its '
+                        'own process')
+    parser.add_argument('--unit', '-u', default=1000, type=int,
+                        help='Number of units')
+    args = parser.parse_args()
+
+    print('# stage: {}'.format(args.stages))
+    print('# micro-batch: {}'.format(args.micro_batches))
+    print('# unit: {}'.format(args.unit))
+    print('# Minibatch-size: {}'.format(args.batchsize))
+    print('# epoch: {}'.format(args.epoch))
+    print('')
+
+    # See train_mnist.py for the meaning of these lines
+
+    model = L.Classifier(PipelineMLP(args.unit, 10, args.stages))
+
+    optimizer = chainer.optimizers.Adam()
+    optimizer.setup(model)
+
+    train, test = chainer.datasets.get_mnist()
+
+    train_iter = chainer.iterators.SerialIterator(train, args.batchsize)
+    test_iter = chainer.iterators.SerialIterator(test, args.batchsize,
+                                                 repeat=False, shuffle=False)
+
+    def loss_func(y, t):
+        chainer.report({'accuracy': F.accuracy(y, t)})
+        return F.softmax_cross_entropy(y, t)
+
+    # The stages are streamed with micro-batches by multiple processes
+    updater = training.PipelineParallelUpdater(
+        train_iter, optimizer, stages=model.predictor,
+        n_micro_batches=args.micro_batches, loss_func=loss_func)
+    trainer = training.Trainer(updater, (args.epoch, 'epoch'), out=args.out)
+
+    trainer.extend(extensions.Evaluator(test_iter, model))
+    trainer.extend(extensions.snapshot(), trigger=(args.epoch, 'epoch'))
+    trainer.extend(extensions.LogReport())
+    trainer.extend(extensions.PrintReport(
+        ['epoch', 'main/loss', 'validation/main/loss',
+         'main/accuracy', 'validation/main/accuracy', 'elapsed_time']))
+    trainer.extend(extensions.ProgressBar())
+
+    if args.resume:
+        chainer.serializers.load_npz(args.resume, trainer)
+
+    trainer.run()
+
+
+if __name__ == '__main__':
+    main()
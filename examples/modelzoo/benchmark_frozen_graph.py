@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""Benchmark of the frozen inference graph of ResNet-50.
+
+This script compares the latency on CPU of the forward computation of
+:class:`~chainer.links.ResNet50Layers` with volatile variables and of the
+frozen graph built from it by :func:`chainer.frozen_graph.freeze`. The
+weights are initialized randomly, so no pretrained model is needed.
+
+"""
+from __future__ import print_function
+
+import argparse
+import time
+
+import numpy
+
+import chainer
+from chainer import frozen_graph
+import chainer.links as L
+
+
+def elapsed(f):
+    start = time.time()
+    f()
+    return time.time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark of the frozen graph of ResNet-50')
+    parser.add_argument('--batchsize', '-B', type=int, default=1,
+                        help='Number of images in each mini-batch')
+    parser.add_argument('--repeat', '-r', type=int, default=10,
+                        help='Number of timed runs; the best one is reported')
+    parser.add_argument('--layer', '-l', default='pool5',
+                        help='Name of the output layer')
+    args = parser.parse_args()
+
+    model = L.ResNet50Layers(pretrained_model=None)
+    for link in model.links():
+        if isinstance(link, L.BatchNormalization):
+            # avoid the division by zero of the initial statistics
+            link.avg_var[:] = 1
+    x = numpy.random.uniform(
+        -1, 1, (args.batchsize, 3, 224, 224)).astype(numpy.float32)
+    layers = [args.layer]
+    graph = frozen_graph.freeze(model, x, layers=layers)
+
+    def run_volatile():
+        return model(chainer.Variable(x, volatile='on'), layers=layers)
+
+    def run_frozen():
+        return graph(x)
+
+    run_volatile()
+    run_frozen()
+    # run them alternately so that both are measured in the same conditions
+    volatile = float('inf')
+    frozen = float('inf')
+    for _ in range(args.repeat):
+        volatile = min(volatile, elapsed(run_volatile))
+        frozen = min(frozen, elapsed(run_frozen))
+
+    print('batch size: {}'.format(args.batchsize))
+    print('volatile: {:.1f} ms'.format(volatile * 1000))
+    print('frozen:   {:.1f} ms'.format(frozen * 1000))
+    print('speedup:  {:.2f}x'.format(volatile / frozen))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""Measures the throughput of saving and loading NPZ files.
+
+It compares :func:`chainer.serializers.savez_compressed` and
+:class:`chainer.serializers.NpzFile` with :func:`numpy.savez_compressed` and
+:func:`numpy.load` on random parameters of a given size.
+"""
+from __future__ import print_function
+import argparse
+import os
+import tempfile
+import time
+
+import numpy
+
+from chainer import serializers
+
+
+def measure(f, size):
+    start = time.time()
+    f()
+    return size / (time.time() - start) / 2 ** 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description='NPZ throughput benchmark')
+    parser.add_argument('--size', '-s', type=int, default=256,
+                        help='Total size of the arrays in MiB')
+    parser.add_argument('--arrays', '-a', type=int, default=8,
+                        help='Number of the arrays')
+    parser.add_argument('--level', '-l', type=int, default=6,
+                        help='Compression level of zlib')
+    parser.add_argument('--threads', '-t', type=int, default=None,
+                        help='Number of the threads (default: all the CPUs)')
+    args = parser.parse_args()
+
+    # Weights of a trained model are compressible only in part; rounding the
+    # mantissa roughly reproduces their compression ratio.
+    n = args.size * 2 ** 20 // 4 // args.arrays
+    arrays = {}
+    for i in range(args.arrays):
+        a = numpy.random.normal(0, 0.05, n).astype(numpy.float32)
+        arrays['param{}'.format(i)] = a.view(numpy.uint32) & 0xffffff00
+    size = sum(a.nbytes for a in arrays.values())
+
+    fd, path = tempfile.mkstemp(suffix='.npz')
+    os.close(fd)
+    try:
+        def numpy_save():
+            numpy.savez_compressed(path, **arrays)
+
+        def numpy_load():
+            with numpy.load(path) as f:
+                for key in f.files:
+                    f[key]
+
+        def chainer_save():
+            serializers.savez_compressed(path, arrays, args.level,
+                                         args.threads)
+
+        def chainer_load():
+            with serializers.NpzFile(path, args.threads) as f:
+                for key in f.files:
+                    f[key]
+
+        print('array size: {} MiB'.format(size // 2 ** 20))
+        save = measure(numpy_save, size)
+        load = measure(numpy_load, size)
+        ratio = float(os.path.getsize(path)) / size
+        print('numpy:   save {:7.1f} MiB/s  load {:7.1f} MiB/s  '
+              'ratio {:.3f}'.format(save, load, ratio))
+        save = measure(chainer_save, size)
+        load = measure(chainer_load, size)
+        ratio = float(os.path.getsize(path)) / size
+        print('chainer: save {:7.1f} MiB/s  load {:7.1f} MiB/s  '
+              'ratio {:.3f}'.format(save, load, ratio))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
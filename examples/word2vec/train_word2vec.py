@@ -43,6 +43,9 @@ parser.add_argument('--out-type', '-o', choices=['hsm', 'ns', 'original'],
                     '"ns": negative sampling, "original": no approximation)')
 parser.add_argument('--out', default='result',
                     help='Directory to output the result')
+parser.add_argument('--processes', '-p', default=1, type=int,
+                    help='number of processes to update the model '
+                    'asynchronously on CPU')
 parser.add_argument('--test', dest='test', action='store_true')
 parser.set_defaults(test=False)
 
@@ -52,7 +55,11 @@ if args.gpu >= 0:
     chainer.cuda.get_device(args.gpu).use()
     cuda.check_cuda_available()
 
+if args.gpu >= 0 and args.processes > 1:
+    raise ValueError('multiple processes are only supported on CPU')
+
 print('GPU: {}'.format(args.gpu))
+print('# process: {}'.format(args.processes))
 print('# unit: {}'.format(args.unit))
 print('Window: {}'.format(args.window))
 print('Minibatch-size: {}'.format(args.batchsize))
@@ -216,10 +223,17 @@ if args.gpu >= 0:
 optimizer = O.Adam()
 optimizer.setup(model)
 
-train_iter = WindowIterator(train, args.window, args.batchsize)
 val_iter = WindowIterator(val, args.window, args.batchsize, repeat=False)
-updater = training.StandardUpdater(
-    train_iter, optimizer, converter=convert, device=args.gpu)
+if args.processes > 1:
+    # each process trains the shared model with a part of the corpus
+    train_iters = [WindowIterator(part, args.window, args.batchsize)
+                   for part in np.array_split(train, args.processes)]
+    updater = training.HogwildUpdater(
+        train_iters, optimizer, converter=convert)
+else:
+    train_iter = WindowIterator(train, args.window, args.batchsize)
+    updater = training.StandardUpdater(
+        train_iter, optimizer, converter=convert, device=args.gpu)
 trainer = training.Trainer(updater, (args.epoch, 'epoch'), out=args.out)
 
 trainer.extend(extensions.Evaluator(
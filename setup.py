@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 
+import os
+
 from setuptools import setup
 
 import chainer_setup_build
@@ -16,9 +18,13 @@ install_requires = [
 
 ext_modules = chainer_setup_build.get_ext_modules()
 
+here = os.path.abspath(os.path.dirname(__file__))
+# Get __version__ variable
+exec(open(os.path.join(here, 'chainer', '_version.py')).read())
+
 setup(
     name='chainer',
-    version='1.22.0',
+    version=__version__,  # NOQA
     description='A flexible framework of neural networks',
     author='Seiya Tokui',
     author_email='tokui@preferred.jp',
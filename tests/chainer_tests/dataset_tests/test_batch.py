@@ -0,0 +1,115 @@
+import unittest
+
+import numpy
+
+from chainer import cuda
+from chainer import dataset
+from chainer import testing
+from chainer.testing import attr
+
+
+class TestColumnBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.random.rand(4, 3)
+        self.t = [0, 1, 2, 3]
+        self.batch = dataset.ColumnBatch((self.x, self.t))
+
+    def test_len(self):
+        self.assertEqual(len(self.batch), 4)
+
+    def test_getitem(self):
+        for i in range(-4, 4):
+            x, t = self.batch[i]
+            numpy.testing.assert_array_equal(x, self.x[i])
+            self.assertEqual(t, self.t[i])
+
+    def test_getitem_overrun(self):
+        with self.assertRaises(IndexError):
+            self.batch[4]
+        with self.assertRaises(IndexError):
+            self.batch[-5]
+
+    def test_slice(self):
+        batch = self.batch[1::2]
+        self.assertIsInstance(batch, dataset.ColumnBatch)
+        numpy.testing.assert_array_equal(batch.columns[0], self.x[1::2])
+        self.assertEqual(batch.columns[1], [1, 3])
+
+    def test_index_array(self):
+        batch = self.batch[numpy.array([3, 0])]
+        self.assertIsInstance(batch, dataset.ColumnBatch)
+        numpy.testing.assert_array_equal(batch.columns[0], self.x[[3, 0]])
+        self.assertEqual(batch.columns[1], [3, 0])
+
+    def test_iter(self):
+        self.assertEqual([t for _, t in self.batch], self.t)
+
+    def test_dict(self):
+        batch = dataset.ColumnBatch({'x': self.x, 't': self.t})
+        self.assertEqual(len(batch), 4)
+        self.assertEqual(batch[2]['t'], 2)
+        self.assertEqual(batch[:2].columns['t'], [0, 1])
+
+    def test_len_mismatch(self):
+        with self.assertRaises(ValueError):
+            dataset.ColumnBatch((self.x, [0]))
+
+
+class TestGetExamples(unittest.TestCase):
+
+    def test_sequence(self):
+        self.assertEqual(dataset.get_examples([1, 2, 3], [2, 0]), [3, 1])
+
+    def test_method(self):
+        class Dataset(object):
+            def get_examples(self, indices):
+                return 'examples'
+
+        self.assertEqual(dataset.get_examples(Dataset(), [0]), 'examples')
+
+
+class TestConcatColumnBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.random.rand(4, 3).astype(numpy.float32)
+        self.t = numpy.arange(4, dtype=numpy.int32)
+
+    def check_concat(self, columns, device=None):
+        batch = dataset.ColumnBatch(columns)
+        actual = dataset.concat_examples(batch, device)
+        expect = dataset.concat_examples(list(batch))
+        if isinstance(expect, dict):
+            self.assertEqual(sorted(actual), sorted(expect))
+            keys = list(expect)
+            actual = [actual[key] for key in keys]
+            expect = [expect[key] for key in keys]
+        for a, e in zip(actual, expect):
+            if device is not None and device >= 0:
+                self.assertIsInstance(a, cuda.ndarray)
+            self.assertEqual(a.dtype, e.dtype)
+            numpy.testing.assert_array_equal(cuda.to_cpu(a), e)
+
+    def test_tuple(self):
+        self.check_concat((self.x, self.t))
+
+    def test_list_column(self):
+        self.check_concat((self.x, list(self.t)))
+
+    def test_dict(self):
+        self.check_concat({'x': self.x, 't': self.t})
+
+    def test_padding(self):
+        x = [numpy.ones(i, numpy.float32) for i in range(1, 5)]
+        batch = dataset.ColumnBatch((x, self.t))
+        actual = dataset.concat_examples(batch, padding=(-1, 0))
+        expect = dataset.concat_examples(list(batch), padding=(-1, 0))
+        for a, e in zip(actual, expect):
+            numpy.testing.assert_array_equal(a, e)
+
+    @attr.gpu
+    def test_to_gpu(self):
+        self.check_concat((self.x, self.t), cuda.Device().id)
+
+
+testing.run_module(__name__, __file__)
@@ -53,5 +53,9 @@ class TestDatasetMixin(unittest.TestCase):
         self.assertEqual(ds[::-2], ds.values[::-2])
         self.assertEqual(ds[:10], ds.values[:10])
 
+    def test_get_examples(self):
+        self.assertEqual(self.ds.get_examples([3, 0, 3]), [4, 1, 4])
+        self.assertEqual(self.ds.get_examples([]), [])
+
 
 testing.run_module(__name__, __file__)
@@ -0,0 +1,264 @@
+import unittest
+
+import numpy
+
+from chainer import cuda
+from chainer import dataset
+from chainer.dataset import transform
+from chainer import testing
+from chainer.testing import attr
+from chainer.utils import imgproc
+
+
+def _images(n=4, c=3, h=8, w=10):
+    return numpy.random.randint(0, 256, (n, c, h, w)).astype(numpy.uint8)
+
+
+class TestCrop(unittest.TestCase):
+
+    def setUp(self):
+        self.x = _images()
+
+    def check_random_crop(self, x):
+        y = transform.random_crop(x, (5, 6), numpy.random.RandomState(0))
+        self.assertIsInstance(y, type(x))
+        self.assertEqual(y.shape, (4, 3, 5, 6))
+        y = cuda.to_cpu(y)
+        x = cuda.to_cpu(x)
+        # each crop is a window of the corresponding image
+        for xi, yi in zip(x, y):
+            found = False
+            for top in range(4):
+                for left in range(5):
+                    if (xi[:, top:top + 5, left:left + 6] == yi).all():
+                        found = True
+            self.assertTrue(found)
+
+    def test_random_crop_cpu(self):
+        self.check_random_crop(self.x)
+
+    @attr.gpu
+    def test_random_crop_gpu(self):
+        self.check_random_crop(cuda.to_gpu(self.x))
+
+    def test_random_crop_reproducible(self):
+        y1 = transform.random_crop(
+            self.x, (5, 6), numpy.random.RandomState(1))
+        y2 = transform.random_crop(
+            self.x, (5, 6), numpy.random.RandomState(1))
+        numpy.testing.assert_array_equal(y1, y2)
+
+    def test_random_crop_too_large(self):
+        with self.assertRaises(ValueError):
+            transform.random_crop(self.x, (9, 6))
+
+    def test_center_crop(self):
+        y = transform.center_crop(self.x, (4, 6))
+        numpy.testing.assert_array_equal(y, self.x[:, :, 2:6, 2:8])
+
+
+class TestFlip(unittest.TestCase):
+
+    def setUp(self):
+        self.x = _images(n=16)
+
+    def check_random_flip(self, x, horizontal, vertical):
+        y = transform.random_flip(x, numpy.random.RandomState(0),
+                                  horizontal, vertical)
+        self.assertEqual(y.shape, x.shape)
+        x = cuda.to_cpu(x)
+        y = cuda.to_cpu(y)
+        flipped = set()
+        for xi, yi in zip(x, y):
+            candidates = {
+                (False, False): xi,
+                (True, False): xi[:, :, ::-1],
+                (False, True): xi[:, ::-1],
+                (True, True): xi[:, ::-1, ::-1],
+            }
+            for key, candidate in candidates.items():
+                if (candidate == yi).all():
+                    flipped.add(key)
+                    break
+            else:
+                self.fail('image is not flipped correctly')
+        self.assertEqual(flipped, {
+            (h, v) for h in {False, horizontal} for v in {False, vertical}})
+
+    def test_random_flip_cpu(self):
+        self.check_random_flip(self.x, True, False)
+
+    def test_random_flip_vertical_cpu(self):
+        self.check_random_flip(self.x, True, True)
+
+    @attr.gpu
+    def test_random_flip_gpu(self):
+        self.check_random_flip(cuda.to_gpu(self.x), True, True)
+
+
+class TestRandomScale(unittest.TestCase):
+
+    def setUp(self):
+        self.x = _images(h=8, w=8)
+
+    def check_identity(self, x):
+        y = transform.random_scale(x, (1, 1))
+        numpy.testing.assert_array_equal(cuda.to_cpu(y), cuda.to_cpu(x))
+
+    def test_identity_cpu(self):
+        self.check_identity(self.x)
+
+    @attr.gpu
+    def test_identity_gpu(self):
+        self.check_identity(cuda.to_gpu(self.x))
+
+    def test_zoom_in(self):
+        y = transform.random_scale(self.x, (2, 2))
+        self.assertEqual(y.shape, self.x.shape)
+        # each pixel of the center region is replicated
+        numpy.testing.assert_array_equal(
+            y[:, :, ::2, ::2], self.x[:, :, 2:6, 2:6])
+        numpy.testing.assert_array_equal(
+            y[:, :, 1::2, 1::2], self.x[:, :, 2:6, 2:6])
+
+    def test_zoom_out(self):
+        y = transform.random_scale(self.x, (0.5, 0.5))
+        # the pixels on the borders are replicated
+        numpy.testing.assert_array_equal(y[:, :, 0, 0], self.x[:, :, 0, 0])
+        numpy.testing.assert_array_equal(y[:, :, 7, 7], self.x[:, :, 7, 7])
+        numpy.testing.assert_array_equal(
+            y[:, :, 2:6, 2:6], self.x[:, :, 1::2, 1::2])
+
+
+class TestNormalize(unittest.TestCase):
+
+    def setUp(self):
+        self.x = _images()
+        self.mean = numpy.random.uniform(0, 255, 3).astype(numpy.float32)
+        self.std = numpy.random.uniform(1, 2, 3).astype(numpy.float32)
+
+    def check_normalize(self, x, mean, std):
+        y = transform.normalize(x, mean, std)
+        self.assertEqual(y.dtype, numpy.float32)
+        expect = ((self.x - self.mean[:, None, None]) /
+                  self.std[:, None, None])
+        numpy.testing.assert_allclose(cuda.to_cpu(y), expect, rtol=1e-6)
+
+    def test_normalize_cpu(self):
+        self.check_normalize(self.x, self.mean, self.std)
+
+    @attr.gpu
+    def test_normalize_gpu(self):
+        self.check_normalize(cuda.to_gpu(self.x), self.mean, self.std)
+
+    @attr.gpu
+    def test_normalize_gpu_mean(self):
+        self.check_normalize(cuda.to_gpu(self.x), cuda.to_gpu(self.mean),
+                             cuda.to_gpu(self.std))
+
+    def test_normalize_scalar(self):
+        y = transform.normalize(self.x, 128, 255, numpy.float64)
+        self.assertEqual(y.dtype, numpy.float64)
+        numpy.testing.assert_allclose(y, (self.x - 128.) / 255)
+
+    def test_normalize_image(self):
+        mean = self.x[0]
+        y = transform.normalize(self.x, mean)
+        numpy.testing.assert_allclose(y, self.x - mean.astype('f'))
+
+
+class TestReorderChannels(unittest.TestCase):
+
+    def check_reorder_channels(self, x):
+        y = transform.reorder_channels(x, (2, 1, 0))
+        numpy.testing.assert_array_equal(
+            cuda.to_cpu(y), cuda.to_cpu(x)[:, ::-1])
+
+    def test_reorder_channels_cpu(self):
+        self.check_reorder_channels(_images())
+
+    @attr.gpu
+    def test_reorder_channels_gpu(self):
+        self.check_reorder_channels(cuda.to_gpu(_images()))
+
+
+class TestOversample(unittest.TestCase):
+
+    def setUp(self):
+        self.x = _images(h=10, w=12)
+
+    def check_oversample(self, x):
+        y = transform.oversample(x, (6, 6))
+        numpy.testing.assert_array_equal(
+            cuda.to_cpu(y), imgproc.oversample(self.x, (6, 6)))
+
+    def test_oversample_cpu(self):
+        self.check_oversample(self.x)
+
+    @attr.gpu
+    def test_oversample_gpu(self):
+        self.check_oversample(cuda.to_gpu(self.x))
+
+
+def _augment(x, random_state):
+    x = transform.random_crop(x, (5, 6), random_state)
+    x = transform.random_flip(x, random_state)
+    return transform.normalize(x, 128, 128)
+
+
+class TestTransformConverter(unittest.TestCase):
+
+    def setUp(self):
+        self.x = _images()
+        self.t = numpy.arange(4, dtype=numpy.int32)
+
+    def test_tuple(self):
+        converter = transform.TransformConverter(_augment, seed=0)
+        x, t = converter(list(zip(self.x, self.t)))
+        self.assertEqual(x.shape, (4, 3, 5, 6))
+        self.assertEqual(x.dtype, numpy.float32)
+        numpy.testing.assert_array_equal(t, self.t)
+        self.assertEqual(converter.count, 1)
+
+    def test_dict(self):
+        converter = transform.TransformConverter(_augment, key='x')
+        batch = [{'x': x, 't': t} for x, t in zip(self.x, self.t)]
+        arrays = converter(batch)
+        self.assertEqual(arrays['x'].shape, (4, 3, 5, 6))
+        numpy.testing.assert_array_equal(arrays['t'], self.t)
+
+    def test_array(self):
+        converter = transform.TransformConverter(_augment)
+        self.assertEqual(converter(list(self.x)).shape, (4, 3, 5, 6))
+
+    def test_reproducible(self):
+        batch = list(self.x)
+        converter1 = transform.TransformConverter(_augment, seed=3)
+        converter2 = transform.TransformConverter(_augment, seed=3)
+        # the global random state does not affect the results
+        numpy.random.seed(0)
+        ys1 = [converter1(batch) for _ in range(3)]
+        numpy.random.seed(1)
+        ys2 = [converter2(batch) for _ in range(3)]
+        for y1, y2 in zip(ys1, ys2):
+            numpy.testing.assert_array_equal(y1, y2)
+        # each batch is transformed differently
+        self.assertFalse((ys1[0] == ys1[1]).all() and
+                         (ys1[0] == ys1[2]).all())
+
+    @attr.gpu
+    def test_to_gpu(self):
+        converter = transform.TransformConverter(_augment, seed=0)
+        x, t = converter(list(zip(self.x, self.t)), cuda.Device().id)
+        self.assertIsInstance(x, cuda.ndarray)
+        self.assertIsInstance(t, cuda.ndarray)
+        expect, _ = transform.TransformConverter(_augment, seed=0)(
+            list(zip(self.x, self.t)))
+        numpy.testing.assert_allclose(cuda.to_cpu(x), expect)
+
+    def test_exported(self):
+        self.assertIs(dataset.TransformConverter,
+                      transform.TransformConverter)
+
+
+testing.run_module(__name__, __file__)
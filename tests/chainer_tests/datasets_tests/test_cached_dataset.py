@@ -0,0 +1,149 @@
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from chainer import dataset
+from chainer import datasets
+from chainer import iterators
+from chainer import testing
+
+
+class CountingDataset(dataset.DatasetMixin):
+
+    def __init__(self, n):
+        self.n = n
+        # shared with the forked processes
+        self.calls = multiprocessing.Array('l', n)
+
+    def __len__(self):
+        return self.n
+
+    def get_example(self, i):
+        with self.calls.get_lock():
+            self.calls[i] += 1
+        return numpy.full(4, i, dtype=numpy.float32), i
+
+
+@testing.parameterize(
+    {'spill': True, 'path': False},
+    {'spill': True, 'path': True},
+    {'spill': False, 'path': False},
+)
+class TestCachedDataset(unittest.TestCase):
+
+    def setUp(self):
+        self.base = CountingDataset(6)
+        self.dir = tempfile.mkdtemp()
+        path = os.path.join(self.dir, 'cache') if self.path else None
+        # about two examples are kept in memory
+        self.dataset = datasets.CachedDataset(
+            self.base, max_bytes=100, path=path, spill=self.spill)
+
+    def tearDown(self):
+        self.dataset.finalize()
+        shutil.rmtree(self.dir)
+
+    def check_example(self, example, i):
+        x, t = example
+        numpy.testing.assert_array_equal(x, numpy.full(4, i, numpy.float32))
+        self.assertEqual(t, i)
+
+    def test_len(self):
+        self.assertEqual(len(self.dataset), 6)
+
+    def test_get_example(self):
+        for _ in range(3):
+            self.check_example(self.dataset[2], 2)
+            self.check_example(self.dataset[-1], 5)
+        self.assertEqual(list(self.base.calls), [0, 0, 1, 0, 0, 1])
+        stats = self.dataset.statistics()
+        self.assertEqual(stats['memory_hits'], 4)
+        self.assertEqual(stats['disk_hits'], 0)
+        self.assertEqual(stats['misses'], 2)
+        self.assertAlmostEqual(stats['hit_rate'], 4. / 6)
+
+    def test_overrun(self):
+        with self.assertRaises(IndexError):
+            self.dataset[6]
+        with self.assertRaises(IndexError):
+            self.dataset.get_examples([0, -7])
+
+    def test_eviction(self):
+        for i in range(6):
+            self.dataset[i]
+        # only the recent examples are kept in memory
+        self.assertLessEqual(self.dataset.statistics()['memory_bytes'], 100)
+        for i in range(6):
+            self.check_example(self.dataset[i], i)
+        stats = self.dataset.statistics()
+        if self.spill:
+            self.assertEqual(list(self.base.calls), [1] * 6)
+            self.assertGreater(stats['disk_hits'], 0)
+        else:
+            self.assertGreater(sum(self.base.calls), 6)
+            self.assertEqual(stats['disk_hits'], 0)
+
+    def test_get_examples(self):
+        self.dataset[1]
+        examples = self.dataset.get_examples([1, 3, 1, 0])
+        self.assertEqual(len(examples), 4)
+        for example, i in zip(examples, [1, 3, 1, 0]):
+            self.check_example(example, i)
+        self.assertEqual(self.base.calls[1], 1)
+        self.assertEqual(self.base.calls[3], 1)
+
+    def test_get_examples_of_tuple_dataset(self):
+        x = numpy.arange(6, dtype=numpy.float32)
+        cached = datasets.CachedDataset(
+            datasets.TupleDataset(x, -x), spill=self.spill)
+        try:
+            examples = cached.get_examples([4, 2])
+            self.assertEqual(examples, [(4, -4), (2, -2)])
+            self.assertEqual(cached[4], (4, -4))
+        finally:
+            cached.finalize()
+
+    def test_multiprocess_iterator(self):
+        it = iterators.MultiprocessIterator(
+            self.dataset, 3, n_processes=2, shuffle=False)
+        try:
+            for _ in range(4):
+                batch = it.next()
+                self.assertEqual(len(batch), 3)
+        finally:
+            it.finalize()
+        if self.spill:
+            # examples computed by a worker are shared with the others
+            self.assertEqual(list(self.base.calls), [1] * 6)
+        # the statistics are counted over the workers
+        self.assertGreaterEqual(
+            sum(self.dataset.statistics()[key]
+                for key in ('memory_hits', 'disk_hits', 'misses')), 12)
+
+
+class TestCachedDatasetFinalize(unittest.TestCase):
+
+    def test_remove_temporary_files(self):
+        cached = datasets.CachedDataset([1, 2, 3])
+        cached[0]
+        path = cached._dir
+        self.assertTrue(os.path.isdir(path))
+        cached.finalize()
+        self.assertFalse(os.path.exists(path))
+
+    def test_keep_given_directory(self):
+        path = tempfile.mkdtemp()
+        try:
+            cached = datasets.CachedDataset([1, 2, 3], path=path)
+            cached[0]
+            cached.finalize()
+            self.assertTrue(os.path.exists(os.path.join(path, 'data')))
+        finally:
+            shutil.rmtree(path)
+
+
+testing.run_module(__name__, __file__)
@@ -70,13 +70,13 @@ class TestCifar(unittest.TestCase):
         train, test = retrieval_func(withlabel=self.withlabel, ndim=self.ndim,
                                      scale=self.scale)
 
-        with mock.patch('chainer.datasets.cifar.numpy', autospec=True) as \
-                mnumpy:
+        with mock.patch('chainer.datasets.cifar.npz', autospec=True) as \
+                mnpz:
             train, test = retrieval_func(withlabel=self.withlabel,
                                          ndim=self.ndim,
                                          scale=self.scale)
-        mnumpy.savez_compressed.assert_not_called()  # creator() not called
-        self.assertEqual(mnumpy.load.call_count, 1)
+        mnpz.savez_compressed.assert_not_called()  # creator() not called
+        self.assertEqual(mnpz.NpzFile.call_count, 1)
 
 
 testing.run_module(__name__, __file__)
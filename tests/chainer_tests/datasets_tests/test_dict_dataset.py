@@ -3,6 +3,7 @@ import unittest
 import numpy
 
 from chainer import cuda
+from chainer import dataset
 from chainer import datasets
 from chainer import testing
 from chainer.testing import attr
@@ -36,6 +37,25 @@ class TestDictDataset(unittest.TestCase):
     def test_dict_dataset_gpu(self):
         self.check_dict_dataset(cuda.to_gpu(self.x), cuda.to_gpu(self.y))
 
+    def check_get_examples(self, x, y):
+        dd = datasets.DictDataset(x=x, y=y)
+        batch = dd.get_examples([1, 2])
+        self.assertIsInstance(batch, dataset.ColumnBatch)
+        self.assertEqual(sorted(batch.columns), ['x', 'y'])
+        numpy.testing.assert_array_equal(
+            cuda.to_cpu(batch.columns['x']), cuda.to_cpu(x)[1:])
+        numpy.testing.assert_array_equal(
+            cuda.to_cpu(batch.columns['y']), cuda.to_cpu(y)[1:])
+        numpy.testing.assert_array_equal(
+            cuda.to_cpu(batch[0]['y']), cuda.to_cpu(y[1]))
+
+    def test_get_examples_cpu(self):
+        self.check_get_examples(self.x, self.y)
+
+    @attr.gpu
+    def test_get_examples_gpu(self):
+        self.check_get_examples(cuda.to_gpu(self.x), cuda.to_gpu(self.y))
+
     def test_dict_dataset_len_mismatch(self):
         with self.assertRaises(ValueError):
             datasets.DictDataset(x=self.x, z=self.z)
@@ -1,6 +1,11 @@
+import multiprocessing
 import os
+import pickle
+import shutil
+import tempfile
 import unittest
 
+import mock
 import numpy
 
 from chainer import datasets
@@ -76,4 +81,110 @@ class TestLabeledImageDatasetInvalidFormat(unittest.TestCase):
             datasets.LabeledImageDataset(path)
 
 
+@testing.parameterize(*testing.product({
+    'file': [False, True],
+    'size': [None, (20, 30)],
+}))
+@unittest.skipUnless(image_dataset.available, 'image_dataset is not available')
+class TestCachedLabeledImageDataset(unittest.TestCase):
+
+    def setUp(self):
+        self.root = os.path.join(os.path.dirname(__file__), 'image_dataset')
+        self.pairs = [('chainer.png', 0), ('chainer.png', 1)]
+        self.dir = tempfile.mkdtemp()
+        self.cache = os.path.join(self.dir, 'cache') if self.file else None
+        self.dataset = self.create()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def create(self):
+        return datasets.CachedLabeledImageDataset(
+            self.pairs, root=self.root, size=self.size, cache=self.cache)
+
+    def expect(self):
+        expect = datasets.LabeledImageDataset(
+            self.pairs, root=self.root, dtype=numpy.uint8)[0][0]
+        if self.size is not None:
+            expect = expect[:, :self.size[0], :self.size[1]]
+        return expect
+
+    def test_get(self):
+        img, label = self.dataset.get_example(1)
+        self.assertEqual(img.dtype, numpy.uint8)
+        self.assertEqual(label.dtype, numpy.int32)
+        self.assertEqual(label, 1)
+        expect = self.expect()
+        self.assertEqual(img.shape, expect.shape)
+        if self.size is None:
+            numpy.testing.assert_array_equal(img, expect)
+
+    def test_decode_once(self):
+        with mock.patch.object(image_dataset.Image, 'open') as m:
+            for _ in range(2):
+                self.dataset.get_example(0)
+        self.assertEqual(m.call_count, 0)
+
+        self.dataset.get_example(1)
+        with mock.patch.object(image_dataset.Image, 'open') as m:
+            self.dataset.get_example(1)
+        self.assertEqual(m.call_count, 0)
+
+    def test_copy(self):
+        img, _ = self.dataset.get_example(0)
+        img[:] = 0
+        img, _ = self.dataset.get_example(0)
+        self.assertTrue(img.any())
+
+    def test_shared_with_forked_process(self):
+        def get(dataset):
+            dataset.get_example(1)
+
+        process = multiprocessing.Process(target=get, args=(self.dataset,))
+        process.start()
+        process.join()
+        with mock.patch.object(image_dataset.Image, 'open') as m:
+            self.dataset.get_example(1)
+        self.assertEqual(m.call_count, 0)
+
+    def test_reuse_file(self):
+        if not self.file:
+            return
+        self.dataset.get_example(1)
+        dataset = self.create()
+        with mock.patch.object(image_dataset.Image, 'open') as m:
+            img, _ = dataset.get_example(1)
+        self.assertEqual(m.call_count, 0)
+        self.assertEqual(img.shape, self.expect().shape)
+
+    def test_pickle_file(self):
+        if not self.file:
+            return
+        self.dataset.get_example(1)
+        dataset = pickle.loads(pickle.dumps(self.dataset))
+        with mock.patch.object(image_dataset.Image, 'open') as m:
+            img, label = dataset.get_example(1)
+        self.assertEqual(m.call_count, 0)
+        numpy.testing.assert_array_equal(img, self.dataset[1][0])
+        self.assertEqual(label, 1)
+
+
+@unittest.skipUnless(image_dataset.available, 'image_dataset is not available')
+class TestCachedLabeledImageDatasetInvalidShape(unittest.TestCase):
+
+    def test_invalid_shape(self):
+        root = os.path.join(os.path.dirname(__file__), 'image_dataset')
+        dataset = datasets.CachedLabeledImageDataset(
+            os.path.join(root, 'labeled_img.lst'), root=root)
+        with self.assertRaises(ValueError):
+            dataset.get_example(1)
+
+    def test_pickle_shared_memory(self):
+        root = os.path.join(os.path.dirname(__file__), 'image_dataset')
+        dataset = datasets.CachedLabeledImageDataset(
+            [('chainer.png', 0)], root=root)
+        with self.assertRaises(TypeError):
+            pickle.dumps(dataset)
+
+
 testing.run_module(__name__, __file__)
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy
+
 from chainer import datasets
 from chainer import testing
 
@@ -28,6 +30,32 @@ class TestSubDataset(unittest.TestCase):
         self.assertEqual(subset[1], 4)
         self.assertEqual(subset[2], 2)
 
+    def test_get_examples(self):
+        original = [1, 2, 3, 4, 5]
+        subset = datasets.SubDataset(original, 1, 4)
+        self.assertEqual(subset.get_examples([2, 0, -1]), [4, 2, 4])
+
+    def test_get_examples_overrun(self):
+        original = [1, 2, 3, 4, 5]
+        subset = datasets.SubDataset(original, 1, 4)
+        with self.assertRaises(IndexError):
+            subset.get_examples([0, 3])
+        with self.assertRaises(IndexError):
+            subset.get_examples([-4])
+
+    def test_permuted_get_examples(self):
+        original = [1, 2, 3, 4, 5]
+        subset = datasets.SubDataset(original, 1, 4, [2, 0, 3, 1, 4])
+        self.assertEqual(subset.get_examples([0, 1, 2]), [1, 4, 2])
+
+    def test_get_examples_of_tuple_dataset(self):
+        x = numpy.arange(10)
+        subset = datasets.SubDataset(
+            datasets.TupleDataset(x, -x), 2, 8, numpy.arange(10)[::-1])
+        batch = subset.get_examples([0, 3])
+        numpy.testing.assert_array_equal(batch.columns[0], [7, 4])
+        numpy.testing.assert_array_equal(batch.columns[1], [-7, -4])
+
     def test_permuted_sub_dataset_len_mismatch(self):
         original = [1, 2, 3, 4, 5]
         with self.assertRaises(ValueError):
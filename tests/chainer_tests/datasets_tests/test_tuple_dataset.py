@@ -3,6 +3,7 @@ import unittest
 import numpy
 
 from chainer import cuda
+from chainer import dataset
 from chainer import datasets
 from chainer import testing
 from chainer.testing import attr
@@ -35,6 +36,30 @@ class TestTupleDataset(unittest.TestCase):
     def test_tuple_dataset_gpu(self):
         self.check_tuple_dataset(cuda.to_gpu(self.x0), cuda.to_gpu(self.x1))
 
+    def check_get_examples(self, x0, x1):
+        td = datasets.TupleDataset(x0, x1, [7, 8, 9])
+        batch = td.get_examples([2, 0])
+        self.assertIsInstance(batch, dataset.ColumnBatch)
+        self.assertEqual(len(batch), 2)
+        # array columns are read by fancy indexing
+        self.assertIsInstance(batch.columns[0], type(x0))
+        numpy.testing.assert_array_equal(
+            cuda.to_cpu(batch.columns[0]), cuda.to_cpu(x0)[[2, 0]])
+        numpy.testing.assert_array_equal(
+            cuda.to_cpu(batch.columns[1]), cuda.to_cpu(x1)[[2, 0]])
+        self.assertEqual(batch.columns[2], [9, 7])
+        for example, i in zip(batch, [2, 0]):
+            numpy.testing.assert_array_equal(
+                cuda.to_cpu(example[0]), cuda.to_cpu(td[i][0]))
+            self.assertEqual(example[2], td[i][2])
+
+    def test_get_examples_cpu(self):
+        self.check_get_examples(self.x0, self.x1)
+
+    @attr.gpu
+    def test_get_examples_gpu(self):
+        self.check_get_examples(cuda.to_gpu(self.x0), cuda.to_gpu(self.x1))
+
     def test_tuple_dataset_len_mismatch(self):
         with self.assertRaises(ValueError):
             datasets.TupleDataset(self.x0, self.z0)
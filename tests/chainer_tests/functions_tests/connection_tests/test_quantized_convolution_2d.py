@@ -0,0 +1,40 @@
+import unittest
+
+import numpy
+
+import chainer
+from chainer import functions
+from chainer import testing
+
+
+@testing.parameterize(*testing.product({
+    'nobias': [True, False],
+    'stride': [1, 2],
+    'cover_all': [True, False],
+}))
+class TestQuantizedConvolution2D(unittest.TestCase):
+
+    def setUp(self):
+        self.W = numpy.random.randint(
+            -127, 128, (2, 3, 3, 2)).astype(numpy.int8)
+        self.W_scale = numpy.random.uniform(0.01, 0.1, 2).astype('f')
+        self.x_scale = 1. / 127
+        self.x = numpy.random.uniform(-1, 1, (2, 3, 5, 4)).astype('f')
+        self.b = None if self.nobias else \
+            numpy.random.uniform(-1, 1, 2).astype('f')
+
+    def test_forward_cpu(self):
+        y = functions.quantized_convolution_2d(
+            chainer.Variable(self.x), self.W, self.W_scale, self.x_scale,
+            self.b, stride=self.stride, pad=1, cover_all=self.cover_all)
+        self.assertEqual(y.data.dtype, numpy.float32)
+
+        x = (numpy.rint(self.x / self.x_scale) * self.x_scale).astype('f')
+        W = (self.W * self.W_scale[:, None, None, None]).astype('f')
+        y_expect = functions.convolution_2d(
+            x, W, self.b, stride=self.stride, pad=1,
+            cover_all=self.cover_all)
+        testing.assert_allclose(y.data, y_expect.data, atol=1e-5, rtol=1e-5)
+
+
+testing.run_module(__name__, __file__)
@@ -0,0 +1,57 @@
+import unittest
+
+import numpy
+
+import chainer
+from chainer import functions
+from chainer import testing
+from chainer.utils import type_check
+
+
+@testing.parameterize(*testing.product({
+    'nobias': [True, False],
+    'x_shape': [(4, 3), (4, 3, 1)],
+}))
+class TestQuantizedLinear(unittest.TestCase):
+
+    def setUp(self):
+        self.W = numpy.random.randint(-127, 128, (2, 3)).astype(numpy.int8)
+        self.W_scale = numpy.random.uniform(0.01, 0.1, 2).astype('f')
+        self.x_scale = 1. / 127
+        self.x = numpy.random.uniform(-1, 1, self.x_shape).astype('f')
+        self.b = None if self.nobias else \
+            numpy.random.uniform(-1, 1, 2).astype('f')
+
+    def test_forward_cpu(self):
+        y = functions.quantized_linear(
+            chainer.Variable(self.x), self.W, self.W_scale, self.x_scale,
+            self.b)
+        self.assertEqual(y.data.dtype, numpy.float32)
+
+        x = numpy.rint(self.x.reshape(4, 3) / self.x_scale) * self.x_scale
+        W = self.W * self.W_scale[:, None]
+        y_expect = x.dot(W.T)
+        if self.b is not None:
+            y_expect += self.b
+        testing.assert_allclose(y.data, y_expect, atol=1e-5, rtol=1e-5)
+
+    def test_close_to_float(self):
+        W_scale = numpy.full(2, 1. / 127, 'f')
+        W = self.W * W_scale[:, None]
+        y = functions.quantized_linear(
+            self.x, self.W, W_scale, self.x_scale, self.b)
+        y_expect = functions.linear(self.x, W.astype('f'), self.b)
+        testing.assert_allclose(y.data, y_expect.data, atol=2e-2)
+
+
+class TestQuantizedLinearInvalidType(unittest.TestCase):
+
+    def test_float_weight(self):
+        x = numpy.zeros((4, 3), 'f')
+        W = numpy.zeros((2, 3), 'f')
+        W_scale = numpy.ones(2, 'f')
+        with self.assertRaises(type_check.InvalidType):
+            functions.quantized_linear(x, W, W_scale, 1.)
+
+
+testing.run_module(__name__, __file__)
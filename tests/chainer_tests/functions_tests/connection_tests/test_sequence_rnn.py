@@ -0,0 +1,234 @@
+import unittest
+
+import numpy
+
+import chainer
+from chainer import cuda
+from chainer import functions
+from chainer.functions.connection import sequence_rnn
+from chainer import gradient_check
+from chainer import testing
+from chainer.testing import attr
+
+
+def _sigmoid(x):
+    return numpy.tanh(x * 0.5) * 0.5 + 0.5
+
+
+@testing.parameterize(*testing.product({
+    'batches': [[3, 3, 3], [4, 2, 2, 1, 0]],
+    'state_size': [4, 5],
+}))
+class TestSequenceLSTM(unittest.TestCase):
+
+    out_size = 3
+
+    def setUp(self):
+        n = self.out_size
+        self.c = numpy.random.uniform(
+            -1, 1, (self.state_size, n)).astype(numpy.float64)
+        self.h = numpy.random.uniform(
+            -1, 1, (self.state_size, n)).astype(numpy.float64)
+        self.x = numpy.random.uniform(
+            -1, 1, (sum(self.batches), 4 * n)).astype(numpy.float64)
+        self.W = numpy.random.uniform(-1, 1, (4 * n, n)).astype(numpy.float64)
+        self.gy = numpy.random.uniform(
+            -1, 1, (sum(self.batches), n)).astype(numpy.float64)
+        self.gc = numpy.random.uniform(-1, 1, self.c.shape)
+        self.gh = numpy.random.uniform(-1, 1, self.h.shape)
+
+    def check_forward(self, c_data, h_data, x_data, W_data):
+        y, c, h = sequence_rnn.SequenceLSTM(self.batches)(
+            chainer.Variable(c_data), chainer.Variable(h_data),
+            chainer.Variable(x_data), chainer.Variable(W_data))
+
+        c_expect = self.c.copy()
+        h_expect = self.h.copy()
+        s = 0
+        for b in self.batches:
+            lstm_in = self.x[s:s + b] + h_expect[:b].dot(self.W.T)
+            r = lstm_in.reshape(b, self.out_size, 4)
+            a, i, f, o = [r[:, :, k] for k in range(4)]
+            c_expect[:b] = (numpy.tanh(a) * _sigmoid(i) +
+                            _sigmoid(f) * c_expect[:b])
+            h_expect[:b] = _sigmoid(o) * numpy.tanh(c_expect[:b])
+            testing.assert_allclose(
+                cuda.to_cpu(y.data[s:s + b]), h_expect[:b])
+            s += b
+        testing.assert_allclose(c.data, c_expect)
+        testing.assert_allclose(h.data, h_expect)
+
+    def test_forward_cpu(self):
+        self.check_forward(self.c, self.h, self.x, self.W)
+
+    @attr.gpu
+    def test_forward_gpu(self):
+        self.check_forward(cuda.to_gpu(self.c), cuda.to_gpu(self.h),
+                           cuda.to_gpu(self.x), cuda.to_gpu(self.W))
+
+    def check_backward(self, c_data, h_data, x_data, W_data, gy, gc, gh):
+        gradient_check.check_backward(
+            sequence_rnn.SequenceLSTM(self.batches),
+            (c_data, h_data, x_data, W_data), (gy, gc, gh),
+            rtol=1e-4, atol=1e-4)
+
+    def test_backward_cpu(self):
+        self.check_backward(self.c, self.h, self.x, self.W,
+                            self.gy, self.gc, self.gh)
+
+    def test_backward_cpu_output_only(self):
+        self.check_backward(self.c, self.h, self.x, self.W,
+                            self.gy, None, None)
+
+    @attr.gpu
+    def test_backward_gpu(self):
+        self.check_backward(
+            cuda.to_gpu(self.c), cuda.to_gpu(self.h), cuda.to_gpu(self.x),
+            cuda.to_gpu(self.W), cuda.to_gpu(self.gy), cuda.to_gpu(self.gc),
+            cuda.to_gpu(self.gh))
+
+
+@testing.parameterize(*testing.product({
+    'batches': [[3, 3, 3], [4, 2, 2, 1, 0]],
+    'initial_state': [True, False],
+}))
+class TestSequenceGRU(unittest.TestCase):
+
+    out_size = 3
+
+    def setUp(self):
+        n = self.out_size
+        if self.initial_state:
+            self.h = numpy.random.uniform(
+                -1, 1, (5, n)).astype(numpy.float64)
+        else:
+            self.h = numpy.zeros((self.batches[0], n), dtype=numpy.float64)
+        self.x = numpy.random.uniform(
+            -1, 1, (sum(self.batches), 3 * n)).astype(numpy.float64)
+        self.U = numpy.random.uniform(-1, 1, (3 * n, n)).astype(numpy.float64)
+        self.b = numpy.random.uniform(-1, 1, (3 * n,)).astype(numpy.float64)
+        self.gy = numpy.random.uniform(
+            -1, 1, (sum(self.batches), n)).astype(numpy.float64)
+        self.gh = numpy.random.uniform(-1, 1, self.h.shape)
+
+    def check_forward(self, h_data, x_data, U_data, b_data):
+        y, h = sequence_rnn.SequenceGRU(self.batches, self.initial_state)(
+            chainer.Variable(h_data), chainer.Variable(x_data),
+            chainer.Variable(U_data), chainer.Variable(b_data))
+
+        n = self.out_size
+        U_r, U_z, U = self.U[:n], self.U[n:2 * n], self.U[2 * n:]
+        b_r, b_z, b = self.b[:n], self.b[n:2 * n], self.b[2 * n:]
+        h_expect = self.h.copy()
+        s = 0
+        for t, batch in enumerate(self.batches):
+            x = self.x[s:s + batch]
+            x_r, x_z, x_h = x[:, :n], x[:, n:2 * n], x[:, 2 * n:]
+            if t == 0 and not self.initial_state:
+                h_expect[:batch] = _sigmoid(x_z) * numpy.tanh(x_h)
+            else:
+                h_prev = h_expect[:batch]
+                r = _sigmoid(x_r + h_prev.dot(U_r.T) + b_r)
+                z = _sigmoid(x_z + h_prev.dot(U_z.T) + b_z)
+                h_bar = numpy.tanh(x_h + (r * h_prev).dot(U.T) + b)
+                h_expect[:batch] = (1 - z) * h_prev + z * h_bar
+            testing.assert_allclose(
+                cuda.to_cpu(y.data[s:s + batch]), h_expect[:batch])
+            s += batch
+        testing.assert_allclose(h.data, h_expect)
+
+    def test_forward_cpu(self):
+        self.check_forward(self.h, self.x, self.U, self.b)
+
+    @attr.gpu
+    def test_forward_gpu(self):
+        self.check_forward(cuda.to_gpu(self.h), cuda.to_gpu(self.x),
+                           cuda.to_gpu(self.U), cuda.to_gpu(self.b))
+
+    def check_backward(self, h_data, x_data, U_data, b_data, gy, gh):
+        gradient_check.check_backward(
+            sequence_rnn.SequenceGRU(self.batches, self.initial_state),
+            (h_data, x_data, U_data, b_data), (gy, gh),
+            rtol=1e-4, atol=1e-4)
+
+    def test_backward_cpu(self):
+        self.check_backward(self.h, self.x, self.U, self.b, self.gy, self.gh)
+
+    def test_backward_cpu_output_only(self):
+        self.check_backward(self.h, self.x, self.U, self.b, self.gy, None)
+
+    @attr.gpu
+    def test_backward_gpu(self):
+        self.check_backward(
+            cuda.to_gpu(self.h), cuda.to_gpu(self.x), cuda.to_gpu(self.U),
+            cuda.to_gpu(self.b), cuda.to_gpu(self.gy), cuda.to_gpu(self.gh))
+
+
+@testing.parameterize(
+    {'form': 'array'},
+    {'form': 'list'},
+)
+class TestSequenceFunctions(unittest.TestCase):
+
+    def setUp(self):
+        self.xs = numpy.random.uniform(-1, 1, (4, 3, 8)).astype(numpy.float32)
+        self.W = numpy.random.uniform(-1, 1, (8, 2)).astype(numpy.float32)
+        self.U = numpy.random.uniform(-1, 1, (6, 2)).astype(numpy.float32)
+        self.b = numpy.random.uniform(-1, 1, (6,)).astype(numpy.float32)
+
+    def _sequence(self, xs):
+        if self.form == 'array':
+            return chainer.Variable(xs)
+        return [chainer.Variable(x) for x in xs]
+
+    def check_form(self, ys, shape):
+        if self.form == 'array':
+            self.assertEqual(ys.shape, shape)
+        else:
+            self.assertEqual(len(ys), shape[0])
+            for y in ys:
+                self.assertEqual(y.shape, shape[1:])
+
+    def test_sequence_lstm(self):
+        c, h, ys = functions.sequence_lstm(
+            None, None, self._sequence(self.xs), chainer.Variable(self.W))
+        self.check_form(ys, (4, 3, 2))
+        self.assertEqual(c.shape, (3, 2))
+
+        # equivalent to lstm applied step by step
+        c_expect = h_expect = chainer.Variable(
+            numpy.zeros((3, 2), dtype=numpy.float32))
+        for x, y in zip(self.xs, ys):
+            c_expect, h_expect = functions.lstm(
+                c_expect, x + h_expect.data.dot(self.W.T))
+            testing.assert_allclose(y.data, h_expect.data)
+        testing.assert_allclose(c.data, c_expect.data)
+        testing.assert_allclose(h.data, h_expect.data)
+
+    def test_sequence_gru(self):
+        h, ys = functions.sequence_gru(
+            None, self._sequence(self.xs[:, :, :6]),
+            chainer.Variable(self.U), chainer.Variable(self.b))
+        self.check_form(ys, (4, 3, 2))
+        self.assertEqual(h.shape, (3, 2))
+        testing.assert_allclose(h.data, ys[-1].data)
+
+    def test_empty_sequence(self):
+        if self.form == 'array':
+            xs = chainer.Variable(self.xs[:0])
+        else:
+            xs = []
+        with self.assertRaises(ValueError):
+            functions.sequence_lstm(None, None, xs, chainer.Variable(self.W))
+
+
+class TestSequenceBatchSizes(unittest.TestCase):
+
+    def test_increasing_batch_sizes(self):
+        with self.assertRaises(ValueError):
+            sequence_rnn.SequenceLSTM([2, 3])
+        with self.assertRaises(ValueError):
+            sequence_rnn.SequenceGRU([2, 3])
+
+
+testing.run_module(__name__, __file__)
@@ -0,0 +1,91 @@
+import unittest
+
+import numpy
+
+import chainer
+from chainer import cuda
+from chainer import functions
+from chainer import gradient_check
+from chainer import testing
+from chainer.testing import attr
+from chainer.testing import condition
+
+
+@testing.parameterize(*testing.product({
+    'x_shape': [(4, 3), (4, 3, 2)],
+    'n_class': [1, 7],
+    'chunk_size': [1, 3, 16],
+    'normalize': [True, False],
+    'ignore': [False, True],
+    'nobias': [True, False],
+}))
+class TestLinearSoftmaxCrossEntropy(unittest.TestCase):
+
+    def setUp(self):
+        n_in = numpy.prod(self.x_shape[1:])
+        self.x = numpy.random.uniform(-1, 1, self.x_shape).astype('f')
+        self.W = numpy.random.uniform(
+            -1, 1, (self.n_class, n_in)).astype('f')
+        self.b = numpy.random.uniform(-1, 1, self.n_class).astype('f')
+        self.t = numpy.random.randint(
+            0, self.n_class, self.x_shape[0]).astype(numpy.int32)
+        if self.ignore:
+            self.t[0] = -1
+
+    def _inputs(self, xp):
+        inputs = [xp.asarray(self.x), xp.asarray(self.t), xp.asarray(self.W)]
+        if not self.nobias:
+            inputs.append(xp.asarray(self.b))
+        return inputs
+
+    def check_forward(self, inputs):
+        x, t, W = inputs[:3]
+        b = inputs[3] if len(inputs) == 4 else None
+        loss = functions.linear_softmax_cross_entropy(
+            chainer.Variable(x), chainer.Variable(t), chainer.Variable(W),
+            None if b is None else chainer.Variable(b),
+            normalize=self.normalize, chunk_size=self.chunk_size)
+        self.assertEqual(loss.data.shape, ())
+        self.assertEqual(loss.data.dtype, numpy.float32)
+
+        y = functions.linear(x, W, b)
+        expect = functions.softmax_cross_entropy(
+            y, t, normalize=self.normalize)
+        testing.assert_allclose(
+            cuda.to_cpu(expect.data), cuda.to_cpu(loss.data))
+
+    @condition.retry(3)
+    def test_forward_cpu(self):
+        self.check_forward(self._inputs(numpy))
+
+    @attr.gpu
+    @condition.retry(3)
+    def test_forward_gpu(self):
+        self.check_forward(self._inputs(cuda.cupy))
+
+    def check_backward(self, inputs):
+        func = functions.LinearSoftmaxCrossEntropy(
+            normalize=self.normalize, chunk_size=self.chunk_size)
+        gradient_check.check_backward(
+            func, tuple(inputs), None, eps=1e-2, atol=1e-3, rtol=1e-3,
+            no_grads=[False, True, False, False][:len(inputs)],
+            dtype=numpy.float64)
+
+    @condition.retry(3)
+    def test_backward_cpu(self):
+        self.check_backward(self._inputs(numpy))
+
+    @attr.gpu
+    @condition.retry(3)
+    def test_backward_gpu(self):
+        self.check_backward(self._inputs(cuda.cupy))
+
+
+class TestLinearSoftmaxCrossEntropyInvalidChunk(unittest.TestCase):
+
+    def test_invalid_chunk_size(self):
+        with self.assertRaises(ValueError):
+            functions.LinearSoftmaxCrossEntropy(chunk_size=0)
+
+
+testing.run_module(__name__, __file__)
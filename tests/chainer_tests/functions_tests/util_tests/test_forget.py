@@ -1,3 +1,4 @@
+import copy
 import unittest
 
 import numpy
@@ -5,6 +6,7 @@ import six
 
 import chainer
 from chainer import functions
+from chainer import links
 from chainer import testing
 
 
@@ -80,4 +82,143 @@ class TestForgetError(unittest.TestCase):
             functions.forget(lambda: (self.v,) * 12 + (1,))
 
 
+@testing.parameterize(
+    {'n_segments': 1, 'memory_budget': None},
+    {'n_segments': 3, 'memory_budget': None},
+    {'n_segments': 10, 'memory_budget': None},
+    {'n_segments': None, 'memory_budget': 0},
+    {'n_segments': None, 'memory_budget': 200},
+    {'n_segments': None, 'memory_budget': 10 ** 9},
+)
+class TestCheckpointSequential(unittest.TestCase):
+
+    def setUp(self):
+        self.chain = chainer.ChainList(
+            *[links.Linear(4, 4) for _ in six.moves.range(5)])
+        self.x = numpy.random.uniform(-1, 1, (3, 4)).astype(numpy.float32)
+        self.gy = numpy.random.uniform(-1, 1, (3, 4)).astype(numpy.float32)
+
+    def _forward(self, x, use_checkpoint):
+        if use_checkpoint:
+            return functions.checkpoint_sequential(
+                self.chain, x, n_segments=self.n_segments,
+                memory_budget=self.memory_budget)
+        for link in self.chain:
+            x = link(x)
+        return x
+
+    def _run(self, use_checkpoint):
+        self.chain.cleargrads()
+        x = chainer.Variable(self.x)
+        y = self._forward(x, use_checkpoint)
+        y.grad = self.gy
+        y.backward()
+        return y.data, x.grad, [link.W.grad.copy() for link in self.chain]
+
+    def test_forward_backward_cpu(self):
+        y_expect, gx_expect, gW_expect = self._run(False)
+        reporter = chainer.Reporter()
+        with reporter.scope(reporter.observation):
+            y, gx, gW = self._run(True)
+        testing.assert_allclose(y_expect, y)
+        testing.assert_allclose(gx_expect, gx)
+        for expect, actual in six.moves.zip(gW_expect, gW):
+            testing.assert_allclose(expect, actual)
+        self.assertGreater(
+            reporter.observation['checkpoint/estimated_peak_memory'], 0)
+
+
+class TestCheckpointSequentialPlan(unittest.TestCase):
+
+    def test_split_segments(self):
+        split = functions.util.forget._split_segments
+        self.assertEqual(split([1, 1, 1, 1], 2), [2, 4])
+        self.assertEqual(split([4, 1, 1, 1], 2), [1, 4])
+        self.assertEqual(split([1, 1, 1, 4], 3), [2, 3, 4])
+        self.assertEqual(split([1, 1], 5), [1, 2])
+
+    def test_estimate_peak_memory(self):
+        estimate = functions.util.forget._estimate_peak_memory
+        self.assertEqual(estimate(1, [1, 1, 1, 1], [4]), 5)
+        self.assertEqual(estimate(1, [1, 1, 1, 1], [2, 4]), 4)
+
+    def test_empty(self):
+        x = chainer.Variable(numpy.zeros(1))
+        self.assertIs(functions.checkpoint_sequential([], x, 1), x)
+        with self.assertRaises(ValueError):
+            functions.checkpoint_sequential([], x, 0)
+
+    def test_plan_cache(self):
+        n_calls = [0]
+
+        def count(h):
+            n_calls[0] += 1
+            return h * 2
+
+        chain = chainer.ChainList(*[links.Linear(4, 4) for _ in range(3)])
+        funcs = [count] + list(chain)
+        x = numpy.zeros((2, 4), dtype=numpy.float32)
+        functions.checkpoint_sequential(funcs, x, memory_budget=100)
+        self.assertEqual(n_calls[0], 2)  # measurement and forward
+        functions.checkpoint_sequential(funcs, x, memory_budget=100)
+        self.assertEqual(n_calls[0], 3)
+        # a different input shape needs a new plan
+        x = numpy.zeros((3, 4), dtype=numpy.float32)
+        functions.checkpoint_sequential(funcs, x, memory_budget=100)
+        self.assertEqual(n_calls[0], 5)
+
+        key = functions.util.forget._plan_key(funcs, chainer.Variable(x), 100)
+        self.assertIn(key, functions.util.forget._plan_cache)
+        del funcs, count
+        self.assertNotIn(key, functions.util.forget._plan_cache)
+
+    def test_persistents_restored(self):
+        bn = links.BatchNormalization(4)
+        x = numpy.random.uniform(-1, 1, (5, 4)).astype(numpy.float32)
+        y = functions.checkpoint_sequential(
+            [bn], x, memory_budget=10 ** 9)
+        expect = links.BatchNormalization(4)
+        expect(chainer.Variable(x))
+        testing.assert_allclose(bn.avg_mean, expect.avg_mean)
+        testing.assert_allclose(bn.avg_var, expect.avg_var)
+        testing.assert_allclose(y.data, expect(chainer.Variable(x)).data)
+
+    def test_recomputation_keeps_persistents(self):
+        bn = links.BatchNormalization(4)
+        x = numpy.random.uniform(-1, 1, (5, 4)).astype(numpy.float32)
+        y = functions.checkpoint_sequential([bn], x, n_segments=1)
+        functions.sum(y).backward()
+        expect = links.BatchNormalization(4)
+        expect(chainer.Variable(x))
+        testing.assert_allclose(bn.avg_mean, expect.avg_mean)
+        testing.assert_allclose(bn.avg_var, expect.avg_var)
+
+    def test_stacked_lstm(self):
+        # the recurrent states are not changed by the measurement pass
+        for memory_budget in (1, 10 ** 9):
+            model = chainer.ChainList(links.LSTM(3, 4), links.LSTM(4, 4))
+            expect = copy.deepcopy(model)
+            xs = [numpy.random.uniform(-1, 1, (2, 3)).astype(numpy.float32)
+                  for _ in range(3)]
+            y = y_expect = 0
+            for x in xs:
+                y += functions.checkpoint_sequential(
+                    model, chainer.Variable(x), memory_budget=memory_budget)
+                y_expect += expect[1](expect[0](chainer.Variable(x)))
+            testing.assert_allclose(y.data, y_expect.data)
+            functions.sum(y).backward()
+            functions.sum(y_expect).backward()
+            for p, q in zip(model.params(), expect.params()):
+                testing.assert_allclose(p.grad, q.grad, atol=1e-5, rtol=1e-4)
+
+    def test_invalid_arguments(self):
+        x = chainer.Variable(numpy.zeros(1))
+        with self.assertRaises(ValueError):
+            functions.checkpoint_sequential([lambda x: x], x)
+        with self.assertRaises(ValueError):
+            functions.checkpoint_sequential([lambda x: x], x, 2, 10)
+        with self.assertRaises(ValueError):
+            functions.checkpoint_sequential([lambda x: x], x, 0)
+
+
 testing.run_module(__name__, __file__)
@@ -0,0 +1,162 @@
+from __future__ import division
+import unittest
+
+import numpy
+import six
+
+from chainer import iterators
+from chainer import serializer
+from chainer import testing
+
+
+class DummySerializer(serializer.Serializer):
+
+    def __init__(self, target):
+        super(DummySerializer, self).__init__()
+        self.target = target
+
+    def __getitem__(self, key):
+        raise NotImplementedError
+
+    def __call__(self, key, value):
+        if isinstance(value, numpy.ndarray):
+            value = value.copy()
+        self.target[key] = value
+        return self.target[key]
+
+
+class DummyDeserializer(serializer.Deserializer):
+
+    def __init__(self, target):
+        super(DummyDeserializer, self).__init__()
+        self.target = target
+
+    def __getitem__(self, key):
+        raise NotImplementedError
+
+    def __call__(self, key, value):
+        if isinstance(value, numpy.ndarray):
+            value[:] = self.target[key]
+        return self.target[key]
+
+
+def _make_dataset(n):
+    lengths = numpy.random.randint(1, 20, n)
+    return [numpy.arange(length) for length in lengths]
+
+
+def _padding_ratio(batch):
+    lengths = [len(x) for x in batch]
+    return 1 - sum(lengths) / (len(lengths) * max(lengths))
+
+
+@testing.parameterize(*testing.product({
+    'shuffle': [True, False],
+    'window_size': [None, 16],
+}))
+class TestBucketIterator(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = _make_dataset(50)
+
+    def test_epoch(self):
+        it = iterators.BucketIterator(
+            self.dataset, 4, shuffle=self.shuffle,
+            window_size=self.window_size)
+        for epoch in six.moves.range(3):
+            ids = []
+            while True:
+                batch = it.next()
+                self.assertLessEqual(len(batch), 4)
+                lengths = [len(x) for x in batch]
+                self.assertEqual(lengths, sorted(lengths, reverse=True))
+                self.assertAlmostEqual(it.padding_ratio,
+                                       _padding_ratio(batch))
+                ids.extend(id(x) for x in batch)
+                self.assertAlmostEqual(it.epoch_detail,
+                                       epoch + len(ids) / 50)
+                if it.is_new_epoch:
+                    break
+            self.assertEqual(it.epoch, epoch + 1)
+            self.assertEqual(sorted(ids), sorted(id(x) for x in self.dataset))
+
+    def test_less_padding(self):
+        it = iterators.BucketIterator(
+            self.dataset, 4, repeat=False, shuffle=self.shuffle,
+            window_size=self.window_size)
+        ratios = [it.padding_ratio for _ in it]
+        serial = iterators.SerialIterator(self.dataset, 4, repeat=False)
+        serial_ratios = [_padding_ratio(batch) for batch in serial]
+        self.assertLess(numpy.mean(ratios), numpy.mean(serial_ratios))
+
+    def test_no_repeat(self):
+        it = iterators.BucketIterator(
+            self.dataset, 4, repeat=False, shuffle=self.shuffle,
+            window_size=self.window_size)
+        n = sum(len(batch) for batch in it)
+        self.assertEqual(n, 50)
+        self.assertRaises(StopIteration, it.next)
+
+    def test_serialize(self):
+        it = iterators.BucketIterator(
+            self.dataset, 4, shuffle=self.shuffle,
+            window_size=self.window_size)
+        for _ in six.moves.range(5):
+            it.next()
+        target = {}
+        it.serialize(DummySerializer(target))
+        expect = [it.next()]
+        while not it.is_new_epoch:
+            expect.append(it.next())
+
+        it = iterators.BucketIterator(
+            self.dataset, 4, shuffle=self.shuffle,
+            window_size=self.window_size)
+        it.serialize(DummyDeserializer(target))
+        actual = [it.next() for _ in expect]
+        self.assertTrue(it.is_new_epoch)
+        for e, a in six.moves.zip(expect, actual):
+            self.assertEqual([id(x) for x in e], [id(x) for x in a])
+
+
+class TestBucketIteratorMaxTokens(unittest.TestCase):
+
+    def test_max_tokens(self):
+        dataset = _make_dataset(100)
+        it = iterators.BucketIterator(
+            dataset, 16, repeat=False, max_tokens=40)
+        n = 0
+        for batch in it:
+            self.assertLessEqual(len(batch), 16)
+            self.assertLessEqual(len(batch) * len(batch[0]), 40)
+            n += len(batch)
+        self.assertEqual(n, 100)
+
+    def test_long_example(self):
+        dataset = [numpy.arange(10), numpy.arange(2), numpy.arange(2)]
+        it = iterators.BucketIterator(
+            dataset, 4, repeat=False, shuffle=False, max_tokens=5)
+        batches = list(it)
+        self.assertEqual([len(b) for b in batches], [1, 2])
+        self.assertIs(batches[0][0], dataset[0])
+
+
+class TestBucketIteratorLength(unittest.TestCase):
+
+    def test_tuple(self):
+        dataset = [(numpy.arange(n), n % 2) for n in (1, 3, 2, 4)]
+        it = iterators.BucketIterator(dataset, 2, repeat=False,
+                                      shuffle=False)
+        batches = list(it)
+        self.assertEqual([[len(x) for x, _ in b] for b in batches],
+                         [[4, 3], [2, 1]])
+        self.assertEqual(it.padding_ratio, 0.25)
+
+    def test_length(self):
+        dataset = [3, 1, 2]
+        it = iterators.BucketIterator(dataset, 3, repeat=False,
+                                      shuffle=False, length=lambda x: x)
+        self.assertEqual(it.next(), [3, 2, 1])
+
+
+testing.run_module(__name__, __file__)
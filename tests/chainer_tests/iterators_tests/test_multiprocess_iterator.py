@@ -215,6 +215,18 @@ class TestMultiprocessIterator(unittest.TestCase):
         for _ in range(2):
             self.assertRaises(StopIteration, copy_it.next)
 
+    def test_restart_after_finalize(self):
+        dataset = [1, 2, 3, 4, 5, 6]
+        it = iterators.MultiprocessIterator(
+            dataset, 2, shuffle=False, **self.options)
+        self.assertEqual(it.next(), [1, 2])
+        it.finalize()
+        it.batch_size = 4
+        self.assertEqual(it.next(), [3, 4, 5, 6])
+        self.assertTrue(it.is_new_epoch)
+        self.assertEqual(it.next(), [1, 2, 3, 4])
+        it.finalize()
+
 
 @testing.parameterize(*testing.product({
     'n_prefetch': [1, 2],
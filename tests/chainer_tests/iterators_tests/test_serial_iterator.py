@@ -3,6 +3,8 @@ import unittest
 
 import numpy
 
+from chainer import dataset
+from chainer import datasets
 from chainer import iterators
 from chainer import serializer
 from chainer import testing
@@ -214,4 +216,38 @@ class TestSerialIteratorSerialize(unittest.TestCase):
         self.assertAlmostEqual(it.epoch_detail, 6 / 6)
 
 
+@testing.parameterize(
+    {'shuffle': False},
+    {'shuffle': True},
+)
+class TestSerialIteratorGetExamples(unittest.TestCase):
+
+    def test_get_examples(self):
+        x = numpy.arange(10, dtype=numpy.float32)
+        td = datasets.TupleDataset(x, x * 2)
+        it = iterators.SerialIterator(td, 4, shuffle=self.shuffle)
+        seen = []
+        for _ in range(5):
+            batch = it.next()
+            self.assertIsInstance(batch, dataset.ColumnBatch)
+            self.assertEqual(len(batch), 4)
+            x0, x1 = dataset.concat_examples(batch)
+            numpy.testing.assert_array_equal(x1, x0 * 2)
+            seen.extend(x0)
+        # the first two epochs, each of which visits all examples once
+        self.assertEqual(sorted(seen[:10]), list(x))
+        self.assertEqual(sorted(seen[10:20]), list(x))
+        self.assertEqual(it.epoch, 2)
+
+    def test_array_dataset_over_epoch(self):
+        # A batch over the end of an epoch is a list of the examples
+        x = numpy.arange(5)
+        it = iterators.SerialIterator(x, 3, shuffle=self.shuffle)
+        batches = [it.next() for _ in range(5)]
+        seen = sum([list(batch) for batch in batches], [])
+        self.assertEqual(sorted(seen[:5]), list(x))
+        self.assertEqual(sorted(seen[5:10]), list(x))
+        self.assertEqual(len(seen), 15)
+
+
 testing.run_module(__name__, __file__)
@@ -1,7 +1,9 @@
+import collections
 import os
 import pkg_resources
 import tempfile
 import unittest
+import weakref
 
 import mock
 import numpy
@@ -1198,6 +1200,183 @@ class TestSplit(TestCaffeFunctionBase):
         self.assertEqual(self.func.split_map, {'y': 'x', 'z': 'x'})
 
 
+_network_data = {
+    'layer': [
+        {
+            'name': 'l1',
+            'type': 'InnerProduct',
+            'bottom': ['x'],
+            'top': ['h'],
+            'inner_product_param': {
+                'bias_term': True,
+                'axis': 1
+            },
+            'blobs': [
+                {
+                    'shape': {
+                        'dim': [2, 3]
+                    },
+                    'data': [1, -1, 0, 2, 0, -1],
+                },
+                {
+                    'shape': {
+                        'dim': [2]
+                    },
+                    'data': [0.5, -0.5],
+                }
+            ]
+        },
+        {
+            'name': 'l2',
+            'type': 'ReLU',
+            'bottom': ['h'],
+            'top': ['h'],
+        },
+        {
+            'name': 'l3',
+            'type': 'Softmax',
+            'bottom': ['h'],
+            'top': ['y'],
+        },
+        {
+            'name': 'l4',
+            'type': 'ReLU',
+            'bottom': ['x'],
+            'top': ['z'],
+        },
+    ]
+}
+
+
+def _network_forward(x, relu=True):
+    W = numpy.array([[1, -1, 0], [2, 0, -1]], dtype=numpy.float32)
+    h = x.dot(W.T) + numpy.array([0.5, -0.5], dtype=numpy.float32)
+    if relu:
+        h = numpy.maximum(h, 0)
+    y = numpy.exp(h - h.max(axis=1, keepdims=True))
+    return y / y.sum(axis=1, keepdims=True)
+
+
+class TestExecutionPlan(TestCaffeFunctionBase):
+
+    data = _network_data
+
+    def setUp(self):
+        super(TestExecutionPlan, self).setUp()
+        self.init_func()
+        self.x = numpy.random.uniform(-1, 1, (4, 3)).astype(numpy.float32)
+        # weak references to the outputs and the numbers of calls
+        self.refs = {}
+        self.counts = collections.Counter()
+        for name, forward in list(self.func.forwards.items()):
+            self.func.forwards[name] = self._recorder(name, forward)
+
+    def _recorder(self, name, forward):
+        def f(*xs):
+            y = forward(*xs)
+            self.refs[name] = weakref.ref(y)
+            self.counts[name] += 1
+            return y
+        return f
+
+    def call(self, outputs, disable=()):
+        x = chainer.Variable(self.x, volatile='on')
+        return self.func(inputs={'x': x}, outputs=outputs, disable=disable)
+
+    def test_pruned(self):
+        y, = self.call(['y'])
+        numpy.testing.assert_allclose(y.data, _network_forward(self.x),
+                                      rtol=1e-5)
+        self.assertEqual(self.counts, {'l1': 1, 'l2': 1, 'l3': 1})
+
+    def test_disable(self):
+        y, = self.call(['y'], disable=['l2'])
+        numpy.testing.assert_allclose(
+            y.data, _network_forward(self.x, relu=False), rtol=1e-5)
+        self.assertEqual(self.counts, {'l1': 1, 'l3': 1})
+
+    def test_multiple_outputs(self):
+        z, h = self.call(['z', 'h'])
+        numpy.testing.assert_array_equal(z.data, numpy.maximum(self.x, 0))
+        self.assertIs(h, self.refs['l2']())
+        self.assertEqual(self.counts, {'l1': 1, 'l2': 1, 'l4': 1})
+
+    def test_release_intermediate_blobs(self):
+        y, = self.call(['y'])
+        self.assertIsNone(self.refs['l1']())
+        self.assertIsNone(self.refs['l2']())
+        self.assertIs(self.refs['l3'](), y)
+        self.assertEqual(set(self.func.variables), {'x', 'y'})
+        self.assertIs(self.func.variables['y'], y)
+
+    def test_reuse_plan(self):
+        self.call(['y'])
+        self.call(['y'])
+        self.assertEqual(len(self.func._plans), 1)
+        self.call(['y'], disable=['l2'])
+        self.assertEqual(len(self.func._plans), 2)
+        self.assertEqual(self.counts['l1'], 3)
+
+    def test_unknown_output(self):
+        with self.assertRaises(KeyError):
+            self.call(['y'], disable=['l1'])
+
+
+class TestLoadWithCache(TestCaffeFunctionBase):
+
+    data = _network_data
+
+    def setUp(self):
+        super(TestLoadWithCache, self).setUp()
+        self.cache_path = self.temp_file_path + '.pkl'
+
+    def tearDown(self):
+        super(TestLoadWithCache, self).tearDown()
+        if os.path.exists(self.cache_path):
+            os.remove(self.cache_path)
+
+    def check_func(self, func):
+        self.assertIsInstance(func, caffe.CaffeFunction)
+        x = numpy.random.uniform(-1, 1, (4, 3)).astype(numpy.float32)
+        y, = func(inputs={'x': chainer.Variable(x)}, outputs=['y'])
+        numpy.testing.assert_allclose(y.data, _network_forward(x), rtol=1e-5)
+
+    def test_load_with_cache(self):
+        func = caffe.CaffeFunction.load_with_cache(self.temp_file_path)
+        self.check_func(func)
+        self.assertTrue(os.path.exists(self.cache_path))
+
+        with mock.patch.object(caffe_pb, 'NetParameter') as m:
+            func = caffe.CaffeFunction.load_with_cache(self.temp_file_path)
+        self.assertEqual(m.call_count, 0)
+        self.check_func(func)
+
+    def test_update_cache(self):
+        caffe.CaffeFunction.load_with_cache(self.temp_file_path)
+        stat = os.stat(self.temp_file_path)
+        os.utime(self.temp_file_path, (stat.st_atime, stat.st_mtime + 10))
+
+        with mock.patch.object(caffe_pb, 'NetParameter',
+                               wraps=caffe_pb.NetParameter) as m:
+            func = caffe.CaffeFunction.load_with_cache(self.temp_file_path)
+        self.assertEqual(m.call_count, 1)
+        self.check_func(func)
+
+        with mock.patch.object(caffe_pb, 'NetParameter') as m:
+            func = caffe.CaffeFunction.load_with_cache(self.temp_file_path)
+        self.assertEqual(m.call_count, 0)
+
+    def test_cache_path(self):
+        path = self.temp_file_path + '.cache'
+        try:
+            caffe.CaffeFunction.load_with_cache(self.temp_file_path, path)
+            self.assertTrue(os.path.exists(path))
+            self.assertFalse(os.path.exists(self.cache_path))
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+
 class TestCaffeFunctionAvailable(unittest.TestCase):
 
     @unittest.skipUnless(six.PY2, 'Only for Py2')
@@ -4,6 +4,7 @@ import numpy
 
 import chainer
 from chainer import cuda
+from chainer import functions
 from chainer import gradient_check
 from chainer import links
 from chainer import testing
@@ -114,6 +115,98 @@ class TestGRU(unittest.TestCase):
                             cuda.to_gpu(self.gy))
 
 
+@testing.parameterize(
+    {'gru': links.GRU, 'form': 'array', 'batches': [3, 3, 3]},
+    {'gru': links.GRU, 'form': 'list', 'batches': [4, 2, 2, 1]},
+    {'gru': links.StatefulGRU, 'form': 'array', 'batches': [3, 3, 3]},
+    {'gru': links.StatefulGRU, 'form': 'list', 'batches': [3, 3, 3]},
+)
+class TestGRUForwardSequence(unittest.TestCase):
+
+    in_size = 3
+    out_size = 5
+
+    def setUp(self):
+        self.link = self._make_link()
+        for param in self.link.params():
+            param.data[...] = numpy.random.uniform(-1, 1, param.data.shape)
+        self.link.cleargrads()
+        self.h = numpy.random.uniform(
+            -1, 1, (4, self.out_size)).astype(numpy.float32)
+        self.xs = [numpy.random.uniform(
+            -1, 1, (b, self.in_size)).astype(numpy.float32)
+            for b in self.batches]
+        self.gys = [numpy.random.uniform(
+            -1, 1, (b, self.out_size)).astype(numpy.float32)
+            for b in self.batches]
+
+    def _make_link(self):
+        if self.gru == links.GRU:
+            return links.GRU(self.out_size, self.in_size)
+        return links.StatefulGRU(self.in_size, self.out_size)
+
+    def _call_steps(self, link, h, xs):
+        ys = []
+        for x in xs:
+            if isinstance(link, links.GRU):
+                batch = x.shape[0]
+                y = link(h[:batch], x)
+                h = functions.concat((y, h[batch:]), axis=0)
+            else:
+                y = link(x)
+            ys.append(y)
+        return h, ys
+
+    def check_forward_sequence(self, link, h_data, xs_data, gys_data):
+        if self.form == 'array':
+            xs = chainer.Variable(link.xp.stack(xs_data))
+        else:
+            xs = [chainer.Variable(x) for x in xs_data]
+        if isinstance(link, links.GRU):
+            h, ys = link.forward_sequence(chainer.Variable(h_data), xs)
+        else:
+            ys = link.forward_sequence(xs)
+            h = link.h
+        if self.form == 'array':
+            ys = functions.separate(ys)
+
+        expect = self._make_link()
+        if link.xp is not numpy:
+            expect.to_gpu()
+        expect.copyparams(link)
+        expect.cleargrads()
+        h_expect, ys_expect = self._call_steps(
+            expect, chainer.Variable(h_data), [
+                chainer.Variable(x) for x in xs_data])
+        if isinstance(link, links.StatefulGRU):
+            h_expect = expect.h
+
+        self.assertEqual(len(ys), len(ys_expect))
+        for y, y_expect in zip(ys, ys_expect):
+            testing.assert_allclose(y.data, y_expect.data)
+        testing.assert_allclose(h.data, h_expect.data)
+
+        loss = sum(functions.sum(y * gy) for y, gy in zip(ys, gys_data))
+        loss_expect = sum(functions.sum(y * gy)
+                          for y, gy in zip(ys_expect, gys_data))
+        loss.backward()
+        loss_expect.backward()
+        for (_, param), (_, param_expect) in zip(
+                sorted(link.namedparams()), sorted(expect.namedparams())):
+            testing.assert_allclose(param.grad, param_expect.grad,
+                                    atol=1e-4, rtol=1e-4)
+
+    def test_forward_sequence_cpu(self):
+        self.check_forward_sequence(self.link, self.h, self.xs, self.gys)
+
+    @attr.gpu
+    def test_forward_sequence_gpu(self):
+        self.link.to_gpu()
+        self.check_forward_sequence(
+            self.link, cuda.to_gpu(self.h), [cuda.to_gpu(x) for x in self.xs],
+            [cuda.to_gpu(gy) for gy in self.gys])
+
+
 @testing.parameterize(
     *testing.product({
         'link_array_module': ['to_cpu', 'to_gpu'],
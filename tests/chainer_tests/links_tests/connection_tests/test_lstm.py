@@ -90,6 +90,74 @@ class TestLSTM(unittest.TestCase):
             self.check_forward(x1, x2, x3)
 
 
+@testing.parameterize(
+    {'form': 'array', 'batches': [3, 3, 3], 'in_size': 5},
+    {'form': 'array', 'batches': [3, 3, 3], 'in_size': None},
+    {'form': 'list', 'batches': [3, 3, 3], 'in_size': 5},
+    {'form': 'list', 'batches': [4, 2, 2, 1], 'in_size': 5},
+)
+class TestLSTMForwardSequence(unittest.TestCase):
+
+    def setUp(self):
+        self.link = links.LSTM(self.in_size, 7)
+        self.link.cleargrads()
+        self.xs = [numpy.random.uniform(-1, 1, (b, 5)).astype(numpy.float32)
+                   for b in self.batches]
+        self.gys = [numpy.random.uniform(-1, 1, (b, 7)).astype(numpy.float32)
+                    for b in self.batches]
+
+    def check_forward_sequence(self, link, xs_data, gys_data, initial_x):
+        if initial_x is not None:
+            link(chainer.Variable(initial_x))
+        if self.form == 'array':
+            ys = link.forward_sequence(
+                chainer.Variable(link.xp.stack(xs_data)))
+            self.assertEqual(ys.shape, (len(xs_data),) + gys_data[0].shape)
+            ys = functions.separate(ys)
+        else:
+            ys = link.forward_sequence([chainer.Variable(x) for x in xs_data])
+
+        # the same link called step by step
+        expect = links.LSTM(5, 7)
+        if link.xp is not numpy:
+            expect.to_gpu()
+        expect.copyparams(link)
+        expect.cleargrads()
+        if initial_x is not None:
+            expect(chainer.Variable(initial_x))
+        ys_expect = [expect(chainer.Variable(x)) for x in xs_data]
+
+        self.assertEqual(len(ys), len(ys_expect))
+        for y, y_expect in zip(ys, ys_expect):
+            testing.assert_allclose(y.data, y_expect.data)
+        testing.assert_allclose(link.c.data, expect.c.data)
+        testing.assert_allclose(link.h.data, expect.h.data)
+
+        loss = sum(functions.sum(y * gy) for y, gy in zip(ys, gys_data))
+        loss_expect = sum(functions.sum(y * gy)
+                          for y, gy in zip(ys_expect, gys_data))
+        (loss + functions.sum(link.c)).backward()
+        (loss_expect + functions.sum(expect.c)).backward()
+        for (_, param), (_, param_expect) in zip(
+                sorted(link.namedparams()), sorted(expect.namedparams())):
+            testing.assert_allclose(param.grad, param_expect.grad,
+                                    atol=1e-4, rtol=1e-4)
+
+    def test_forward_sequence_cpu(self):
+        self.check_forward_sequence(self.link, self.xs, self.gys, None)
+
+    def test_forward_sequence_with_state_cpu(self):
+        x = numpy.random.uniform(-1, 1, (5, 5)).astype(numpy.float32)
+        self.check_forward_sequence(self.link, self.xs, self.gys, x)
+
+    @attr.gpu
+    def test_forward_sequence_gpu(self):
+        self.link.to_gpu()
+        self.check_forward_sequence(
+            self.link, [cuda.to_gpu(x) for x in self.xs],
+            [cuda.to_gpu(gy) for gy in self.gys], None)
+
+
 class TestLSTMState(unittest.TestCase):
 
     def setUp(self):
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+
+import numpy
+
+import chainer
+from chainer import datasets
+import chainer.functions as F
+from chainer import iterators
+import chainer.links as L
+from chainer import serializers
+from chainer import testing
+
+
+class Model(chainer.Chain):
+
+    def __init__(self):
+        super(Model, self).__init__(
+            conv=L.Convolution2D(3, 4, 3, stride=2, pad=1),
+            layers=chainer.ChainList(L.Linear(36, 10), L.Linear(10, 5)),
+            unused=L.Linear(2, 2),
+        )
+
+    def __call__(self, x):
+        h = F.relu(self.conv(x))
+        h = F.relu(self.layers[0](h))
+        return self.layers[1](h)
+
+
+class TestQuantize(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.x = numpy.random.uniform(-1, 1, (20, 3, 6, 6)).astype('f')
+        self.iterator = iterators.SerialIterator(
+            self.x, 8, repeat=False, shuffle=False)
+        self.quantized = L.quantize(self.model, self.iterator)
+
+    def test_links(self):
+        q = self.quantized
+        self.assertIsInstance(q.conv, L.QuantizedConvolution2D)
+        self.assertIsInstance(q.layers[0], L.QuantizedLinear)
+        self.assertIsInstance(q.layers[1], L.QuantizedLinear)
+        self.assertEqual(q.conv.name, 'conv')
+        self.assertEqual(q.layers[1].name, '1')
+        self.assertEqual(q.conv.W.dtype, numpy.int8)
+        self.assertEqual(q.conv.W_scale.shape, (4,))
+        # links not called during the calibration are kept
+        self.assertIsInstance(q.unused, L.Linear)
+        # the model is not modified
+        self.assertIsInstance(self.model.conv, L.Convolution2D)
+        self.assertIsInstance(self.model.layers[0], L.Linear)
+
+    def test_calibration(self):
+        self.assertAlmostEqual(self.quantized.conv.x_scale,
+                               abs(self.x).max() / 127, places=6)
+
+    def test_forward(self):
+        y = self.quantized(self.x)
+        y_expect = self.model(self.x)
+        testing.assert_allclose(y.data, y_expect.data, atol=5e-2, rtol=5e-2)
+
+    def test_serialize(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            serializers.save_npz(path, self.quantized)
+            loaded = L.quantize(Model(), self.iterator)
+            serializers.load_npz(path, loaded)
+        finally:
+            os.remove(path)
+        testing.assert_allclose(loaded(self.x).data,
+                                self.quantized(self.x).data)
+
+    def test_single_link(self):
+        link = L.Linear(3, 2)
+        x = numpy.random.uniform(-1, 1, (4, 3)).astype('f')
+        iterator = iterators.SerialIterator(x, 2, repeat=False)
+        quantized = L.quantize(link, iterator)
+        self.assertIsInstance(quantized, L.QuantizedLinear)
+
+    def test_classifier(self):
+        model = L.Classifier(self.model)
+        t = numpy.random.randint(0, 5, 20).astype(numpy.int32)
+        iterator = iterators.SerialIterator(
+            datasets.TupleDataset(self.x, t), 8, repeat=False)
+        quantized = L.quantize(model, iterator)
+        self.assertIsInstance(quantized.predictor.conv,
+                              L.QuantizedConvolution2D)
+
+
+testing.run_module(__name__, __file__)
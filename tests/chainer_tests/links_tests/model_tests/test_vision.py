@@ -1,8 +1,12 @@
+import time
 import unittest
 
 import numpy
 
+import chainer
 from chainer import cuda
+from chainer import frozen_graph
+from chainer.links import BatchNormalization
 from chainer.links.model.vision import resnet
 from chainer.links.model.vision import vgg
 from chainer import testing
@@ -45,6 +49,56 @@ class TestResNet50Layers(unittest.TestCase):
         self.link.to_gpu()
         self.check_call()
 
+    def test_call_array_only_cpu(self):
+        x = numpy.random.uniform(-1, 1, (1, 3, 224, 224)).astype(
+            numpy.float32)
+
+        with numpy.errstate(divide='ignore'):
+            expect = self.link(Variable(x, volatile='on'))['prob'].data
+            with chainer.array_only_mode():
+                y = self.link(x)['prob']
+        self.assertIsInstance(y, numpy.ndarray)
+        testing.assert_allclose(y, expect)
+
+    def test_latency_array_only_cpu(self):
+        # Benchmark of the per-request latency in both modes. The computation
+        # is dominant in this model, so the array-only mode is expected to be
+        # at least as fast as the volatile mode up to the measurement noise.
+        x = numpy.random.uniform(-1, 1, (1, 3, 224, 224)).astype(
+            numpy.float32)
+
+        def latency(f):
+            f()
+            best = float('inf')
+            for _ in range(3):
+                start = time.time()
+                f()
+                best = min(best, time.time() - start)
+            return best
+
+        def predict_volatile():
+            return self.link(Variable(x, volatile='on'))['prob'].data
+
+        def predict_array_only():
+            with chainer.array_only_mode():
+                return self.link(x)['prob']
+
+        with numpy.errstate(divide='ignore'):
+            volatile = latency(predict_volatile)
+            array_only = latency(predict_array_only)
+        self.assertLess(array_only, volatile * 1.2)
+
+    def test_freeze_cpu(self):
+        for link in self.link.links():
+            if isinstance(link, BatchNormalization):
+                link.avg_var[:] = 1
+        x = numpy.random.uniform(-1, 1, (1, 3, 224, 224)).astype(
+            numpy.float32)
+        graph = frozen_graph.freeze(self.link, x, layers=['pool5'])
+        expect = self.link(Variable(x, volatile='on'), layers=['pool5'])
+        testing.assert_allclose(graph(x)['pool5'], expect['pool5'].data,
+                                atol=1e-4, rtol=1e-3)
+
     def test_prepare(self):
         x1 = numpy.random.uniform(0, 255, (320, 240, 3)).astype(numpy.uint8)
         x2 = numpy.random.uniform(0, 255, (320, 240)).astype(numpy.uint8)
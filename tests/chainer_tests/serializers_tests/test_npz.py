@@ -1,9 +1,13 @@
+import io
 import os
+import struct
 import tempfile
 import unittest
+import zipfile
 
 import mock
 import numpy
+import six
 
 from chainer import cuda
 from chainer import link
@@ -293,4 +297,99 @@ class TestGroupHierachy(unittest.TestCase):
             self.assertTrue((param.data == 1).all())
 
 
+@testing.parameterize(*testing.product({
+    'n_threads': [1, 3],
+    'level': [1, 6],
+}))
+class TestSavezCompressed(unittest.TestCase):
+
+    def setUp(self):
+        self.arrays = {
+            'x': numpy.random.uniform(-1, 1, (20, 30)).astype(numpy.float32),
+            'y': numpy.arange(1000, dtype=numpy.int64),
+            'z/w': numpy.asfortranarray(numpy.random.uniform(size=(7, 9))),
+            'scalar': numpy.array(1.5),
+            'empty': numpy.empty((0, 3), dtype=numpy.float32),
+        }
+        self.file = io.BytesIO()
+        # small chunks to split each array into many chunks
+        with mock.patch('chainer.serializers.npz._CHUNK_SIZE', 256):
+            npz.savez_compressed(self.file, self.arrays, self.level,
+                                 self.n_threads)
+
+    def check_arrays(self, loaded):
+        self.assertEqual(sorted(loaded.files), sorted(self.arrays))
+        for key, array in six.iteritems(self.arrays):
+            self.assertIn(key, loaded)
+            y = loaded[key]
+            self.assertEqual(y.dtype, array.dtype)
+            numpy.testing.assert_array_equal(y, array)
+
+    def test_numpy_load(self):
+        self.file.seek(0)
+        with numpy.load(self.file) as loaded:
+            self.check_arrays(loaded)
+
+    def test_npz_file(self):
+        self.file.seek(0)
+        with npz.NpzFile(self.file, self.n_threads) as loaded:
+            self.check_arrays(loaded)
+
+    def test_valid_zip(self):
+        self.file.seek(0)
+        self.assertIsNone(zipfile.ZipFile(self.file).testzip())
+
+    def test_npz_file_of_numpy(self):
+        f = io.BytesIO()
+        numpy.savez_compressed(f, **self.arrays)
+        f.seek(0)
+        with npz.NpzFile(f, self.n_threads) as loaded:
+            self.check_arrays(loaded)
+
+    def test_zip64(self):
+        f = io.BytesIO()
+        with mock.patch('chainer.serializers.npz._ZIP64_LIMIT', 100):
+            npz.savez_compressed(f, self.arrays, self.level, self.n_threads)
+        f.seek(0)
+        with numpy.load(f) as loaded:
+            self.check_arrays(loaded)
+        f.seek(0)
+        with npz.NpzFile(f, self.n_threads) as loaded:
+            self.check_arrays(loaded)
+
+    def test_bad_crc(self):
+        data = bytearray(self.file.getvalue())
+        crc = zipfile.ZipFile(self.file).getinfo('y.npy').CRC
+        # breaks the CRC in the central directory
+        index = data.rfind(struct.pack('<L', crc))
+        data[index] ^= 1
+        with npz.NpzFile(io.BytesIO(bytes(data))) as loaded:
+            with self.assertRaises(ValueError):
+                loaded['y']
+
+    def test_invalid_n_threads(self):
+        with self.assertRaises(ValueError):
+            npz.savez_compressed(io.BytesIO(), self.arrays, n_threads=0)
+
+
+@testing.parameterize(*testing.product({'compression': [True, 1, 9]}))
+class TestSaveNpzCompression(unittest.TestCase):
+
+    def test_save_and_load(self):
+        link = links.Linear(3, 2)
+        loaded = links.Linear(3, 2)
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            npz.save_npz(path, link, self.compression, n_threads=2)
+            with zipfile.ZipFile(path) as f:
+                for info in f.infolist():
+                    self.assertEqual(info.compress_type, zipfile.ZIP_DEFLATED)
+            npz.load_npz(path, loaded, n_threads=2)
+        finally:
+            os.remove(path)
+        numpy.testing.assert_array_equal(loaded.W.data, link.W.data)
+        numpy.testing.assert_array_equal(loaded.b.data, link.b.data)
+
+
 testing.run_module(__name__, __file__)
@@ -0,0 +1,213 @@
+import os
+import tempfile
+import unittest
+
+import numpy
+import six
+
+import chainer
+from chainer import cuda
+from chainer import frozen_graph
+import chainer.functions as F
+from chainer.functions.connection import convolution_2d
+from chainer.functions.normalization import batch_normalization
+import chainer.links as L
+from chainer import testing
+from chainer.testing import attr
+
+
+class ConvNet(chainer.Chain):
+
+    def __init__(self):
+        super(ConvNet, self).__init__(
+            conv1=L.Convolution2D(3, 4, 3, pad=1, nobias=True),
+            bn1=L.BatchNormalization(4),
+            conv2=L.Convolution2D(4, 4, 3, pad=1),
+            bn2=L.BatchNormalization(4),
+            fc=L.Linear(4 * 5 * 5, 6),
+            bn3=L.BatchNormalization(6),
+        )
+
+    def __call__(self, x, test=True):
+        h0 = F.relu(self.bn1(self.conv1(x), test=test))
+        h = F.dropout(h0, train=not test)
+        h = F.identity(F.reshape(h, h.shape))
+        h = self.bn2(self.conv2(h), test=test)
+        h = F.relu(h + h0)
+        h = F.reshape(h, (x.shape[0], 4 * 5 * 5))
+        return {'fc': self.bn3(self.fc(h), test=test), 'conv': h}
+
+
+def _randomize_statistics(link):
+    for bn in (link.bn1, link.bn2, link.bn3):
+        bn.gamma.data[:] = numpy.random.uniform(0.5, 1.5, bn.gamma.shape)
+        bn.beta.data[:] = numpy.random.uniform(-1, 1, bn.beta.shape)
+        bn.avg_mean[:] = numpy.random.uniform(-1, 1, bn.avg_mean.shape)
+        bn.avg_var[:] = numpy.random.uniform(0.5, 1.5, bn.avg_var.shape)
+
+
+class TestFreeze(unittest.TestCase):
+
+    def setUp(self):
+        self.link = ConvNet()
+        _randomize_statistics(self.link)
+        self.x = numpy.random.uniform(-1, 1, (2, 3, 5, 5)).astype('f')
+        self.graph = frozen_graph.freeze(self.link, self.x)
+
+    def expect(self, x):
+        y = self.link(chainer.Variable(x, volatile='on'))
+        return {key: cuda.to_cpu(value.data) for key, value in y.items()}
+
+    def check_outputs(self, graph, x):
+        y = graph(x)
+        self.assertIsInstance(y, dict)
+        expect = self.expect(x)
+        for key in ('fc', 'conv'):
+            testing.assert_allclose(cuda.to_cpu(y[key]), expect[key],
+                                    atol=1e-5, rtol=1e-4)
+
+    def test_call_cpu(self):
+        self.check_outputs(self.graph, self.x)
+
+    @attr.gpu
+    def test_call_gpu(self):
+        self.link.to_gpu()
+        self.graph.to_gpu()
+        self.check_outputs(self.graph, cuda.to_gpu(self.x))
+
+    def test_batch_size(self):
+        x = numpy.random.uniform(-1, 1, (5, 3, 5, 5)).astype('f')
+        self.check_outputs(self.graph, x)
+
+    def test_optimized(self):
+        functions = [node.function for node in self.graph.nodes]
+        for f in functions:
+            self.assertNotIsInstance(
+                f, (batch_normalization.BatchNormalizationFunction,
+                    F.Dropout, F.Identity))
+        reshapes = [f for f in functions if isinstance(f, F.Reshape)]
+        self.assertEqual(len(reshapes), 1)
+        self.assertEqual(reshapes[0].shape, (-1, 4 * 5 * 5))
+        convolutions = [node for node in self.graph.nodes
+                        if isinstance(node.function,
+                                      convolution_2d.Convolution2DFunction)]
+        self.assertEqual(len(convolutions), 2)
+        self.assertEqual(convolutions[0].activation, 'relu')
+        self.assertEqual(len(convolutions[0].inputs), 3)
+        # the second convolution is followed by an addition
+        self.assertIsNone(convolutions[1].activation)
+        # only the relu of the addition remains
+        relus = [f for f in functions if isinstance(f, F.ReLU)]
+        self.assertEqual(len(relus), 1)
+
+    def test_no_retained_arrays(self):
+        self.graph(self.x)
+        for node in self.graph.nodes:
+            for value in six.itervalues(node.function.__dict__):
+                self.assertNotIsInstance(value, numpy.ndarray)
+
+    def test_frozen_parameters(self):
+        y1 = self.graph(self.x)['fc']
+        self.link.fc.W.data[:] = 0
+        y2 = self.graph(self.x)['fc']
+        testing.assert_allclose(y1, y2)
+
+    def test_save_load(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            self.graph.save(path)
+            graph = frozen_graph.load(path)
+        finally:
+            os.remove(path)
+        self.check_outputs(graph, self.x)
+
+    def test_invalid_number_of_inputs(self):
+        with self.assertRaises(ValueError):
+            self.graph(self.x, self.x)
+
+
+class ScaledLinearNet(chainer.Chain):
+
+    def __init__(self):
+        super(ScaledLinearNet, self).__init__(
+            fc=L.Linear(3, 4),
+            bn=L.BatchNormalization(4),
+        )
+
+    def __call__(self, x, test=True):
+        # the weight is computed, so it cannot be folded
+        h = F.linear(x, self.fc.W * 0.5, self.fc.b)
+        return self.bn(h, test=test)
+
+
+class TestFreezeComputedWeight(unittest.TestCase):
+
+    def setUp(self):
+        self.link = ScaledLinearNet()
+        self.link.bn.avg_mean[:] = numpy.random.uniform(-1, 1, 4)
+        self.link.bn.avg_var[:] = numpy.random.uniform(0.5, 1.5, 4)
+        self.x = numpy.random.uniform(-1, 1, (2, 3)).astype('f')
+
+    def test_call(self):
+        graph = frozen_graph.freeze(self.link, self.x)
+        functions = [node.function for node in graph.nodes]
+        self.assertTrue(any(
+            isinstance(f, batch_normalization.BatchNormalizationFunction)
+            for f in functions))
+        expect = self.link(chainer.Variable(self.x, volatile='on')).data
+        testing.assert_allclose(graph(self.x), expect, atol=1e-5, rtol=1e-4)
+
+
+class TestFreezeDropout(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.ones((100, 3), dtype='f')
+
+    def model(self, x, test=False):
+        return F.dropout(x, train=True)
+
+    def test_train(self):
+        graph = frozen_graph.freeze(self.model, self.x)
+        self.assertTrue(any(isinstance(node.function, F.Dropout)
+                            for node in graph.nodes))
+        y1 = graph(self.x)
+        y2 = graph(self.x)
+        self.assertTrue(numpy.any(y1 == 0))
+        self.assertFalse(numpy.array_equal(y1, y2))
+
+    def test_test(self):
+        graph = frozen_graph.freeze(self.model, self.x, test=True)
+        self.assertEqual(graph.nodes, [])
+        testing.assert_allclose(graph(self.x), self.x)
+
+
+class TestFreezeOutputs(unittest.TestCase):
+
+    def setUp(self):
+        self.link = L.Linear(3, 2)
+        self.x = numpy.random.uniform(-1, 1, (4, 3)).astype('f')
+
+    def test_variable(self):
+        graph = frozen_graph.freeze(self.link, self.x)
+        y = graph(self.x)
+        self.assertIsInstance(y, numpy.ndarray)
+        testing.assert_allclose(y, self.link(self.x).data)
+
+    def test_tuple(self):
+        def f(x):
+            y = self.link(x)
+            return y, F.relu(y)
+
+        graph = frozen_graph.freeze(f, self.x)
+        y1, y2 = graph(self.x)
+        # the relu is not fused since the output of the linear is also used
+        testing.assert_allclose(y1, self.link(self.x).data)
+        testing.assert_allclose(y2, numpy.maximum(y1, 0))
+
+    def test_invalid_output(self):
+        with self.assertRaises(TypeError):
+            frozen_graph.freeze(lambda x: x.data, self.x)
+
+
+testing.run_module(__name__, __file__)
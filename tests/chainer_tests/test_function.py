@@ -1,4 +1,5 @@
 import threading
+import time
 import unittest
 
 import mock
@@ -309,6 +310,20 @@ class TestFunctionBackwardIntegration(unittest.TestCase):
         self.assertEqual(x.grad[0], 2)
 
 
+class TestFunctionHostOnly(unittest.TestCase):
+
+    def test_no_device_selection(self):
+        data = numpy.random.uniform(-1, 1, (3, 2)).astype(numpy.float32)
+        x = chainer.Variable(data)
+        with mock.patch('chainer.cuda.available', False), \
+                mock.patch('chainer.cuda.get_device') as get_device:
+            y = F.sum(x * x + x)
+            y.backward()
+        self.assertFalse(get_device.called)
+        testing.assert_allclose(y.data, (data * data + data).sum())
+        testing.assert_allclose(x.grad, 2 * data + 1)
+
+
 class TestFunctionInvalidType(unittest.TestCase):
 
     def test_forward_invalid1(self):
@@ -485,4 +500,121 @@ class TestBackpropModeMultiThread(unittest.TestCase):
         self.assertTrue(t.creator_is_none)
 
 
+class TestArrayOnlyMode(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.random.uniform(-1, 1, (3, 2)).astype(numpy.float32)
+
+    def test_array_output(self):
+        with chainer.array_only_mode():
+            y = F.relu(self.x)
+        self.assertIsInstance(y, numpy.ndarray)
+        testing.assert_allclose(y, numpy.maximum(self.x, 0))
+
+    def test_variable_input(self):
+        w = chainer.Variable(self.x)
+        with chainer.array_only_mode():
+            y = w * self.x + 1
+        self.assertIsInstance(y, numpy.ndarray)
+        testing.assert_allclose(y, self.x * self.x + 1)
+
+    def test_multiple_outputs(self):
+        with chainer.array_only_mode():
+            ys = F.split_axis(self.x, 2, axis=1)
+        self.assertEqual(len(ys), 2)
+        for y in ys:
+            self.assertIsInstance(y, numpy.ndarray)
+            self.assertEqual(y.shape, (3, 1))
+
+    def test_skip_type_check(self):
+        f = F.Identity()
+        f.check_type_forward = mock.MagicMock()
+        with chainer.array_only_mode():
+            f(self.x)
+        self.assertFalse(f.check_type_forward.called)
+
+    def test_skip_hooks(self):
+        hook = mock.MagicMock(spec=chainer.function.FunctionHook)
+        f = F.Identity()
+        f.add_hook(hook)
+        with chainer.array_only_mode():
+            f(self.x)
+        self.assertFalse(hook.forward_preprocess.called)
+        self.assertFalse(hook.forward_postprocess.called)
+
+    def test_no_graph(self):
+        f = F.Identity()
+        with chainer.array_only_mode():
+            f(self.x)
+        self.assertFalse(hasattr(f, 'inputs'))
+        self.assertFalse(hasattr(f, 'outputs'))
+
+    def test_restore(self):
+        with self.assertRaises(ValueError):
+            with chainer.array_only_mode():
+                raise ValueError
+        y = F.relu(self.x)
+        self.assertIsInstance(y, chainer.Variable)
+
+    def test_link(self):
+        link = chainer.links.Classifier(chainer.links.Linear(2, 4))
+        expect = link.predictor(chainer.Variable(self.x, volatile='on')).data
+        with chainer.array_only_mode():
+            y = link.predictor(self.x)
+        self.assertIsInstance(y, numpy.ndarray)
+        testing.assert_allclose(y, expect)
+
+
+class MLP(chainer.Chain):
+
+    def __init__(self):
+        super(MLP, self).__init__(
+            l1=chainer.links.Linear(784, 100),
+            l2=chainer.links.Linear(100, 100),
+            l3=chainer.links.Linear(100, 10),
+        )
+
+    def __call__(self, x):
+        h = F.relu(self.l1(x))
+        h = F.relu(self.l2(h))
+        return F.softmax(self.l3(h))
+
+
+@attr.slow
+class TestArrayOnlyModeLatency(unittest.TestCase):
+
+    # Benchmark of the per-request latency of a small MLP, where the overhead
+    # of the graph construction is dominant.
+
+    n_requests = 100
+
+    def setUp(self):
+        self.link = MLP()
+        self.x = numpy.random.uniform(-1, 1, (1, 784)).astype(numpy.float32)
+
+    def latency(self, f):
+        f()
+        best = float('inf')
+        for _ in six.moves.range(5):
+            start = time.time()
+            for _ in six.moves.range(self.n_requests):
+                f()
+            best = min(best, (time.time() - start) / self.n_requests)
+        return best
+
+    def predict_volatile(self):
+        return self.link(chainer.Variable(self.x, volatile='on')).data
+
+    def predict_array_only(self):
+        with chainer.array_only_mode():
+            return self.link(self.x)
+
+    def test_latency(self):
+        testing.assert_allclose(self.predict_array_only(),
+                                self.predict_volatile())
+        volatile = self.latency(self.predict_volatile)
+        array_only = self.latency(self.predict_array_only)
+        self.assertLess(array_only, volatile)
+
+
 testing.run_module(__name__, __file__)
@@ -0,0 +1,164 @@
+import copy
+import pickle
+import sys
+import time
+import unittest
+import weakref
+
+import numpy
+import six
+
+import chainer
+from chainer import links
+from chainer import testing
+from chainer.testing import attr
+
+
+class TestVariableSlots(unittest.TestCase):
+
+    def setUp(self):
+        self.x = chainer.Variable(numpy.arange(3, dtype='f'), name='x')
+
+    def test_no_dict(self):
+        self.assertFalse(hasattr(self.x, '__dict__'))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            self.x.unknown = 1
+
+    def test_weakref(self):
+        ref = weakref.ref(self.x)
+        self.assertIs(ref(), self.x)
+
+    def test_copy(self):
+        x = copy.copy(self.x)
+        self.assertIs(x.data, self.x.data)
+        self.assertEqual(x.name, 'x')
+
+    def test_pickle(self):
+        for protocol in six.moves.range(3):
+            x = pickle.loads(pickle.dumps(self.x, protocol))
+            numpy.testing.assert_array_equal(x.data, self.x.data)
+            self.assertEqual(x.name, 'x')
+
+    def test_pickle_link(self):
+        link = links.Linear(3, 2)
+        for protocol in six.moves.range(3):
+            copied = pickle.loads(pickle.dumps(link, protocol))
+            numpy.testing.assert_array_equal(copied.W.data, link.W.data)
+
+
+class TestFunctionSlots(unittest.TestCase):
+
+    def setUp(self):
+        self.x = chainer.Variable(numpy.arange(3, dtype='f'))
+        self.f = chainer.functions.Identity()
+        self.y = self.f(self.x)
+
+    def test_bookkeeping_not_in_dict(self):
+        for name in ('inputs', 'outputs', 'rank'):
+            self.assertNotIn(name, self.f.__dict__)
+        self.assertEqual(self.f.inputs, [self.x])
+        self.assertIs(self.f.outputs[0](), self.y)
+        self.assertEqual(self.f.rank, 0)
+
+    def test_unset_attributes(self):
+        f = chainer.Function()
+        self.assertFalse(hasattr(f, 'inputs'))
+        self.assertIsNone(f.stack)
+        self.assertEqual(f._n_local_function_hooks, 0)
+
+    def test_arbitrary_attribute(self):
+        self.f.retained = 1
+        self.assertEqual(self.f.__dict__['retained'], 1)
+
+    def test_copy(self):
+        f = copy.copy(self.f)
+        self.assertIs(f.inputs, self.f.inputs)
+        self.assertEqual(f.rank, self.f.rank)
+
+    def test_pickle(self):
+        f = chainer.functions.Dropout(0.3)
+        f.rank = 2
+        for protocol in six.moves.range(3):
+            copied = pickle.loads(pickle.dumps(f, protocol))
+            self.assertEqual(copied.dropout_ratio, 0.3)
+            self.assertEqual(copied.rank, 2)
+            self.assertFalse(hasattr(copied, 'inputs'))
+
+
+def _graph_nodes(y):
+    # Collects the variables and functions of the graph reachable from y.
+    variables = {id(y): y}
+    functions = {}
+    stack = [y.creator]
+    while stack:
+        f = stack.pop()
+        if f is None or id(f) in functions:
+            continue
+        functions[id(f)] = f
+        for x in f.inputs:
+            variables[id(x)] = x
+            stack.append(x.creator)
+    return list(six.itervalues(variables)), list(six.itervalues(functions))
+
+
+def _node_size(node):
+    # Size of the object itself and its instance dictionary, if any. The
+    # arrays are not included.
+    size = sys.getsizeof(node)
+    if hasattr(node, '__dict__'):
+        size += sys.getsizeof(node.__dict__)
+    return size
+
+
+@attr.slow
+class TestUnrolledLSTMGraph(unittest.TestCase):
+
+    # Benchmark of the graph construction of a 1000-step unrolled LSTM.
+
+    n_steps = 1000
+
+    def setUp(self):
+        self.link = links.LSTM(10, 10)
+        self.xs = [numpy.random.uniform(-1, 1, (1, 10)).astype('f')
+                   for _ in six.moves.range(self.n_steps)]
+
+    def unroll(self, volatile='off'):
+        self.link.reset_state()
+        loss = 0
+        for x in self.xs:
+            x = chainer.Variable(x, volatile=volatile)
+            loss += chainer.functions.sum(self.link(x))
+        return loss
+
+    def measure(self, volatile):
+        elapsed = []
+        for _ in six.moves.range(3):
+            start = time.time()
+            self.unroll(volatile)
+            elapsed.append(time.time() - start)
+        return min(elapsed)
+
+    def test_construction_time(self):
+        # The overhead of the graph construction is compared with the same
+        # computation without graph, so that the test does not depend on the
+        # speed of the machine.
+        self.unroll()
+        baseline = self.measure('on')
+        elapsed = self.measure('off')
+        self.assertLess(elapsed, baseline * 2)
+
+    def test_node_memory(self):
+        variables, functions = _graph_nodes(self.unroll())
+        self.assertGreater(len(variables), self.n_steps)
+
+        variable_size = sum(_node_size(v) for v in variables) / len(variables)
+        # a variable node consists of the object header and its slots only
+        self.assertEqual(variable_size,
+                         sys.getsizeof(chainer.Variable(self.xs[0])))
+        function_size = sum(_node_size(f) for f in functions) / len(functions)
+        self.assertLess(function_size, 1024)
+
+
+testing.run_module(__name__, __file__)
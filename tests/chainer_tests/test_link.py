@@ -149,6 +149,15 @@ class TestLink(unittest.TestCase):
         self.assertTrue(hasattr(l, 'y'))
         numpy.testing.assert_array_equal(l.y.data, self.link.y.data)
 
+    def test_astype(self):
+        self.link.y.cleargrad()
+        self.assertIs(self.link.astype(numpy.float16), self.link)
+        self.assertEqual(self.link.x.data.dtype, numpy.float16)
+        self.assertEqual(self.link.x.grad.dtype, numpy.float16)
+        self.assertEqual(self.link.y.data.dtype, numpy.float16)
+        self.assertIsNone(self.link.y.grad)
+        self.assertIs(self.link.p, self.p)
+
     def test_cleargrads(self):
         self.link.cleargrads()
         self.assertIsNone(self.link.x.grad)
@@ -286,6 +295,12 @@ class TestChain(unittest.TestCase):
         self.assertIs(self.c1.l2, self.l2)
         self.assertEqual(self.l2.name, 'l2')
 
+    def test_astype(self):
+        self.c2.astype(numpy.float16)
+        for param in self.c2.params():
+            self.assertEqual(param.data.dtype, numpy.float16)
+            self.assertEqual(param.grad.dtype, numpy.float16)
+
     def test_copy(self):
         c2 = self.c2.copy()
         self.assertIs(c2.name, None)
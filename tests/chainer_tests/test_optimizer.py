@@ -418,4 +418,168 @@ class TestGradientMethodClearGrads(unittest.TestCase):
         self.optimizer.update()
 
 
+class TestGradientMethodHostOnly(unittest.TestCase):
+
+    def test_update_without_device_selection(self):
+        target = chainer.links.Linear(3, 2)
+        w = target.W.data.copy()
+        opt = optimizers.MomentumSGD()
+        opt.setup(target)
+        x = np.random.uniform(-1, 1, (4, 3)).astype(np.float32)
+
+        def lossfun():
+            return chainer.functions.sum(target(x))
+
+        with mock.patch('chainer.cuda.available', False), \
+                mock.patch('chainer.cuda.get_device') as get_device:
+            opt.update(lossfun)
+            opt.update(lossfun)
+        self.assertFalse(get_device.called)
+        self.assertEqual(opt.t, 2)
+        self.assertFalse((target.W.data == w).any())
+
+
+class TestGradientMethodFP32Update(unittest.TestCase):
+
+    def setUp(self):
+        self.optimizer = optimizers.Adam()
+        self.optimizer.use_fp32_update()
+        self.target = SimpleLink(
+            np.arange(3).astype(np.float16),
+            np.arange(3).astype(np.float16))
+        self.optimizer.setup(self.target)
+
+    def check_update(self):
+        self.optimizer.update()
+        state = self.optimizer._states['/param']
+        self.assertEqual(self.target.param.data.dtype, np.float16)
+        self.assertEqual(self.target.param.grad.dtype, np.float16)
+        self.assertEqual(state['m'].dtype, np.float32)
+        master = state['master']
+        self.assertEqual(master.dtype, np.float32)
+        testing.assert_allclose(
+            self.target.param.data, master.astype(np.float16))
+        # the update is kept by the master even if rounded off in fp16
+        self.assertFalse((master == np.arange(3)).all())
+
+    def test_update_cpu(self):
+        self.check_update()
+
+    @attr.gpu
+    def test_update_gpu(self):
+        self.target.to_gpu()
+        self.check_update()
+
+    def test_keeps_small_updates(self):
+        optimizer = optimizers.SGD(lr=1e-4)
+        optimizer.use_fp32_update()
+        target = SimpleLink(np.ones(3, np.float16), np.ones(3, np.float16))
+        optimizer.setup(target)
+        for _ in range(10):
+            target.param.grad.fill(1)
+            optimizer.update()
+        master = optimizer._states['/param']['master']
+        testing.assert_allclose(master, np.full(3, 0.999, np.float32))
+        testing.assert_allclose(target.param.data, master, atol=1e-3)
+
+    def test_serialize(self):
+        self.target.param.grad = np.full(3, 1e-3, np.float16)
+        self.optimizer.update()
+        state = self.optimizer._states['/param']
+        target = chainer.serializers.DictionarySerializer()
+        self.optimizer.serialize(target)
+
+        optimizer = optimizers.Adam()
+        optimizer.use_fp32_update()
+        optimizer.setup(self.target)
+        optimizer.serialize(
+            chainer.serializers.NpzDeserializer(target.target))
+        loaded = optimizer._states['/param']
+        for key in ('master', 'm', 'v'):
+            self.assertEqual(loaded[key].dtype, np.float32)
+            np.testing.assert_array_equal(loaded[key], state[key])
+        # values below the half precision range survive the round trip
+        self.assertTrue((loaded['v'] > 0).all())
+        self.assertTrue((loaded['v'] < 1e-7).all())
+
+        self.target.param.grad = np.full(3, 1e-3, np.float16)
+        self.optimizer.update()
+        self.target.param.grad = np.full(3, 1e-3, np.float16)
+        optimizer.update()
+        np.testing.assert_array_equal(loaded['master'], state['master'])
+
+    def test_float32_param_has_no_master(self):
+        target = SimpleLink(np.ones(3, np.float32), np.ones(3, np.float32))
+        self.optimizer.setup(target)
+        self.optimizer.update()
+        self.assertNotIn('master', self.optimizer._states['/param'])
+
+
+class TestGradientMethodLossScaling(unittest.TestCase):
+
+    def setUp(self):
+        self.optimizer = optimizers.SGD(lr=1.0)
+        self.optimizer.use_loss_scaling(scale=8.0, interval=2)
+        self.target = SimpleLink(
+            np.zeros(3, np.float32), np.zeros(3, np.float32))
+        self.optimizer.setup(self.target)
+
+    def lossfun(self, *args):
+        return chainer.functions.sum(self.target.param * self.coeff)
+
+    def test_default(self):
+        self.assertIsNone(optimizers.SGD().loss_scale)
+
+    def test_update_with_lossfun(self):
+        self.coeff = np.array([1, 2, 3], np.float32)
+        self.optimizer.update(self.lossfun)
+        testing.assert_allclose(self.target.param.data, -self.coeff)
+        self.assertEqual(self.optimizer.t, 1)
+
+    def test_dynamic_scale(self):
+        self.coeff = np.array([1, 2, 3], np.float32)
+        self.optimizer.update(self.lossfun)
+        self.assertEqual(self.optimizer.loss_scale, 8.0)
+        self.optimizer.update(self.lossfun)
+        self.assertEqual(self.optimizer.loss_scale, 16.0)
+
+        self.coeff = np.array([1, np.inf, 3], np.float32)
+        self.optimizer.update(self.lossfun)
+        self.assertEqual(self.optimizer.loss_scale, 8.0)
+        self.assertEqual(self.optimizer.t, 2)
+        testing.assert_allclose(
+            self.target.param.data, np.array([-2, -4, -6], np.float32))
+
+    def test_large_finite_gradient(self):
+        # the sum of the gradient overflows in single precision
+        self.target.param.grad = np.full(3, 3e38, np.float32)
+        self.optimizer.update()
+        self.assertEqual(self.optimizer.t, 1)
+
+    def test_static_scale(self):
+        self.optimizer.use_loss_scaling(scale=8.0, dynamic=False)
+        self.target.param.grad = np.array([8, np.nan, 8], np.float32)
+        self.optimizer.update()
+        self.assertEqual(self.optimizer.t, 0)
+        self.target.param.grad = np.array([8, 8, 8], np.float32)
+        self.optimizer.update()
+        self.assertEqual(self.optimizer.t, 1)
+        self.assertEqual(self.optimizer.loss_scale, 8.0)
+        testing.assert_allclose(self.target.param.data, -np.ones(3))
+
+    def test_serialize(self):
+        self.coeff = np.array([1, 2, 3], np.float32)
+        self.optimizer.update(self.lossfun)
+        self.optimizer.update(self.lossfun)
+        target = chainer.serializers.DictionarySerializer()
+        self.optimizer.serialize(target)
+
+        optimizer = optimizers.SGD(lr=1.0)
+        optimizer.use_loss_scaling(interval=2)
+        optimizer.setup(self.target)
+        optimizer.serialize(
+            chainer.serializers.NpzDeserializer(target.target))
+        self.assertEqual(optimizer.loss_scale, 16.0)
+
+
 testing.run_module(__name__, __file__)
@@ -0,0 +1,77 @@
+import threading
+import unittest
+
+import mock
+
+from chainer import profiler
+from chainer import testing
+
+
+class TestPhaseTimer(unittest.TestCase):
+
+    def setUp(self):
+        self.timer = profiler.PhaseTimer()
+        self.now = 0.
+        patcher = mock.patch('time.time', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tick(self, t):
+        self.now += t
+
+    def test_no_timer(self):
+        self.assertIsNone(profiler.get_current_timer())
+        with profiler.phase('forward'):
+            self.tick(1)
+        self.assertEqual(self.timer.times, {})
+
+    def test_phase(self):
+        with self.timer:
+            self.assertIs(profiler.get_current_timer(), self.timer)
+            with profiler.phase('forward'):
+                self.tick(1)
+            self.tick(10)
+            with profiler.phase('forward'):
+                self.tick(2)
+            with profiler.phase('backward'):
+                self.tick(4)
+        self.assertIsNone(profiler.get_current_timer())
+        self.assertEqual(self.timer.times, {'forward': 3, 'backward': 4})
+
+    def test_nested_phases(self):
+        with self.timer:
+            with profiler.phase('update'):
+                self.tick(1)
+                with profiler.phase('iterator'):
+                    self.tick(2)
+                    with profiler.phase('converter'):
+                        self.tick(4)
+                    self.tick(8)
+                self.tick(16)
+        self.assertEqual(
+            self.timer.times, {'update': 17, 'iterator': 10, 'converter': 4})
+
+    def test_reset(self):
+        with self.timer:
+            with profiler.phase('update'):
+                self.tick(1)
+                times = self.timer.reset()
+                self.tick(2)
+        self.assertEqual(times, {})
+        self.assertEqual(self.timer.times, {'update': 3})
+        self.assertEqual(self.timer.reset(), {'update': 3})
+        self.assertEqual(self.timer.times, {})
+
+    def test_other_thread(self):
+        def target():
+            with profiler.phase('evaluation'):
+                self.tick(1)
+
+        with self.timer:
+            thread = threading.Thread(target=target)
+            thread.start()
+            thread.join()
+        self.assertEqual(self.timer.times, {})
+
+
+testing.run_module(__name__, __file__)
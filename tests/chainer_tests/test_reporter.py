@@ -1,3 +1,4 @@
+import threading
 import unittest
 
 import numpy
@@ -118,6 +119,22 @@ class TestReport(unittest.TestCase):
         self.assertEqual(observation['x'], 1)
         self.assertNotIn('x', reporter.observation)
 
+    def test_report_in_another_thread(self):
+        reporter1 = chainer.Reporter()
+        reporter2 = chainer.Reporter()
+
+        def report():
+            chainer.report({'y': 2})
+            with reporter2:
+                chainer.report({'x': 1})
+
+        with reporter1:
+            thread = threading.Thread(target=report)
+            thread.start()
+            thread.join()
+        self.assertEqual(reporter1.observation, {})
+        self.assertEqual(reporter2.observation, {'x': 1})
+
 
 class TestSummary(unittest.TestCase):
 
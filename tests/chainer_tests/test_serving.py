@@ -0,0 +1,324 @@
+import threading
+import time
+import unittest
+
+import mock
+import numpy
+import six
+
+import chainer
+from chainer import cuda
+import chainer.functions as F
+import chainer.links as L
+from chainer import serving
+from chainer import testing
+from chainer.testing import attr
+
+
+class TestBatchingServer(unittest.TestCase):
+
+    def setUp(self):
+        self.link = L.Linear(3, 2)
+        self.calls = []
+
+        def predict(x):
+            self.calls.append(len(x))
+            return self.link(x)
+
+        self.server = serving.BatchingServer(
+            predict, max_batch_size=4, max_latency=0.05)
+        self.xs = numpy.random.uniform(-1, 1, (10, 3)).astype('f')
+
+    def tearDown(self):
+        self.server.stop()
+
+    def expect(self, x):
+        return self.link(x[None]).data[0]
+
+    def test_predict(self):
+        with self.server:
+            y = self.server.predict(self.xs[0])
+        testing.assert_allclose(y, self.expect(self.xs[0]))
+        self.assertEqual(self.calls, [1])
+
+    def test_batching(self):
+        self.server.start()
+        requests = [self.server.submit(x) for x in self.xs]
+        for x, request in six.moves.zip(self.xs, requests):
+            testing.assert_allclose(request.result(1), self.expect(x))
+            self.assertTrue(request.done())
+        self.assertEqual(sum(self.calls), len(self.xs))
+        self.assertLessEqual(max(self.calls), 4)
+        self.assertLess(len(self.calls), len(self.xs))
+
+    def test_no_backprop(self):
+        def predict(x):
+            y = self.link(x)
+            self.assertIsNone(y.creator)
+            return y
+
+        server = serving.BatchingServer(predict)
+        with server:
+            server.predict(self.xs[0])
+
+    def test_threads(self):
+        results = {}
+
+        def client(i):
+            results[i] = self.server.predict(self.xs[i], 1)
+
+        self.server.start()
+        threads = [threading.Thread(target=client, args=(i,))
+                   for i in six.moves.range(len(self.xs))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        for i, x in enumerate(self.xs):
+            testing.assert_allclose(results[i], self.expect(x))
+
+    def test_stop_processes_waiting_examples(self):
+        self.server.start()
+        requests = [self.server.submit(x) for x in self.xs]
+        self.server.stop()
+        for request in requests:
+            self.assertTrue(request.done())
+
+    def test_stop_while_submitting(self):
+        entered = threading.Event()
+        proceed = threading.Event()
+        requests = []
+        request_class = serving.Request
+
+        def create_request(example):
+            # stop is called between the check of the state and the
+            # enqueueing of the request
+            entered.set()
+            proceed.wait(1)
+            return request_class(example)
+
+        def submit():
+            requests.append(self.server.submit(self.xs[0]))
+
+        self.server.start()
+        with mock.patch.object(serving, 'Request', create_request):
+            client = threading.Thread(target=submit)
+            client.start()
+            entered.wait(1)
+        stopper = threading.Thread(target=self.server.stop)
+        stopper.start()
+        time.sleep(0.1)
+        proceed.set()
+        client.join()
+        stopper.join()
+        self.assertTrue(requests[0].done())
+
+    def test_submit_before_start(self):
+        with self.assertRaises(RuntimeError):
+            self.server.submit(self.xs[0])
+
+    def test_start_twice(self):
+        self.server.start()
+        with self.assertRaises(RuntimeError):
+            self.server.start()
+
+    def test_exception(self):
+        def predict(x):
+            raise ValueError('invalid')
+
+        with serving.BatchingServer(predict) as server:
+            request = server.submit(self.xs[0])
+            with self.assertRaises(ValueError):
+                request.result(1)
+
+    def test_invalid_batch_size_of_outputs(self):
+        def predict(x):
+            return x[:1]
+
+        with serving.BatchingServer(predict, max_latency=0.05) as server:
+            requests = [server.submit(x) for x in self.xs[:2]]
+            with self.assertRaises(ValueError):
+                requests[0].result(1)
+
+    def test_callback(self):
+        done = []
+        with self.server:
+            request = self.server.submit(self.xs[0])
+            request.add_done_callback(done.append)
+            request.result(1)
+        self.assertEqual(done, [request])
+        request.add_done_callback(done.append)
+        self.assertEqual(done, [request, request])
+
+    def test_statistics(self):
+        self.assertEqual(self.server.latency_percentiles(), {})
+        with self.server:
+            for x in self.xs[:3]:
+                self.server.predict(x)
+        stats = self.server.statistics()
+        self.assertEqual(stats['queue_depth'], 0)
+        self.assertEqual(stats['batch_size'], 1)
+        for p in (50, 90, 99):
+            self.assertGreater(stats['latency/{}'.format(p)], 0)
+        self.assertLessEqual(stats['latency/50'], stats['latency/99'])
+
+    def test_queue_depth(self):
+        started = threading.Event()
+        resume = threading.Event()
+
+        def predict(x):
+            started.set()
+            resume.wait()
+            return x
+
+        with serving.BatchingServer(predict, max_batch_size=1) as server:
+            server.submit(self.xs[0])
+            started.wait()
+            for x in self.xs[1:4]:
+                server.submit(x)
+            self.assertEqual(server.queue_depth, 3)
+            resume.set()
+        self.assertEqual(server.queue_depth, 0)
+
+
+class TestBatchingServerOutputs(unittest.TestCase):
+
+    def setUp(self):
+        self.xs = numpy.random.uniform(-1, 1, (3, 2)).astype('f')
+        self.ts = numpy.arange(3, dtype='i')
+
+    def test_tuple(self):
+        def predict(x, t):
+            return x * 2, t
+
+        with serving.BatchingServer(predict) as server:
+            y, t = server.predict((self.xs[1], self.ts[1]))
+        testing.assert_allclose(y, self.xs[1] * 2)
+        self.assertEqual(t, 1)
+
+    def test_dict(self):
+        def predict(x):
+            return {'y': F.relu(x), 'x': x}
+
+        def converter(batch, device):
+            return {'x': chainer.dataset.concat_examples(batch, device)}
+
+        with serving.BatchingServer(predict, converter=converter) as server:
+            y = server.predict(self.xs[0])
+        testing.assert_allclose(y['y'], numpy.maximum(self.xs[0], 0))
+        testing.assert_allclose(y['x'], self.xs[0])
+
+    @attr.gpu
+    def test_gpu(self):
+        link = L.Linear(2, 2)
+        link.to_gpu()
+        with serving.BatchingServer(link, device=0) as server:
+            y = server.predict(self.xs[0])
+        self.assertIsInstance(y, numpy.ndarray)
+        testing.assert_allclose(
+            y, cuda.to_cpu(link(cuda.to_gpu(self.xs[:1])).data)[0],
+            atol=1e-4, rtol=1e-4)
+
+
+class TestSubmitAsyncio(unittest.TestCase):
+
+    def setUp(self):
+        try:
+            import asyncio
+        except ImportError:
+            raise unittest.SkipTest('asyncio is not available')
+        self.loop = asyncio.new_event_loop()
+        if not hasattr(self.loop, 'create_future'):
+            raise unittest.SkipTest('create_future is not available')
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_submit_asyncio(self):
+        import asyncio
+
+        xs = numpy.arange(6, dtype='f').reshape(3, 2)
+        with serving.BatchingServer(lambda x: x * 2) as server:
+            futures = [server.submit_asyncio(x, self.loop) for x in xs]
+            ys = self.loop.run_until_complete(
+                asyncio.gather(*futures, loop=self.loop))
+        for x, y in six.moves.zip(xs, ys):
+            testing.assert_allclose(y, x * 2)
+
+
+class TestLocalClient(unittest.TestCase):
+
+    def test_call(self):
+        x = numpy.arange(3, dtype='f')
+        examples = []
+
+        def predict(x):
+            examples.append(x)
+            return x + 1
+
+        with serving.BatchingServer(predict) as server:
+            client = serving.LocalClient(server, timeout=1)
+            testing.assert_allclose(client(x), x + 1)
+            testing.assert_allclose(client.call_async(x).result(1), x + 1)
+        x[:] = -1
+        testing.assert_allclose(examples[0][0], numpy.arange(3))
+
+
+class MLP(chainer.Chain):
+
+    def __init__(self):
+        super(MLP, self).__init__(
+            l1=L.Linear(100, 100),
+            l2=L.Linear(100, 100),
+            l3=L.Linear(100, 10),
+        )
+
+    def __call__(self, x):
+        return self.l3(F.relu(self.l2(F.relu(self.l1(x)))))
+
+
+def _throughput(predict, xs, n_threads):
+    # Number of examples processed per second by the clients in n_threads.
+    def client(i):
+        for x in xs[i::n_threads]:
+            predict(x)
+
+    threads = [threading.Thread(target=client, args=(i,))
+               for i in six.moves.range(n_threads)]
+    start = time.time()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return len(xs) / (time.time() - start)
+
+
+@attr.slow
+class TestBatchingServerThroughput(unittest.TestCase):
+
+    # Benchmark of the throughput of clients sending single examples.
+
+    n_threads = 16
+
+    def setUp(self):
+        self.model = MLP()
+        self.xs = numpy.random.uniform(-1, 1, (2000, 100)).astype('f')
+
+    def test_throughput(self):
+        lock = threading.Lock()
+
+        def predict_one(x):
+            with lock, chainer.no_backprop_mode():
+                return self.model(x[None]).data[0]
+
+        baseline = _throughput(predict_one, self.xs, self.n_threads)
+        with serving.BatchingServer(self.model, max_batch_size=32,
+                                    max_latency=0.002) as server:
+            client = serving.LocalClient(server)
+            batched = _throughput(client, self.xs, self.n_threads)
+            stats = server.statistics()
+        self.assertGreater(stats['batch_size'], 1)
+        self.assertGreater(batched, baseline)
+
+
+testing.run_module(__name__, __file__)
@@ -1,6 +1,7 @@
 import inspect
 import unittest
 
+import mock
 import numpy as np
 
 import chainer
@@ -427,6 +428,17 @@ class TestVariable(unittest.TestCase):
                            np.full(3, 20, dtype=np.float32),
                            np.full(3, 30, dtype=np.float32))
 
+    def test_addgrad_cpu_without_device_selection(self):
+        a = chainer.Variable(np.full(3, 10, dtype=np.float32))
+        a.grad = a.data
+        b = chainer.Variable(np.full(3, 20, dtype=np.float32))
+        with mock.patch('chainer.cuda.get_device') as get_device:
+            b.addgrad(a)
+            b.addgrad(a)
+        self.assertFalse(get_device.called)
+        np.testing.assert_array_equal(b.grad, np.full(3, 20, np.float32))
+        self.assertIsNot(b.grad, a.grad)
+
     @attr.gpu
     def test_addgrad_cpu_to_gpu(self):
         cp = cuda.cupy
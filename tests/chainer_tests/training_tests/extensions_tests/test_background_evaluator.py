@@ -0,0 +1,205 @@
+import shutil
+import tempfile
+import threading
+import unittest
+
+import mock
+import numpy
+
+import chainer
+from chainer import datasets
+from chainer import iterators
+from chainer import links
+from chainer import optimizers
+from chainer import testing
+from chainer import training
+from chainer.training import extensions
+
+
+class DummyIterator(chainer.dataset.Iterator):
+
+    def __init__(self, dataset, repeat):
+        self.dataset = dataset
+        self.repeat = repeat
+        self.epoch = 0
+        self.is_new_epoch = False
+        self.current_position = 0
+        self.n_copies = 0
+        self.finalized = False
+
+    def __copy__(self):
+        self.n_copies += 1
+        ret = DummyIterator(self.dataset, self.repeat)
+        return ret
+
+    def __next__(self):
+        if not self.repeat and self.epoch > 0:
+            raise StopIteration
+        batch = self.dataset[self.current_position]
+        self.current_position += 1
+        self.is_new_epoch = self.current_position == len(self.dataset)
+        if self.is_new_epoch:
+            self.current_position = 0
+            self.epoch += 1
+        return batch
+
+    next = __next__
+
+    def finalize(self):
+        self.finalized = True
+
+
+class DummyModel(chainer.Chain):
+
+    def __init__(self):
+        super(DummyModel, self).__init__(l=links.Linear(3, 1))
+        self.l.W.data[:] = 1
+        self.add_persistent('count', numpy.zeros(1, 'f'))
+        self.started = threading.Event()
+        self.resume = threading.Event()
+        self.resume.set()
+
+    def __call__(self, x):
+        self.started.set()
+        self.resume.wait()
+        y = self.l(x)
+        chainer.report(
+            {'y': chainer.functions.sum(y), 'count': self.count[0]}, self)
+        return y
+
+
+def _trainer(iteration):
+    trainer = mock.MagicMock()
+    trainer.updater.epoch = 0
+    trainer.updater.iteration = iteration
+    return trainer
+
+
+def _call(evaluator, trainer):
+    observation = {}
+    reporter = chainer.Reporter()
+    with reporter.scope(observation):
+        evaluator(trainer)
+    return observation
+
+
+@testing.parameterize(
+    {'repeat': True},
+    {'repeat': False},
+)
+class TestBackgroundEvaluator(unittest.TestCase):
+
+    def setUp(self):
+        self.dataset = [numpy.ones((1, 3), 'f'), numpy.ones((1, 3), 'f') * 2]
+        self.iterator = DummyIterator(self.dataset, self.repeat)
+        self.model = DummyModel()
+        self.evaluator = extensions.BackgroundEvaluator(
+            self.iterator, self.model, converter=lambda batch, device: batch,
+            trigger=(2, 'iteration'))
+        self.evaluator.name = 'val'
+
+    def test_evaluate_snapshot(self):
+        self.model.resume.clear()
+        observation = _call(self.evaluator, _trainer(2))
+        self.assertEqual(observation, {})
+        self.model.started.wait()
+        # updates during the evaluation are not visible to it
+        self.model.l.W.data[:] = 0
+        self.model.count[:] = 1
+        self.model.resume.set()
+        self.evaluator.wait()
+
+        observation = _call(self.evaluator, _trainer(3))
+        self.assertAlmostEqual(observation['val/main/y'], 4.5)
+        self.assertEqual(observation['val/main/count'], 0)
+        self.assertEqual(observation['val/epoch'], 0)
+        self.assertEqual(observation['val/iteration'], 2)
+        self.assertEqual(len(self.evaluator.results), 1)
+        self.assertEqual(self.evaluator.results[0][:2], (0, 2))
+
+    def test_trigger(self):
+        self.assertEqual(_call(self.evaluator, _trainer(1)), {})
+        self.evaluator.wait()
+        self.assertEqual(_call(self.evaluator, _trainer(1)), {})
+        self.assertEqual(self.evaluator.results, [])
+
+    def test_iterator(self):
+        for iteration in (2, 4):
+            _call(self.evaluator, _trainer(iteration))
+            self.evaluator.wait()
+        observation = _call(self.evaluator, _trainer(5))
+        self.assertAlmostEqual(observation['val/main/y'], 4.5)
+        if self.repeat:
+            self.assertEqual(self.iterator.n_copies, 0)
+            self.assertEqual(self.iterator.epoch, 2)
+        else:
+            self.assertEqual(self.iterator.n_copies, 2)
+            self.assertEqual(self.iterator.epoch, 0)
+
+        self.evaluator.finalize()
+        self.assertEqual(self.iterator.finalized, self.repeat)
+
+    def test_wait_for_previous_evaluation(self):
+        self.model.resume.clear()
+        _call(self.evaluator, _trainer(2))
+        self.model.started.wait()
+        threading.Timer(0.05, self.model.resume.set).start()
+        observation = _call(self.evaluator, _trainer(4))
+        # the result of the previous evaluation is reported
+        self.assertEqual(observation['val/iteration'], 2)
+        self.evaluator.finalize()
+        self.assertEqual([r[1] for r in self.evaluator.results], [2, 4])
+
+    def test_exception(self):
+        def eval_func(x):
+            raise ValueError('invalid')
+
+        self.evaluator.eval_func = eval_func
+        _call(self.evaluator, _trainer(2))
+        self.evaluator.wait()
+        with self.assertRaises(ValueError):
+            _call(self.evaluator, _trainer(3))
+
+    def test_call_without_trainer(self):
+        reporter = chainer.Reporter()
+        with reporter:
+            result = self.evaluator()
+        self.assertAlmostEqual(result['val/main/y'], 4.5)
+
+
+class TestBackgroundEvaluatorWithTrainer(unittest.TestCase):
+
+    def setUp(self):
+        x = numpy.random.uniform(-1, 1, (12, 3)).astype(numpy.float32)
+        t = numpy.random.randint(0, 2, 12).astype(numpy.int32)
+        dataset = datasets.TupleDataset(x, t)
+        self.model = links.Classifier(links.Linear(3, 2))
+        optimizer = optimizers.SGD()
+        optimizer.setup(self.model)
+        updater = training.StandardUpdater(
+            iterators.SerialIterator(dataset, 4), optimizer)
+        self.out = tempfile.mkdtemp()
+        self.trainer = training.Trainer(updater, (3, 'epoch'), out=self.out)
+        self.evaluator = extensions.BackgroundEvaluator(
+            iterators.SerialIterator(dataset, 4, shuffle=False), self.model)
+        self.trainer.extend(self.evaluator)
+        self.log_report = extensions.LogReport(log_name=None)
+        self.trainer.extend(self.log_report)
+
+    def tearDown(self):
+        shutil.rmtree(self.out)
+
+    def test_run(self):
+        self.trainer.run()
+        results = self.evaluator.results
+        self.assertEqual([(r[0], r[1]) for r in results],
+                         [(1, 3), (2, 6), (3, 9)])
+        for r in results:
+            self.assertIn('validation/main/loss', r[2])
+        # the evaluations are attributed to the epochs of their parameters
+        for entry in self.log_report.log:
+            if 'validation/epoch' in entry:
+                self.assertLess(entry['validation/epoch'], entry['epoch'])
+
+
+testing.run_module(__name__, __file__)
@@ -0,0 +1,161 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from chainer import datasets
+from chainer import iterators
+from chainer import links
+from chainer import optimizers
+from chainer import serializers
+from chainer import testing
+from chainer import training
+from chainer.training import extensions
+from chainer.training.extensions import batch_size_tuner
+
+
+@testing.parameterize(
+    {'iterator_settings': None, 'memory_limit': None, 'multiprocess': False},
+    {'iterator_settings': [{'n_prefetch': 1}, {'n_prefetch': 2}],
+     'memory_limit': None, 'multiprocess': True},
+    {'iterator_settings': None, 'memory_limit': 1, 'multiprocess': False},
+    {'iterator_settings': [{'n_prefetch': 2}, {'n_prefetch': 3}],
+     'memory_limit': 1, 'multiprocess': True},
+)
+class TestBatchSizeTuner(unittest.TestCase):
+
+    def setUp(self):
+        x = numpy.random.uniform(-1, 1, (20, 3)).astype(numpy.float32)
+        t = numpy.random.randint(0, 2, 20).astype(numpy.int32)
+        self.model = links.Classifier(links.Linear(3, 2))
+        self.optimizer = optimizers.SGD()
+        self.optimizer.use_cleargrads()
+        self.optimizer.setup(self.model)
+        dataset = datasets.TupleDataset(x, t)
+        if self.multiprocess:
+            self.iterator = iterators.MultiprocessIterator(
+                dataset, 3, n_processes=1, n_prefetch=0)
+        else:
+            self.iterator = iterators.SerialIterator(dataset, 3)
+        self.updater = training.StandardUpdater(self.iterator, self.optimizer)
+        self.out = tempfile.mkdtemp()
+        self.trainer = training.Trainer(self.updater, out=self.out)
+
+    def tearDown(self):
+        self.iterator.finalize()
+        shutil.rmtree(self.out)
+
+    def test_call(self):
+        W = self.model.predictor.W.data.copy()
+        tuner = extensions.BatchSizeTuner(
+            [8, 2, 4], iterator_settings=self.iterator_settings,
+            n_iterations=2, memory_limit=self.memory_limit)
+        tuner(self.trainer)
+
+        n_settings = len(self.iterator_settings or [{}])
+        self.assertEqual(len(tuner.results), 3 * n_settings)
+        self.assertEqual(
+            [r['batch_size'] for r in tuner.results], [2, 4, 8] * n_settings)
+        for result in tuner.results:
+            self.assertGreater(result['throughput'], 0)
+
+        # the state before the probes is restored
+        numpy.testing.assert_array_equal(W, self.model.predictor.W.data)
+        self.assertEqual(self.iterator.epoch_detail, 0)
+        self.assertEqual(self.updater.iteration, 0)
+        self.assertEqual(self.optimizer.t, 0)
+
+        if self.memory_limit is None or tuner.results[0]['memory'] is None:
+            self.assertIsNotNone(tuner.best)
+            self.assertEqual(self.iterator.batch_size,
+                             tuner.best['batch_size'])
+            self.assertEqual(len(self.iterator.next()),
+                             tuner.best['batch_size'])
+        else:
+            self.assertIsNone(tuner.best)
+            self.assertEqual(self.iterator.batch_size, 3)
+            if self.multiprocess:
+                self.assertEqual(self.iterator.n_prefetch, 1)
+
+        with open(os.path.join(self.out, 'batch_size_tuning')) as f:
+            log = json.load(f)
+        self.assertEqual(log['results'], tuner.results)
+
+        # the extension runs only once
+        tuner(self.trainer)
+        self.assertEqual(len(tuner.results), 3 * n_settings)
+
+    def test_resume(self):
+        tuner = extensions.BatchSizeTuner([2, 4], n_iterations=1)
+        tuner(self.trainer)
+        target = serializers.DictionarySerializer()
+        tuner.serialize(target)
+
+        # the iterator of the resumed training has the original batch size
+        self.iterator.batch_size = 3
+        resumed = extensions.BatchSizeTuner([2, 4], n_iterations=1)
+        resumed.serialize(serializers.NpzDeserializer(target.target))
+        self.assertEqual(resumed.results, tuner.results)
+        resumed(self.trainer)
+        self.assertEqual(resumed.results, tuner.results)
+        if tuner.best is None:
+            self.assertEqual(self.iterator.batch_size, 3)
+        else:
+            self.assertEqual(self.iterator.batch_size,
+                             tuner.best['batch_size'])
+        self.assertEqual(self.updater.iteration, 0)
+
+
+class _TemporaryArrayUpdater(training.StandardUpdater):
+
+    def update(self):
+        super(_TemporaryArrayUpdater, self).update()
+        # allocate and free a temporary array of 64 MB
+        numpy.ones(1 << 24, dtype=numpy.float32)
+
+
+@unittest.skipUnless(batch_size_tuner._reset_peak_rss(),
+                     'peak memory cannot be measured')
+class TestBatchSizeTunerPeakMemory(unittest.TestCase):
+
+    def test_temporary_array(self):
+        x = numpy.zeros((4, 3), dtype=numpy.float32)
+        optimizer = optimizers.SGD()
+        optimizer.setup(links.Linear(3, 2))
+        updater = _TemporaryArrayUpdater(
+            iterators.SerialIterator(x, 2), optimizer,
+            loss_func=lambda x: optimizer.target(x)[0, 0])
+        trainer = training.Trainer(updater)
+        tuner = extensions.BatchSizeTuner([2], n_iterations=1, log_name=None)
+        tuner(trainer)
+
+        batch_size_tuner._reset_peak_rss()
+        current = batch_size_tuner._get_peak_rss()
+        # the memory of the array freed within the update is included
+        self.assertGreaterEqual(tuner.results[0]['memory'],
+                                current + (1 << 25))
+
+
+class TestBatchSizeTunerInvalid(unittest.TestCase):
+
+    def test_empty_batch_sizes(self):
+        with self.assertRaises(ValueError):
+            extensions.BatchSizeTuner([])
+
+    def test_unknown_attribute(self):
+        x = numpy.zeros((4, 3), dtype=numpy.float32)
+        optimizer = optimizers.SGD()
+        optimizer.setup(links.Linear(3, 2))
+        updater = training.StandardUpdater(
+            iterators.SerialIterator(x, 2), optimizer)
+        trainer = training.Trainer(updater)
+        tuner = extensions.BatchSizeTuner(
+            [2], iterator_settings=[{'n_prefetch': 1}])
+        with self.assertRaises(ValueError):
+            tuner(trainer)
+
+
+testing.run_module(__name__, __file__)
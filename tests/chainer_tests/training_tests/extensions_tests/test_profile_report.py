@@ -0,0 +1,103 @@
+import shutil
+import tempfile
+import time
+import unittest
+import warnings
+
+import numpy
+
+from chainer import datasets
+from chainer import iterators
+from chainer import links
+from chainer import optimizers
+from chainer import testing
+from chainer import training
+from chainer.training import extensions
+
+
+# Either the iterator or the model is made slow so that the training is
+# clearly input-bound or not even on a loaded machine.
+
+class _SlowIterator(iterators.SerialIterator):
+
+    def __next__(self):
+        time.sleep(0.05)
+        return super(_SlowIterator, self).__next__()
+
+    next = __next__
+
+
+class _SlowLinear(links.Linear):
+
+    def __call__(self, x):
+        time.sleep(0.05)
+        return super(_SlowLinear, self).__call__(x)
+
+
+@testing.parameterize(
+    {'slow': False},
+    {'slow': True},
+)
+class TestProfileReport(unittest.TestCase):
+
+    def setUp(self):
+        x = numpy.random.uniform(-1, 1, (20, 3)).astype(numpy.float32)
+        t = numpy.random.randint(0, 2, 20).astype(numpy.int32)
+        predictor_class = links.Linear if self.slow else _SlowLinear
+        model = links.Classifier(predictor_class(3, 2))
+        optimizer = optimizers.SGD()
+        optimizer.use_cleargrads()
+        optimizer.setup(model)
+        iterator_class = _SlowIterator if self.slow else \
+            iterators.SerialIterator
+        iterator = iterator_class(datasets.TupleDataset(x, t), 4)
+        updater = training.StandardUpdater(iterator, optimizer)
+        self.out = tempfile.mkdtemp()
+        self.trainer = training.Trainer(
+            updater, (5, 'iteration'), out=self.out)
+        self.observations = []
+        self.trainer.extend(
+            lambda trainer: self.observations.append(
+                dict(trainer.observation)),
+            name='record')
+
+    def tearDown(self):
+        shutil.rmtree(self.out)
+
+    def test_report(self):
+        report = extensions.ProfileReport()
+        self.trainer.extend(report)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            self.trainer.run()
+
+        self.assertEqual(len(self.observations), 5)
+        for observation in self.observations:
+            self.assertGreater(observation['profile/iterations_per_second'], 0)
+            testing.assert_allclose(
+                observation['profile/examples_per_second'],
+                observation['profile/iterations_per_second'] * 4)
+            fractions = [observation['profile/' + key] for key in (
+                'iterator', 'converter', 'forward', 'backward', 'optimizer',
+                'update', 'other')]
+            for fraction in fractions:
+                self.assertGreaterEqual(fraction, 0)
+            self.assertLessEqual(sum(fractions), 1 + 1e-6)
+            self.assertEqual(observation['profile/input_bound'],
+                             float(self.slow))
+        self.assertEqual(report.input_bound, self.slow)
+        n_warnings = len([x for x in w if 'input-bound' in str(x.message)])
+        self.assertEqual(n_warnings, int(self.slow))
+
+    def test_log_report(self):
+        self.trainer.extend(extensions.ProfileReport(prefix='prof'))
+        log_report = extensions.LogReport(trigger=(5, 'iteration'))
+        self.trainer.extend(log_report)
+        self.trainer.run()
+
+        self.assertEqual(len(log_report.log), 1)
+        self.assertIn('prof/iterations_per_second', log_report.log[0])
+        self.assertIn('prof/extension/record', log_report.log[0])
+
+
+testing.run_module(__name__, __file__)
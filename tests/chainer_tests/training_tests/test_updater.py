@@ -1,3 +1,5 @@
+import copy
+import time
 import unittest
 
 import mock
@@ -5,8 +7,13 @@ import numpy
 
 import chainer
 from chainer import dataset
+from chainer import functions
+from chainer import iterators
+from chainer import links
+from chainer import optimizers
 from chainer import testing
 from chainer import training
+from chainer.training import updater as updater_module
 
 
 class DummyIterator(dataset.Iterator):
@@ -176,4 +183,498 @@ class TestUpdaterUpdateArguments(unittest.TestCase):
         self.assertEqual(iterator.next_called, 1)
 
 
+class RecordingOptimizer(optimizers.SGD):
+
+    def update(self, lossfun=None, *args, **kwds):
+        if lossfun is not None:
+            self.target.cleargrads()
+            lossfun(*args, **kwds).backward()
+        self.grads = [param.grad.copy() for param in self.target.params()]
+
+
+@testing.parameterize(
+    {'n_micro_batches': 1, 'parallel': False, 'batch_size': 6},
+    {'n_micro_batches': 3, 'parallel': False, 'batch_size': 6},
+    {'n_micro_batches': 6, 'parallel': False, 'batch_size': 6},
+    {'n_micro_batches': 10, 'parallel': False, 'batch_size': 6},
+    {'n_micro_batches': 4, 'parallel': False, 'batch_size': 7},
+    {'n_micro_batches': 1, 'parallel': True, 'batch_size': 6},
+    {'n_micro_batches': 3, 'parallel': True, 'batch_size': 6},
+    {'n_micro_batches': 3, 'parallel': True, 'batch_size': 8},
+)
+class TestUpdaterMicroBatches(unittest.TestCase):
+
+    def setUp(self):
+        self.model = links.Classifier(links.Linear(3, 2))
+        self.x = numpy.random.uniform(
+            -1, 1, (self.batch_size, 3)).astype(numpy.float32)
+        self.t = numpy.random.randint(
+            0, 2, self.batch_size).astype(numpy.int32)
+
+    def _expected_grads(self):
+        # Each micro-batch is weighted by its size. ParallelUpdater sums up
+        # the gradients of the mean losses of the devices.
+        model = self.model.copy()
+        model.cleargrads()
+        n_micro = min(self.n_micro_batches, self.batch_size)
+        n_devices = 2 if self.parallel else 1
+        for i in range(n_micro):
+            x, t = self.x[i::n_micro], self.t[i::n_micro]
+            for j in range(n_devices):
+                loss = model(x[j::n_devices], t[j::n_devices])
+                loss.grad = numpy.full(
+                    (), float(len(x)) / self.batch_size, numpy.float32)
+                loss.backward()
+        return [param.grad.copy() for param in model.params()]
+
+    def test_update_core(self):
+        expect = self._expected_grads()
+        optimizer = RecordingOptimizer()
+        optimizer.setup(self.model)
+        iterator = DummyIterator(list(zip(self.x, self.t)))
+        if self.parallel:
+            updater = training.ParallelUpdater(
+                iterator, optimizer, devices={'main': -1, 'second': -1},
+                n_micro_batches=self.n_micro_batches)
+        else:
+            updater = training.StandardUpdater(
+                iterator, optimizer, n_micro_batches=self.n_micro_batches)
+
+        reporter = chainer.Reporter()
+        reporter.add_observer('main', self.model)
+        if self.parallel:
+            reporter.add_observer('second', updater._models['second'])
+        with reporter:
+            updater.update_core()
+
+        self.assertEqual(iterator.next_called, 1)
+        for e, g in zip(expect, optimizer.grads):
+            testing.assert_allclose(e, g, atol=1e-5, rtol=1e-4)
+        self.assertIn('main/loss', reporter.observation)
+        if not self.parallel:
+            loss = reporter.observation['main/loss']
+            if isinstance(loss, chainer.Variable):
+                loss = loss.data
+            testing.assert_allclose(loss, self.model(self.x, self.t).data)
+
+    def test_invalid_n_micro_batches(self):
+        with self.assertRaises(ValueError):
+            training.StandardUpdater(
+                DummyIterator([]), RecordingOptimizer(), n_micro_batches=0)
+
+
+class LinearLoss(chainer.Link):
+
+    def __init__(self):
+        super(LinearLoss, self).__init__(W=(3,))
+        self.W.data[:] = 0
+
+    def __call__(self, x):
+        loss = functions.sum(x * functions.broadcast_to(self.W, x.shape))
+        chainer.report({'loss': loss}, self)
+        return loss
+
+
+class TestHogwildUpdater(unittest.TestCase):
+
+    def setUp(self):
+        self.model = LinearLoss()
+        self.optimizer = optimizers.SGD(lr=0.1)
+        self.optimizer.setup(self.model)
+        # only the worker process changes the parameters
+        self.main_iterator = iterators.SerialIterator(
+            numpy.zeros((4, 3), 'f'), 2, shuffle=False)
+        self.worker_iterator = iterators.SerialIterator(
+            numpy.ones((4, 3), 'f'), 2, shuffle=False)
+        self.updater = training.HogwildUpdater(
+            [self.main_iterator, self.worker_iterator], self.optimizer)
+
+    def tearDown(self):
+        self.updater.finalize()
+
+    def wait_for(self, condition):
+        deadline = time.time() + 10
+        while not condition():
+            self.assertLess(time.time(), deadline)
+            time.sleep(0.01)
+
+    def test_update(self):
+        reporter = chainer.Reporter()
+        reporter.add_observer('main', self.model)
+        for i in range(3):
+            with reporter:
+                self.updater.update()
+            self.assertIn('main/loss', reporter.observation)
+            # each update of the worker changes W by -0.2; the copy may be
+            # taken in the middle of an update
+            n_updates = self.model.W.data.copy() / -0.2
+            testing.assert_allclose(n_updates, numpy.rint(n_updates),
+                                    atol=1e-3)
+        self.assertEqual(self.updater.iteration, 3)
+        self.assertEqual(self.updater.epoch, 1)
+
+    def test_observation(self):
+        # the observations of the worker are averaged with that of the main
+        # process, whose loss is always zero
+        self.updater.update()
+        # waits for two updates of the worker, the first of which has been
+        # reported when the second one finishes
+        W = self.model.W.data[0]
+        self.wait_for(lambda: self.model.W.data[0] < W - 0.3)
+        reporter = chainer.Reporter()
+        reporter.add_observer('main', self.model)
+        with reporter:
+            self.updater.update()
+        self.assertLess(reporter.observation['main/loss'], 0)
+
+    def test_worker_runs_free(self):
+        self.updater.update()
+        # the worker keeps updating without waiting for the main process
+        self.wait_for(lambda: self.model.W.data[0] < -0.2 * 5)
+        self.assertEqual(self.updater.iteration, 1)
+
+    def test_finalize(self):
+        self.updater.update()
+        workers = self.updater._workers
+        self.updater.finalize()
+        for worker in workers:
+            self.assertFalse(worker.is_alive())
+        self.assertIsNone(self.updater._workers)
+        # the parameters are no longer updated
+        W = self.model.W.data.copy()
+        time.sleep(0.05)
+        testing.assert_allclose(self.model.W.data, W)
+
+    def test_worker_error(self):
+        self.worker_iterator.dataset = numpy.ones((4, 2), 'f')
+        with self.assertRaises(RuntimeError):
+            deadline = time.time() + 10
+            while time.time() < deadline:
+                self.updater.update()
+                time.sleep(0.01)
+
+    def test_uninitialized_params(self):
+        optimizer = optimizers.SGD()
+        optimizer.setup(links.Linear(None, 2))
+        updater = training.HogwildUpdater(
+            [self.main_iterator, self.worker_iterator], optimizer)
+        with self.assertRaises(ValueError):
+            updater.update()
+
+    def test_empty_iterators(self):
+        with self.assertRaises(ValueError):
+            training.HogwildUpdater([], self.optimizer)
+
+
+class RegressionLoss(chainer.Chain):
+
+    def __init__(self):
+        super(RegressionLoss, self).__init__(l=links.Linear(None, 2))
+
+    def __call__(self, x, t):
+        loss = functions.mean_squared_error(self.l(x), t)
+        chainer.report({'loss': loss}, self)
+        return loss
+
+
+class TestMultiprocessParallelUpdater(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.random.uniform(-1, 1, (8, 3)).astype('f')
+        self.t = numpy.random.uniform(-1, 1, (8, 2)).astype('f')
+        self.model = RegressionLoss()
+        self.optimizer = optimizers.MomentumSGD(lr=0.1)
+        self.optimizer.setup(self.model)
+        # each batch of the processes is a half of a batch of four examples
+        self.iterators = [
+            iterators.SerialIterator(
+                chainer.datasets.TupleDataset(self.x[i::2], self.t[i::2]), 2,
+                shuffle=False)
+            for i in range(2)]
+        self.updater = training.MultiprocessParallelUpdater(
+            self.iterators, self.optimizer)
+
+    def tearDown(self):
+        self.updater.finalize()
+
+    def train_standard(self, n):
+        model = RegressionLoss()
+        optimizer = optimizers.MomentumSGD(lr=0.1)
+        optimizer.setup(model)
+        iterator = iterators.SerialIterator(
+            chainer.datasets.TupleDataset(self.x, self.t), 4, shuffle=False)
+        updater = training.StandardUpdater(iterator, optimizer)
+        reporter = chainer.Reporter()
+        reporter.add_observer('main', model)
+        losses = []
+        numpy.random.seed(0)
+        for _ in range(n):
+            with reporter:
+                updater.update()
+            losses.append(reporter.observation['main/loss'].data)
+        return model, losses
+
+    def test_update(self):
+        expected_model, expected_losses = self.train_standard(3)
+        reporter = chainer.Reporter()
+        reporter.add_observer('main', self.model)
+        numpy.random.seed(0)
+        for i in range(3):
+            with reporter:
+                self.updater.update()
+            # mean of the losses of the processes
+            testing.assert_allclose(
+                reporter.observation['main/loss'], expected_losses[i],
+                atol=1e-5, rtol=1e-4)
+        testing.assert_allclose(
+            self.model.l.W.data, expected_model.l.W.data, atol=1e-5,
+            rtol=1e-4)
+        testing.assert_allclose(
+            self.model.l.b.data, expected_model.l.b.data, atol=1e-5,
+            rtol=1e-4)
+        self.assertEqual(self.updater.iteration, 3)
+        self.assertEqual(self.updater.epoch, 1)
+
+    def test_hyperparameter(self):
+        self.updater.update()
+        # the parameters are updated only by the main process, so that the
+        # changes of the hyperparameters by extensions take effect
+        self.optimizer.lr = 0
+        W = self.model.l.W.data.copy()
+        self.optimizer.momentum = 0
+        self.updater.update()
+        testing.assert_allclose(self.model.l.W.data, W)
+
+    def test_finalize(self):
+        self.updater.update()
+        workers = self.updater._workers
+        self.updater.finalize()
+        for worker in workers:
+            self.assertFalse(worker.is_alive())
+        self.assertIsNone(self.updater._workers)
+
+    def test_worker_error(self):
+        self.iterators[1].dataset = numpy.ones((4, 3), 'f')
+        with self.assertRaises(RuntimeError):
+            self.updater.update()
+
+    def test_single_process(self):
+        updater = training.MultiprocessParallelUpdater(
+            self.iterators[:1], self.optimizer)
+        try:
+            updater.update()
+            self.assertEqual(updater._workers, [])
+        finally:
+            updater.finalize()
+
+    def test_empty_iterators(self):
+        with self.assertRaises(ValueError):
+            training.MultiprocessParallelUpdater([], self.optimizer)
+
+
+class PipelineStage(chainer.Chain):
+
+    def __init__(self, n_in, n_out, fail=False):
+        super(PipelineStage, self).__init__(l=links.Linear(n_in, n_out))
+        self.fail = fail
+
+    def __call__(self, x):
+        if self.fail and x.volatile is chainer.OFF:
+            raise ValueError('stage failed')
+        return functions.tanh(self.l(x))
+
+
+class Pipeline(chainer.ChainList):
+
+    def __call__(self, x):
+        for stage in self:
+            x = stage(x)
+        return x
+
+
+@testing.parameterize(*testing.product({
+    'n_stages': [1, 2, 3],
+    'n_micro_batches': [1, 3, 8],
+}))
+class TestPipelineParallelUpdater(unittest.TestCase):
+
+    def setUp(self):
+        self.x = numpy.random.uniform(-1, 1, (12, 3)).astype('f')
+        self.t = numpy.random.randint(0, 2, 12).astype('i')
+        sizes = [3] + [5, 4][:self.n_stages - 1] + [2]
+        self.model = Pipeline(*[
+            PipelineStage(n_in, n_out)
+            for n_in, n_out in zip(sizes[:-1], sizes[1:])])
+        self.expected_model = copy.deepcopy(self.model)
+        self.optimizer = optimizers.MomentumSGD(lr=0.1)
+        self.optimizer.setup(self.model)
+        self.iterator = iterators.SerialIterator(
+            chainer.datasets.TupleDataset(self.x, self.t), 4, shuffle=False)
+        self.updater = training.PipelineParallelUpdater(
+            self.iterator, self.optimizer,
+            n_micro_batches=self.n_micro_batches)
+
+    def tearDown(self):
+        self.updater.finalize()
+
+    def test_update(self):
+        model = self.expected_model
+        optimizer = optimizers.MomentumSGD(lr=0.1)
+        optimizer.setup(model)
+        iterator = iterators.SerialIterator(
+            chainer.datasets.TupleDataset(self.x, self.t), 4, shuffle=False)
+        updater = training.StandardUpdater(
+            iterator, optimizer,
+            loss_func=lambda x, t: functions.softmax_cross_entropy(
+                model(x), t))
+
+        reporter = chainer.Reporter()
+        reporter.add_observer('main', self.model)
+        for i in range(3):
+            x, t = self.x[i * 4:(i + 1) * 4], self.t[i * 4:(i + 1) * 4]
+            loss = functions.softmax_cross_entropy(model(x), t).data
+            updater.update()
+            with reporter:
+                self.updater.update()
+            testing.assert_allclose(
+                reporter.observation['main/loss'], loss, atol=1e-5,
+                rtol=1e-4)
+        for p, q in zip(self.model.params(), model.params()):
+            testing.assert_allclose(p.data, q.data, atol=1e-5, rtol=1e-4)
+        self.assertEqual(self.updater.iteration, 3)
+        self.assertEqual(self.updater.epoch, 1)
+
+    def test_observation(self):
+        def loss_func(y, t):
+            chainer.report({'t': float(t.mean())})
+            return functions.softmax_cross_entropy(y, t)
+
+        updater = training.PipelineParallelUpdater(
+            self.iterator, self.optimizer,
+            n_micro_batches=self.n_micro_batches, loss_func=loss_func)
+        reporter = chainer.Reporter()
+        reporter.add_observer('main', self.model)
+        try:
+            with reporter:
+                updater.update()
+        finally:
+            updater.finalize()
+        # the micro-batches of uneven sizes are weighted by their sizes
+        testing.assert_allclose(reporter.observation['main/t'],
+                                self.t[:4].mean())
+
+    def test_finalize(self):
+        self.updater.update()
+        workers = self.updater._workers
+        self.assertEqual(len(workers), self.n_stages - 1)
+        self.updater.finalize()
+        for worker in workers:
+            self.assertFalse(worker.is_alive())
+        self.assertIsNone(self.updater._workers)
+
+    def test_stage_error(self):
+        self.model[-1].fail = True
+        with self.assertRaises((RuntimeError, ValueError)):
+            self.updater.update()
+        self.assertIsNone(self.updater._workers)
+
+
+class TestPipelineParallelUpdaterArguments(unittest.TestCase):
+
+    def setUp(self):
+        self.optimizer = optimizers.SGD()
+        self.optimizer.setup(Pipeline(PipelineStage(3, 2)))
+        self.iterator = DummyIterator([])
+
+    def test_empty_stages(self):
+        with self.assertRaises(ValueError):
+            training.PipelineParallelUpdater(
+                self.iterator, self.optimizer, stages=Pipeline())
+
+    def test_invalid_n_micro_batches(self):
+        with self.assertRaises(ValueError):
+            training.PipelineParallelUpdater(
+                self.iterator, self.optimizer, n_micro_batches=0)
+
+
+class TestPipelineParallelUpdaterGrowingBatch(unittest.TestCase):
+
+    def setUp(self):
+        # the arrays passed between the stages do not fit in the buffer of
+        # the pipe
+        self.x = numpy.random.uniform(-1, 1, (12, 3)).astype('f')
+        self.t = numpy.random.randint(0, 2, 12).astype('i')
+        self.model = Pipeline(PipelineStage(3, 50000), PipelineStage(50000, 2))
+        self.expected_model = copy.deepcopy(self.model)
+        self.optimizer = optimizers.SGD(lr=0.1)
+        self.optimizer.setup(self.model)
+        self.iterator = iterators.SerialIterator(
+            chainer.datasets.TupleDataset(self.x, self.t), 4, shuffle=False)
+        self.updater = training.PipelineParallelUpdater(
+            self.iterator, self.optimizer, n_micro_batches=2)
+
+    def tearDown(self):
+        self.updater.finalize()
+
+    def test_update(self):
+        model = self.expected_model
+        optimizer = optimizers.SGD(lr=0.1)
+        optimizer.setup(model)
+        reporter = chainer.Reporter()
+        reporter.add_observer('main', self.model)
+        for begin, end in ((0, 4), (4, 12)):
+            self.iterator.batch_size = end - begin
+            model.cleargrads()
+            loss = functions.softmax_cross_entropy(
+                model(self.x[begin:end]), self.t[begin:end])
+            loss.backward()
+            optimizer.update()
+            with reporter:
+                self.updater.update()
+            testing.assert_allclose(
+                reporter.observation['main/loss'], loss.data, atol=1e-5,
+                rtol=1e-4)
+        for p, q in zip(self.model.params(), model.params()):
+            testing.assert_allclose(p.data, q.data, atol=1e-5, rtol=1e-4)
+
+
+class TestPipelineEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.upstream, self.downstream = updater_module._pipeline_connection(
+            64, 2)
+
+    def tearDown(self):
+        self.upstream.conn.close()
+        self.downstream.conn.close()
+
+    def check_send(self, x):
+        self.upstream.send(1, x)
+        y = self.downstream.recv(1)
+        testing.assert_allclose(x, y)
+        self.downstream.send(1, x * 2)
+        testing.assert_allclose(self.upstream.recv(1), x * 2)
+
+    def test_shared_memory(self):
+        self.check_send(numpy.arange(16, dtype='f').reshape(4, 4))
+
+    def test_large_array(self):
+        # the slots are reallocated for an array larger than them
+        x = numpy.arange(16, dtype='f')
+        self.upstream.send(0, x)
+        y_small = self.downstream.recv(0)
+        self.check_send(numpy.arange(32, dtype='f').reshape(4, 8))
+        self.assertGreaterEqual(self.upstream.send_capacity, 128)
+        self.assertGreaterEqual(self.downstream.recv_capacity, 128)
+        self.assertGreaterEqual(self.downstream.send_capacity, 128)
+        # the array received before the reallocation is kept
+        testing.assert_allclose(y_small, x)
+        self.check_send(numpy.arange(32, dtype='f') + 1)
+
+    def test_out_of_sync(self):
+        self.upstream.send(0, numpy.zeros(2, 'f'))
+        with self.assertRaises(RuntimeError):
+            self.downstream.recv(1)
+
+
 testing.run_module(__name__, __file__)
@@ -0,0 +1,143 @@
+import json
+import subprocess
+import sys
+import types
+import unittest
+
+import numpy
+
+import chainer
+from chainer import testing
+from chainer.testing import attr
+from chainer.training import extensions
+from chainer.utils import lazy_import
+
+
+class TestLazyModule(unittest.TestCase):
+
+    def setUp(self):
+        self.name = 'chainer_tests_lazy_import_dummy'
+        sys.modules[self.name] = types.ModuleType(self.name)
+        self.module = lazy_import.replace_module(self.name, {
+            'json': ['dumps', 'loads'],
+            'os': ['path'],
+            'chainer.iterators': ['_private'],
+        })
+
+    def tearDown(self):
+        del sys.modules[self.name]
+
+    def test_replace(self):
+        self.assertIsInstance(self.module, lazy_import.LazyModule)
+        self.assertIs(sys.modules[self.name], self.module)
+        self.assertEqual(self.module.__name__, self.name)
+
+    def test_getattr(self):
+        self.assertNotIn('dumps', self.module.__dict__)
+        self.assertIs(self.module.dumps, json.dumps)
+        self.assertIs(self.module.__dict__['dumps'], json.dumps)
+
+    def test_getattr_submodule(self):
+        import os.path
+        self.assertIs(self.module.path, os.path)
+
+    def test_getattr_unknown(self):
+        with self.assertRaises(AttributeError):
+            self.module.unknown
+
+    def test_getattr_missing(self):
+        with self.assertRaises(ImportError):
+            self.module._private
+
+    def test_all(self):
+        self.assertEqual(self.module.__all__, ['dumps', 'loads', 'path'])
+
+    def test_dir(self):
+        names = dir(self.module)
+        for name in ('dumps', 'loads', 'path', '__name__'):
+            self.assertIn(name, names)
+
+
+class TestLazyPackages(unittest.TestCase):
+
+    def test_lazy_packages(self):
+        for package in (chainer.datasets, chainer.functions, chainer.links,
+                        chainer.iterators, chainer.optimizers,
+                        chainer.serializers, extensions):
+            self.assertIsInstance(package, lazy_import.LazyModule)
+
+    def test_submodule(self):
+        from chainer.iterators import serial_iterator
+        self.assertIs(chainer.iterators.serial_iterator, serial_iterator)
+        self.assertIs(chainer.iterators.SerialIterator,
+                      serial_iterator.SerialIterator)
+
+    def test_import_from(self):
+        from chainer.functions.activation import relu as relu_module
+        from chainer.functions import relu
+        self.assertIs(relu, relu_module.relu)
+
+    def test_dotted_submodule(self):
+        # Submodules of the subpackages are imported on attribute access. It
+        # is checked in a new process, where none of them is imported yet.
+        probe = '''
+import chainer
+chainer.functions.loss.crf1d.argmax_crf1d
+chainer.functions.activation.lstm.lstm
+chainer.functions.util.forget.forget
+chainer.links.connection.linear.Linear
+chainer.links.model.vision.resnet.ResNet50Layers
+chainer.utils.conv.get_conv_outsize
+'''
+        subprocess.check_call([sys.executable, '-c', probe])
+
+    def test_function_globals(self):
+        # functions defined in a replaced module keep their globals
+        self.assertIsInstance(chainer.utils.force_array(1.0), numpy.ndarray)
+
+    def test_dotted_submodule_unknown(self):
+        with self.assertRaises(AttributeError):
+            chainer.functions.loss.unknown
+        with self.assertRaises(AttributeError):
+            chainer.utils.unknown
+
+
+_probe = '''
+import json
+import sys
+import time
+import numpy
+start = time.time()
+import chainer
+elapsed = time.time() - start
+print(json.dumps({'modules': list(sys.modules), 'time': elapsed}))
+'''
+
+
+def _import_chainer():
+    output = subprocess.check_output([sys.executable, '-c', _probe])
+    return json.loads(output.decode('utf-8'))
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_heavy_modules_not_imported(self):
+        modules = set(_import_chainer()['modules'])
+        for name in ('pkg_resources',
+                     'chainer.functions.activation.relu',
+                     'chainer.links.connection.linear',
+                     'chainer.links.caffe',
+                     'chainer.iterators.multiprocess_iterator',
+                     'chainer.serializers.hdf5',
+                     'chainer.training.extensions.plot_report',
+                     'chainer.datasets.image_dataset'):
+            self.assertNotIn(name, modules)
+
+    @attr.slow
+    def test_import_time(self):
+        # Time to import chainer excluding numpy, the best of a few runs.
+        elapsed = min(_import_chainer()['time'] for _ in range(3))
+        self.assertLess(elapsed, 0.5)
+
+
+testing.run_module(__name__, __file__)
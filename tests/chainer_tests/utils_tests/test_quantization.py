@@ -0,0 +1,73 @@
+import unittest
+
+import mock
+import numpy
+
+from chainer import testing
+from chainer.utils import quantization
+
+
+class TestScaleOf(unittest.TestCase):
+
+    def test_scale_of(self):
+        scale = quantization.scale_of(numpy.array([127., 0., 254.]))
+        self.assertEqual(scale.dtype, numpy.float32)
+        testing.assert_allclose(scale, numpy.array([1., 1., 2.]))
+
+
+class TestQuantize(unittest.TestCase):
+
+    def test_quantize(self):
+        x = numpy.array([-300., -1.6, -0.4, 0., 0.6, 1.5, 300.], 'f')
+        q = quantization.quantize(x, 1.)
+        self.assertEqual(q.dtype, numpy.int8)
+        numpy.testing.assert_array_equal(q, [-127, -2, 0, 0, 1, 2, 127])
+
+    def test_quantize_channels(self):
+        x = numpy.array([[1., 2.], [4., 8.]], 'f')
+        q = quantization.quantize(x, numpy.array([[1.], [4.]], 'f'))
+        numpy.testing.assert_array_equal(q, [[1, 2], [1, 2]])
+
+    def test_round_half_to_even(self):
+        x = numpy.arange(-130, 130, 0.5, dtype='f')
+        q = quantization.quantize(x, 1.)
+        expect = numpy.clip(numpy.rint(x), -127, 127)
+        numpy.testing.assert_array_equal(q, expect)
+
+
+@testing.parameterize(
+    {'k': 0},
+    {'k': 7},
+    {'k': 1024},
+    {'k': 2500},
+)
+class TestMatmulInt32(unittest.TestCase):
+
+    def check_matmul(self, a, b):
+        y = quantization.matmul_int32(a, b)
+        self.assertEqual(y.dtype, numpy.int32)
+        self.assertEqual(y.shape, (len(a), len(b)))
+        expect = a.astype(numpy.int64).dot(b.astype(numpy.int64).T)
+        numpy.testing.assert_array_equal(y, expect)
+
+    def test_random(self):
+        a = numpy.random.randint(-127, 128, (3, self.k)).astype(numpy.int8)
+        b = numpy.random.randint(-127, 128, (4, self.k)).astype(numpy.int8)
+        self.check_matmul(a, b)
+
+    def test_extreme(self):
+        # the sums are not exact in float32 if they are not split
+        a = numpy.full((2, self.k), 127, dtype=numpy.int8)
+        b = numpy.full((3, self.k), -127, dtype=numpy.int8)
+        b[0, :] = 127
+        self.check_matmul(a, b)
+
+    def test_small_scratch(self):
+        # the rows of b are converted in several parts
+        a = numpy.random.randint(-127, 128, (3, self.k)).astype(numpy.int8)
+        b = numpy.random.randint(-127, 128, (5, self.k)).astype(numpy.int8)
+        with mock.patch.object(quantization, '_scratch_size', 16):
+            self.check_matmul(a, b)
+
+
+testing.run_module(__name__, __file__)